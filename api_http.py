@@ -0,0 +1,588 @@
+"""
+API HTTP/JSON (somente leitura) da Plataforma de Estatísticas do Futebol Feminino
+
+Servidor assíncrono (asyncio, apenas biblioteca padrão) que expõe as consultas
+do SistemaFutebolFeminino. Cada conexão é atendida por uma corrotina, então
+milhares de clientes simultâneos não bloqueiam uns aos outros nem o menu
+interativo. As consultas rodam fora do laço de eventos, numa thread de
+consultas (uma só: o sistema e a conexão SQLite não são compartilhados entre
+threads); uma consulta lenta atrasa só as outras consultas ainda não
+calculadas, enquanto conexões, respostas já calculadas e 304 seguem no laço.
+As respostas levam ETag: clientes que repetem a consulta com
+If-None-Match recebem 304 sem corpo enquanto os dados não mudam.
+
+Rotas (GET ou HEAD):
+    /                               lista de rotas
+    /jogadoras?clube_id=&inicio=&limite=
+    /jogadoras/{id}                 dados e estatísticas da jogadora
+        ?campeonato_id=&temporada=&data_inicio=&data_fim=&ultimas=N   (recorte opcional)
+    /jogadoras/{id}/clubes          passagens da jogadora por clubes (transferências)
+    /rankings/{chave}?limite=10     chave: gols, assistencias, cartoes, ...
+    /clubes   /clubes/{id}
+    /campeonatos   /campeonatos/{id}
+    /campeonatos/{id}/classificacao?data=YYYY-MM-DD
+    /partidas?campeonato_id=&inicio=&limite=
+    /partidas/{id}                  dados, resumo e eventos da partida
+    /partidas/{id}/linha-do-tempo   lances em ordem de minuto com placar parcial
+    /histogramas/{agrupar}?tipos=gol,cartao_amarelo&largura=15&id=   agrupar: jogadora, clube, campeonato
+    /primeiro-gol?campeonato_id=&temporada=&data_inicio=&data_fim=&largura=15
+    /gols-por-clube?temporada=&tipo=gol   totais por clube e temporada (clube da jogadora na data)
+    /busca?q=termo&limite=10
+    /comparacao?ids=jog_001,jog_002&confronto_direto=1   (ou ?clube_id=&adversario_id=)
+    /metricas?formato=prometheus|json   métricas por método (com --instrumentar)
+
+Uso:
+    python api_http.py [dados.db | diretorio_log] [--host 127.0.0.1] [--porta 8000] [--instrumentar]
+"""
+
+import argparse
+import asyncio
+import hashlib
+import json
+import re
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import parse_qs, unquote, urlsplit
+
+from linha_do_tempo import DURACAO_PARTIDA, LARGURA_FAIXA
+from plataforma_futebol_feminino import (
+    CHAVES_RANKING,
+    EVENTO_GOL,
+    Registro,
+    SistemaFutebolFeminino
+)
+
+# =============================================================================
+# CONFIGURAÇÕES DO SERVIDOR
+# =============================================================================
+
+HOST_PADRAO = '127.0.0.1'
+PORTA_PADRAO = 8000
+
+# Conexões aguardando aceite na fila do sistema operacional
+FILA_CONEXOES = 2048
+
+# Tempo máximo (segundos) esperando a próxima requisição de uma conexão keep-alive
+TEMPO_OCIOSO = 30
+
+# Paginação das listagens
+LIMITE_PADRAO = 100
+LIMITE_MAXIMO = 1000
+
+# Tamanho máximo da linha de requisição e de cada cabeçalho
+TAMANHO_MAXIMO_LINHA = 8192
+
+# Filtros aceitos nas estatísticas da jogadora (além de ultimas=N)
+FILTROS_ESTATISTICAS = ('campeonato_id', 'temporada', 'data_inicio', 'data_fim')
+
+# Respostas guardadas por alvo enquanto a versão dos dados não muda
+MAXIMO_RESPOSTAS_GUARDADAS = 10000
+
+# Tipos de conteúdo: JSON nas rotas e texto do Prometheus em /metricas
+TIPO_JSON = 'application/json; charset=utf-8'
+TIPO_PROMETHEUS = 'text/plain; version=0.0.4; charset=utf-8'
+
+MENSAGENS_STATUS = {
+    200: 'OK',
+    304: 'Not Modified',
+    400: 'Bad Request',
+    404: 'Not Found',
+    405: 'Method Not Allowed',
+    500: 'Internal Server Error'
+}
+
+
+class ErroHttp(Exception):
+    """Erro que vira uma resposta HTTP com status e mensagem"""
+    
+    def __init__(self, status, mensagem):
+        super().__init__(mensagem)
+        self.status = status
+        self.mensagem = mensagem
+
+# =============================================================================
+# SERIALIZAÇÃO E ETAG
+# =============================================================================
+
+def serializar(valor):
+    """Converte registros compactos e conjuntos para tipos JSON"""
+    if isinstance(valor, Registro):
+        return dict(valor.items())
+    if isinstance(valor, (set, frozenset)):
+        return sorted(valor)
+    raise TypeError(f"tipo não serializável: {type(valor).__name__}")
+
+
+def para_json(dados):
+    """Corpo JSON da resposta (bytes UTF-8)"""
+    return json.dumps(dados, default=serializar, ensure_ascii=False, separators=(',', ':')).encode()
+
+
+def calcular_etag(corpo):
+    """ETag forte a partir do conteúdo da resposta"""
+    return '"' + hashlib.blake2b(corpo, digest_size=12).hexdigest() + '"'
+
+
+def etag_confere(if_none_match, etag):
+    """Verifica se o cabeçalho If-None-Match do cliente contém a ETag atual"""
+    if if_none_match is None:
+        return False
+    if if_none_match.strip() == '*':
+        return True
+    # Aceita listas e ETags fracas (W/"...") como o RFC 9110 pede para GET
+    return etag in (item.strip().removeprefix('W/') for item in if_none_match.split(','))
+
+# =============================================================================
+# CONSULTAS (ROTAS)
+# =============================================================================
+
+def inteiro(parametros, nome, padrao, minimo=0, maximo=None):
+    """Lê um parâmetro inteiro da query string"""
+    valor = parametros.get(nome, padrao)
+    try:
+        valor = int(valor)
+    except (TypeError, ValueError):
+        raise ErroHttp(400, f"parâmetro '{nome}' deve ser inteiro") from None
+    if valor < minimo:
+        raise ErroHttp(400, f"parâmetro '{nome}' deve ser >= {minimo}")
+    return min(valor, maximo) if maximo else valor
+
+
+def paginar(registros, parametros):
+    """Aplica inicio/limite a uma lista de registros"""
+    inicio = inteiro(parametros, 'inicio', 0)
+    limite = inteiro(parametros, 'limite', LIMITE_PADRAO, 1, LIMITE_MAXIMO)
+    return {
+        'total': len(registros),
+        'inicio': inicio,
+        'itens': registros[inicio:inicio + limite]
+    }
+
+
+def encontrar(registro, descricao):
+    """Retorna o registro ou gera 404"""
+    if registro is None:
+        raise ErroHttp(404, f"{descricao} não encontrado(a)")
+    return registro
+
+
+def rota_indice(sistema, parametros):
+    """Lista as rotas disponíveis"""
+    return {'rotas': [padrao for padrao, _ in ROTAS_DOCUMENTADAS]}
+
+
+def rota_jogadoras(sistema, parametros):
+    """Lista jogadoras (opcionalmente de um clube)"""
+    if 'clube_id' in parametros:
+        return paginar(sistema.listar_jogadoras_do_clube(parametros['clube_id']), parametros)
+    return paginar(sistema.jogadoras, parametros)
+
+
+def rota_jogadora(sistema, parametros, jogadora_id):
+    """Dados e estatísticas de uma jogadora (carreira ou no recorte pedido)"""
+    jogadora = encontrar(sistema.buscar_jogadora_por_id(jogadora_id), 'jogadora')
+    filtros = {chave: parametros[chave] for chave in FILTROS_ESTATISTICAS if chave in parametros}
+    if 'ultimas' in parametros:
+        filtros['ultimas'] = inteiro(parametros, 'ultimas', None)
+    return {
+        'jogadora': jogadora,
+        'filtros': filtros,
+        'estatisticas': sistema.calcular_estatisticas_jogadora(jogadora_id, **filtros)
+    }
+
+
+def rota_historico_clubes(sistema, parametros, jogadora_id):
+    """Passagens da jogadora por clubes (transferências)"""
+    historico = encontrar(sistema.historico_da_jogadora(jogadora_id), 'jogadora')
+    return {'jogadora_id': jogadora_id, 'clubes': historico}
+
+
+def rota_ranking(sistema, parametros, chave):
+    """Ranking das jogadoras por uma estatística"""
+    if chave not in CHAVES_RANKING:
+        raise ErroHttp(404, f"ranking inexistente: {chave} (use {', '.join(CHAVES_RANKING)})")
+    limite = inteiro(parametros, 'limite', 10, 1, LIMITE_MAXIMO)
+    ranking = sistema.obter_ranking(chave, limite)
+    return {
+        'chave': chave,
+        'itens': [
+            {'posicao': posicao, 'jogadora_id': item['jogadora']['id'],
+             'nome': item['jogadora']['nome'], chave: item[chave], 'partidas': item['partidas']}
+            for posicao, item in enumerate(ranking, 1)
+        ]
+    }
+
+
+def rota_clubes(sistema, parametros):
+    """Lista clubes"""
+    return paginar(sistema.clubes, parametros)
+
+
+def rota_clube(sistema, parametros, clube_id):
+    """Dados de um clube e IDs do elenco"""
+    clube = encontrar(sistema.buscar_clube_por_id(clube_id), 'clube')
+    return {
+        'clube': clube,
+        'jogadoras': [jogadora['id'] for jogadora in sistema.listar_jogadoras_do_clube(clube_id)]
+    }
+
+
+def rota_campeonatos(sistema, parametros):
+    """Lista campeonatos"""
+    return paginar(sistema.campeonatos, parametros)
+
+
+def rota_campeonato(sistema, parametros, campeonato_id):
+    """Dados de um campeonato"""
+    return {'campeonato': encontrar(sistema.buscar_campeonato_por_id(campeonato_id), 'campeonato')}
+
+
+def rota_classificacao(sistema, parametros, campeonato_id):
+    """Classificação do campeonato (atual ou na data informada)"""
+    data = parametros.get('data')
+    tabela = encontrar(sistema.obter_classificacao(campeonato_id, data), 'campeonato')
+    return {'campeonato_id': campeonato_id, 'data': data, 'tabela': tabela}
+
+
+def rota_partidas(sistema, parametros):
+    """Lista partidas (opcionalmente de um campeonato)"""
+    if 'campeonato_id' in parametros:
+        campeonato_id = parametros['campeonato_id']
+        partidas = [partida for partida in sistema.partidas if partida['campeonato_id'] == campeonato_id]
+        return paginar(partidas, parametros)
+    return paginar(sistema.partidas, parametros)
+
+
+def rota_partida(sistema, parametros, partida_id):
+    """Dados, resumo e eventos de uma partida"""
+    partida = encontrar(sistema.buscar_partida_por_id(partida_id), 'partida')
+    return {
+        'partida': partida,
+        'resumo': sistema.resumo_partida(partida_id),
+        'eventos': sistema.listar_eventos_da_partida(partida_id)
+    }
+
+
+def rota_linha_do_tempo(sistema, parametros, partida_id):
+    """Linha do tempo compacta de uma partida"""
+    return encontrar(sistema.linha_do_tempo(partida_id), 'partida')
+
+
+def rota_histograma(sistema, parametros, agrupar):
+    """Eventos por faixa de minutos de cada jogadora, clube ou campeonato (ou só do id pedido)"""
+    tipos = tuple(tipo for tipo in parametros.get('tipos', EVENTO_GOL).split(',') if tipo)
+    largura = inteiro(parametros, 'largura', LARGURA_FAIXA, 1, DURACAO_PARTIDA)
+    try:
+        resultado = sistema.histograma_minutos(agrupar, tipos, largura)
+    except ValueError as erro:
+        raise ErroHttp(404, str(erro)) from None
+    if 'id' in parametros:
+        # Cópia: o resultado original fica no cache do sistema
+        contagens = resultado['grupos'].get(parametros['id'], [0] * len(resultado['faixas']))
+        resultado = dict(resultado, grupos={parametros['id']: contagens})
+    return resultado
+
+
+def rota_primeiro_gol(sistema, parametros):
+    """Distribuição do minuto do primeiro gol das partidas do recorte"""
+    filtros = {chave: parametros[chave] for chave in FILTROS_ESTATISTICAS if chave in parametros}
+    largura = inteiro(parametros, 'largura', LARGURA_FAIXA, 1, DURACAO_PARTIDA)
+    return dict(sistema.distribuicao_primeiro_gol(largura=largura, **filtros), filtros=filtros)
+
+
+def rota_gols_por_clube(sistema, parametros):
+    """Gols (ou outro tipo de evento) de cada clube por temporada, pelo clube da jogadora na data da partida"""
+    temporada = parametros.get('temporada')
+    tipo = parametros.get('tipo', EVENTO_GOL)
+    try:
+        totais = sistema.gols_por_clube(temporada, tipo)
+    except ValueError as erro:
+        raise ErroHttp(400, str(erro)) from None
+    return {
+        'tipo': tipo,
+        'temporadas': {
+            temporada: sorted(({'clube_id': clube_id, 'total': total} for clube_id, total in por_clube.items()),
+                              key=lambda item: -item['total'])
+            for temporada, por_clube in totais.items()
+        }
+    }
+
+
+def rota_busca(sistema, parametros):
+    """Busca por nome em jogadoras, clubes e campeonatos"""
+    termo = parametros.get('q', '')
+    limite = inteiro(parametros, 'limite', 10, 1, LIMITE_MAXIMO)
+    return {'termo': termo, 'resultados': sistema.buscar(termo, limite)}
+
+
+def rota_comparacao(sistema, parametros):
+    """Comparação de jogadoras (ids separados por vírgula) ou do elenco de um clube"""
+    ids = [jogadora_id for jogadora_id in parametros.get('ids', '').split(',') if jogadora_id]
+    clube_id = parametros.get('clube_id')
+    if clube_id is not None:
+        encontrar(sistema.buscar_clube_por_id(clube_id), 'clube')
+    elif not ids:
+        raise ErroHttp(400, "informe ids=jog_001,jog_002 ou clube_id")
+    confronto_direto = parametros.get('confronto_direto', '0') not in ('0', 'false', '')
+    adversario_id = parametros.get('adversario_id')
+    if adversario_id is not None:
+        encontrar(sistema.buscar_clube_por_id(adversario_id), 'clube')
+    try:
+        return sistema.comparar(ids, clube_id, confronto_direto, adversario_id)
+    except ValueError as erro:
+        raise ErroHttp(400, str(erro)) from None
+
+
+# Tabela de rotas: padrão documentado e função (os segmentos {x} viram argumentos)
+ROTAS_DOCUMENTADAS = (
+    ('/', rota_indice),
+    ('/jogadoras', rota_jogadoras),
+    ('/jogadoras/{id}', rota_jogadora),
+    ('/jogadoras/{id}/clubes', rota_historico_clubes),
+    ('/rankings/{chave}', rota_ranking),
+    ('/clubes', rota_clubes),
+    ('/clubes/{id}', rota_clube),
+    ('/campeonatos', rota_campeonatos),
+    ('/campeonatos/{id}', rota_campeonato),
+    ('/campeonatos/{id}/classificacao', rota_classificacao),
+    ('/partidas', rota_partidas),
+    ('/partidas/{id}', rota_partida),
+    ('/partidas/{id}/linha-do-tempo', rota_linha_do_tempo),
+    ('/histogramas/{agrupar}', rota_histograma),
+    ('/primeiro-gol', rota_primeiro_gol),
+    ('/gols-por-clube', rota_gols_por_clube),
+    ('/busca', rota_busca),
+    ('/comparacao', rota_comparacao)
+)
+
+ROTAS = [
+    (re.compile('^' + re.sub(r'\{\w+\}', '([^/]+)', padrao) + '/?$'), funcao)
+    for padrao, funcao in ROTAS_DOCUMENTADAS
+]
+
+
+def responder_consulta(sistema, alvo):
+    """Executa a rota do alvo (caminho + query string) e retorna (status, corpo)"""
+    url = urlsplit(alvo)
+    parametros = {chave: valores[-1] for chave, valores in parse_qs(url.query).items()}
+    
+    try:
+        for padrao, funcao in ROTAS:
+            casamento = padrao.match(url.path)
+            if casamento:
+                argumentos = [unquote(segmento) for segmento in casamento.groups()]
+                return 200, para_json(funcao(sistema, parametros, *argumentos))
+        raise ErroHttp(404, f"rota inexistente: {url.path}")
+    except ErroHttp as erro:
+        return erro.status, para_json({'erro': erro.mensagem})
+
+# =============================================================================
+# SERVIDOR HTTP ASSÍNCRONO
+# =============================================================================
+
+class ServidorApi:
+    """Servidor HTTP/1.1 assíncrono com conexões keep-alive"""
+    
+    def __init__(self, sistema, host=HOST_PADRAO, porta=PORTA_PADRAO, executor=None):
+        self.sistema = sistema
+        self.host = host
+        self.porta = porta
+        self.servidor = None
+        self.requisicoes = 0
+        
+        # Thread única de consultas: tira o trabalho do laço de eventos sem acessar o sistema em paralelo
+        # (com SQLite, o sistema precisa ter sido criado nessa mesma thread, ver main)
+        self.executor = executor or ThreadPoolExecutor(max_workers=1, thread_name_prefix='consultas')
+        
+        # Dicionário: alvo -> (status, corpo, etag), válido para a versão dos dados guardada
+        self.respostas = {}
+        self.versao_respostas = None
+        # Consultas em cálculo: (versão, alvo) -> futuro compartilhado pelas requisições simultâneas
+        self.em_andamento = {}
+    
+    async def iniciar(self):
+        """Abre o socket e começa a aceitar conexões (porta 0 escolhe uma porta livre)"""
+        self.servidor = await asyncio.start_server(
+            self.atender_conexao, self.host, self.porta,
+            backlog=FILA_CONEXOES, limit=TAMANHO_MAXIMO_LINHA
+        )
+        self.porta = self.servidor.sockets[0].getsockname()[1]
+        return self.porta
+    
+    async def servir(self):
+        """Inicia (se preciso) e atende até ser cancelado"""
+        if self.servidor is None:
+            await self.iniciar()
+        async with self.servidor:
+            await self.servidor.serve_forever()
+    
+    async def ler_requisicao(self, leitor):
+        """Lê linha de requisição e cabeçalhos; None quando o cliente fecha a conexão"""
+        linha = await asyncio.wait_for(leitor.readline(), TEMPO_OCIOSO)
+        if not linha:
+            return None
+        partes = linha.decode('latin-1').split()
+        if len(partes) != 3:
+            raise ErroHttp(400, "linha de requisição inválida")
+        
+        cabecalhos = {}
+        while True:
+            linha = await leitor.readline()
+            if linha in (b'\r\n', b'\n', b''):
+                break
+            nome, _, valor = linha.decode('latin-1').partition(':')
+            cabecalhos[nome.strip().lower()] = valor.strip()
+        
+        # Corpo é ignorado (API somente leitura), mas precisa ser consumido
+        tamanho_corpo = int(cabecalhos.get('content-length', 0) or 0)
+        if tamanho_corpo:
+            await leitor.readexactly(tamanho_corpo)
+        
+        metodo, alvo, versao = partes
+        return metodo, alvo, versao, cabecalhos
+    
+    def calcular_resposta(self, alvo):
+        """Executa a consulta na thread de consultas: (versão dos dados, (status, corpo, etag))"""
+        versao = self.sistema.versao
+        status, corpo = responder_consulta(self.sistema, alvo)
+        return versao, (status, corpo, calcular_etag(corpo) if status == 200 else None)
+    
+    async def consultar(self, alvo):
+        """Resposta (status, corpo, etag) do alvo, reaproveitada enquanto os dados não mudam"""
+        if self.versao_respostas != self.sistema.versao or len(self.respostas) >= MAXIMO_RESPOSTAS_GUARDADAS:
+            self.respostas = {}
+            self.versao_respostas = self.sistema.versao
+        
+        resposta = self.respostas.get(alvo)
+        if resposta is not None:
+            return resposta
+        
+        # Mesmo alvo já em cálculo: as requisições simultâneas esperam o mesmo resultado
+        chave = (self.versao_respostas, alvo)
+        pendente = self.em_andamento.get(chave)
+        if pendente is None:
+            pendente = asyncio.get_running_loop().run_in_executor(self.executor, self.calcular_resposta, alvo)
+            self.em_andamento[chave] = pendente
+            pendente.add_done_callback(lambda _: self.em_andamento.pop(chave, None))
+        # shield: cliente que desiste não cancela o cálculo dos demais
+        versao, resposta = await asyncio.shield(pendente)
+        if versao == self.versao_respostas:
+            self.respostas[alvo] = resposta
+        return resposta
+    
+    def responder_metricas(self, alvo):
+        """Métricas da instrumentação (mudam a cada requisição: nunca reaproveitadas)"""
+        instrumentacao = self.sistema.instrumentacao
+        if instrumentacao is None:
+            return 404, {}, para_json({'erro': "instrumentação desativada (inicie com --instrumentar)"})
+        parametros = parse_qs(urlsplit(alvo).query)
+        if parametros.get('formato', ['prometheus'])[-1] == 'json':
+            return 200, {}, instrumentacao.json().encode('utf-8')
+        return 200, {'Content-Type': TIPO_PROMETHEUS}, instrumentacao.prometheus().encode('utf-8')
+    
+    async def montar_resposta(self, metodo, alvo, cabecalhos):
+        """Calcula status, cabeçalhos extras e corpo de uma requisição"""
+        if metodo not in ('GET', 'HEAD'):
+            return 405, {'Allow': 'GET, HEAD'}, para_json({'erro': "API somente leitura"})
+        if urlsplit(alvo).path.rstrip('/') == '/metricas':
+            return await asyncio.get_running_loop().run_in_executor(self.executor, self.responder_metricas, alvo)
+        
+        try:
+            status, corpo, etag = await self.consultar(alvo)
+        except Exception as erro:
+            return 500, {}, para_json({'erro': f"erro interno: {erro}"})
+        if etag is None:
+            return status, {}, corpo
+        
+        extras = {'ETag': etag, 'Cache-Control': 'no-cache'}
+        if etag_confere(cabecalhos.get('if-none-match'), etag):
+            return 304, extras, b''
+        return status, extras, corpo
+    
+    async def atender_conexao(self, leitor, escritor):
+        """Atende as requisições de uma conexão até o cliente fechar"""
+        try:
+            while True:
+                try:
+                    requisicao = await self.ler_requisicao(leitor)
+                except ErroHttp as erro:
+                    escritor.write(self.formatar(erro.status, {}, para_json({'erro': erro.mensagem}), False))
+                    break
+                if requisicao is None:
+                    break
+                
+                metodo, alvo, versao, cabecalhos = requisicao
+                manter = (cabecalhos.get('connection', '').lower() != 'close'
+                          and versao == 'HTTP/1.1')
+                status, extras, corpo = await self.montar_resposta(metodo, alvo, cabecalhos)
+                self.requisicoes += 1
+                
+                escritor.write(self.formatar(status, extras, corpo, manter, metodo == 'HEAD'))
+                await escritor.drain()
+                if not manter:
+                    break
+        except (asyncio.TimeoutError, asyncio.IncompleteReadError, ConnectionError, ValueError):
+            pass
+        finally:
+            escritor.close()
+    
+    @staticmethod
+    def formatar(status, extras, corpo, manter, somente_cabecalhos=False):
+        """Monta os bytes da resposta HTTP"""
+        linhas = [f"HTTP/1.1 {status} {MENSAGENS_STATUS[status]}"]
+        if status != 304:
+            if 'Content-Type' not in extras:
+                linhas.append(f"Content-Type: {TIPO_JSON}")
+            linhas.append(f"Content-Length: {len(corpo)}")
+        for nome, valor in extras.items():
+            linhas.append(f"{nome}: {valor}")
+        linhas.append("Connection: keep-alive" if manter else "Connection: close")
+        cabecalho = ("\r\n".join(linhas) + "\r\n\r\n").encode('latin-1')
+        return cabecalho if somente_cabecalhos or status == 304 else cabecalho + corpo
+
+# =============================================================================
+# EXECUÇÃO PRINCIPAL
+# =============================================================================
+
+def main(argumentos=None):
+    """Ponto de entrada do servidor pela linha de comando"""
+    parser = argparse.ArgumentParser(description="API HTTP/JSON da plataforma de futebol feminino")
+    parser.add_argument('armazenamento', nargs='?', help="arquivo .db (SQLite) ou diretório de log")
+    parser.add_argument('--host', default=HOST_PADRAO)
+    parser.add_argument('--porta', type=int, default=PORTA_PADRAO)
+    parser.add_argument('--instrumentar', action='store_true',
+                        help="mede as consultas e publica as métricas em /metricas")
+    args = parser.parse_args(argumentos)
+    
+    def criar_sistema():
+        armazenamento = None
+        if args.armazenamento:
+            from persistencia import abrir_armazenamento
+            armazenamento = abrir_armazenamento(args.armazenamento)
+        sistema = SistemaFutebolFeminino(armazenamento)
+        if args.instrumentar:
+            sistema.ativar_instrumentacao()
+        return sistema
+    
+    # A conexão SQLite só pode ser usada pela thread que a abriu: o sistema nasce na thread de consultas
+    executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='consultas')
+    sistema = executor.submit(criar_sistema).result()
+    servidor = ServidorApi(sistema, args.host, args.porta, executor)
+    try:
+        asyncio.run(servidor_anunciado(servidor))
+    except KeyboardInterrupt:
+        print("\n👋 Servidor encerrado")
+    finally:
+        if sistema.armazenamento:
+            executor.submit(sistema.armazenamento.fechar).result()
+        executor.shutdown()
+
+
+async def servidor_anunciado(servidor):
+    """Inicia o servidor, informa o endereço e atende até Ctrl+C"""
+    porta = await servidor.iniciar()
+    print(f"🌐 API disponível em http://{servidor.host}:{porta}/")
+    await servidor.servir()
+
+
+if __name__ == "__main__":
+    main()
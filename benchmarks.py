@@ -0,0 +1,1212 @@
+"""
+Benchmarks da Plataforma de Estatísticas do Futebol Feminino
+
+Uso:
+    python benchmarks.py memoria [--eventos 1000000]
+    python benchmarks.py login [--usuarios 20] [--logins 200] [--threads 8]
+    python benchmarks.py ids [--quantidade 1000000] [--threads 4]
+    python benchmarks.py busca [--nomes 1000000]
+    python benchmarks.py api [--conexoes 1000] [--requisicoes 50000] [--eventos 100000]
+                             [--url http://127.0.0.1:8000]
+    python benchmarks.py ingestao [--eventos 200000] [--taxa 20000]
+    python benchmarks.py paralelo [--eventos 1000000] [--processos 1 2 4 8]
+    python benchmarks.py cache [--eventos 100000] [--operacoes 20000] [--escritas 0.05]
+    python benchmarks.py cache_latencia [--eventos 100000]
+    python benchmarks.py cli [--eventos 100000] [--consultas 20]
+    python benchmarks.py inicializacao [--eventos 10000000] [--banco inicializacao.db] [--completo]
+    python benchmarks.py exportacao [--eventos 100000 1000000] [--processos 2] [--diretorio bancos/]
+    python benchmarks.py instrumentacao [--eventos 100000] [--operacoes 20000] [--rodadas 3]
+    python benchmarks.py linha_do_tempo [--eventos 1000000] [--consultas 20000] [--lances 0.05]
+    python benchmarks.py placares [--eventos 1000000] [--gols 20000] [--lote 500]
+    python benchmarks.py transferencias [--eventos 1000000] [--transferencias 20000] [--amostra 2000]
+    python benchmarks.py consultas [--tamanhos 1000 10000 100000 1000000]
+                                   [--baseline benchmarks_baseline.json] [--salvar-baseline]
+"""
+
+import argparse
+import asyncio
+import gc
+import json
+import multiprocessing
+import os
+import random
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import quote, urlsplit
+
+try:
+    import resource
+except ImportError:
+    resource = None
+
+from api_http import ServidorApi
+from eventos_colunares import EventosColunares
+from ingestao import IngestaoEventos
+from persistencia import abrir_armazenamento
+from recalculo_paralelo import recalcular_estatisticas
+from dados_sinteticos import (
+    PRIMEIROS_NOMES,
+    SOBRENOMES,
+    dimensoes_para_eventos,
+    gerar_temporada,
+    gravar_temporada
+)
+from plataforma_futebol_feminino import (
+    ESTATISTICA_POR_EVENTO,
+    EVENTO_GOL,
+    TIPO_USUARIO,
+    Evento,
+    IndiceBusca,
+    SistemaFutebolFeminino,
+    agregar_estatisticas,
+    gerar_id
+)
+
+TIPOS_EVENTO = list(ESTATISTICA_POR_EVENTO)
+
+# Suíte de consultas: tamanhos padrão, tempo máximo por consulta e tolerância de regressão
+TAMANHOS_PADRAO = (1_000, 10_000, 100_000, 1_000_000)
+TEMPO_POR_CONSULTA = 0.5  # segundos
+REPETICOES_MINIMAS = 3
+REPETICOES_MAXIMAS = 2000
+TOLERANCIA_REGRESSAO = 1.5
+ARQUIVO_BASELINE = 'benchmarks_baseline.json'
+
+# =============================================================================
+# FUNÇÕES AUXILIARES
+# =============================================================================
+
+def medir_memoria(funcao):
+    """Executa a função e retorna (bytes alocados que continuam em uso, resultado)"""
+    gc.collect()
+    tracemalloc.start()
+    resultado = funcao()
+    atual, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return atual, resultado
+
+
+def formatar_bytes(quantidade):
+    """Formata uma quantidade de bytes em MB"""
+    return f"{quantidade / (1024 * 1024):.1f} MB"
+
+
+def memoria_pico_mb():
+    """Pico de memória residente do processo em MB (None se indisponível)"""
+    if resource is None:
+        return None
+    pico = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux informa em KB, macOS em bytes
+    return pico / 1024 if sys.platform != 'darwin' else pico / (1024 * 1024)
+
+
+def percentil(valores_ordenados, fracao):
+    """Percentil de uma lista já ordenada"""
+    posicao = min(int(len(valores_ordenados) * fracao), len(valores_ordenados) - 1)
+    return valores_ordenados[posicao]
+
+# =============================================================================
+# MEMÓRIA: DICIONÁRIOS x REGISTROS COMPACTOS
+# =============================================================================
+
+def eventos_como_dicionarios(quantidade):
+    """Eventos no formato original (um dicionário por evento)"""
+    return [
+        {
+            'id': f"evt_{i:07d}",
+            'partida_id': f"part_{i // 40:05d}",
+            'jogadora_id': f"jog_{i % 5000:05d}",
+            'tipo': TIPOS_EVENTO[i % len(TIPOS_EVENTO)],
+            'minuto': i % 90,
+            'observacoes': ''
+        }
+        for i in range(quantidade)
+    ]
+
+
+def eventos_como_registros(quantidade):
+    """Eventos como registros Evento (__slots__ e strings internadas)"""
+    return [
+        Evento(
+            f"evt_{i:07d}",
+            f"part_{i // 40:05d}",
+            f"jog_{i % 5000:05d}",
+            TIPOS_EVENTO[i % len(TIPOS_EVENTO)],
+            i % 90
+        )
+        for i in range(quantidade)
+    ]
+
+
+def benchmark_memoria(quantidade=1_000_000):
+    """Compara a memória de eventos em dicionários e em registros compactos"""
+    print(f"\n💾 MEMÓRIA DE {quantidade:,} EVENTOS")
+    print("-" * 60)
+    
+    resultados = {}
+    for nome, funcao in (('dicionários', eventos_como_dicionarios),
+                         ('registros Evento', eventos_como_registros)):
+        memoria, eventos = medir_memoria(lambda: funcao(quantidade))
+        resultados[nome] = memoria
+        print(f"{nome:<20} {formatar_bytes(memoria):>12} "
+              f"({memoria / quantidade:.0f} bytes/evento)")
+        del eventos
+    
+    reducao = resultados['dicionários'] / resultados['registros Evento']
+    print(f"{'redução':<20} {reducao:>11.1f}x")
+    
+    # Colunas de eventos_em_colunas(): montadas a partir dos registros e descartadas depois do bloco
+    registros = eventos_como_registros(quantidade)
+    memoria, colunar = medir_memoria(lambda: EventosColunares.de_eventos(registros))
+    resultados['colunas'] = memoria
+    print(f"{'colunas (no bloco)':<20} {formatar_bytes(memoria):>12} "
+          f"({memoria / quantidade:.0f} bytes/evento)")
+    print(f"{'redução x registros':<20} {resultados['registros Evento'] / memoria:>11.1f}x")
+    
+    # Montar as colunas custa uma passada pelos registros: compensa quando o bloco faz várias agregações
+    inicio = time.perf_counter()
+    agregar_estatisticas(registros)
+    laco = time.perf_counter() - inicio
+    inicio = time.perf_counter()
+    EventosColunares.de_eventos(registros)
+    montagem = time.perf_counter() - inicio
+    inicio = time.perf_counter()
+    colunar.contagens_por_jogadora()
+    colunar.partidas_por_jogadora()
+    agregacao = time.perf_counter() - inicio
+    print(f"{'agregação em laço':<20} {laco:>11.2f}s")
+    print(f"{'montagem colunas':<20} {montagem:>11.2f}s")
+    print(f"{'agregação colunar':<20} {agregacao:>11.2f}s")
+    return resultados
+
+# =============================================================================
+# LOGIN: VAZÃO SEQUENCIAL x CONCORRENTE
+# =============================================================================
+
+def benchmark_login(usuarios=20, logins=200, threads=8):
+    """Mede logins por segundo em sequência e com verificações concorrentes"""
+    sistema = SistemaFutebolFeminino()
+    credenciais = [(f"usuaria{i}@teste.com", f"senha{i}") for i in range(usuarios)]
+    for email, senha in credenciais:
+        sistema.criar_usuario(email, senha, email, TIPO_USUARIO)
+    tentativas = [credenciais[i % usuarios] for i in range(logins)]
+    
+    print(f"\n🔐 VAZÃO DE LOGIN ({logins} logins, {usuarios} usuárias)")
+    print("-" * 60)
+    
+    inicio = time.perf_counter()
+    for email, senha in tentativas:
+        assert sistema.autenticar(email, senha)
+    sequencial = logins / (time.perf_counter() - inicio)
+    print(f"{'sequencial':<20} {sequencial:>10.1f} logins/s")
+    
+    # Vários clientes simultâneos, cada um na sua thread (o PBKDF2 libera o GIL)
+    inicio = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=threads) as clientes:
+        resultados = list(clientes.map(lambda credencial: sistema.autenticar(*credencial), tentativas))
+    concorrente = logins / (time.perf_counter() - inicio)
+    assert all(resultados)
+    print(f"{f'concorrente ({threads})':<20} {concorrente:>10.1f} logins/s")
+    
+    # Um único chamador com o lote inteiro: os hashes são calculados no pool de senhas
+    inicio = time.perf_counter()
+    assert all(sistema.autenticar_varios(tentativas))
+    lote = logins / (time.perf_counter() - inicio)
+    print(f"{'em lote':<20} {lote:>10.1f} logins/s")
+    print(f"{'ganho':<20} {concorrente / sequencial:>9.1f}x (threads) {lote / sequencial:>6.1f}x (lote)")
+    return sequencial, concorrente, lote
+
+# =============================================================================
+# IDS: VAZÃO (a unicidade é conferida em tests/test_ids.py)
+# =============================================================================
+
+def gerar_ids_em_processo(quantidade):
+    """Gera IDs em um processo filho (usado na medição entre processos)"""
+    return [gerar_id() for _ in range(quantidade)]
+
+
+def benchmark_ids(quantidade=1_000_000, threads=4):
+    """Mede a vazão de gerar_id numa thread, em várias threads, em processos e no cadastro"""
+    print(f"\n🆔 GERAÇÃO DE IDS ({quantidade:,})")
+    print("-" * 60)
+    
+    inicio = time.perf_counter()
+    for _ in range(quantidade):
+        gerar_id()
+    duracao = time.perf_counter() - inicio
+    print(f"{'1 thread':<24} {quantidade / duracao / 1e6:>8.2f} milhões/s")
+    
+    por_thread = quantidade // threads
+    inicio = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=threads) as executor:
+        list(executor.map(lambda _: [gerar_id() for _ in range(por_thread)], range(threads)))
+    duracao = time.perf_counter() - inicio
+    print(f"{f'{threads} threads':<24} {por_thread * threads / duracao / 1e6:>8.2f} milhões/s")
+    
+    inicio = time.perf_counter()
+    with multiprocessing.Pool(2) as processos:
+        processos.map(gerar_ids_em_processo, [por_thread, por_thread])
+    duracao = time.perf_counter() - inicio
+    print(f"{'2 processos':<24} {2 * por_thread / duracao / 1e6:>8.2f} milhões/s (com a criação do pool)")
+    
+    # Cadastro pelo caminho normal do sistema (ID + índices + estatísticas)
+    sistema = SistemaFutebolFeminino()
+    inicio = time.perf_counter()
+    for i in range(quantidade):
+        sistema.registrar_evento('part_001', 'jog_001', EVENTO_GOL, i % 90)
+    duracao = time.perf_counter() - inicio
+    print(f"{'registrar_evento':<24} {quantidade / duracao:>8,.0f}/s")
+
+# =============================================================================
+# BUSCA POR NOME: ÍNDICE x VARREDURA LINEAR
+# =============================================================================
+
+def busca_linear(nomes, termo):
+    """Busca original: minúsculas e trecho do nome, percorrendo toda a lista"""
+    termo_lower = termo.lower()
+    return [nome for nome in nomes if termo_lower in nome.lower()]
+
+
+def benchmark_busca(quantidade=1_000_000, limite=10):
+    """Compara a busca digitada (type-ahead) no índice com a varredura linear"""
+    aleatorio = random.Random(2024)
+    nomes = [f"{aleatorio.choice(PRIMEIROS_NOMES)} {aleatorio.choice(SOBRENOMES)} {aleatorio.choice(SOBRENOMES)}"
+             for _ in range(quantidade)]
+    
+    print(f"\n🔍 BUSCA EM {quantidade:,} NOMES (limite {limite})")
+    print("-" * 60)
+    inicio = time.perf_counter()
+    indice = IndiceBusca()
+    for posicao, nome in enumerate(nomes):
+        indice.adicionar(posicao, nome, nome)
+    print(f"construção do índice: {time.perf_counter() - inicio:.1f}s")
+    
+    print(f"{'Termo':<16} {'índice p50 (µs)':>16} {'linear p50 (µs)':>16} {'ganho':>10}")
+    for termo in ('m', 'ma', 'mar', 'cassia', 'silva', 'ana sil', 'gonç'):
+        medida_indice = medir_consulta(lambda: indice.buscar(termo, limite))
+        medida_linear = medir_consulta(lambda: busca_linear(nomes, termo))
+        print(f"{termo:<16} {medida_indice['p50_us']:>16.1f} {medida_linear['p50_us']:>16.1f} "
+              f"{medida_linear['p50_us'] / medida_indice['p50_us']:>9.0f}x")
+
+# =============================================================================
+# API HTTP: TESTE DE CARGA
+# =============================================================================
+
+def executar_servidor_carga(total_eventos, fila):
+    """Processo filho: gera uma temporada sintética e atende a API numa porta livre"""
+    sistema = SistemaFutebolFeminino()
+    gerar_temporada(sistema, **dimensoes_para_eventos(total_eventos))
+    servidor = ServidorApi(sistema, porta=0)
+    
+    async def servir():
+        fila.put(await servidor.iniciar())
+        await servidor.servir()
+    
+    asyncio.run(servir())
+
+
+def caminhos_de_carga(quantidade, semente=2024):
+    """Mistura de consultas de um cliente típico: rankings (com polling), jogadoras, partidas e busca"""
+    aleatorio = random.Random(semente)
+    termos = [nome.lower()[:4] for nome in PRIMEIROS_NOMES + SOBRENOMES]
+    caminhos = []
+    for _ in range(quantidade):
+        sorteio = aleatorio.random()
+        if sorteio < 0.5:
+            caminhos.append(f"/rankings/{aleatorio.choice(('gols', 'assistencias', 'cartoes'))}?limite=10")
+        elif sorteio < 0.75:
+            caminhos.append(f"/jogadoras/jog_s{aleatorio.randrange(500):07d}")
+        elif sorteio < 0.9:
+            caminhos.append(f"/busca?q={quote(aleatorio.choice(termos))}&limite=10")
+        else:
+            caminhos.append(f"/partidas/part_s{aleatorio.randrange(300):07d}")
+    return caminhos
+
+
+async def cliente_carga(host, porta, caminhos, etags, latencias, contagem_status):
+    """Uma conexão keep-alive que envia as requisições em sequência, revalidando com ETag"""
+    leitor, escritor = await asyncio.open_connection(host, porta)
+    try:
+        for caminho in caminhos:
+            cabecalhos = f"GET {caminho} HTTP/1.1\r\nHost: {host}\r\n"
+            if caminho in etags:
+                cabecalhos += f"If-None-Match: {etags[caminho]}\r\n"
+            
+            antes = time.perf_counter_ns()
+            escritor.write((cabecalhos + "\r\n").encode())
+            status = int((await leitor.readline()).split()[1])
+            tamanho = 0
+            while True:
+                linha = await leitor.readline()
+                if linha == b'\r\n':
+                    break
+                nome, _, valor = linha.decode('latin-1').partition(':')
+                nome = nome.lower()
+                if nome == 'content-length':
+                    tamanho = int(valor)
+                elif nome == 'etag':
+                    etags[caminho] = valor.strip()
+            if tamanho:
+                await leitor.readexactly(tamanho)
+            latencias.append(time.perf_counter_ns() - antes)
+            contagem_status[status] = contagem_status.get(status, 0) + 1
+    finally:
+        escritor.close()
+
+
+async def disparar_carga(host, porta, conexoes, requisicoes):
+    """Abre as conexões simultâneas e divide as requisições entre elas"""
+    por_conexao = max(requisicoes // conexoes, 1)
+    latencias = []
+    contagem_status = {}
+    # ETags compartilhadas: clientes que repetem uma consulta recebem 304
+    etags = {}
+    inicio = time.perf_counter()
+    await asyncio.gather(*(
+        cliente_carga(host, porta, caminhos_de_carga(por_conexao, semente=numero),
+                      etags, latencias, contagem_status)
+        for numero in range(conexoes)
+    ))
+    return time.perf_counter() - inicio, latencias, contagem_status
+
+
+def benchmark_api(conexoes=1000, requisicoes=50_000, total_eventos=100_000, url=None):
+    """Teste de carga da API HTTP com conexões simultâneas"""
+    processo = None
+    if url:
+        endereco = urlsplit(url)
+        host, porta = endereco.hostname, endereco.port or 80
+    else:
+        # Servidor em outro processo para não disputar o GIL com os clientes
+        fila = multiprocessing.Queue()
+        processo = multiprocessing.Process(target=executar_servidor_carga, args=(total_eventos, fila),
+                                           daemon=True)
+        processo.start()
+        host, porta = '127.0.0.1', fila.get()
+    
+    try:
+        print(f"\n🌐 API HTTP: {conexoes} conexões, {requisicoes:,} requisições em http://{host}:{porta}/")
+        print("-" * 60)
+        duracao, latencias, contagem_status = asyncio.run(disparar_carga(host, porta, conexoes, requisicoes))
+    finally:
+        if processo:
+            processo.terminate()
+            processo.join()
+    
+    latencias.sort()
+    print(f"vazão:            {len(latencias) / duracao:>10,.0f} req/s")
+    print(f"latência p50:     {percentil(latencias, 0.50) / 1e6:>10.2f} ms")
+    print(f"latência p99:     {percentil(latencias, 0.99) / 1e6:>10.2f} ms")
+    for status, total in sorted(contagem_status.items()):
+        print(f"status {status}:       {total:>10,}")
+
+# =============================================================================
+# INGESTÃO CONTÍNUA: VAZÃO E LATÊNCIA FIM A FIM
+# =============================================================================
+
+def eventos_ao_vivo(sistema, quantidade, semente=2024):
+    """Eventos (dicionários, como chegam na ingestão) das partidas já cadastradas"""
+    aleatorio = random.Random(semente)
+    partidas = sistema.partidas
+    eventos = []
+    for _ in range(quantidade):
+        partida = aleatorio.choice(partidas)
+        elenco = sistema.jogadoras_por_clube[aleatorio.choice((partida['clube_casa_id'], partida['clube_fora_id']))]
+        eventos.append({
+            'partida_id': partida['id'],
+            'jogadora_id': aleatorio.choice(elenco)['id'],
+            'tipo': aleatorio.choice(TIPOS_EVENTO),
+            'minuto': aleatorio.randrange(95)
+        })
+    return eventos
+
+
+async def alimentar_ingestao(ingestao, eventos, taxa):
+    """Publica os eventos na taxa pedida (eventos/s; 0 = o mais rápido possível)"""
+    processamento = asyncio.create_task(ingestao.processar())
+    inscrito = ingestao.inscrever()
+    inicio = time.perf_counter()
+    fatia = max(taxa // 1000, 1) if taxa else len(eventos)
+    for posicao in range(0, len(eventos), fatia):
+        for evento in eventos[posicao:posicao + fatia]:
+            await ingestao.publicar(evento)
+        if taxa:
+            # Espera até o instante previsto para a próxima fatia (1 ms por fatia)
+            atraso = inicio + (posicao + fatia) / taxa - time.perf_counter()
+            await asyncio.sleep(max(atraso, 0))
+    await ingestao.fila.join()
+    duracao = time.perf_counter() - inicio
+    processamento.cancel()
+    return duracao, inscrito.qsize()
+
+
+def benchmark_ingestao(quantidade=200_000, taxa=20_000):
+    """Mede vazão e latência fim a fim da ingestão em micro-lotes"""
+    sistema = SistemaFutebolFeminino()
+    gerar_temporada(sistema, **dimensoes_para_eventos(100_000))
+    eventos = eventos_ao_vivo(sistema, quantidade)
+    
+    descricao = f"{taxa:,} eventos/s" if taxa else "vazão máxima"
+    print(f"\n⚡ INGESTÃO: {quantidade:,} eventos ({descricao})")
+    print("-" * 60)
+    ingestao = IngestaoEventos(sistema)
+    duracao, notificacoes = asyncio.run(alimentar_ingestao(ingestao, eventos, taxa))
+    metricas = ingestao.metricas()
+    
+    print(f"vazão:            {metricas['processados'] / duracao:>10,.0f} eventos/s")
+    print(f"micro-lotes:      {metricas['lotes']:>10,}")
+    print(f"notificações:     {notificacoes:>10,} (na fila do inscrito)")
+    print(f"latência p50:     {metricas['latencia_p50_ms']:>10.2f} ms")
+    print(f"latência p99:     {metricas['latencia_p99_ms']:>10.2f} ms")
+    print(f"consistência:     {'ok' if not sistema.verificar_consistencia_estatisticas() else 'DIVERGENTE':>10}")
+
+# =============================================================================
+# RECÁLCULO PARALELO: SPEEDUP POR QUANTIDADE DE PROCESSOS
+# =============================================================================
+
+def benchmark_paralelo(total_eventos=1_000_000, processos=(1, 2, 4, 8)):
+    """Compara o recálculo serial com o paralelo e confere se os resultados são idênticos"""
+    sistema = SistemaFutebolFeminino()
+    gerar_temporada(sistema, **dimensoes_para_eventos(total_eventos))
+    
+    print(f"\n🧮 RECÁLCULO DE {len(sistema.eventos):,} EVENTOS ({os.cpu_count()} CPUs)")
+    print("-" * 60)
+    inicio = time.perf_counter()
+    sistema.reconstruir_estatisticas()
+    serial = time.perf_counter() - inicio
+    esperado = (sistema.estatisticas, sistema.partidas_por_jogadora)
+    print(f"{'serial':<14} {serial:>8.2f}s")
+    
+    for quantidade in processos:
+        for criterio in ('partida', 'campeonato'):
+            inicio = time.perf_counter()
+            resultado = recalcular_estatisticas(sistema, quantidade, criterio)
+            duracao = time.perf_counter() - inicio
+            identico = resultado == esperado and list(resultado[0]) == list(recalcular_estatisticas(sistema, 1, criterio)[0])
+            print(f"{quantidade:>2} proc/{criterio:<10} {duracao:>6.2f}s  speedup {serial / duracao:>5.2f}x  "
+                  f"{'idêntico' if identico else 'DIVERGENTE'}")
+
+# =============================================================================
+# CACHE DE CONSULTAS: CARGA MISTA DE LEITURAS E ESCRITAS
+# =============================================================================
+
+def carga_mista(sistema, operacoes, fracao_escritas, semente=2024):
+    """Executa consultas populares intercaladas com novos eventos; retorna a duração"""
+    aleatorio = random.Random(semente)
+    jogadoras = [jogadora['id'] for jogadora in sistema.jogadoras]
+    partidas = [partida['id'] for partida in sistema.partidas]
+    # Poucas partidas e termos "quentes", como numa rodada em andamento
+    partidas_populares = partidas[-20:]
+    termos = [nome.lower()[:4] for nome in PRIMEIROS_NOMES[:10]]
+    consultas = (
+        lambda: sistema.obter_ranking('gols', 10),
+        lambda: sistema.obter_ranking('assistencias', 10),
+        lambda: sistema.resumo_partida(aleatorio.choice(partidas_populares)),
+        lambda: sistema.buscar(aleatorio.choice(termos), 10),
+        sistema.listar_disponiveis
+    )
+    
+    inicio = time.perf_counter()
+    for _ in range(operacoes):
+        if aleatorio.random() < fracao_escritas:
+            sistema.registrar_evento(aleatorio.choice(partidas), aleatorio.choice(jogadoras),
+                                     aleatorio.choice(TIPOS_EVENTO), aleatorio.randint(1, 90))
+        else:
+            aleatorio.choice(consultas)()
+    return time.perf_counter() - inicio
+
+
+def benchmark_cache(total_eventos=100_000, operacoes=20_000, fracao_escritas=0.05):
+    """Compara a carga mista sem e com o cache de consultas"""
+    print(f"\n🗃️  CACHE: {operacoes:,} operações, {fracao_escritas:.0%} escritas, {total_eventos:,} eventos")
+    print("-" * 60)
+    duracoes = {}
+    for nome in ('sem cache', 'com cache'):
+        sistema = SistemaFutebolFeminino()
+        gerar_temporada(sistema, **dimensoes_para_eventos(total_eventos))
+        if nome == 'sem cache':
+            sistema.cache = None
+        duracoes[nome] = carga_mista(sistema, operacoes, fracao_escritas)
+        print(f"{nome:<10} {operacoes / duracoes[nome]:>10,.0f} ops/s")
+    
+    metricas = sistema.cache.metricas()
+    print(f"speedup    {duracoes['sem cache'] / duracoes['com cache']:>10.2f}x")
+    print(f"acertos    {metricas['acertos']:>10,} ({metricas['taxa_acerto']:.1%})")
+    print(f"falhas     {metricas['falhas']:>10,}")
+    print(f"invalid.   {metricas['invalidacoes']:>10,}")
+    print(f"despejos   {metricas['despejos']:>10,}")
+
+
+
+def benchmark_latencia_cache(total_eventos=100_000, semente=2024):
+    """Latência p50 de cada consulta pública sem cache e com o cache já aquecido"""
+    sistema = SistemaFutebolFeminino()
+    gerar_temporada(sistema, semente=semente, **dimensoes_para_eventos(total_eventos))
+    cache = sistema.cache
+    print(f"\n🗃️  LATÊNCIA COM CACHE: {len(sistema.eventos):,} eventos")
+    print("-" * 74)
+    print(f"{'Consulta':<42} {'sem cache':>10} {'com cache':>10} {'acertos':>8}")
+    print("-" * 74)
+    
+    for nome, consulta in consultas_publicas(sistema, random.Random(semente)).items():
+        sistema.cache = None
+        sem_cache = medir_consulta(consulta)
+        # Mesma sequência de argumentos sorteados: primeiro aquece, depois mede
+        sistema.cache = cache
+        antes = cache.metricas()['acertos']
+        medir_consulta(consulta)
+        com_cache = medir_consulta(consulta)
+        acertos = (cache.metricas()['acertos'] - antes) / max(com_cache['repeticoes'] * 2, 1)
+        print(f"{nome:<42} {sem_cache['p50_us']:>8.1f}µs {com_cache['p50_us']:>8.1f}µs {acertos:>8.0%}")
+
+# =============================================================================
+# INSTRUMENTAÇÃO: CUSTO DESATIVADA, ATIVADA E COM PERFIL
+# =============================================================================
+
+def benchmark_instrumentacao(total_eventos=100_000, operacoes=20_000, rodadas=3):
+    """Carga mista sem instrumentação, com métricas, com amostragem de memória e com cProfile"""
+    sistema = SistemaFutebolFeminino()
+    gerar_temporada(sistema, **dimensoes_para_eventos(total_eventos))
+    print(f"\n⏱️  INSTRUMENTAÇÃO: {operacoes:,} operações, {total_eventos:,} eventos "
+          f"(melhor de {rodadas} rodadas)")
+    print("-" * 60)
+    
+    def ativar(amostragem, perfil=False):
+        instrumentacao = sistema.ativar_instrumentacao(amostragem)
+        if perfil:
+            instrumentacao.iniciar_perfil()
+    
+    modos = (
+        ('desativada', None),
+        ('métricas', lambda: ativar(0)),
+        ('métricas + memória (1/1000)', lambda: ativar(1000)),
+        ('métricas + cProfile', lambda: ativar(0, perfil=True))
+    )
+    # Rodadas intercaladas: variações da máquina afetam todos os modos igualmente
+    melhores = {nome: float('inf') for nome, _ in modos}
+    for rodada in range(rodadas):
+        for nome, preparar in modos:
+            if preparar:
+                preparar()
+            melhores[nome] = min(melhores[nome], carga_mista(sistema, operacoes, 0.05, semente=rodada))
+            if nome != 'desativada':
+                instrumentacao = sistema.instrumentacao
+                sistema.desativar_instrumentacao()
+    
+    base = melhores['desativada']
+    for nome, duracao in melhores.items():
+        print(f"{nome:<28} {operacoes / duracao:>10,.0f} ops/s  ({duracao / base - 1:+.1%})")
+    
+    print(f"\n{'método':<32} {'chamadas':>9} {'média':>10} {'linhas':>10}")
+    for metodo, dados in instrumentacao.mais_demoradas(8):
+        print(f"{metodo:<32} {dados['chamadas']:>9,} {dados['latencia']['media'] * 1e6:>8.1f}µs "
+              f"{dados['linhas_examinadas']:>10,}")
+
+# =============================================================================
+# LINHA DO TEMPO E HISTOGRAMAS POR FAIXA DE MINUTOS
+# =============================================================================
+
+def benchmark_linha_do_tempo(total_eventos=1_000_000, consultas=20_000, fracao_lances=0.05):
+    """Linha do tempo (montagem x linha guardada, com lances ao vivo) e histogramas por faixa de minutos"""
+    sistema = SistemaFutebolFeminino()
+    gerar_temporada(sistema, **dimensoes_para_eventos(total_eventos))
+    sistema.cache = None
+    partidas = [partida['id'] for partida in sistema.partidas]
+    print(f"\n🕒 LINHA DO TEMPO: {len(sistema.eventos):,} eventos, {len(partidas):,} partidas")
+    print("-" * 60)
+    
+    inicio = time.perf_counter()
+    for partida_id in partidas:
+        sistema.linha_do_tempo(partida_id)
+    montagem = (time.perf_counter() - inicio) / len(partidas)
+    print(f"{'montagem (1ª consulta)':<34} {montagem * 1e6:>10.1f} µs/partida")
+    
+    # Páginas ao vivo: poucas partidas consultadas sem parar enquanto recebem lances
+    aleatorio = random.Random(2024)
+    ao_vivo = partidas[-20:]
+    jogadoras = [jogadora['id'] for jogadora in sistema.jogadoras]
+    lances = 0
+    inicio = time.perf_counter()
+    for _ in range(consultas):
+        if aleatorio.random() < fracao_lances:
+            sistema.registrar_evento(aleatorio.choice(ao_vivo), aleatorio.choice(jogadoras),
+                                     aleatorio.choice(TIPOS_EVENTO), aleatorio.randint(1, 95))
+            lances += 1
+        else:
+            sistema.linha_do_tempo(aleatorio.choice(ao_vivo))
+    duracao = time.perf_counter() - inicio
+    print(f"{'ao vivo (' + format(lances, ',') + ' lances)':<34} {(consultas - lances) / duracao:>10,.0f} consultas/s")
+    
+    print(f"\n{'histograma':<14} {'laço':>10} {'colunar':>10}")
+    laco = {}
+    for agrupar in ('jogadora', 'clube', 'campeonato'):
+        inicio = time.perf_counter()
+        laco[agrupar] = (sistema.histograma_minutos(agrupar), time.perf_counter() - inicio)
+    with sistema.eventos_em_colunas():
+        for agrupar, (esperado, segundos) in laco.items():
+            inicio = time.perf_counter()
+            resultado = sistema.histograma_minutos(agrupar)
+            colunar = time.perf_counter() - inicio
+            print(f"{agrupar:<14} {segundos * 1000:>8.1f}ms {colunar * 1000:>8.1f}ms  "
+                  f"{'idêntico' if resultado == esperado else 'DIVERGENTE'}")
+    
+    inicio = time.perf_counter()
+    distribuicao = sistema.distribuicao_primeiro_gol()
+    print(f"\nprimeiro gol ({distribuicao['partidas']:,} partidas): {(time.perf_counter() - inicio) * 1000:.1f}ms")
+
+# =============================================================================
+# PLACARES DERIVADOS DOS GOLS: EM LOTE X INCREMENTAL
+# =============================================================================
+
+def benchmark_placares(total_eventos=1_000_000, gols=20_000, tamanho_lote=500):
+    """Reconciliação em lote, gols ao vivo incrementais e conferência com a varredura por partida"""
+    sistema = SistemaFutebolFeminino()
+    gerar_temporada(sistema, **dimensoes_para_eventos(total_eventos))
+    print(f"\n🥅 PLACARES: {len(sistema.eventos):,} eventos, {len(sistema.partidas):,} partidas")
+    print("-" * 60)
+    
+    inicio = time.perf_counter()
+    relatorio = sistema.reconciliar_placares()
+    duracao = time.perf_counter() - inicio
+    print(f"{'reconciliação em lote':<26} {duracao:>8.2f}s  {len(sistema.eventos) / duracao:>12,.0f} eventos/s")
+    print(f"{'divergências':<26} {len(relatorio['divergencias']):>8,}")
+    
+    # Gols ao vivo em micro-lotes: cada um soma 1 ao placar derivado da partida
+    novos = eventos_ao_vivo(sistema, gols)
+    for evento in novos:
+        evento['tipo'] = EVENTO_GOL
+    registros = [Evento(gerar_id(), evento['partida_id'], evento['jogadora_id'], evento['tipo'], evento['minuto'])
+                 for evento in novos]
+    inicio = time.perf_counter()
+    for posicao in range(0, len(registros), tamanho_lote):
+        sistema.adicionar_registros('eventos', registros[posicao:posicao + tamanho_lote])
+    incremental = time.perf_counter() - inicio
+    print(f"{'gol ao vivo (cadastro)':<26} {incremental / gols * 1e6:>8.2f}µs por gol")
+    
+    # Sem o placar derivado, cada partida alterada exigiria varrer todos os eventos
+    amostra = list(dict.fromkeys(evento['partida_id'] for evento in novos))[:20]
+    inicio = time.perf_counter()
+    for partida_id in amostra:
+        sum(1 for evento in sistema.eventos if evento['partida_id'] == partida_id and evento['tipo'] == EVENTO_GOL)
+    varredura = (time.perf_counter() - inicio) / len(amostra)
+    print(f"{'varredura por partida':<26} {varredura * 1e6:>8,.0f}µs por gol")
+    
+    derivados = {partida['id']: sistema.placar_derivado(partida['id']) for partida in sistema.partidas}
+    sistema.reconciliar_placares()
+    identico = derivados == {partida['id']: sistema.placar_derivado(partida['id']) for partida in sistema.partidas}
+    print(f"{'incremental x lote':<26} {'idêntico' if identico else 'DIVERGENTE':>8}")
+
+
+def benchmark_transferencias(total_eventos=1_000_000, transferencias=20_000, amostra=2_000):
+    """Gols por clube e temporada com o histórico de transferências x varredura das transferências por gol"""
+    sistema = SistemaFutebolFeminino()
+    gerar_temporada(sistema, **dimensoes_para_eventos(total_eventos))
+    aleatorio = random.Random(2024)
+    datas = sorted(partida['data'] for partida in sistema.partidas)
+    clubes = [clube['id'] for clube in sistema.clubes]
+    print(f"\n🔁 TRANSFERÊNCIAS: {len(sistema.eventos):,} eventos, {transferencias:,} transferências")
+    print("-" * 60)
+    
+    # Transferências em datas aleatórias da temporada (algumas retroativas, fora de ordem)
+    inicio = time.perf_counter()
+    for _ in range(transferencias):
+        jogadora = aleatorio.choice(sistema.jogadoras)
+        sistema.registrar_transferencia(jogadora['id'], aleatorio.choice(clubes), aleatorio.choice(datas))
+    duracao = time.perf_counter() - inicio
+    print(f"{'cadastro':<26} {duracao / transferencias * 1e6:>8.2f}µs por transferência")
+    
+    inicio = time.perf_counter()
+    totais = sistema.gols_por_clube()
+    duracao = time.perf_counter() - inicio
+    print(f"{'gols por clube (1 passada)':<26} {duracao:>8.2f}s  {len(sistema.eventos) / duracao:>12,.0f} eventos/s")
+    
+    # Sem o índice por jogadora: cada gol procura a última transferência da jogadora até a data da partida
+    gols = [evento for evento in sistema.eventos if evento['tipo'] == EVENTO_GOL]
+    gols = aleatorio.sample(gols, min(amostra, len(gols)))
+    inicio = time.perf_counter()
+    for evento in gols:
+        data = sistema.buscar_partida_por_id(evento['partida_id'])['data']
+        anteriores = [transferencia for transferencia in sistema.transferencias
+                      if transferencia['jogadora_id'] == evento['jogadora_id'] and transferencia['data'] <= data]
+        max(anteriores, key=lambda transferencia: transferencia['data'], default=None)
+    varredura = (time.perf_counter() - inicio) / len(gols)
+    inicio = time.perf_counter()
+    for evento in gols:
+        sistema.clube_da_jogadora(evento['jogadora_id'], sistema.buscar_partida_por_id(evento['partida_id'])['data'])
+    indice = (time.perf_counter() - inicio) / len(gols)
+    print(f"{'clube na data (índice)':<26} {indice * 1e6:>8.2f}µs por gol")
+    print(f"{'varredura por gol':<26} {varredura * 1e6:>8,.0f}µs por gol")
+    
+    # Conferência: a passada agrupada bate com a atribuição gol a gol
+    temporadas = {campeonato['id']: campeonato['temporada'] for campeonato in sistema.campeonatos}
+    conferencia = {}
+    for evento in sistema.eventos:
+        if evento['tipo'] == EVENTO_GOL:
+            partida = sistema.buscar_partida_por_id(evento['partida_id'])
+            clube_id = sistema.clube_da_jogadora(evento['jogadora_id'], partida['data'])
+            por_clube = conferencia.setdefault(temporadas[partida['campeonato_id']], {})
+            por_clube[clube_id] = por_clube.get(clube_id, 0) + 1
+    print(f"{'passada x gol a gol':<26} {'idêntico' if totais == conferencia else 'DIVERGENTE':>8}")
+
+# =============================================================================
+# LINHA DE COMANDO: UM PROCESSO POR CONSULTA X BATCH
+# =============================================================================
+
+def benchmark_cli(total_eventos=100_000, quantidade=20):
+    """Compara consultas em processos separados com o mesmo lote num único processo"""
+    with tempfile.TemporaryDirectory() as diretorio:
+        caminho_dados = os.path.join(diretorio, 'dados.db')
+        armazenamento = abrir_armazenamento(caminho_dados)
+        sistema = SistemaFutebolFeminino(armazenamento)
+        gerar_temporada(sistema, **dimensoes_para_eventos(total_eventos))
+        jogadoras = [jogadora['id'] for jogadora in sistema.jogadoras]
+        armazenamento.fechar()
+        
+        aleatorio = random.Random(2024)
+        consultas = [
+            aleatorio.choice([f"stats {aleatorio.choice(jogadoras)}", "ranking gols",
+                              f"search {aleatorio.choice(PRIMEIROS_NOMES).lower()}"])
+            for _ in range(quantidade)
+        ]
+        caminho_lote = os.path.join(diretorio, 'consultas.txt')
+        with open(caminho_lote, 'w', encoding='utf-8') as arquivo:
+            arquivo.write('\n'.join(consultas) + '\n')
+        
+        cli = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'cli.py')
+        comando = [sys.executable, cli, '--dados', caminho_dados]
+        print(f"\n💻 CLI: {quantidade} consultas, {total_eventos:,} eventos")
+        print("-" * 60)
+        inicio = time.perf_counter()
+        for consulta in consultas:
+            subprocess.run(comando + consulta.split(), check=True, stdout=subprocess.DEVNULL)
+        separados = time.perf_counter() - inicio
+        
+        inicio = time.perf_counter()
+        subprocess.run(comando + ['batch', caminho_lote], check=True, stdout=subprocess.DEVNULL)
+        lote = time.perf_counter() - inicio
+    
+    print(f"um processo por consulta: {separados:>8.2f}s ({separados / quantidade * 1000:,.0f} ms/consulta)")
+    print(f"batch (um processo):      {lote:>8.2f}s ({lote / quantidade * 1000:,.0f} ms/consulta)")
+    print(f"speedup:                  {separados / lote:>8.2f}x")
+
+# =============================================================================
+# INICIALIZAÇÃO: IMPORTAÇÃO E TEMPO ATÉ A PRIMEIRA CONSULTA
+# =============================================================================
+
+DIRETORIO = os.path.dirname(os.path.abspath(__file__))
+
+# Executado num processo novo: cada etapa medida desde o início do interpretador
+SCRIPT_PRIMEIRA_CONSULTA = """
+import json, sys, time
+inicio = time.perf_counter()
+from persistencia import abrir_armazenamento
+from plataforma_futebol_feminino import SistemaFutebolFeminino
+tempos = {'importacao': time.perf_counter() - inicio}
+sistema = SistemaFutebolFeminino(abrir_armazenamento(sys.argv[1]), preguicoso=sys.argv[2] == 'sim')
+tempos['inicializacao'] = time.perf_counter() - inicio
+sistema.calcular_estatisticas_jogadora(sys.argv[3])
+tempos['estatisticas_jogadora'] = time.perf_counter() - inicio
+sistema.resumo_partida(sys.argv[4])
+tempos['resumo_partida'] = time.perf_counter() - inicio
+sistema.buscar_jogadora_por_id(sys.argv[3])
+tempos['buscar_jogadora'] = time.perf_counter() - inicio
+sistema.obter_ranking('gols', 10)
+tempos['ranking'] = time.perf_counter() - inicio
+print(json.dumps(tempos))
+"""
+
+
+def tempos_de_importacao(modulo='plataforma_futebol_feminino'):
+    """Tempo total e os módulos mais lentos segundo python -X importtime (microssegundos)"""
+    resultado = subprocess.run([sys.executable, '-X', 'importtime', '-c', f"import {modulo}"],
+                               check=True, capture_output=True, text=True, cwd=DIRETORIO)
+    modulos = []
+    # Linhas no formato "import time: próprio | acumulado | módulo"
+    for linha in resultado.stderr.splitlines():
+        partes = linha.split('|')
+        if len(partes) != 3 or not partes[0].strip().split(':')[-1].strip().isdigit():
+            continue
+        modulos.append((int(partes[0].split(':')[-1]), int(partes[1]), partes[2].strip()))
+    total = sum(proprio for proprio, _, _ in modulos)
+    return total, sorted(modulos, reverse=True)[:5]
+
+
+def preparar_banco(caminho, total_eventos):
+    """Grava uma temporada sintética no banco SQLite (reaproveita o arquivo se já existir)"""
+    if os.path.exists(caminho):
+        return False
+    armazenamento = abrir_armazenamento(caminho)
+    try:
+        gravar_temporada(armazenamento, **dimensoes_para_eventos(total_eventos))
+    finally:
+        armazenamento.fechar()
+    return True
+
+
+def benchmark_inicializacao(total_eventos=10_000_000, banco=None, completo=False):
+    """Importação e tempo até a primeira consulta com carregamento sob demanda (e completo)"""
+    with tempfile.TemporaryDirectory() as diretorio:
+        caminho = banco or os.path.join(diretorio, 'inicializacao.db')
+        print(f"\n🚀 INICIALIZAÇÃO: {total_eventos:,} eventos ({caminho})")
+        print("-" * 60)
+        inicio = time.perf_counter()
+        if preparar_banco(caminho, total_eventos):
+            print(f"banco gerado em {time.perf_counter() - inicio:.1f}s "
+                  f"({os.path.getsize(caminho) / 1024 ** 2:,.0f} MB)")
+        
+        total, mais_lentos = tempos_de_importacao()
+        print(f"\npython -X importtime: {total / 1000:.1f} ms no total")
+        for proprio, acumulado, modulo in mais_lentos:
+            print(f"  {modulo:<32} {proprio / 1000:>7.1f} ms (acumulado {acumulado / 1000:.1f} ms)")
+        
+        dimensoes = dimensoes_para_eventos(total_eventos)
+        jogadora_id = f"jog_s{0:07d}"
+        partida_id = f"part_s{dimensoes['partidas'] - 1:07d}"
+        modos = [('sob demanda', 'sim')] + ([('completo', 'nao')] if completo else [])
+        for nome, preguicoso in modos:
+            inicio = time.perf_counter()
+            resultado = subprocess.run(
+                [sys.executable, '-c', SCRIPT_PRIMEIRA_CONSULTA, caminho, preguicoso, jogadora_id, partida_id],
+                check=True, capture_output=True, text=True, cwd=DIRETORIO
+            )
+            processo = time.perf_counter() - inicio
+            tempos = json.loads(resultado.stdout.splitlines()[-1])
+            print(f"\ncarregamento {nome} (tempo acumulado desde o início do processo):")
+            for etapa, segundos in tempos.items():
+                print(f"  {etapa:<24} {segundos * 1000:>10,.1f} ms")
+            print(f"  {'processo inteiro':<24} {processo * 1000:>10,.1f} ms")
+        
+        comando = [sys.executable, os.path.join(DIRETORIO, 'cli.py'), '--dados', caminho, 'stats', jogadora_id]
+        inicio = time.perf_counter()
+        subprocess.run(comando, check=True, stdout=subprocess.DEVNULL)
+        print(f"\ncli.py stats {jogadora_id}: {(time.perf_counter() - inicio) * 1000:,.1f} ms")
+
+# =============================================================================
+# EXPORTAÇÃO EM FLUXO: TEMPO E MEMÓRIA POR TAMANHO
+# =============================================================================
+
+# Executado num processo novo para medir o pico de memória só da exportação
+SCRIPT_EXPORTACAO = """
+import resource, sys, time
+from exportacao import main
+inicio = time.perf_counter()
+main(sys.argv[1:])
+pico = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+print(time.perf_counter() - inicio, pico / 1024 if sys.platform != 'darwin' else pico / 1024 ** 2, file=sys.stderr)
+"""
+
+
+def medir_exportacao(argumentos):
+    """Executa a exportação num processo novo: (segundos, pico de memória em MB)"""
+    resultado = subprocess.run([sys.executable, '-c', SCRIPT_EXPORTACAO, *argumentos],
+                               check=True, capture_output=True, text=True, cwd=DIRETORIO)
+    segundos, pico = resultado.stderr.split()[-2:]
+    return float(segundos), float(pico)
+
+
+def benchmark_exportacao(tamanhos=(100_000, 1_000_000), processos=2, diretorio_bancos=None):
+    """Exportação de eventos e estatísticas em CSV/JSONL: vazão e pico de memória por tamanho"""
+    if resource is None:
+        print("Benchmark de exportação indisponível (módulo resource ausente)")
+        return
+    
+    with tempfile.TemporaryDirectory() as diretorio:
+        print("\n📤 EXPORTAÇÃO EM FLUXO")
+        print("-" * 72)
+        print(f"{'eventos':>12} {'exportação':<34} {'tempo':>8} {'linhas/s':>10} {'pico':>8}")
+        for total_eventos in tamanhos:
+            banco = os.path.join(diretorio_bancos or diretorio, f"exportacao_{total_eventos}.db")
+            # Banco gerado noutro processo: o pico de memória da geração não contamina as medições
+            geracao = multiprocessing.Process(target=preparar_banco, args=(banco, total_eventos))
+            geracao.start()
+            geracao.join()
+            saida = os.path.join(diretorio, 'saida')
+            casos = [
+                ('eventos → csv', ['eventos', saida + '.csv'], total_eventos),
+                ('eventos → jsonl', ['eventos', saida + '.jsonl'], total_eventos),
+                ('estatisticas → csv', ['estatisticas', saida + '.csv'], None),
+                (f'eventos por campeonato ({processos} proc.)',
+                 ['eventos', saida, '--por-campeonato', '--processos', str(processos)], total_eventos)
+            ]
+            for nome, argumentos, linhas in casos:
+                segundos, pico = medir_exportacao([banco, *argumentos])
+                vazao = f"{linhas / segundos:,.0f}" if linhas else '-'
+                print(f"{total_eventos:>12,} {nome:<34} {segundos:>7.1f}s {vazao:>10} {pico:>5.0f} MB")
+
+# =============================================================================
+# SUÍTE DE CONSULTAS POR TAMANHO DE TEMPORADA
+# =============================================================================
+
+def consultas_publicas(sistema, aleatorio):
+    """Consultas públicas do sistema, cada uma sorteando seus argumentos"""
+    jogadoras = [jogadora['id'] for jogadora in sistema.jogadoras]
+    clubes = [clube['id'] for clube in sistema.clubes]
+    partidas = [partida['id'] for partida in sistema.partidas]
+    campeonatos = [campeonato['id'] for campeonato in sistema.campeonatos]
+    datas = sorted({partida['data'] for partida in sistema.partidas})
+    termos = [nome.lower()[:4] for nome in PRIMEIROS_NOMES + SOBRENOMES]
+    
+    return {
+        'calcular_estatisticas_jogadora': lambda: sistema.calcular_estatisticas_jogadora(aleatorio.choice(jogadoras)),
+        'calcular_estatisticas_jogadora[campeonato]': lambda: sistema.calcular_estatisticas_jogadora(
+            aleatorio.choice(jogadoras), campeonato_id=aleatorio.choice(campeonatos)),
+        'calcular_estatisticas_jogadora[ultimas=5]': lambda: sistema.calcular_estatisticas_jogadora(
+            aleatorio.choice(jogadoras), ultimas=5),
+        'calcular_estatisticas_todas[periodo]': lambda: sistema.calcular_estatisticas_todas(
+            data_inicio=aleatorio.choice(datas[-7:])),
+        'obter_ranking_gols': lambda: sistema.obter_ranking_gols(10),
+        'obter_ranking_assistencias': lambda: sistema.obter_ranking_assistencias(10),
+        'obter_ranking[cartoes]': lambda: sistema.obter_ranking('cartoes', 10),
+        'buscar_jogadora_por_id': lambda: sistema.buscar_jogadora_por_id(aleatorio.choice(jogadoras)),
+        'buscar_clube_por_id': lambda: sistema.buscar_clube_por_id(aleatorio.choice(clubes)),
+        'buscar_jogadoras_por_nome': lambda: sistema.buscar_jogadoras_por_nome(aleatorio.choice(termos)),
+        'buscar[10]': lambda: sistema.buscar(aleatorio.choice(termos), 10),
+        'listar_jogadoras_do_clube': lambda: sistema.listar_jogadoras_do_clube(aleatorio.choice(clubes)),
+        'listar_eventos_da_partida': lambda: sistema.listar_eventos_da_partida(aleatorio.choice(partidas)),
+        'resumo_partida': lambda: sistema.resumo_partida(aleatorio.choice(partidas)),
+        'resumo_partidas': sistema.resumo_partidas,
+        'linha_do_tempo': lambda: sistema.linha_do_tempo(aleatorio.choice(partidas)),
+        'histograma_minutos[clube]': lambda: sistema.histograma_minutos('clube'),
+        'distribuicao_primeiro_gol[campeonato]': lambda: sistema.distribuicao_primeiro_gol(
+            aleatorio.choice(campeonatos)),
+        'obter_classificacao': lambda: sistema.obter_classificacao(aleatorio.choice(campeonatos)),
+        'obter_classificacao[data]': lambda: sistema.obter_classificacao(
+            aleatorio.choice(campeonatos), aleatorio.choice(datas)),
+        'reconstruir_estatisticas': sistema.reconstruir_estatisticas,
+        'verificar_consistencia_estatisticas': sistema.verificar_consistencia_estatisticas
+    }
+
+
+def medir_consulta(consulta):
+    """Executa a consulta repetidas vezes e retorna p50/p99 (µs) e vazão (ops/s)"""
+    latencias = []
+    inicio = time.perf_counter()
+    while (len(latencias) < REPETICOES_MINIMAS or
+           (len(latencias) < REPETICOES_MAXIMAS and time.perf_counter() - inicio < TEMPO_POR_CONSULTA)):
+        antes = time.perf_counter_ns()
+        consulta()
+        latencias.append(time.perf_counter_ns() - antes)
+    
+    latencias.sort()
+    return {
+        'p50_us': percentil(latencias, 0.50) / 1000,
+        'p99_us': percentil(latencias, 0.99) / 1000,
+        'ops_s': len(latencias) / (sum(latencias) / 1e9),
+        'repeticoes': len(latencias)
+    }
+
+
+def executar_tamanho(total_eventos, semente=2024):
+    """Gera uma temporada com ~total_eventos e mede todas as consultas públicas"""
+    sistema = SistemaFutebolFeminino()
+    # Sem o cache de consultas: cada repetição mede a consulta, não um acerto no cache
+    # (a latência dos acertos é medida à parte, no benchmark cache_latencia)
+    sistema.cache = None
+    inicio = time.perf_counter()
+    dimensoes = gerar_temporada(sistema, semente=semente, **dimensoes_para_eventos(total_eventos))
+    geracao = time.perf_counter() - inicio
+    
+    aleatorio = random.Random(semente)
+    resultados = {nome: medir_consulta(consulta)
+                  for nome, consulta in consultas_publicas(sistema, aleatorio).items()}
+    return {
+        'dimensoes': dimensoes,
+        'geracao_s': geracao,
+        'memoria_pico_mb': memoria_pico_mb(),
+        'consultas': resultados
+    }
+
+
+def exibir_resultado_tamanho(total_eventos, resultado, baseline=None, tolerancia=TOLERANCIA_REGRESSAO):
+    """Exibe a tabela de um tamanho e retorna as consultas que regrediram"""
+    dimensoes = resultado['dimensoes']
+    memoria = resultado['memoria_pico_mb']
+    print(f"\n📈 {total_eventos:,} EVENTOS ({dimensoes['eventos']:,} gerados, "
+          f"{dimensoes['jogadoras']:,} jogadoras, {dimensoes['partidas']:,} partidas)")
+    print(f"   geração: {resultado['geracao_s']:.1f}s | pico de memória: "
+          f"{f'{memoria:.0f} MB' if memoria is not None else 'N/A'}")
+    print("-" * 90)
+    print(f"{'Consulta':<38} {'p50 (µs)':>12} {'p99 (µs)':>12} {'ops/s':>12}  Baseline")
+    print("-" * 90)
+    
+    regressoes = []
+    for nome, medida in resultado['consultas'].items():
+        comparacao = ""
+        anterior = (baseline or {}).get(nome)
+        if anterior:
+            razao = medida['p50_us'] / max(anterior['p50_us'], 1e-9)
+            comparacao = f"{razao:.2f}x"
+            if razao > tolerancia:
+                comparacao += " ⚠️  REGRESSÃO"
+                regressoes.append(nome)
+        print(f"{nome:<38} {medida['p50_us']:>12.1f} {medida['p99_us']:>12.1f} "
+              f"{medida['ops_s']:>12,.0f}  {comparacao}")
+    return regressoes
+
+
+def benchmark_consultas(tamanhos=TAMANHOS_PADRAO, arquivo_baseline=ARQUIVO_BASELINE,
+                        salvar_baseline=False, tolerancia=TOLERANCIA_REGRESSAO):
+    """Mede as consultas em cada tamanho e compara com a baseline gravada"""
+    baseline = {}
+    if os.path.exists(arquivo_baseline):
+        with open(arquivo_baseline, encoding='utf-8') as arquivo:
+            baseline = json.load(arquivo)
+    
+    resultados = {}
+    regressoes = []
+    for total_eventos in tamanhos:
+        # Processo novo por tamanho: pico de memória isolado e nenhum resíduo do anterior
+        with multiprocessing.Pool(1) as processo:
+            resultado = processo.apply(executar_tamanho, (total_eventos,))
+        resultados[str(total_eventos)] = resultado
+        anteriores = baseline.get(str(total_eventos), {}).get('consultas')
+        regressoes += [f"{nome} @ {total_eventos:,}" for nome in
+                       exibir_resultado_tamanho(total_eventos, resultado, anteriores, tolerancia)]
+    
+    if salvar_baseline:
+        baseline.update(resultados)
+        with open(arquivo_baseline, 'w', encoding='utf-8') as arquivo:
+            json.dump(baseline, arquivo, indent=2)
+        print(f"\n💾 Baseline gravada em {arquivo_baseline}")
+    
+    if regressoes:
+        print(f"\n⚠️  {len(regressoes)} regressão(ões) acima de {tolerancia}x:")
+        for regressao in regressoes:
+            print(f"   • {regressao}")
+    return resultados, regressoes
+
+# =============================================================================
+# EXECUÇÃO PRINCIPAL
+# =============================================================================
+
+def main(argumentos=None):
+    """Ponto de entrada dos benchmarks"""
+    parser = argparse.ArgumentParser(description="Benchmarks da plataforma")
+    subcomandos = parser.add_subparsers(dest='benchmark', required=True)
+    
+    memoria = subcomandos.add_parser('memoria', help="dicionários x registros compactos")
+    memoria.add_argument('--eventos', type=int, default=1_000_000)
+    
+    login = subcomandos.add_parser('login', help="vazão de login sequencial x concorrente")
+    login.add_argument('--usuarios', type=int, default=20)
+    login.add_argument('--logins', type=int, default=200)
+    login.add_argument('--threads', type=int, default=8)
+    
+    ids = subcomandos.add_parser('ids', help="vazão de gerar_id")
+    ids.add_argument('--quantidade', type=int, default=1_000_000)
+    ids.add_argument('--threads', type=int, default=4)
+    
+    busca = subcomandos.add_parser('busca', help="índice de busca x varredura linear")
+    busca.add_argument('--nomes', type=int, default=1_000_000)
+    
+    api = subcomandos.add_parser('api', help="teste de carga da API HTTP")
+    api.add_argument('--conexoes', type=int, default=1000)
+    api.add_argument('--requisicoes', type=int, default=50_000)
+    api.add_argument('--eventos', type=int, default=100_000,
+                     help="tamanho da temporada sintética do servidor local")
+    api.add_argument('--url', help="servidor já em execução (padrão: inicia um servidor local)")
+    
+    ingestao = subcomandos.add_parser('ingestao', help="vazão e latência da ingestão contínua")
+    ingestao.add_argument('--eventos', type=int, default=200_000)
+    ingestao.add_argument('--taxa', type=int, default=20_000, help="eventos por segundo (0 = máximo)")
+    
+    paralelo = subcomandos.add_parser('paralelo', help="speedup do recálculo em vários processos")
+    paralelo.add_argument('--eventos', type=int, default=1_000_000)
+    paralelo.add_argument('--processos', type=int, nargs='+', default=[1, 2, 4, 8])
+    
+    cache = subcomandos.add_parser('cache', help="carga mista de consultas e escritas, sem e com cache")
+    cache.add_argument('--eventos', type=int, default=100_000)
+    cache.add_argument('--operacoes', type=int, default=20_000)
+    cache.add_argument('--escritas', type=float, default=0.05, help="fração de operações que são escritas")
+    
+    cache_latencia = subcomandos.add_parser('cache_latencia', help="latência das consultas sem cache e com acertos")
+    cache_latencia.add_argument('--eventos', type=int, default=100_000)
+    
+    instrumentacao = subcomandos.add_parser('instrumentacao', help="custo da instrumentação e do cProfile")
+    instrumentacao.add_argument('--eventos', type=int, default=100_000)
+    instrumentacao.add_argument('--operacoes', type=int, default=20_000)
+    instrumentacao.add_argument('--rodadas', type=int, default=3)
+    
+    linha_do_tempo = subcomandos.add_parser('linha_do_tempo', help="linha do tempo das partidas e histogramas")
+    linha_do_tempo.add_argument('--eventos', type=int, default=1_000_000)
+    linha_do_tempo.add_argument('--consultas', type=int, default=20_000)
+    linha_do_tempo.add_argument('--lances', type=float, default=0.05, help="fração de operações que são lances")
+    
+    placares = subcomandos.add_parser('placares', help="placares derivados dos gols: lote x incremental")
+    placares.add_argument('--eventos', type=int, default=1_000_000)
+    placares.add_argument('--gols', type=int, default=20_000)
+    placares.add_argument('--lote', type=int, default=500)
+    
+    transferencias = subcomandos.add_parser('transferencias', help="gols por clube com histórico de transferências")
+    transferencias.add_argument('--eventos', type=int, default=1_000_000)
+    transferencias.add_argument('--transferencias', type=int, default=20_000)
+    transferencias.add_argument('--amostra', type=int, default=2_000, help="gols da comparação com a varredura")
+    
+    cli = subcomandos.add_parser('cli', help="consultas em processos separados x batch")
+    cli.add_argument('--eventos', type=int, default=100_000)
+    cli.add_argument('--consultas', type=int, default=20)
+    
+    inicializacao = subcomandos.add_parser('inicializacao', help="importação e tempo até a primeira consulta")
+    inicializacao.add_argument('--eventos', type=int, default=10_000_000)
+    inicializacao.add_argument('--banco', help="arquivo .db a reaproveitar entre execuções (criado se não existir)")
+    inicializacao.add_argument('--completo', action='store_true',
+                               help="mede também o carregamento completo (lento em bancos grandes)")
+    
+    exportacao = subcomandos.add_parser('exportacao', help="vazão e memória da exportação em fluxo")
+    exportacao.add_argument('--eventos', type=int, nargs='+', default=[100_000, 1_000_000])
+    exportacao.add_argument('--processos', type=int, default=2, help="processos da exportação por campeonato")
+    exportacao.add_argument('--diretorio', help="onde guardar (e reaproveitar) os bancos gerados")
+    
+    consultas = subcomandos.add_parser('consultas', help="latência das consultas públicas por tamanho")
+    consultas.add_argument('--tamanhos', type=int, nargs='+', default=list(TAMANHOS_PADRAO),
+                           help="quantidades de eventos (ex: 1000 10000 ... 10000000)")
+    consultas.add_argument('--baseline', default=ARQUIVO_BASELINE)
+    consultas.add_argument('--salvar-baseline', action='store_true')
+    consultas.add_argument('--tolerancia', type=float, default=TOLERANCIA_REGRESSAO)
+    
+    args = parser.parse_args(argumentos)
+    if args.benchmark == 'memoria':
+        benchmark_memoria(args.eventos)
+    elif args.benchmark == 'login':
+        benchmark_login(args.usuarios, args.logins, args.threads)
+    elif args.benchmark == 'ids':
+        benchmark_ids(args.quantidade, args.threads)
+    elif args.benchmark == 'busca':
+        benchmark_busca(args.nomes)
+    elif args.benchmark == 'api':
+        benchmark_api(args.conexoes, args.requisicoes, args.eventos, args.url)
+    elif args.benchmark == 'ingestao':
+        benchmark_ingestao(args.eventos, args.taxa)
+    elif args.benchmark == 'paralelo':
+        benchmark_paralelo(args.eventos, args.processos)
+    elif args.benchmark == 'cache':
+        benchmark_cache(args.eventos, args.operacoes, args.escritas)
+    elif args.benchmark == 'cache_latencia':
+        benchmark_latencia_cache(args.eventos)
+    elif args.benchmark == 'instrumentacao':
+        benchmark_instrumentacao(args.eventos, args.operacoes, args.rodadas)
+    elif args.benchmark == 'linha_do_tempo':
+        benchmark_linha_do_tempo(args.eventos, args.consultas, args.lances)
+    elif args.benchmark == 'placares':
+        benchmark_placares(args.eventos, args.gols, args.lote)
+    elif args.benchmark == 'transferencias':
+        benchmark_transferencias(args.eventos, args.transferencias, args.amostra)
+    elif args.benchmark == 'cli':
+        benchmark_cli(args.eventos, args.consultas)
+    elif args.benchmark == 'inicializacao':
+        benchmark_inicializacao(args.eventos, args.banco, args.completo)
+    elif args.benchmark == 'exportacao':
+        benchmark_exportacao(args.eventos, args.processos, args.diretorio)
+    elif args.benchmark == 'consultas':
+        _, regressoes = benchmark_consultas(args.tamanhos, args.baseline,
+                                            args.salvar_baseline, args.tolerancia)
+        if regressoes:
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,179 @@
+"""
+Classificação dos campeonatos da Plataforma de Estatísticas do Futebol Feminino
+
+Mantém, para cada campeonato, pontos, jogos, vitórias, empates, derrotas,
+gols pró, gols contra e saldo de cada clube. Cada partida finalizada soma
+apenas a sua contribuição (sem percorrer as outras partidas). Depois de cada
+rodada (data) a tabela é guardada num retrato, então "classificação na data X"
+é uma busca binária nas datas das rodadas.
+
+Critérios de desempate, em ordem: pontos, vitórias, saldo de gols, gols pró,
+confronto direto (pontos nos jogos entre as equipes empatadas) e nome do clube.
+"""
+
+import bisect
+
+PONTOS_VITORIA = 3
+PONTOS_EMPATE = 1
+
+# Contadores de cada linha da tabela, na ordem em que são guardados nos retratos
+CAMPOS_LINHA = ('pontos', 'jogos', 'vitorias', 'empates', 'derrotas', 'gols_pro', 'gols_contra')
+
+LINHA_VAZIA = (0,) * len(CAMPOS_LINHA)
+
+
+def contribuicao(gols_pro, gols_contra):
+    """Contadores que uma partida soma à linha de um clube"""
+    if gols_pro > gols_contra:
+        return (PONTOS_VITORIA, 1, 1, 0, 0, gols_pro, gols_contra)
+    if gols_pro == gols_contra:
+        return (PONTOS_EMPATE, 1, 0, 1, 0, gols_pro, gols_contra)
+    return (0, 1, 0, 0, 1, gols_pro, gols_contra)
+
+
+def somar_linha(retrato, clube_id, valores, sinal):
+    """Soma (ou subtrai, com sinal -1) contadores à linha de um clube"""
+    atual = retrato.get(clube_id, LINHA_VAZIA)
+    retrato[clube_id] = tuple(total + sinal * valor for total, valor in zip(atual, valores))
+
+
+def resultado_da_partida(partida):
+    """Resultado usado na tabela: (data, casa, fora, gols_casa, gols_fora)"""
+    return (partida['data'], partida['clube_casa_id'], partida['clube_fora_id'],
+            partida['placar_casa'], partida['placar_fora'])
+
+
+class TabelaCampeonato:
+    """Tabela de um campeonato com um retrato por rodada"""
+    
+    def __init__(self):
+        self.datas = []        # datas das rodadas, em ordem
+        self.retratos = []     # por rodada: clube_id -> contadores acumulados até a data
+        self.ordenadas = {}    # posição da rodada -> tabela já ordenada (cache)
+        self.confrontos = {}   # (clube_a, clube_b) -> {partida_id: resultado}
+    
+    def aplicar(self, partida_id, resultado, sinal=1):
+        """Soma (sinal 1) ou retira (sinal -1) o resultado de uma partida"""
+        data, casa, fora, gols_casa, gols_fora = resultado
+        
+        # Busca binária: rodada da partida (cria o retrato se a data for nova)
+        posicao = bisect.bisect_left(self.datas, data)
+        if posicao == len(self.datas) or self.datas[posicao] != data:
+            anterior = self.retratos[posicao - 1] if posicao else {}
+            self.datas.insert(posicao, data)
+            self.retratos.insert(posicao, dict(anterior))
+        
+        # Caso comum (rodada mais recente): só o último retrato muda
+        for retrato in self.retratos[posicao:]:
+            somar_linha(retrato, casa, contribuicao(gols_casa, gols_fora), sinal)
+            somar_linha(retrato, fora, contribuicao(gols_fora, gols_casa), sinal)
+        for indice in [indice for indice in self.ordenadas if indice >= posicao]:
+            del self.ordenadas[indice]
+        
+        par = tuple(sorted((casa, fora)))
+        if sinal > 0:
+            self.confrontos.setdefault(par, {})[partida_id] = resultado
+        else:
+            self.confrontos.get(par, {}).pop(partida_id, None)
+    
+    def pontos_confronto_direto(self, clubes, data):
+        """Pontos de cada clube nos jogos entre os clubes informados até a data"""
+        pontos = dict.fromkeys(clubes, 0)
+        lista = sorted(clubes)
+        for i, clube_a in enumerate(lista):
+            for clube_b in lista[i + 1:]:
+                for data_jogo, casa, fora, gols_casa, gols_fora in self.confrontos.get((clube_a, clube_b), {}).values():
+                    if data is None or data_jogo <= data:
+                        pontos[casa] += contribuicao(gols_casa, gols_fora)[0]
+                        pontos[fora] += contribuicao(gols_fora, gols_casa)[0]
+        return pontos
+    
+    def tabela(self, data=None, nome_clube=str):
+        """Classificação ordenada na data (ou atual): lista de dicionários"""
+        # Busca binária: último retrato com data <= data pedida
+        posicao = len(self.datas) if data is None else bisect.bisect_right(self.datas, data)
+        if posicao == 0:
+            return []
+        indice = posicao - 1
+        if indice in self.ordenadas:
+            return self.ordenadas[indice]
+        
+        retrato = self.retratos[indice]
+        linhas = []
+        for clube_id, valores in retrato.items():
+            linha = {'posicao': 0, 'clube_id': clube_id}
+            linha.update(zip(CAMPOS_LINHA, valores))
+            if not linha['jogos']:
+                continue
+            linha['saldo'] = linha['gols_pro'] - linha['gols_contra']
+            linhas.append(linha)
+        
+        def criterio(linha):
+            return (-linha['pontos'], -linha['vitorias'], -linha['saldo'], -linha['gols_pro'])
+        
+        linhas.sort(key=criterio)
+        
+        # Empates nos critérios numéricos: confronto direto e, por fim, nome do clube
+        ordenadas = []
+        inicio = 0
+        while inicio < len(linhas):
+            fim = inicio + 1
+            while fim < len(linhas) and criterio(linhas[fim]) == criterio(linhas[inicio]):
+                fim += 1
+            grupo = linhas[inicio:fim]
+            if len(grupo) > 1:
+                pontos = self.pontos_confronto_direto([linha['clube_id'] for linha in grupo],
+                                                      self.datas[indice])
+                grupo.sort(key=lambda linha: (-pontos[linha['clube_id']], nome_clube(linha['clube_id'])))
+            ordenadas.extend(grupo)
+            inicio = fim
+        
+        for numero, linha in enumerate(ordenadas, 1):
+            linha['posicao'] = numero
+        self.ordenadas[indice] = ordenadas
+        return ordenadas
+
+
+class Classificacoes:
+    """Tabelas de todos os campeonatos, atualizadas partida a partida"""
+    
+    def __init__(self, nome_clube=str):
+        self.nome_clube = nome_clube
+        self.tabelas = {}      # campeonato_id -> TabelaCampeonato
+        self.computadas = {}   # partida_id -> (campeonato_id, resultado) já somado na tabela
+    
+    @classmethod
+    def de_partidas(cls, partidas, nome_clube=str):
+        """Monta as tabelas a partir de uma lista de partidas"""
+        classificacoes = cls(nome_clube)
+        for partida in partidas:
+            classificacoes.aplicar(partida)
+        return classificacoes
+    
+    def aplicar(self, partida):
+        """Atualiza a tabela com o estado atual da partida; retorna True se algo mudou"""
+        anterior = self.computadas.get(partida['id'])
+        atual = (partida['campeonato_id'], resultado_da_partida(partida)) if partida['finalizada'] else None
+        if anterior == atual:
+            return False
+        
+        # Correção de placar (ou partida reaberta): retira o resultado antigo antes
+        if anterior:
+            campeonato_id, resultado = anterior
+            self.tabelas[campeonato_id].aplicar(partida['id'], resultado, -1)
+            del self.computadas[partida['id']]
+        if atual:
+            campeonato_id, resultado = atual
+            self.tabelas.setdefault(campeonato_id, TabelaCampeonato()).aplicar(partida['id'], resultado)
+            self.computadas[partida['id']] = atual
+        return True
+    
+    def tabela(self, campeonato_id, data=None):
+        """Classificação do campeonato na data (formato YYYY-MM-DD) ou atual"""
+        tabela = self.tabelas.get(campeonato_id)
+        return tabela.tabela(data, self.nome_clube) if tabela else []
+    
+    def rodadas(self, campeonato_id):
+        """Datas das rodadas já disputadas do campeonato"""
+        tabela = self.tabelas.get(campeonato_id)
+        return list(tabela.datas) if tabela else []
@@ -0,0 +1,292 @@
+"""
+Linha de comando (não interativa) da Plataforma de Estatísticas do Futebol Feminino
+
+Cada comando chama diretamente os métodos do SistemaFutebolFeminino, escreve
+o resultado no stdout (JSON Lines, JSON ou CSV) e termina, sem menus nem
+pausas. O comando batch executa um arquivo com várias consultas num único
+processo, pagando a inicialização e a carga dos dados uma só vez.
+
+Uso:
+    python cli.py [--dados dados.db] [--formato jsonl|json|csv] COMANDO ...
+    python cli.py stats jog_001 jog_002 --temporada 2024 --ultimas 5
+    python cli.py ranking gols --limite 20 --formato csv
+    python cli.py search marta
+    python cli.py compare jog_001 jog_002 --confronto-direto
+    python cli.py classificacao camp_001 --data 2024-04-01
+    python cli.py import eventos eventos.jsonl
+    python cli.py export jogadoras --formato csv > jogadoras.csv
+    python cli.py export eventos --campeonato camp_001 > eventos.jsonl
+    python cli.py placares [--corrigir]
+    python cli.py batch consultas.txt
+
+No arquivo do batch, cada linha é um comando (sem o "python cli.py"), linhas
+vazias e iniciadas por # são ignoradas. A saída do batch é uma linha JSON por
+consulta: {"consulta": ..., "resultado": [...]} ou {"consulta": ..., "erro": ...}.
+Erros de um comando isolado vão para o stderr, com código de saída 1.
+"""
+
+import argparse
+import csv
+import json
+import shlex
+import sys
+
+from exportacao import FONTES_EXPORTACAO, linhas_ranking, lotes_exportacao, valor_csv
+from importador import ORDEM_IMPORTACAO, importar_arquivo
+from plataforma_futebol_feminino import CHAVES_RANKING, SistemaFutebolFeminino
+
+FORMATOS = ('jsonl', 'json', 'csv')
+
+
+class ErroConsulta(Exception):
+    """Consulta inválida: comando malformado ou registro inexistente"""
+
+
+class ParserConsultas(argparse.ArgumentParser):
+    """ArgumentParser que gera ErroConsulta em vez de encerrar o processo (necessário no batch)"""
+    
+    def error(self, mensagem):
+        raise ErroConsulta(mensagem)
+
+# =============================================================================
+# COMANDOS (cada um valida os argumentos e retorna um iterável de linhas)
+# =============================================================================
+
+def comando_stats(sistema, args):
+    """Estatísticas de uma ou mais jogadoras, opcionalmente filtradas"""
+    for jogadora_id in args.jogadoras:
+        if sistema.buscar_jogadora_por_id(jogadora_id) is None:
+            raise ErroConsulta(f"jogadora não encontrada: {jogadora_id}")
+    
+    return (
+        {'jogadora_id': jogadora_id, **sistema.calcular_estatisticas_jogadora(
+            jogadora_id, args.campeonato, args.temporada, args.inicio, args.fim, args.ultimas)}
+        for jogadora_id in args.jogadoras
+    )
+
+
+def comando_ranking(sistema, args):
+    """Ranking das jogadoras por uma estatística"""
+    return linhas_ranking(sistema, args.chave, args.limite)
+
+
+def comando_search(sistema, args):
+    """Busca por nome em jogadoras, clubes e campeonatos"""
+    for colecao, resultados in sistema.buscar(args.termo, args.limite).items():
+        for registro in resultados:
+            yield {'colecao': colecao, 'id': registro['id'], 'nome': registro['nome']}
+
+
+def comando_compare(sistema, args):
+    """Comparação de jogadoras (ou do elenco de um clube) com taxas por 90 e percentis"""
+    if args.clube is not None and sistema.buscar_clube_por_id(args.clube) is None:
+        raise ErroConsulta(f"clube não encontrado: {args.clube}")
+    if args.clube is None and not args.jogadoras:
+        raise ErroConsulta("informe os IDs das jogadoras ou --clube")
+    if args.adversario is not None and sistema.buscar_clube_por_id(args.adversario) is None:
+        raise ErroConsulta(f"clube não encontrado: {args.adversario}")
+    
+    comparacao = sistema.comparar(args.jogadoras, args.clube, args.confronto_direto, args.adversario)
+    if comparacao['nao_encontradas']:
+        raise ErroConsulta(f"jogadoras não encontradas: {', '.join(comparacao['nao_encontradas'])}")
+    
+    linhas = []
+    for linha in comparacao['jogadoras']:
+        jogadora = linha['jogadora']
+        resultado = {'jogadora_id': jogadora['id'], 'nome': jogadora['nome'],
+                     'posicao': jogadora['posicao'], 'minutos': linha['minutos']}
+        resultado.update(linha['estatisticas'])
+        resultado.update((f"{chave}_por_90", taxa) for chave, taxa in linha['por_90'].items())
+        resultado.update((f"{chave}_percentil", valor) for chave, valor in linha['percentis'].items())
+        linhas.append(resultado)
+    return linhas
+
+
+def comando_classificacao(sistema, args):
+    """Classificação de um campeonato (atual ou na data)"""
+    tabela = sistema.obter_classificacao(args.campeonato_id, args.data)
+    if tabela is None:
+        raise ErroConsulta(f"campeonato não encontrado: {args.campeonato_id}")
+    return (dict(linha) for linha in tabela)
+
+
+def comando_import(sistema, args):
+    """Importa um arquivo CSV ou JSON Lines para uma coleção"""
+    try:
+        resumo = importar_arquivo(sistema, args.colecao, args.arquivo, args.lote)
+    except OSError as erro:
+        raise ErroConsulta(f"não foi possível ler {args.arquivo}: {erro.strerror}") from None
+    return [{'colecao': resumo['colecao'], 'importados': resumo['importados'],
+             'rejeitados': resumo['rejeitados'],
+             'erros': [f"{identificacao}: {mensagem}" for identificacao, mensagem in resumo['erros']]}]
+
+
+def comando_export(sistema, args):
+    """Coleção ou consulta inteira (ou de um campeonato), lida em lotes e escrita linha a linha"""
+    return (linha for lote in lotes_exportacao(sistema, args.fonte, args.campeonato) for linha in lote)
+
+def comando_placares(sistema, args):
+    """Partidas cujo placar registrado diverge dos gols (opcionalmente corrigidas)"""
+    relatorio = sistema.reconciliar_placares(args.corrigir)
+    # Uma coluna por número: a saída em CSV fica direta
+    return (
+        {'partida_id': divergencia['partida_id'], 'data': divergencia['data'],
+         'finalizada': divergencia['finalizada'],
+         'placar_casa': divergencia['registrado'][0], 'placar_fora': divergencia['registrado'][1],
+         'gols_casa': divergencia['derivado'][0], 'gols_fora': divergencia['derivado'][1],
+         'gols_sem_clube': divergencia['gols_sem_clube'],
+         'corrigida': args.corrigir and divergencia['registrado'] != divergencia['derivado']}
+        for divergencia in relatorio['divergencias']
+    )
+
+# =============================================================================
+# SAÍDA
+# =============================================================================
+
+def escrever(linhas, formato, saida):
+    """Escreve as linhas à medida que são geradas (JSON Lines, JSON ou CSV)"""
+    if formato == 'csv':
+        # Cabeçalho com as colunas da primeira linha
+        escritor = None
+        for linha in linhas:
+            if escritor is None:
+                escritor = csv.DictWriter(saida, fieldnames=list(linha), extrasaction='ignore')
+                escritor.writeheader()
+            escritor.writerow({chave: valor_csv(valor) for chave, valor in linha.items()})
+    elif formato == 'json':
+        saida.write('[')
+        for posicao, linha in enumerate(linhas):
+            saida.write((',\n' if posicao else '') + json.dumps(linha, ensure_ascii=False))
+        saida.write(']\n')
+    else:
+        for linha in linhas:
+            saida.write(json.dumps(linha, ensure_ascii=False) + '\n')
+
+
+def executar_lote(sistema, parser, caminho, saida):
+    """Executa um arquivo de consultas no mesmo processo; retorna a quantidade de erros"""
+    erros = 0
+    with open(caminho, encoding='utf-8') as arquivo:
+        for linha in arquivo:
+            consulta = linha.strip()
+            if not consulta or consulta.startswith('#'):
+                continue
+            
+            try:
+                args = parser.parse_args(shlex.split(consulta))
+                if args.comando == 'batch':
+                    raise ErroConsulta("batch não pode ser usado dentro de um batch")
+                resultado = {'consulta': consulta, 'resultado': list(args.funcao(sistema, args))}
+            except (ErroConsulta, ValueError) as erro:
+                erros += 1
+                resultado = {'consulta': consulta, 'erro': str(erro)}
+            saida.write(json.dumps(resultado, ensure_ascii=False) + '\n')
+    return erros
+
+# =============================================================================
+# EXECUÇÃO PRINCIPAL
+# =============================================================================
+
+def criar_parser():
+    """Parser com um subcomando por consulta"""
+    parser = ParserConsultas(description="Consultas da plataforma pela linha de comando")
+    parser.add_argument('--dados', help="arquivo .db (SQLite) ou diretório de log (padrão: dados de exemplo)")
+    parser.add_argument('--formato', choices=FORMATOS, default='jsonl')
+    
+    # --formato também é aceito depois do comando (ex: ranking gols --formato csv)
+    saida = ParserConsultas(add_help=False)
+    saida.add_argument('--formato', choices=FORMATOS, default=argparse.SUPPRESS)
+    subcomandos = parser.add_subparsers(dest='comando', required=True)
+    
+    stats = subcomandos.add_parser('stats', parents=[saida], help="estatísticas de jogadoras")
+    stats.add_argument('jogadoras', nargs='+', metavar='JOGADORA_ID')
+    stats.add_argument('--campeonato')
+    stats.add_argument('--temporada')
+    stats.add_argument('--inicio', help="data inicial (YYYY-MM-DD)")
+    stats.add_argument('--fim', help="data final (YYYY-MM-DD)")
+    stats.add_argument('--ultimas', type=int, help="apenas as últimas N partidas")
+    stats.set_defaults(funcao=comando_stats)
+    
+    ranking = subcomandos.add_parser('ranking', parents=[saida], help="ranking por estatística")
+    ranking.add_argument('chave', nargs='?', default='gols', choices=CHAVES_RANKING)
+    ranking.add_argument('--limite', type=int, default=10)
+    ranking.set_defaults(funcao=comando_ranking)
+    
+    search = subcomandos.add_parser('search', parents=[saida], help="busca por nome")
+    search.add_argument('termo')
+    search.add_argument('--limite', type=int, default=10)
+    search.set_defaults(funcao=comando_search)
+    
+    compare = subcomandos.add_parser('compare', parents=[saida], help="comparação de jogadoras")
+    compare.add_argument('jogadoras', nargs='*', metavar='JOGADORA_ID')
+    compare.add_argument('--clube', help="compara o elenco do clube")
+    compare.add_argument('--confronto-direto', action='store_true',
+                         help="apenas partidas entre os clubes das jogadoras (ou do clube contra --adversario)")
+    compare.add_argument('--adversario', help="clube adversário no confronto direto de um elenco (--clube)")
+    compare.set_defaults(funcao=comando_compare)
+    
+    classificacao = subcomandos.add_parser('classificacao', parents=[saida],
+                                           help="classificação de um campeonato")
+    classificacao.add_argument('campeonato_id')
+    classificacao.add_argument('--data', help="classificação na data (YYYY-MM-DD)")
+    classificacao.set_defaults(funcao=comando_classificacao)
+    
+    importar = subcomandos.add_parser('import', parents=[saida], help="importa arquivo CSV ou JSONL")
+    importar.add_argument('colecao', choices=ORDEM_IMPORTACAO)
+    importar.add_argument('arquivo')
+    importar.add_argument('--lote', type=int, default=5000, help="registros por lote")
+    importar.set_defaults(funcao=comando_import)
+    
+    exportar = subcomandos.add_parser('export', parents=[saida], help="exporta uma coleção ou consulta")
+    exportar.add_argument('fonte', choices=FONTES_EXPORTACAO)
+    exportar.add_argument('--campeonato', help="apenas um campeonato (partidas, eventos, estatísticas...)")
+    exportar.set_defaults(funcao=comando_export)
+    
+    placares = subcomandos.add_parser('placares', parents=[saida], help="placares que divergem dos gols")
+    placares.add_argument('--corrigir', action='store_true', help="grava o placar derivado dos gols")
+    placares.set_defaults(funcao=comando_placares)
+    
+    batch = subcomandos.add_parser('batch', help="executa um arquivo de consultas")
+    batch.add_argument('arquivo')
+    
+    return parser
+
+
+def main(argumentos=None):
+    """Ponto de entrada da linha de comando; retorna o código de saída"""
+    parser = criar_parser()
+    try:
+        args = parser.parse_args(argumentos)
+    except ErroConsulta as erro:
+        parser.print_usage(sys.stderr)
+        print(f"erro: {erro}", file=sys.stderr)
+        return 2
+    
+    armazenamento = None
+    if args.dados:
+        from persistencia import abrir_armazenamento
+        armazenamento = abrir_armazenamento(args.dados)
+    
+    try:
+        sistema = SistemaFutebolFeminino(armazenamento)
+        if args.comando == 'batch':
+            return 1 if executar_lote(sistema, parser, args.arquivo, sys.stdout) else 0
+        escrever(args.funcao(sistema, args), args.formato, sys.stdout)
+        return 0
+    except BrokenPipeError:
+        raise
+    except (ErroConsulta, ValueError, OSError) as erro:
+        print(f"erro: {erro}", file=sys.stderr)
+        return 1
+    finally:
+        if armazenamento:
+            armazenamento.fechar()
+
+
+if __name__ == "__main__":
+    try:
+        sys.exit(main())
+    except BrokenPipeError:
+        # Saída fechada antes do fim (ex: "| head"): encerra sem rastreamento de erro
+        sys.stderr.close()
+        sys.exit(0)
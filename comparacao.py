@@ -0,0 +1,107 @@
+"""
+Comparação de jogadoras da Plataforma de Estatísticas do Futebol Feminino
+
+Compara várias jogadoras (ou o elenco de um clube) de uma vez: totais,
+taxas por 90 minutos e percentil de cada taxa entre as jogadoras da mesma
+posição. As distribuições por posição são montadas numa única passada pelas
+estatísticas materializadas e cada percentil é uma busca binária.
+
+No modo confronto direto, as estatísticas e as distribuições de referência
+dos percentis são recalculadas apenas com os eventos das partidas do
+confronto: partidas entre os clubes em que as jogadoras comparadas estavam na
+data de cada jogo (transferências contam) ou, para o elenco de um clube, as
+partidas contra o adversário informado. Assim os percentis comparam taxas do
+mesmo recorte, não taxas do confronto com taxas da carreira.
+
+Como os eventos não registram substituições, cada partida jogada conta como
+90 minutos.
+"""
+
+import bisect
+
+from plataforma_futebol_feminino import novas_estatisticas
+
+MINUTOS_POR_PARTIDA = 90
+
+# Estatísticas comparadas (partidas_jogadas entra como minutos)
+CHAVES_COMPARACAO = tuple(chave for chave in novas_estatisticas() if chave != 'partidas_jogadas')
+
+
+def minutos_jogados(stats):
+    """Minutos estimados a partir das partidas jogadas"""
+    return stats['partidas_jogadas'] * MINUTOS_POR_PARTIDA
+
+
+def taxas_por_90(stats):
+    """Cada estatística a cada 90 minutos jogados (0.0 para quem não jogou)"""
+    minutos = minutos_jogados(stats)
+    return {
+        chave: stats[chave] * MINUTOS_POR_PARTIDA / minutos if minutos else 0.0
+        for chave in CHAVES_COMPARACAO
+    }
+
+
+def distribuicoes_por_posicao(jogadoras, estatisticas):
+    """Taxas por 90 minutos ordenadas: posição -> estatística -> lista (jogadoras ativas que jogaram)"""
+    distribuicoes = {}
+    for jogadora in jogadoras:
+        stats = estatisticas.get(jogadora['id'])
+        if not jogadora['ativa'] or not stats or not stats['partidas_jogadas']:
+            continue
+        por_chave = distribuicoes.get(jogadora['posicao'])
+        if por_chave is None:
+            por_chave = distribuicoes[jogadora['posicao']] = {chave: [] for chave in CHAVES_COMPARACAO}
+        for chave, taxa in taxas_por_90(stats).items():
+            por_chave[chave].append(taxa)
+    
+    for por_chave in distribuicoes.values():
+        for valores in por_chave.values():
+            valores.sort()
+    return distribuicoes
+
+
+def percentil(valores_ordenados, valor):
+    """Percentil (0 a 100) do valor: quem fica abaixo mais metade dos empates; None sem referência"""
+    if not valores_ordenados:
+        return None
+    abaixo = bisect.bisect_left(valores_ordenados, valor)
+    empates = bisect.bisect_right(valores_ordenados, valor) - abaixo
+    return 100 * (abaixo + empates / 2) / len(valores_ordenados)
+
+
+def partidas_entre_clubes(partidas, jogadora_ids, clube_na_data):
+    """IDs das partidas em que os dois clubes tinham, na data do jogo, alguma das jogadoras comparadas"""
+    confrontos = []
+    for partida in partidas:
+        casa, fora = partida['clube_casa_id'], partida['clube_fora_id']
+        if casa == fora:
+            continue
+        # Clube de cada jogadora na data da partida (pelo histórico de transferências)
+        clubes = {clube_na_data(jogadora_id, partida['data']) for jogadora_id in jogadora_ids}
+        if casa in clubes and fora in clubes:
+            confrontos.append(partida['id'])
+    return confrontos
+
+
+def partidas_do_confronto(partidas, clube_id, adversario_id):
+    """IDs das partidas entre dois clubes, com qualquer mando de campo"""
+    clubes = {clube_id, adversario_id}
+    return [partida['id'] for partida in partidas
+            if {partida['clube_casa_id'], partida['clube_fora_id']} == clubes]
+
+
+def linhas_comparacao(jogadoras, estatisticas, distribuicoes):
+    """Uma linha por jogadora: totais, minutos, taxas por 90 e percentis na posição"""
+    linhas = []
+    for jogadora in jogadoras:
+        stats = estatisticas.get(jogadora['id']) or novas_estatisticas()
+        taxas = taxas_por_90(stats)
+        referencia = distribuicoes.get(jogadora['posicao'], {})
+        linhas.append({
+            'jogadora': jogadora,
+            'estatisticas': dict(stats),
+            'minutos': minutos_jogados(stats),
+            'por_90': taxas,
+            'percentis': {chave: percentil(referencia.get(chave), taxa) for chave, taxa in taxas.items()}
+        })
+    return linhas
@@ -0,0 +1,236 @@
+"""
+Gerador de temporadas sintéticas da Plataforma de Estatísticas do Futebol Feminino
+
+Cria ligas com N clubes, M jogadoras, K partidas e eventos com distribuição
+realista (atacantes marcam mais gols, goleiras fazem mais defesas, mais
+eventos no fim dos tempos). Com a mesma semente o resultado é sempre o mesmo.
+
+Uso:
+    from dados_sinteticos import gerar_temporada
+    gerar_temporada(sistema, clubes=20, jogadoras_por_clube=25, partidas=380)
+"""
+
+import datetime
+import random
+
+from plataforma_futebol_feminino import (
+    EVENTO_ASSISTENCIA,
+    EVENTO_CARTAO_AMARELO,
+    EVENTO_CARTAO_VERMELHO,
+    EVENTO_DEFESA,
+    EVENTO_FINALIZACAO,
+    EVENTO_GOL,
+    Clube,
+    Evento,
+    Jogadora,
+    Partida
+)
+
+# =============================================================================
+# DADOS BASE
+# =============================================================================
+
+PRIMEIROS_NOMES = (
+    'Ana', 'Bárbara', 'Beatriz', 'Bia', 'Camila', 'Cássia', 'Cristiane', 'Débora',
+    'Duda', 'Érika', 'Fabiana', 'Formiga', 'Gabriela', 'Geyse', 'Jéssica', 'Júlia',
+    'Kathellen', 'Kerolin', 'Letícia', 'Lorena', 'Luana', 'Mônica', 'Nathália', 'Raquel',
+    'Rafaelle', 'Sônia', 'Tainá', 'Tamires', 'Thaís', 'Vitória', 'Yasmim', 'Ludmila'
+)
+
+SOBRENOMES = (
+    'Silva', 'Santos', 'Oliveira', 'Souza', 'Araújo', 'Conceição', 'Ferreira', 'Gonçalves',
+    'Lima', 'Magalhães', 'Mendes', 'Nascimento', 'Pereira', 'Ribeiro', 'Rodrigues', 'Simões',
+    'Teixeira', 'Vieira', 'Zanotti', 'Antônio', 'Brandão', 'Cândido', 'Falcão', 'Guimarães'
+)
+
+CIDADES = (
+    ('São Paulo', 'SP'), ('Rio de Janeiro', 'RJ'), ('Belo Horizonte', 'MG'),
+    ('Porto Alegre', 'RS'), ('Salvador', 'BA'), ('Recife', 'PE'), ('Curitiba', 'PR'),
+    ('Fortaleza', 'CE'), ('Goiânia', 'GO'), ('Florianópolis', 'SC'), ('Manaus', 'AM'),
+    ('Belém', 'PA'), ('Brasília', 'DF'), ('Natal', 'RN'), ('Cuiabá', 'MT')
+)
+
+CORES = ('vermelho', 'branco', 'preto', 'azul', 'verde', 'amarelo', 'grená', 'laranja')
+
+# Composição de um elenco: (posição, proporção)
+POSICOES = (
+    ('Goleira', 0.12),
+    ('Zagueira', 0.20),
+    ('Lateral', 0.16),
+    ('Volante', 0.16),
+    ('Meia', 0.16),
+    ('Atacante', 0.20)
+)
+
+# Peso de cada tipo de evento conforme a posição da jogadora
+PESOS_EVENTOS = {
+    'Goleira': {EVENTO_DEFESA: 30, EVENTO_CARTAO_AMARELO: 1, EVENTO_ASSISTENCIA: 0.2},
+    'Zagueira': {EVENTO_DEFESA: 4, EVENTO_CARTAO_AMARELO: 3, EVENTO_CARTAO_VERMELHO: 0.3,
+                 EVENTO_FINALIZACAO: 1, EVENTO_GOL: 0.4},
+    'Lateral': {EVENTO_CARTAO_AMARELO: 2, EVENTO_FINALIZACAO: 2, EVENTO_ASSISTENCIA: 1.2,
+                EVENTO_GOL: 0.4, EVENTO_DEFESA: 1},
+    'Volante': {EVENTO_CARTAO_AMARELO: 3, EVENTO_CARTAO_VERMELHO: 0.2, EVENTO_FINALIZACAO: 2,
+                EVENTO_ASSISTENCIA: 1, EVENTO_GOL: 0.5, EVENTO_DEFESA: 1},
+    'Meia': {EVENTO_FINALIZACAO: 4, EVENTO_ASSISTENCIA: 2.5, EVENTO_GOL: 1.2,
+             EVENTO_CARTAO_AMARELO: 1},
+    'Atacante': {EVENTO_FINALIZACAO: 6, EVENTO_GOL: 2.5, EVENTO_ASSISTENCIA: 1.2,
+                 EVENTO_CARTAO_AMARELO: 0.8}
+}
+
+DATA_INICIAL = datetime.date(2024, 3, 1)
+
+# =============================================================================
+# GERAÇÃO
+# =============================================================================
+
+def sortear_minuto(aleatorio):
+    """Minuto do evento, com mais ocorrências perto do fim de cada tempo"""
+    minuto = int(aleatorio.triangular(0, 45, 40))
+    return minuto if aleatorio.random() < 0.5 else 45 + int(aleatorio.triangular(0, 50, 45))
+
+
+def gerar_clubes(aleatorio, quantidade):
+    """Gera clubes sintéticos"""
+    clubes = []
+    for i in range(quantidade):
+        cidade, estado = CIDADES[i % len(CIDADES)]
+        clubes.append(Clube(
+            f"clube_s{i:05d}", f"Clube {cidade} {i + 1} Feminino", cidade, estado, 'Brasil',
+            aleatorio.randint(1890, 2015), aleatorio.sample(CORES, 2)
+        ))
+    return clubes
+
+
+def gerar_jogadoras(aleatorio, clubes, por_clube):
+    """Gera o elenco de cada clube respeitando a proporção de posições"""
+    jogadoras = []
+    posicoes = [posicao for posicao, _ in POSICOES]
+    pesos = [peso for _, peso in POSICOES]
+    for clube in clubes:
+        for numero in range(1, por_clube + 1):
+            nome = f"{aleatorio.choice(PRIMEIROS_NOMES)} {aleatorio.choice(SOBRENOMES)} {aleatorio.choice(SOBRENOMES)}"
+            jogadoras.append(Jogadora(
+                f"jog_s{len(jogadoras):07d}", nome, aleatorio.choices(posicoes, pesos)[0],
+                clube['id'], numero, aleatorio.randint(17, 39), 'Brasileira',
+                round(aleatorio.gauss(1.66, 0.06), 2), round(aleatorio.gauss(60, 5), 1)
+            ))
+    return jogadoras
+
+
+def gerar_partidas(aleatorio, clubes, campeonatos, quantidade):
+    """Gera partidas em rodadas semanais entre pares de clubes sorteados"""
+    partidas = []
+    jogos_por_rodada = max(len(clubes) // 2, 1)
+    for i in range(quantidade):
+        casa, fora = aleatorio.sample(clubes, 2)
+        data = DATA_INICIAL + datetime.timedelta(days=7 * (i // jogos_por_rodada))
+        partidas.append(Partida(
+            f"part_s{i:07d}", casa['id'], fora['id'], campeonatos[i % len(campeonatos)]['id'],
+            data.isoformat(), finalizada=True
+        ))
+    return partidas
+
+
+def gerar_eventos(aleatorio, partidas, jogadoras_por_clube, eventos_por_partida, primeiro_id=0):
+    """Gera eventos de cada partida e calcula o placar a partir dos gols"""
+    eventos = []
+    for partida in partidas:
+        elenco = jogadoras_por_clube[partida['clube_casa_id']] + jogadoras_por_clube[partida['clube_fora_id']]
+        casa = partida['clube_casa_id']
+        for _ in range(max(1, int(aleatorio.gauss(eventos_por_partida, eventos_por_partida / 4)))):
+            jogadora = aleatorio.choice(elenco)
+            pesos = PESOS_EVENTOS[jogadora['posicao']]
+            tipo = aleatorio.choices(list(pesos), list(pesos.values()))[0]
+            eventos.append(Evento(
+                f"evt_s{primeiro_id + len(eventos):09d}", partida['id'], jogadora['id'], tipo,
+                sortear_minuto(aleatorio)
+            ))
+            if tipo == EVENTO_GOL:
+                if jogadora['clube_id'] == casa:
+                    partida['placar_casa'] += 1
+                else:
+                    partida['placar_fora'] += 1
+    return eventos
+
+
+def gerar_cadastros(aleatorio, clubes, jogadoras_por_clube, partidas, campeonatos):
+    """Clubes, campeonatos, jogadoras, elencos por clube e partidas de uma temporada"""
+    novos_clubes = gerar_clubes(aleatorio, clubes)
+    novos_campeonatos = [
+        {'id': f"camp_s{i:03d}", 'nome': f"Liga Sintética {i + 1}", 'pais': 'Brasil',
+         'temporada': str(DATA_INICIAL.year), 'ativo': True}
+        for i in range(campeonatos)
+    ]
+    novas_jogadoras = gerar_jogadoras(aleatorio, novos_clubes, jogadoras_por_clube)
+    
+    elencos = {}
+    for jogadora in novas_jogadoras:
+        elencos.setdefault(jogadora['clube_id'], []).append(jogadora)
+    
+    novas_partidas = gerar_partidas(aleatorio, novos_clubes, novos_campeonatos, partidas)
+    return novos_clubes, novos_campeonatos, novas_jogadoras, elencos, novas_partidas
+
+
+def gerar_temporada(sistema, clubes=20, jogadoras_por_clube=25, partidas=380,
+                    eventos_por_partida=30, campeonatos=2, semente=2024):
+    """Gera uma temporada sintética completa e a adiciona ao sistema"""
+    aleatorio = random.Random(semente)
+    novos_clubes, novos_campeonatos, novas_jogadoras, elencos, novas_partidas = gerar_cadastros(
+        aleatorio, clubes, jogadoras_por_clube, partidas, campeonatos
+    )
+    novos_eventos = gerar_eventos(aleatorio, novas_partidas, elencos, eventos_por_partida)
+    
+    # Inserção em lote: mantém índices e estatísticas sincronizados
+    sistema.adicionar_registros('clubes', novos_clubes)
+    sistema.adicionar_registros('campeonatos', novos_campeonatos)
+    sistema.adicionar_registros('jogadoras', novas_jogadoras)
+    sistema.adicionar_registros('partidas', novas_partidas)
+    sistema.adicionar_registros('eventos', novos_eventos)
+    
+    return {
+        'clubes': len(novos_clubes),
+        'jogadoras': len(novas_jogadoras),
+        'partidas': len(novas_partidas),
+        'eventos': len(novos_eventos)
+    }
+
+
+def gravar_temporada(armazenamento, clubes=20, jogadoras_por_clube=25, partidas=380,
+                     eventos_por_partida=30, campeonatos=2, semente=2024, partidas_por_lote=10_000):
+    """Gera a mesma temporada de gerar_temporada direto no armazenamento, em lotes de partidas"""
+    # Sem passar pelo sistema: a memória usada não depende da quantidade de eventos
+    aleatorio = random.Random(semente)
+    novos_clubes, novos_campeonatos, novas_jogadoras, elencos, novas_partidas = gerar_cadastros(
+        aleatorio, clubes, jogadoras_por_clube, partidas, campeonatos
+    )
+    armazenamento.salvar_registros('clubes', novos_clubes)
+    armazenamento.salvar_registros('campeonatos', novos_campeonatos)
+    armazenamento.salvar_registros('jogadoras', novas_jogadoras)
+    
+    total_eventos = 0
+    for inicio in range(0, len(novas_partidas), partidas_por_lote):
+        lote = novas_partidas[inicio:inicio + partidas_por_lote]
+        eventos = gerar_eventos(aleatorio, lote, elencos, eventos_por_partida, total_eventos)
+        # Partidas gravadas depois dos seus eventos: o placar é calculado a partir dos gols
+        armazenamento.salvar_registros('partidas', lote)
+        armazenamento.salvar_registros('eventos', eventos)
+        total_eventos += len(eventos)
+    
+    return {
+        'clubes': len(novos_clubes),
+        'jogadoras': len(novas_jogadoras),
+        'partidas': len(novas_partidas),
+        'eventos': total_eventos
+    }
+
+
+def dimensoes_para_eventos(total_eventos, eventos_por_partida=30):
+    """Escolhe clubes, elencos e partidas proporcionais ao total de eventos desejado"""
+    partidas = max(total_eventos // eventos_por_partida, 1)
+    clubes = min(max(partidas // 19, 4), 2000)
+    return {
+        'clubes': clubes,
+        'jogadoras_por_clube': 25,
+        'partidas': partidas,
+        'eventos_por_partida': eventos_por_partida
+    }
@@ -0,0 +1,210 @@
+"""
+Armazenamento colunar de eventos da Plataforma de Estatísticas do Futebol Feminino
+
+Guarda os eventos em colunas de inteiros em vez de um dicionário por evento:
+- partida, jogadora e tipo como códigos inteiros (cada string é guardada uma única vez)
+- minuto como inteiro de 16 bits
+
+Com NumPy instalado as agregações são vetorizadas (np.bincount, np.unique,
+np.searchsorted). Sem NumPy as colunas usam o módulo array da biblioteca padrão
+e as agregações são feitas com laços simples, com o mesmo resultado.
+
+As colunas ocupam cerca de 14 bytes por evento, contra ~150 dos registros
+Evento (medido por `python benchmarks.py memoria`). Os registros continuam
+sendo a fonte dos dados (menus, buscas, páginas e exportação leem os campos
+completos), então o sistema não mantém as colunas permanentemente: elas são
+montadas por sistema.eventos_em_colunas() para um bloco de agregações e
+descartadas no final, sem memória extra fora do bloco.
+"""
+
+import bisect
+from array import array
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+# Tipos das colunas: (dtype NumPy, typecode do módulo array)
+TIPOS_COLUNAS = {
+    'partida': ('int32', 'i'),
+    'jogadora': ('int32', 'i'),
+    'tipo': ('int8', 'b'),
+    'minuto': ('int16', 'h')
+}
+
+CAPACIDADE_INICIAL = 1024
+
+
+class EventosColunares:
+    """Eventos armazenados em colunas de códigos inteiros"""
+    
+    def __init__(self):
+        # Dicionários de códigos: valor -> código, e listas: código -> valor
+        self.codigos = {coluna: {} for coluna in ('partida', 'jogadora', 'tipo')}
+        self.valores = {coluna: [] for coluna in ('partida', 'jogadora', 'tipo')}
+        self.tamanho = 0
+        
+        if np is not None:
+            self.colunas = {
+                coluna: np.empty(CAPACIDADE_INICIAL, dtype=dtype)
+                for coluna, (dtype, _) in TIPOS_COLUNAS.items()
+            }
+        else:
+            self.colunas = {
+                coluna: array(typecode) for coluna, (_, typecode) in TIPOS_COLUNAS.items()
+            }
+    
+    @classmethod
+    def de_eventos(cls, eventos):
+        """Cria o armazenamento colunar a partir de uma lista de eventos (dicionários)"""
+        colunar = cls()
+        colunar.adicionar_varios(eventos)
+        return colunar
+    
+    def __len__(self):
+        return self.tamanho
+    
+    # =========================================================================
+    # INSERÇÃO
+    # =========================================================================
+    
+    def codificar(self, coluna, valor):
+        """Retorna o código inteiro de um valor, criando um novo se necessário"""
+        codigos = self.codigos[coluna]
+        codigo = codigos.get(valor)
+        if codigo is None:
+            codigo = codigos[valor] = len(codigos)
+            self.valores[coluna].append(valor)
+        return codigo
+    
+    def garantir_capacidade(self, quantidade):
+        """Dobra a capacidade das colunas NumPy até caber 'quantidade' eventos"""
+        capacidade = len(self.colunas['minuto'])
+        if quantidade <= capacidade:
+            return
+        while capacidade < quantidade:
+            capacidade *= 2
+        for coluna, valores in self.colunas.items():
+            nova = np.empty(capacidade, dtype=valores.dtype)
+            nova[:self.tamanho] = valores[:self.tamanho]
+            self.colunas[coluna] = nova
+    
+    def adicionar(self, evento):
+        """Adiciona um evento"""
+        self.adicionar_varios([evento])
+    
+    def adicionar_varios(self, eventos):
+        """Adiciona vários eventos de uma vez"""
+        novas = {
+            'partida': [self.codificar('partida', evento['partida_id']) for evento in eventos],
+            'jogadora': [self.codificar('jogadora', evento['jogadora_id']) for evento in eventos],
+            'tipo': [self.codificar('tipo', evento['tipo']) for evento in eventos],
+            'minuto': [evento['minuto'] for evento in eventos]
+        }
+        quantidade = len(novas['minuto'])
+        
+        if np is not None:
+            self.garantir_capacidade(self.tamanho + quantidade)
+            for coluna, valores in novas.items():
+                self.colunas[coluna][self.tamanho:self.tamanho + quantidade] = valores
+        else:
+            for coluna, valores in novas.items():
+                self.colunas[coluna].extend(valores)
+        
+        self.tamanho += quantidade
+    
+    def coluna(self, nome):
+        """Retorna a coluna com apenas as posições ocupadas"""
+        return self.colunas[nome][:self.tamanho]
+    
+    # =========================================================================
+    # AGREGAÇÕES
+    # =========================================================================
+    
+    def contagens(self, grupo):
+        """Quantidade de eventos por (grupo, tipo): lista de listas [código_grupo][código_tipo]"""
+        total_grupos = len(self.valores[grupo])
+        total_tipos = len(self.valores['tipo'])
+        
+        if np is not None:
+            # Vetorizado: cada par (grupo, tipo) vira uma posição única do bincount
+            chaves = self.coluna(grupo).astype(np.int64) * total_tipos + self.coluna('tipo')
+            matriz = np.bincount(chaves, minlength=total_grupos * total_tipos)
+            return matriz.reshape(total_grupos, total_tipos).tolist()
+        
+        matriz = [[0] * total_tipos for _ in range(total_grupos)]
+        for codigo_grupo, codigo_tipo in zip(self.coluna(grupo), self.coluna('tipo')):
+            matriz[codigo_grupo][codigo_tipo] += 1
+        return matriz
+    
+    def pares_jogadora_partida(self):
+        """Pares (código da jogadora, código da partida) distintos"""
+        if np is not None:
+            total_partidas = max(len(self.valores['partida']), 1)
+            pares = self.coluna('jogadora').astype(np.int64) * total_partidas + self.coluna('partida')
+            unicos = np.unique(pares)
+            return zip((unicos // total_partidas).tolist(), (unicos % total_partidas).tolist())
+        return set(zip(self.coluna('jogadora'), self.coluna('partida')))
+    
+    def contagens_por_jogadora(self):
+        """Dicionário jogadora_id -> {tipo: quantidade}"""
+        tipos = self.valores['tipo']
+        return {
+            jogadora_id: {tipo: total for tipo, total in zip(tipos, linha) if total}
+            for jogadora_id, linha in zip(self.valores['jogadora'], self.contagens('jogadora'))
+        }
+    
+    def partidas_por_jogadora(self):
+        """Dicionário jogadora_id -> conjunto de partidas em que a jogadora teve eventos"""
+        jogadoras = self.valores['jogadora']
+        partidas = self.valores['partida']
+        resultado = {jogadora_id: set() for jogadora_id in jogadoras}
+        for codigo_jogadora, codigo_partida in self.pares_jogadora_partida():
+            resultado[jogadoras[codigo_jogadora]].add(partidas[codigo_partida])
+        return resultado
+    
+    def resumo_por_partida(self):
+        """Dicionário partida_id -> {tipo: quantidade}"""
+        tipos = self.valores['tipo']
+        return {
+            partida_id: {tipo: total for tipo, total in zip(tipos, linha) if total}
+            for partida_id, linha in zip(self.valores['partida'], self.contagens('partida'))
+        }
+    
+    def histograma_minutos(self, coluna, tipos_evento, limites, mapa=None):
+        """Eventos dos tipos por faixa de minutos, por valor da coluna (ou pelo grupo que o mapa dá a ele)"""
+        codigos_tipo = [self.codigos['tipo'][tipo] for tipo in tipos_evento if tipo in self.codigos['tipo']]
+        if not codigos_tipo:
+            return {}
+        
+        # Código de grupo de cada código da coluna (-1: valor sem grupo, ignorado)
+        grupos = []
+        codigo_do_grupo = {}
+        for valor in self.valores[coluna]:
+            grupo = mapa.get(valor) if mapa is not None else valor
+            grupos.append(-1 if grupo is None else codigo_do_grupo.setdefault(grupo, len(codigo_do_grupo)))
+        nomes = list(codigo_do_grupo)
+        total_faixas = len(limites) + 1
+        
+        if np is not None:
+            # Vetorizado: faixa por busca binária nos limites e um bincount por (grupo, faixa)
+            codigos_grupo = np.array(grupos, dtype=np.int64)[self.coluna(coluna)]
+            faixas = np.searchsorted(np.array(limites), self.coluna('minuto'))
+            mascara = np.isin(self.coluna('tipo'), codigos_tipo) & (codigos_grupo >= 0)
+            matriz = np.bincount(codigos_grupo[mascara] * total_faixas + faixas[mascara],
+                                 minlength=len(nomes) * total_faixas)
+            linhas = matriz.reshape(len(nomes), total_faixas).tolist()
+        else:
+            linhas = [[0] * total_faixas for _ in nomes]
+            codigos_tipo = set(codigos_tipo)
+            for codigo, codigo_tipo, minuto in zip(self.coluna(coluna), self.coluna('tipo'), self.coluna('minuto')):
+                if codigo_tipo in codigos_tipo and grupos[codigo] >= 0:
+                    linhas[grupos[codigo]][bisect.bisect_left(limites, minuto)] += 1
+        return {grupo: linha for grupo, linha in zip(nomes, linhas) if any(linha)}
+    
+    def memoria_bytes(self):
+        """Memória ocupada pelas colunas (sem contar as tabelas de códigos)"""
+        if np is not None:
+            return sum(valores[:self.tamanho].nbytes for valores in self.colunas.values())
+        return sum(len(valores) * valores.itemsize for valores in self.colunas.values())
@@ -0,0 +1,371 @@
+"""
+Exportação em fluxo da Plataforma de Estatísticas do Futebol Feminino
+
+Exporta qualquer coleção (clubes, campeonatos, jogadoras, partidas, eventos)
+ou resultado de consulta (estatísticas de todas as jogadoras, ranking,
+classificação) para CSV, JSON Lines ou Parquet. Os registros são lidos e
+gravados em lotes de tamanho fixo: com um armazenamento SQLite, exportar 10
+milhões de eventos usa a mesma memória que exportar mil.
+
+Com --por-campeonato cada campeonato vai para um arquivo próprio e os
+campeonatos são exportados em paralelo, um processo por campeonato, cada
+processo com a própria conexão ao banco.
+
+Parquet exige o pacote opcional pyarrow.
+
+Uso:
+    python exportacao.py dados.db eventos eventos.csv
+    python exportacao.py dados.db estatisticas estatisticas.parquet --campeonato camp_001
+    python exportacao.py dados.db ranking ranking.jsonl --chave assistencias --limite 100
+    python exportacao.py dados.db eventos exportacao/ --por-campeonato --processos 4
+"""
+
+import argparse
+import csv
+import json
+import multiprocessing
+import os
+from operator import attrgetter
+
+from importador import ORDEM_IMPORTACAO, em_lotes
+from plataforma_futebol_feminino import (
+    CHAVES_RANKING,
+    Registro,
+    SistemaFutebolFeminino,
+    agregar_estatisticas,
+    novas_estatisticas
+)
+
+# =============================================================================
+# CONFIGURAÇÕES DA EXPORTAÇÃO
+# =============================================================================
+
+FORMATOS_EXPORTACAO = ('csv', 'jsonl', 'parquet')
+
+# Coleções (sem usuários: teriam os hashes de senha) e consultas exportáveis
+CONSULTAS_EXPORTACAO = ('estatisticas', 'ranking', 'classificacao')
+FONTES_EXPORTACAO = ORDEM_IMPORTACAO + CONSULTAS_EXPORTACAO
+
+# Fontes que podem ser restritas a um campeonato (e divididas em um arquivo por campeonato)
+FONTES_POR_CAMPEONATO = ('campeonatos', 'partidas', 'eventos', 'estatisticas', 'classificacao')
+
+TAMANHO_LOTE = 10000
+
+# =============================================================================
+# CONVERSÃO DOS REGISTROS EM LINHAS
+# =============================================================================
+
+def linha_registro(registro):
+    """Registro compacto ou dicionário como dicionário simples"""
+    return dict(registro.items()) if isinstance(registro, Registro) else dict(registro)
+
+
+def linhas_lote(registros):
+    """Lote de registros como dicionários simples (campos lidos de uma vez, em C, via attrgetter)"""
+    if not registros or not isinstance(registros[0], Registro):
+        return [linha_registro(registro) for registro in registros]
+    campos = type(registros[0]).__slots__
+    valores = attrgetter(*campos)
+    return [dict(zip(campos, valores(registro))) for registro in registros]
+
+
+def valor_csv(valor):
+    """Valor de uma célula CSV (listas separadas por '|', como no importador)"""
+    if valor is None:
+        return ''
+    if isinstance(valor, (list, tuple, set)):
+        return '|'.join(str(item) for item in valor)
+    return valor
+
+# =============================================================================
+# FONTES (cada uma produz lotes de linhas)
+# =============================================================================
+
+def lotes_registros(sistema, colecao, campeonato_id=None, tamanho_lote=TAMANHO_LOTE):
+    """Registros da coleção em lotes, lidos do armazenamento em fluxo quando possível"""
+    armazenamento = sistema.armazenamento
+    if hasattr(armazenamento, 'iterar_colecao'):
+        return armazenamento.iterar_colecao(colecao, tamanho_lote, campeonato_id)
+    
+    # Sem leitura em fluxo: os registros já estão (ou passam a estar) em memória
+    if campeonato_id is None:
+        registros = getattr(sistema, colecao)
+    elif colecao == 'eventos':
+        registros = (evento for _, partida_id in sistema.partidas_filtradas(campeonato_id)
+                     for evento in sistema.eventos_por_partida.get(partida_id, ()))
+    else:
+        campo = 'id' if colecao == 'campeonatos' else 'campeonato_id'
+        registros = (registro for registro in getattr(sistema, colecao) if registro[campo] == campeonato_id)
+    return em_lotes(registros, tamanho_lote)
+
+
+def linhas_estatisticas(sistema, campeonato_id=None, tamanho_lote=TAMANHO_LOTE):
+    """Estatísticas de todas as jogadoras (zeradas para quem não jogou), uma linha por jogadora"""
+    if campeonato_id is None:
+        estatisticas = sistema.calcular_estatisticas_todas()
+    else:
+        # Agregação sobre os eventos do campeonato lidos em lotes (sem carregar as partidas)
+        estatisticas = agregar_estatisticas(
+            evento for lote in lotes_registros(sistema, 'eventos', campeonato_id, tamanho_lote)
+            for evento in lote
+        )
+    
+    vazias = novas_estatisticas()
+    for jogadora in sistema.jogadoras:
+        linha = {'jogadora_id': jogadora['id'], 'nome': jogadora['nome'],
+                 'clube_id': jogadora['clube_id'], 'posicao': jogadora['posicao']}
+        if campeonato_id is not None:
+            linha['campeonato_id'] = campeonato_id
+        linha.update(estatisticas.get(jogadora['id'], vazias))
+        yield linha
+
+
+def linhas_ranking(sistema, chave='gols', limite=10):
+    """Ranking das jogadoras por uma estatística, uma linha por posição"""
+    for posicao, item in enumerate(sistema.obter_ranking(chave, limite), 1):
+        jogadora = item['jogadora']
+        yield {
+            'posicao': posicao,
+            'jogadora_id': jogadora['id'],
+            'nome': jogadora['nome'],
+            'clube_id': jogadora['clube_id'],
+            chave: item[chave],
+            'partidas': item['partidas']
+        }
+
+
+def linhas_classificacao(sistema, campeonato_id=None):
+    """Classificação atual de um campeonato (ou de todos), com o ID do campeonato em cada linha"""
+    campeonatos = [campeonato_id] if campeonato_id is not None else [
+        campeonato['id'] for campeonato in sistema.campeonatos
+    ]
+    for atual in campeonatos:
+        for linha in sistema.obter_classificacao(atual) or ():
+            yield {'campeonato_id': atual, **linha}
+
+
+def lotes_exportacao(sistema, fonte, campeonato_id=None, chave='gols', limite=None,
+                     tamanho_lote=TAMANHO_LOTE):
+    """Lotes de linhas (dicionários simples) de uma coleção ou consulta"""
+    # Validação antes de qualquer leitura: erros aparecem antes de o arquivo ser criado
+    if fonte not in FONTES_EXPORTACAO:
+        raise ValueError(f"Fonte de exportação inválida: {fonte}")
+    if campeonato_id is not None and fonte not in FONTES_POR_CAMPEONATO:
+        raise ValueError(f"A exportação de {fonte} não pode ser filtrada por campeonato")
+    if campeonato_id is not None and sistema.buscar_campeonato_por_id(campeonato_id) is None:
+        raise ValueError(f"Campeonato não encontrado: {campeonato_id}")
+    
+    if fonte in ORDEM_IMPORTACAO:
+        return (
+            linhas_lote(lote)
+            for lote in lotes_registros(sistema, fonte, campeonato_id, tamanho_lote)
+        )
+    
+    if fonte == 'estatisticas':
+        linhas = linhas_estatisticas(sistema, campeonato_id, tamanho_lote)
+    elif fonte == 'ranking':
+        if chave not in CHAVES_RANKING:
+            raise ValueError(f"Estatística inválida para ranking: {chave}")
+        # Sem limite: todas as jogadoras ativas
+        linhas = linhas_ranking(sistema, chave, limite or sistema.contar('jogadoras'))
+    else:
+        linhas = linhas_classificacao(sistema, campeonato_id)
+    return em_lotes(linhas, tamanho_lote)
+
+# =============================================================================
+# ESCRITORES (um por formato, gravam lote a lote)
+# =============================================================================
+
+class EscritorCSV:
+    """CSV com as colunas da primeira linha"""
+    
+    def __init__(self, caminho):
+        self.arquivo = open(caminho, 'w', encoding='utf-8', newline='')
+        self.escritor = csv.writer(self.arquivo)
+        self.colunas = None
+        self.colunas_lista = None
+    
+    def escrever(self, linhas):
+        if self.colunas is None:
+            self.colunas = list(linhas[0])
+            self.escritor.writerow(self.colunas)
+            # O csv já grava None como vazio: só as colunas com listas (ex: cores) passam por valor_csv
+            self.colunas_lista = [
+                coluna for coluna in self.colunas
+                if any(isinstance(linha.get(coluna), (list, tuple, set)) for linha in linhas)
+            ]
+        
+        if self.colunas_lista:
+            linhas = [{**linha, **{coluna: valor_csv(linha.get(coluna)) for coluna in self.colunas_lista}}
+                      for linha in linhas]
+        self.escritor.writerows([linha.get(coluna) for coluna in self.colunas] for linha in linhas)
+    
+    def fechar(self):
+        self.arquivo.close()
+
+
+class EscritorJSONL:
+    """JSON Lines: um objeto por linha"""
+    
+    def __init__(self, caminho):
+        self.arquivo = open(caminho, 'w', encoding='utf-8')
+    
+    def escrever(self, linhas):
+        self.arquivo.writelines(json.dumps(linha, ensure_ascii=False) + '\n' for linha in linhas)
+    
+    def fechar(self):
+        self.arquivo.close()
+
+
+class EscritorParquet:
+    """Parquet (pyarrow): cada lote vira um row group com o esquema do primeiro lote"""
+    
+    def __init__(self, caminho):
+        # Importado só aqui: pyarrow é opcional e demora a importar (pesaria na inicialização da CLI)
+        try:
+            import pyarrow
+            import pyarrow.parquet
+        except ImportError:
+            raise ValueError("A exportação em Parquet requer o pacote pyarrow (pip install pyarrow)") from None
+        self.pyarrow = pyarrow
+        self.caminho = caminho
+        self.escritor = None
+    
+    def escrever(self, linhas):
+        if self.escritor is None:
+            tabela = self.pyarrow.Table.from_pylist(linhas)
+            self.escritor = self.pyarrow.parquet.ParquetWriter(self.caminho, tabela.schema)
+        else:
+            tabela = self.pyarrow.Table.from_pylist(linhas, schema=self.escritor.schema)
+        self.escritor.write_table(tabela)
+    
+    def fechar(self):
+        # Sem nenhuma linha não há esquema: nenhum arquivo é criado
+        if self.escritor is not None:
+            self.escritor.close()
+
+
+ESCRITORES = {'csv': EscritorCSV, 'jsonl': EscritorJSONL, 'parquet': EscritorParquet}
+
+
+def formato_do_arquivo(caminho):
+    """Escolhe o formato pela extensão do arquivo (JSON Lines por padrão)"""
+    extensao = os.path.splitext(caminho)[1].lstrip('.').lower()
+    return extensao if extensao in ESCRITORES else 'jsonl'
+
+# =============================================================================
+# EXPORTAÇÃO
+# =============================================================================
+
+def exportar(sistema, fonte, caminho, formato=None, campeonato_id=None, chave='gols', limite=None,
+             tamanho_lote=TAMANHO_LOTE):
+    """Exporta uma coleção ou consulta para o arquivo, lote a lote, e retorna um resumo"""
+    formato = formato or formato_do_arquivo(caminho)
+    if formato not in ESCRITORES:
+        raise ValueError(f"Formato de exportação inválido: {formato}")
+    
+    lotes = lotes_exportacao(sistema, fonte, campeonato_id, chave, limite, tamanho_lote)
+    escritor = ESCRITORES[formato](caminho)
+    linhas = 0
+    try:
+        for lote in lotes:
+            escritor.escrever(lote)
+            linhas += len(lote)
+    finally:
+        escritor.fechar()
+    return {'fonte': fonte, 'campeonato_id': campeonato_id, 'arquivo': caminho, 'linhas': linhas}
+
+
+def exportar_campeonato(tarefa):
+    """Exporta um campeonato num processo separado, com a própria conexão ao armazenamento"""
+    from persistencia import abrir_armazenamento
+    
+    caminho_dados, fonte, campeonato_id, caminho, formato, tamanho_lote = tarefa
+    armazenamento = abrir_armazenamento(caminho_dados)
+    try:
+        sistema = SistemaFutebolFeminino(armazenamento)
+        return exportar(sistema, fonte, caminho, formato, campeonato_id, tamanho_lote=tamanho_lote)
+    finally:
+        armazenamento.fechar()
+
+
+def exportar_por_campeonato(caminho_dados, fonte, diretorio, formato='jsonl', processos=None,
+                            tamanho_lote=TAMANHO_LOTE):
+    """Um arquivo por campeonato (fonte_campeonato.formato), campeonatos em paralelo"""
+    from persistencia import abrir_armazenamento
+    
+    if fonte not in FONTES_POR_CAMPEONATO:
+        raise ValueError(f"A exportação de {fonte} não pode ser dividida por campeonato")
+    if formato not in ESCRITORES:
+        raise ValueError(f"Formato de exportação inválido: {formato}")
+    
+    os.makedirs(diretorio, exist_ok=True)
+    armazenamento = abrir_armazenamento(caminho_dados)
+    try:
+        sistema = SistemaFutebolFeminino(armazenamento)
+        tarefas = [
+            (caminho_dados, fonte, campeonato['id'],
+             os.path.join(diretorio, f"{fonte}_{campeonato['id']}.{formato}"), formato, tamanho_lote)
+            for campeonato in sistema.campeonatos
+        ]
+        processos = min(processos or os.cpu_count() or 1, len(tarefas))
+        
+        # Sem leitura em fluxo (log) cada processo releria tudo: exporta no próprio processo
+        if processos <= 1 or not hasattr(armazenamento, 'iterar_colecao'):
+            return [exportar(sistema, fonte, caminho, formato, campeonato_id, tamanho_lote=tamanho_lote)
+                    for _, _, campeonato_id, caminho, formato, _ in tarefas]
+    finally:
+        armazenamento.fechar()
+    
+    with multiprocessing.Pool(processos) as pool:
+        return list(pool.imap(exportar_campeonato, tarefas))
+
+
+def exibir_resumo(resumo):
+    """Exibe o resumo de uma exportação"""
+    recorte = f" ({resumo['campeonato_id']})" if resumo['campeonato_id'] else ""
+    print(f"✅ {resumo['fonte']}{recorte}: {resumo['linhas']:,} linhas → {resumo['arquivo']}")
+
+# =============================================================================
+# EXECUÇÃO PRINCIPAL
+# =============================================================================
+
+def main(argumentos=None):
+    """Ponto de entrada da exportação pela linha de comando"""
+    from persistencia import abrir_armazenamento
+    
+    parser = argparse.ArgumentParser(description="Exportação em lote de dados do futebol feminino")
+    parser.add_argument('dados', help="arquivo .db (SQLite) ou diretório de log")
+    parser.add_argument('fonte', choices=FONTES_EXPORTACAO)
+    parser.add_argument('destino', help="arquivo de saída (diretório com --por-campeonato)")
+    parser.add_argument('--formato', choices=FORMATOS_EXPORTACAO,
+                        help="padrão: pela extensão do destino (JSON Lines com --por-campeonato)")
+    parser.add_argument('--campeonato', help="apenas um campeonato")
+    parser.add_argument('--por-campeonato', action='store_true', help="um arquivo por campeonato")
+    parser.add_argument('--processos', type=int, help="processos em paralelo com --por-campeonato")
+    parser.add_argument('--chave', choices=CHAVES_RANKING, default='gols', help="estatística do ranking")
+    parser.add_argument('--limite', type=int, help="posições do ranking (padrão: todas)")
+    parser.add_argument('--lote', type=int, default=TAMANHO_LOTE, help="linhas por lote")
+    args = parser.parse_args(argumentos)
+    
+    try:
+        if args.por_campeonato:
+            resumos = exportar_por_campeonato(args.dados, args.fonte, args.destino, args.formato or 'jsonl',
+                                              args.processos, args.lote)
+        else:
+            armazenamento = abrir_armazenamento(args.dados)
+            try:
+                sistema = SistemaFutebolFeminino(armazenamento)
+                resumos = [exportar(sistema, args.fonte, args.destino, args.formato, args.campeonato,
+                                    args.chave, args.limite, args.lote)]
+            finally:
+                armazenamento.fechar()
+    except (ValueError, OSError) as erro:
+        parser.exit(1, f"❌ {erro}\n")
+    
+    for resumo in resumos:
+        exibir_resumo(resumo)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,269 @@
+"""
+Importação em lote da Plataforma de Estatísticas do Futebol Feminino
+
+Lê arquivos CSV ou JSON Lines em fluxo (um registro por vez), valida as
+chaves estrangeiras (clube_id, campeonato_id, partida_id, jogadora_id)
+e os IDs duplicados lote a lote, com uma consulta por lote ao
+armazenamento, e grava cada lote de uma vez direto no armazenamento.
+Com o sistema aberto sob demanda (o padrão), os registros importados não
+ficam em memória: o consumo se mantém constante com o tamanho do arquivo.
+
+Uso:
+    python importador.py dados.db --clubes clubes.csv --partidas partidas.csv \\
+        --eventos eventos.jsonl
+"""
+
+import argparse
+import csv
+import json
+from itertools import islice
+
+from plataforma_futebol_feminino import (
+    ESTATISTICA_POR_EVENTO,
+    SistemaFutebolFeminino,
+    criar_registro,
+    gerar_id
+)
+
+# =============================================================================
+# CONFIGURAÇÕES DA IMPORTAÇÃO
+# =============================================================================
+
+# Ordem de importação: cada coleção só referencia coleções anteriores
+ORDEM_IMPORTACAO = ('clubes', 'campeonatos', 'jogadoras', 'transferencias', 'partidas', 'eventos')
+
+TAMANHO_LOTE = 5000
+
+# Quantidade máxima de erros guardados no resumo (os demais são apenas contados)
+LIMITE_ERROS = 100
+
+
+def para_bool(valor):
+    """Converte texto de CSV em booleano"""
+    return str(valor).strip().lower() in ('1', 'true', 'sim', 's', 'yes')
+
+
+def para_lista(valor):
+    """Converte texto de CSV separado por '|' em lista"""
+    return [item.strip() for item in valor.split('|') if item.strip()]
+
+
+# Campos obrigatórios de cada coleção
+CAMPOS_OBRIGATORIOS = {
+    'clubes': ('nome', 'cidade', 'estado', 'pais', 'fundacao'),
+    'campeonatos': ('nome', 'pais', 'temporada'),
+    'jogadoras': ('nome', 'posicao', 'clube_id', 'numero_camisa', 'idade', 'nacionalidade'),
+    'transferencias': ('jogadora_id', 'clube_destino_id', 'data'),
+    'partidas': ('clube_casa_id', 'clube_fora_id', 'campeonato_id', 'data'),
+    'eventos': ('partida_id', 'jogadora_id', 'tipo', 'minuto')
+}
+
+# Conversores aplicados aos campos lidos como texto (CSV)
+CONVERSORES = {
+    'clubes': {'fundacao': int, 'cores': para_lista, 'ativo': para_bool},
+    'campeonatos': {'ativo': para_bool},
+    'jogadoras': {'numero_camisa': int, 'idade': int, 'altura': float, 'peso': float,
+                  'ativa': para_bool},
+    'transferencias': {},
+    'partidas': {'placar_casa': int, 'placar_fora': int, 'finalizada': para_bool},
+    'eventos': {'minuto': int}
+}
+
+# Valores padrão para campos opcionais
+PADROES = {
+    'clubes': {'cores': '', 'ativo': True},
+    'campeonatos': {'ativo': True},
+    'jogadoras': {'altura': None, 'peso': None, 'ativa': True},
+    'transferencias': {'clube_origem_id': None},
+    'partidas': {'placar_casa': 0, 'placar_fora': 0, 'finalizada': False},
+    'eventos': {'observacoes': ''}
+}
+
+# Chaves estrangeiras: campo -> coleção referenciada
+CHAVES_ESTRANGEIRAS = {
+    'clubes': {},
+    'campeonatos': {},
+    'jogadoras': {'clube_id': 'clubes'},
+    'transferencias': {'jogadora_id': 'jogadoras', 'clube_origem_id': 'clubes', 'clube_destino_id': 'clubes'},
+    'partidas': {'clube_casa_id': 'clubes', 'clube_fora_id': 'clubes',
+                 'campeonato_id': 'campeonatos'},
+    'eventos': {'partida_id': 'partidas', 'jogadora_id': 'jogadoras'}
+}
+
+# Chaves estrangeiras que podem ficar vazias (None): só são conferidas quando informadas
+CHAVES_OPCIONAIS = {('transferencias', 'clube_origem_id')}
+
+# =============================================================================
+# LEITURA EM FLUXO (GERADORES)
+# =============================================================================
+
+def ler_csv(caminho):
+    """Lê um arquivo CSV registro a registro"""
+    with open(caminho, newline='', encoding='utf-8') as arquivo:
+        for linha in csv.DictReader(arquivo):
+            # Campos vazios do CSV são tratados como ausentes
+            yield {chave: valor for chave, valor in linha.items() if valor not in ('', None)}
+
+
+def ler_jsonl(caminho):
+    """Lê um arquivo JSON Lines registro a registro"""
+    with open(caminho, encoding='utf-8') as arquivo:
+        for linha in arquivo:
+            if linha.strip():
+                yield json.loads(linha)
+
+
+def ler_registros(caminho):
+    """Escolhe o leitor pela extensão do arquivo"""
+    if caminho.endswith('.csv'):
+        return ler_csv(caminho)
+    return ler_jsonl(caminho)
+
+
+def em_lotes(registros, tamanho):
+    """Agrupa um fluxo de registros em listas de tamanho fixo"""
+    registros = iter(registros)
+    while True:
+        lote = list(islice(registros, tamanho))
+        if not lote:
+            return
+        yield lote
+
+# =============================================================================
+# NORMALIZAÇÃO E VALIDAÇÃO
+# =============================================================================
+
+def normalizar(colecao, dados):
+    """Converte tipos, aplica valores padrão, gera ID quando ausente e cria o registro"""
+    registro = dict(PADROES[colecao])
+    registro.update(dados)
+    
+    for campo in CAMPOS_OBRIGATORIOS[colecao]:
+        if campo not in registro:
+            raise ValueError(f"campo obrigatório ausente: {campo}")
+    
+    # Estrutura de repetição: converte apenas valores que vieram como texto
+    for campo, conversor in CONVERSORES[colecao].items():
+        if isinstance(registro.get(campo), str):
+            registro[campo] = conversor(registro[campo])
+    
+    if colecao == 'eventos' and registro['tipo'] not in ESTATISTICA_POR_EVENTO:
+        raise ValueError(f"tipo de evento inválido: {registro['tipo']}")
+    
+    if not registro.get('id'):
+        registro['id'] = gerar_id()
+    return criar_registro(colecao, registro)
+
+
+def validar_lote(sistema, colecao, registros):
+    """Separa registros válidos dos rejeitados, checando chaves estrangeiras em lote"""
+    validos = []
+    erros = []
+    ids_do_lote = set()
+    
+    # Conjuntos: cada chave estrangeira é consultada uma única vez por lote (IN (...) no banco,
+    # sem carregar a coleção referenciada inteira)
+    faltantes = {}
+    for campo, referenciada in CHAVES_ESTRANGEIRAS[colecao].items():
+        valores = {registro[campo] for registro in registros}
+        if (colecao, campo) in CHAVES_OPCIONAIS:
+            valores.discard(None)
+        faltantes[campo] = valores - sistema.ids_existentes(referenciada, valores)
+    duplicados = sistema.ids_existentes(colecao, {registro['id'] for registro in registros})
+    
+    for registro in registros:
+        erro = None
+        if registro['id'] in duplicados or registro['id'] in ids_do_lote:
+            erro = f"ID duplicado: {registro['id']}"
+        else:
+            for campo, ausentes in faltantes.items():
+                if registro[campo] in ausentes:
+                    erro = f"{campo} inexistente: {registro[campo]}"
+                    break
+        
+        if erro:
+            erros.append((registro['id'], erro))
+        else:
+            ids_do_lote.add(registro['id'])
+            validos.append(registro)
+    
+    return validos, erros
+
+# =============================================================================
+# IMPORTAÇÃO
+# =============================================================================
+
+def importar_registros(sistema, colecao, registros, tamanho_lote=TAMANHO_LOTE):
+    """Importa um fluxo de registros (dicionários) em lotes e retorna um resumo"""
+    resumo = {'colecao': colecao, 'importados': 0, 'rejeitados': 0, 'erros': []}
+    
+    def registrar_erro(identificacao, mensagem):
+        resumo['rejeitados'] += 1
+        if len(resumo['erros']) < LIMITE_ERROS:
+            resumo['erros'].append((identificacao, mensagem))
+    
+    for numero_lote, lote in enumerate(em_lotes(registros, tamanho_lote)):
+        normalizados = []
+        for posicao, dados in enumerate(lote):
+            try:
+                normalizados.append(normalizar(colecao, dados))
+            except (ValueError, TypeError) as erro:
+                registrar_erro(f"registro {numero_lote * tamanho_lote + posicao + 1}", str(erro))
+        
+        validos, erros = validar_lote(sistema, colecao, normalizados)
+        for identificacao, mensagem in erros:
+            registrar_erro(identificacao, mensagem)
+        
+        if validos:
+            if colecao == 'transferencias':
+                # Mesmo caminho do cadastro: completa a origem e leva a jogadora ao clube mais recente
+                sistema.registrar_transferencias(validos)
+            else:
+                # Direto para o armazenamento: o lote não fica nas listas nem nas páginas do sistema
+                sistema.gravar_registros(colecao, validos)
+            resumo['importados'] += len(validos)
+    
+    return resumo
+
+
+def importar_arquivo(sistema, colecao, caminho, tamanho_lote=TAMANHO_LOTE):
+    """Importa um arquivo CSV ou JSON Lines para uma coleção"""
+    return importar_registros(sistema, colecao, ler_registros(caminho), tamanho_lote)
+
+
+def exibir_resumo(resumo):
+    """Exibe o resumo de uma importação"""
+    print(f"✅ {resumo['colecao']}: {resumo['importados']} importados, "
+          f"{resumo['rejeitados']} rejeitados")
+    for identificacao, mensagem in resumo['erros'][:10]:
+        print(f"   ❌ {identificacao}: {mensagem}")
+
+# =============================================================================
+# EXECUÇÃO PRINCIPAL
+# =============================================================================
+
+def main(argumentos=None):
+    """Ponto de entrada da importação pela linha de comando"""
+    from persistencia import abrir_armazenamento
+    
+    parser = argparse.ArgumentParser(description="Importação em lote de dados do futebol feminino")
+    parser.add_argument('destino', help="arquivo .db (SQLite) ou diretório de log")
+    for colecao in ORDEM_IMPORTACAO:
+        parser.add_argument(f'--{colecao}', metavar='ARQUIVO',
+                            help=f"arquivo CSV ou JSONL de {colecao}")
+    parser.add_argument('--lote', type=int, default=TAMANHO_LOTE, help="registros por lote")
+    args = parser.parse_args(argumentos)
+    
+    armazenamento = abrir_armazenamento(args.destino)
+    sistema = SistemaFutebolFeminino(armazenamento)
+    try:
+        for colecao in ORDEM_IMPORTACAO:
+            caminho = getattr(args, colecao)
+            if caminho:
+                exibir_resumo(importar_arquivo(sistema, colecao, caminho, args.lote))
+    finally:
+        armazenamento.fechar()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,359 @@
+"""
+Ingestão contínua de eventos da Plataforma de Estatísticas do Futebol Feminino
+
+Em dia de jogo os eventos chegam sem parar. Este módulo recebe eventos em
+JSON Lines (entrada padrão ou socket TCP), coloca-os numa fila asyncio e os
+aplica em micro-lotes: cada lote valida os eventos, atualiza o placar derivado das
+partidas quando chega um gol, os contadores das jogadoras e os rankings
+top-N de forma incremental, e avisa os inscritos sobre o que mudou.
+
+Uso:
+    python ingestao.py [dados.db | diretorio_log] [--porta 9000] [--lote 500]
+    cat eventos.jsonl | python ingestao.py
+
+Formato de cada linha: {"partida_id": "...", "jogadora_id": "...", "tipo": "gol", "minuto": 12}
+"""
+
+import argparse
+import asyncio
+import json
+import sys
+import time
+from collections import deque
+
+from importador import LIMITE_ERROS, normalizar, validar_lote
+from plataforma_futebol_feminino import EVENTO_GOL, SistemaFutebolFeminino, valor_estatistica
+
+# =============================================================================
+# CONFIGURAÇÕES DA INGESTÃO
+# =============================================================================
+
+# Micro-lote: aplica ao atingir o tamanho ou ao passar o intervalo (o que vier primeiro)
+TAMANHO_LOTE = 500
+INTERVALO_LOTE = 0.005  # segundos
+
+# Eventos aguardando na fila antes de o produtor esperar (controle de fluxo)
+TAMANHO_FILA = 100_000
+
+# Notificações guardadas por inscrito lento (as mais antigas são descartadas)
+TAMANHO_FILA_INSCRITO = 1000
+
+RANKINGS_ACOMPANHADOS = ('gols', 'assistencias', 'cartoes')
+TAMANHO_TOP = 10
+
+# Latências recentes usadas nos percentis
+AMOSTRAS_LATENCIA = 10_000
+
+# =============================================================================
+# RANKING INCREMENTAL
+# =============================================================================
+
+class RankingIncremental:
+    """Top-N de uma estatística mantido a cada alteração, sem recalcular o ranking todo"""
+    
+    def __init__(self, sistema, chave, limite=TAMANHO_TOP):
+        self.sistema = sistema
+        self.chave = chave
+        self.limite = limite
+        
+        # Empates seguem a ordem de cadastro, como em obter_ranking
+        self.ordem_cadastro = {jogadora['id']: posicao for posicao, jogadora in enumerate(sistema.jogadoras)}
+        self.membros = {
+            item['jogadora']['id']: item[chave]
+            for item in sistema.obter_ranking(chave, limite)
+        }
+        # (critério, ID) da última colocada; None = recalcular na próxima comparação
+        self.ultima = None
+    
+    def criterio(self, jogadora_id, valor):
+        """Chave de comparação: maior valor primeiro, depois a jogadora cadastrada antes"""
+        return valor, -self.ordem_cadastro.get(jogadora_id, len(self.ordem_cadastro))
+    
+    def atualizar(self, jogadora_id):
+        """Reavalia uma jogadora cujos contadores aumentaram; retorna True se o top-N mudou"""
+        jogadora = self.sistema.buscar_jogadora_por_id(jogadora_id)
+        if jogadora is None or not jogadora['ativa']:
+            return False
+        if jogadora_id not in self.ordem_cadastro:
+            self.ordem_cadastro[jogadora_id] = len(self.ordem_cadastro)
+        
+        valor = valor_estatistica(self.sistema.estatisticas[jogadora_id], self.chave)
+        if jogadora_id in self.membros:
+            if self.membros[jogadora_id] == valor:
+                return False
+            self.membros[jogadora_id] = valor
+            self.ultima = None
+            return True
+        
+        if len(self.membros) < self.limite:
+            self.membros[jogadora_id] = valor
+            self.ultima = None
+            return True
+        
+        # Os contadores só aumentam: basta comparar com a última colocada (guardada até o top-N mudar)
+        if self.ultima is None:
+            self.ultima = min((self.criterio(membro, total), membro) for membro, total in self.membros.items())
+        criterio_ultima, ultima_id = self.ultima
+        if self.criterio(jogadora_id, valor) > criterio_ultima:
+            del self.membros[ultima_id]
+            self.membros[jogadora_id] = valor
+            self.ultima = None
+            return True
+        return False
+    
+    def itens(self):
+        """Top-N ordenado: lista de (jogadora_id, valor)"""
+        return sorted(self.membros.items(), key=lambda item: self.criterio(*item), reverse=True)
+
+# =============================================================================
+# PIPELINE DE INGESTÃO
+# =============================================================================
+
+class IngestaoEventos:
+    """Fila de eventos aplicada em micro-lotes, com notificações para inscritos"""
+    
+    def __init__(self, sistema, tamanho_lote=TAMANHO_LOTE, intervalo_lote=INTERVALO_LOTE,
+                 rankings=RANKINGS_ACOMPANHADOS, limite_top=TAMANHO_TOP):
+        self.sistema = sistema
+        self.tamanho_lote = tamanho_lote
+        self.intervalo_lote = intervalo_lote
+        self.fila = asyncio.Queue(TAMANHO_FILA)
+        self.inscritos = []
+        self.rankings = {chave: RankingIncremental(sistema, chave, limite_top) for chave in rankings}
+        
+        # Métricas da ingestão
+        self.processados = 0
+        self.rejeitados = 0
+        self.lotes = 0
+        self.erros = []
+        self.latencias = deque(maxlen=AMOSTRAS_LATENCIA)
+    
+    # =========================================================================
+    # ENTRADA
+    # =========================================================================
+    
+    async def publicar(self, dados):
+        """Enfileira um evento (dicionário); espera se a fila estiver cheia"""
+        await self.fila.put((time.perf_counter_ns(), dados))
+    
+    def inscrever(self):
+        """Cria a fila de notificações de um novo inscrito"""
+        fila = asyncio.Queue(TAMANHO_FILA_INSCRITO)
+        self.inscritos.append(fila)
+        return fila
+    
+    def cancelar_inscricao(self, fila):
+        """Remove um inscrito"""
+        if fila in self.inscritos:
+            self.inscritos.remove(fila)
+    
+    # =========================================================================
+    # PROCESSAMENTO EM MICRO-LOTES
+    # =========================================================================
+    
+    async def proximo_lote(self):
+        """Espera o primeiro evento e junta os que chegarem até encher o lote ou vencer o intervalo"""
+        lote = [await self.fila.get()]
+        limite_tempo = time.perf_counter() + self.intervalo_lote
+        while len(lote) < self.tamanho_lote:
+            if self.fila.empty():
+                restante = limite_tempo - time.perf_counter()
+                if restante <= 0:
+                    break
+                try:
+                    lote.append(await asyncio.wait_for(self.fila.get(), restante))
+                except asyncio.TimeoutError:
+                    break
+            else:
+                lote.append(self.fila.get_nowait())
+        return lote
+    
+    def registrar_erro(self, identificacao, mensagem):
+        """Conta um evento rejeitado, guardando apenas os primeiros erros"""
+        self.rejeitados += 1
+        if len(self.erros) < LIMITE_ERROS:
+            self.erros.append((identificacao, mensagem))
+    
+    def aplicar_lote(self, lote):
+        """Valida e aplica um micro-lote; retorna a notificação das mudanças"""
+        normalizados = []
+        for _, dados in lote:
+            try:
+                normalizados.append(normalizar('eventos', dados))
+            except (ValueError, TypeError, KeyError) as erro:
+                self.registrar_erro(str(dados)[:80], str(erro))
+        
+        validos, erros = validar_lote(self.sistema, 'eventos', normalizados)
+        for identificacao, mensagem in erros:
+            self.registrar_erro(identificacao, mensagem)
+        
+        notificacao = {'eventos': len(validos), 'placares': {}, 'rankings': {}}
+        if not validos:
+            return notificacao
+        
+        # Estatísticas, índices e placares derivados dos gols (uma única gravação por lote)
+        self.sistema.adicionar_registros('eventos', validos)
+        
+        # Dicionário ordenado sem repetições: partidas que receberam gols neste lote
+        for partida_id in dict.fromkeys(evento['partida_id'] for evento in validos if evento['tipo'] == EVENTO_GOL):
+            notificacao['placares'][partida_id] = list(self.sistema.placar_derivado(partida_id))
+        
+        # Conjunto: cada jogadora é reavaliada uma vez por lote, mesmo com vários eventos
+        jogadoras = {evento['jogadora_id'] for evento in validos}
+        for chave, ranking in self.rankings.items():
+            alterado = False
+            for jogadora_id in jogadoras:
+                alterado = ranking.atualizar(jogadora_id) or alterado
+            if alterado:
+                notificacao['rankings'][chave] = ranking.itens()
+        return notificacao
+    
+    def notificar(self, notificacao):
+        """Entrega a notificação a cada inscrito sem esperar pelos mais lentos"""
+        for fila in self.inscritos:
+            if fila.full():
+                fila.get_nowait()
+            fila.put_nowait(notificacao)
+    
+    async def processar(self):
+        """Laço principal: consome a fila em micro-lotes até ser cancelado"""
+        while True:
+            lote = await self.proximo_lote()
+            try:
+                notificacao = self.aplicar_lote(lote)
+            except Exception as erro:
+                # Falha inesperada (ex: campo com valor de tipo errado): o lote é rejeitado e a ingestão segue
+                for _, dados in lote:
+                    self.registrar_erro(str(dados)[:80], f"lote rejeitado: {erro}")
+                notificacao = {'eventos': 0}
+            finally:
+                # Sempre marca o lote como tratado: senão fila.join() esperaria para sempre
+                for _ in lote:
+                    self.fila.task_done()
+            
+            agora = time.perf_counter_ns()
+            self.latencias.extend(agora - instante for instante, _ in lote)
+            self.processados += notificacao['eventos']
+            self.lotes += 1
+            
+            if notificacao['eventos']:
+                notificacao['latencia_ms'] = (agora - lote[0][0]) / 1e6
+                self.notificar(notificacao)
+    
+    def metricas(self):
+        """Resumo da ingestão: contagens e latência fim a fim (ms)"""
+        latencias = sorted(self.latencias)
+        
+        def percentil(fracao):
+            return latencias[min(int(len(latencias) * fracao), len(latencias) - 1)] / 1e6 if latencias else 0.0
+        
+        return {
+            'processados': self.processados,
+            'rejeitados': self.rejeitados,
+            'lotes': self.lotes,
+            'latencia_p50_ms': percentil(0.50),
+            'latencia_p99_ms': percentil(0.99),
+            'latencia_max_ms': latencias[-1] / 1e6 if latencias else 0.0
+        }
+
+# =============================================================================
+# FONTES DE EVENTOS (JSON LINES)
+# =============================================================================
+
+async def publicar_linha(ingestao, linha):
+    """Decodifica uma linha JSON e a publica (linhas inválidas são rejeitadas)"""
+    if not linha.strip():
+        return
+    try:
+        dados = json.loads(linha)
+    except ValueError as erro:
+        ingestao.registrar_erro(linha[:80].strip(), f"JSON inválido: {erro}")
+        return
+    await ingestao.publicar(dados)
+
+
+async def consumir_entrada_padrao(ingestao, entrada=None):
+    """Lê eventos da entrada padrão numa thread e os publica na fila"""
+    entrada = entrada or sys.stdin
+    laco = asyncio.get_running_loop()
+    
+    def ler():
+        for linha in entrada:
+            asyncio.run_coroutine_threadsafe(publicar_linha(ingestao, linha), laco).result()
+    
+    await asyncio.to_thread(ler)
+
+
+async def servir_tcp(ingestao, host='127.0.0.1', porta=9000):
+    """Aceita conexões TCP que enviam eventos em JSON Lines"""
+    async def atender(leitor, escritor):
+        try:
+            async for linha in leitor:
+                await publicar_linha(ingestao, linha.decode('utf-8'))
+        finally:
+            escritor.close()
+    
+    servidor = await asyncio.start_server(atender, host, porta)
+    async with servidor:
+        await servidor.serve_forever()
+
+
+async def exibir_notificacoes(ingestao):
+    """Inscrito que escreve cada notificação como uma linha JSON na saída padrão"""
+    fila = ingestao.inscrever()
+    while True:
+        print(json.dumps(await fila.get(), ensure_ascii=False), flush=True)
+
+# =============================================================================
+# EXECUÇÃO PRINCIPAL
+# =============================================================================
+
+async def executar(sistema, args):
+    """Inicia o processamento, a fonte de eventos e o inscrito da saída padrão"""
+    ingestao = IngestaoEventos(sistema, args.lote, args.intervalo_ms / 1000)
+    tarefas = [asyncio.create_task(ingestao.processar()),
+               asyncio.create_task(exibir_notificacoes(ingestao))]
+    try:
+        if args.porta:
+            await servir_tcp(ingestao, args.host, args.porta)
+        else:
+            await consumir_entrada_padrao(ingestao)
+            # Fim da entrada: espera a fila esvaziar e os inscritos receberem tudo
+            await ingestao.fila.join()
+            while any(not fila.empty() for fila in ingestao.inscritos):
+                await asyncio.sleep(0)
+    finally:
+        for tarefa in tarefas:
+            tarefa.cancel()
+    return ingestao.metricas()
+
+
+def main(argumentos=None):
+    """Ponto de entrada da ingestão pela linha de comando"""
+    from persistencia import abrir_armazenamento
+    
+    parser = argparse.ArgumentParser(description="Ingestão contínua de eventos em JSON Lines")
+    parser.add_argument('armazenamento', nargs='?', help="arquivo .db (SQLite) ou diretório de log")
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--porta', type=int, help="recebe eventos por TCP em vez da entrada padrão")
+    parser.add_argument('--lote', type=int, default=TAMANHO_LOTE, help="eventos por micro-lote")
+    parser.add_argument('--intervalo-ms', type=float, default=INTERVALO_LOTE * 1000,
+                        help="espera máxima para completar um micro-lote")
+    args = parser.parse_args(argumentos)
+    
+    armazenamento = abrir_armazenamento(args.armazenamento) if args.armazenamento else None
+    sistema = SistemaFutebolFeminino(armazenamento)
+    try:
+        metricas = asyncio.run(executar(sistema, args))
+        print(f"✅ {metricas['processados']} eventos aplicados em {metricas['lotes']} lotes, "
+              f"{metricas['rejeitados']} rejeitados, latência p99 {metricas['latencia_p99_ms']:.1f} ms",
+              file=sys.stderr)
+    except KeyboardInterrupt:
+        print("\n👋 Ingestão encerrada", file=sys.stderr)
+    finally:
+        if armazenamento:
+            armazenamento.fechar()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,292 @@
+"""
+Instrumentação da Plataforma de Estatísticas do Futebol Feminino
+
+Envolve as consultas e os cadastros de um SistemaFutebolFeminino e registra,
+por método: quantidade de chamadas e de erros, histograma de latência, linhas
+examinadas (eventos, jogadoras e candidatos da busca) e, numa amostra das
+chamadas, a memória alocada (tracemalloc). As métricas saem em texto no
+formato do Prometheus ou em JSON, e um perfil cProfile pode ser ligado e
+desligado a qualquer momento.
+
+Os métodos são envolvidos apenas na instância do sistema (atributos que
+encobrem os métodos da classe). Sem instrumentação ativa nada é envolvido,
+então o custo é zero.
+
+Uso:
+    instrumentacao = sistema.ativar_instrumentacao()
+    ...
+    print(instrumentacao.prometheus())
+    instrumentacao.iniciar_perfil()
+    ...
+    print(instrumentacao.parar_perfil())
+"""
+
+import bisect
+import cProfile
+import functools
+import io
+import json
+import pstats
+import threading
+import time
+import tracemalloc
+
+# =============================================================================
+# CONFIGURAÇÕES DA INSTRUMENTAÇÃO
+# =============================================================================
+
+# Métodos instrumentados (consultas, autenticação e cadastros)
+METODOS_INSTRUMENTADOS = (
+    'calcular_estatisticas_jogadora',
+    'calcular_estatisticas_todas',
+    'obter_ranking',
+    'obter_ranking_gols',
+    'obter_ranking_assistencias',
+    'obter_classificacao',
+    'resumo_partida',
+    'resumo_partidas',
+    'comparar',
+    'linha_do_tempo',
+    'histograma_minutos',
+    'distribuicao_primeiro_gol',
+    'placar_derivado',
+    'reconciliar_placares',
+    'historico_da_jogadora',
+    'gols_por_clube',
+    'listar_disponiveis',
+    'buscar',
+    'buscar_jogadoras_por_nome',
+    'buscar_clubes_por_nome',
+    'buscar_campeonatos_por_nome',
+    'buscar_jogadora_por_id',
+    'buscar_clube_por_id',
+    'buscar_campeonato_por_id',
+    'buscar_partida_por_id',
+    'autenticar',
+    'fazer_login',
+    'adicionar_registro',
+    'adicionar_registros',
+    'registrar_jogadora',
+    'registrar_partida',
+    'finalizar_partida',
+    'registrar_evento',
+    'reconstruir_estatisticas'
+)
+
+# Limites superiores (segundos) das faixas do histograma de latência
+FAIXAS_LATENCIA = (0.00001, 0.00005, 0.0001, 0.0005, 0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1.0, 5.0)
+
+# Uma a cada N chamadas de cada método mede a memória alocada (0 desativa)
+AMOSTRAGEM_MEMORIA = 1000
+
+PREFIXO_PROMETHEUS = 'futebol'
+
+
+def novas_metricas():
+    """Métricas zeradas de um método"""
+    return {
+        'chamadas': 0,
+        'erros': 0,
+        'latencia_soma': 0.0,
+        'latencia_maxima': 0.0,
+        'faixas': [0] * (len(FAIXAS_LATENCIA) + 1),  # última faixa: acima de todos os limites
+        'linhas_examinadas': 0,
+        'amostras_memoria': 0,
+        'memoria_soma': 0,
+        'memoria_maxima': 0
+    }
+
+
+def escapar_rotulo(valor):
+    """Valor de rótulo no formato de texto do Prometheus"""
+    return str(valor).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+# =============================================================================
+# INSTRUMENTAÇÃO
+# =============================================================================
+
+class Instrumentacao:
+    """Métricas por método de um sistema; os métodos voltam ao normal com remover()"""
+    
+    def __init__(self, sistema, amostragem_memoria=None, metodos=None):
+        self.sistema = sistema
+        self.amostragem_memoria = AMOSTRAGEM_MEMORIA if amostragem_memoria is None else amostragem_memoria
+        self.metodos = tuple(metodos or METODOS_INSTRUMENTADOS)
+        self.dados = {metodo: novas_metricas() for metodo in self.metodos}
+        # Autenticação roda em threads (fazer_login): atualizações sob trava
+        self.trava = threading.Lock()
+        self.perfil = None
+        self.inicio = time.time()
+        
+        for metodo in self.metodos:
+            setattr(sistema, metodo, self.envolver(metodo, getattr(sistema, metodo)))
+    
+    def remover(self):
+        """Devolve os métodos originais da classe (e encerra um perfil em andamento)"""
+        if self.perfil is not None:
+            self.perfil.disable()
+            self.perfil = None
+        for metodo in self.metodos:
+            vars(self.sistema).pop(metodo, None)
+    
+    def envolver(self, metodo, original):
+        """Função que mede cada chamada do método e repassa para o original"""
+        dados = self.dados[metodo]
+        sistema = self.sistema
+        relogio = time.perf_counter
+        
+        @functools.wraps(original)
+        def medido(*args, **kwargs):
+            amostrar = (self.amostragem_memoria and dados['chamadas'] % self.amostragem_memoria == 0
+                        and not tracemalloc.is_tracing())
+            if amostrar:
+                tracemalloc.start()
+            linhas = sistema.total_linhas_examinadas()
+            inicio = relogio()
+            erro = False
+            try:
+                return original(*args, **kwargs)
+            except BaseException:
+                erro = True
+                raise
+            finally:
+                duracao = relogio() - inicio
+                linhas = sistema.total_linhas_examinadas() - linhas
+                pico = None
+                if amostrar:
+                    pico = tracemalloc.get_traced_memory()[1]
+                    tracemalloc.stop()
+                self.registrar(dados, duracao, linhas, erro, pico)
+        return medido
+    
+    def registrar(self, dados, duracao, linhas, erro, pico):
+        """Acumula uma chamada nas métricas do método"""
+        with self.trava:
+            dados['chamadas'] += 1
+            dados['erros'] += erro
+            dados['latencia_soma'] += duracao
+            if duracao > dados['latencia_maxima']:
+                dados['latencia_maxima'] = duracao
+            dados['faixas'][bisect.bisect_left(FAIXAS_LATENCIA, duracao)] += 1
+            # Chamadas internas (ex: ranking de gols -> ranking) também somam nas externas
+            dados['linhas_examinadas'] += linhas
+            if pico is not None:
+                dados['amostras_memoria'] += 1
+                dados['memoria_soma'] += pico
+                dados['memoria_maxima'] = max(dados['memoria_maxima'], pico)
+    
+    def zerar(self):
+        """Descarta as métricas coletadas até agora"""
+        with self.trava:
+            # Zera no lugar: cada função envolvida guarda o dicionário do seu método
+            for dados in self.dados.values():
+                dados.update(novas_metricas())
+            self.inicio = time.time()
+    
+    # =============================================================================
+    # EXPORTAÇÃO DAS MÉTRICAS
+    # =============================================================================
+    
+    def metricas(self):
+        """Métricas dos métodos já chamados: chamadas, erros, latência, linhas e memória"""
+        with self.trava:
+            copia = {metodo: dict(dados, faixas=list(dados['faixas']))
+                     for metodo, dados in self.dados.items() if dados['chamadas']}
+        
+        resultado = {}
+        for metodo, dados in copia.items():
+            chamadas = dados['chamadas']
+            acumulado = 0
+            faixas = {}
+            for limite, quantidade in zip(FAIXAS_LATENCIA + ('+Inf',), dados['faixas']):
+                acumulado += quantidade
+                faixas[str(limite)] = acumulado
+            amostras = dados['amostras_memoria']
+            resultado[metodo] = {
+                'chamadas': chamadas,
+                'erros': dados['erros'],
+                'latencia': {
+                    'soma': dados['latencia_soma'],
+                    'media': dados['latencia_soma'] / chamadas,
+                    'maxima': dados['latencia_maxima'],
+                    'faixas': faixas  # acumuladas: chamadas com latência <= limite
+                },
+                'linhas_examinadas': dados['linhas_examinadas'],
+                'memoria': {
+                    'amostras': amostras,
+                    'soma': dados['memoria_soma'],
+                    'pico_medio': dados['memoria_soma'] / amostras if amostras else 0,
+                    'pico_maximo': dados['memoria_maxima']
+                }
+            }
+        return resultado
+    
+    def mais_demoradas(self, limite=10):
+        """Pares (método, métricas) com o maior tempo total primeiro"""
+        return sorted(self.metricas().items(), key=lambda item: item[1]['latencia']['soma'], reverse=True)[:limite]
+    
+    def json(self):
+        """Métricas em JSON (com o instante de início da coleta)"""
+        return json.dumps({'inicio': self.inicio, 'metodos': self.metricas()}, indent=2, ensure_ascii=False)
+    
+    def prometheus(self, prefixo=PREFIXO_PROMETHEUS):
+        """Métricas no formato de texto do Prometheus (version 0.0.4)"""
+        metricas = self.metricas()
+        linhas = []
+        
+        def familia(nome, tipo, descricao):
+            linhas.append(f"# HELP {prefixo}_{nome} {descricao}")
+            linhas.append(f"# TYPE {prefixo}_{nome} {tipo}")
+        
+        familia('chamadas_total', 'counter', "Chamadas por método")
+        for metodo, dados in metricas.items():
+            linhas.append(f'{prefixo}_chamadas_total{{metodo="{escapar_rotulo(metodo)}"}} {dados["chamadas"]}')
+        
+        familia('erros_total', 'counter', "Chamadas que terminaram com exceção")
+        for metodo, dados in metricas.items():
+            linhas.append(f'{prefixo}_erros_total{{metodo="{escapar_rotulo(metodo)}"}} {dados["erros"]}')
+        
+        familia('latencia_segundos', 'histogram', "Latência das chamadas em segundos")
+        for metodo, dados in metricas.items():
+            rotulo = escapar_rotulo(metodo)
+            for limite, acumulado in dados['latencia']['faixas'].items():
+                linhas.append(f'{prefixo}_latencia_segundos_bucket{{metodo="{rotulo}",le="{limite}"}} {acumulado}')
+            linhas.append(f'{prefixo}_latencia_segundos_sum{{metodo="{rotulo}"}} {dados["latencia"]["soma"]}')
+            linhas.append(f'{prefixo}_latencia_segundos_count{{metodo="{rotulo}"}} {dados["chamadas"]}')
+        
+        familia('linhas_examinadas_total', 'counter', "Registros examinados (eventos, jogadoras, candidatos)")
+        for metodo, dados in metricas.items():
+            linhas.append(f'{prefixo}_linhas_examinadas_total{{metodo="{escapar_rotulo(metodo)}"}} '
+                          f'{dados["linhas_examinadas"]}')
+        
+        familia('memoria_alocada_bytes', 'summary', "Pico de memória alocada por chamada (amostra tracemalloc)")
+        for metodo, dados in metricas.items():
+            memoria = dados['memoria']
+            if memoria['amostras']:
+                rotulo = escapar_rotulo(metodo)
+                linhas.append(f'{prefixo}_memoria_alocada_bytes_sum{{metodo="{rotulo}"}} {memoria["soma"]}')
+                linhas.append(f'{prefixo}_memoria_alocada_bytes_count{{metodo="{rotulo}"}} {memoria["amostras"]}')
+        return '\n'.join(linhas) + '\n'
+    
+    # =============================================================================
+    # PERFIL (cProfile)
+    # =============================================================================
+    
+    def iniciar_perfil(self):
+        """Liga o cProfile (todas as funções chamadas a partir de agora, não só os métodos medidos)"""
+        if self.perfil is None:
+            self.perfil = cProfile.Profile()
+            self.perfil.enable()
+        return self.perfil
+    
+    def parar_perfil(self, limite=20, arquivo=None, ordem='cumulative'):
+        """Desliga o cProfile e retorna o relatório das funções mais caras (opcionalmente salva o .prof)"""
+        if self.perfil is None:
+            return ''
+        self.perfil.disable()
+        perfil, self.perfil = self.perfil, None
+        if arquivo:
+            perfil.dump_stats(arquivo)
+        saida = io.StringIO()
+        pstats.Stats(perfil, stream=saida).sort_stats(ordem).print_stats(limite)
+        return saida.getvalue()
@@ -0,0 +1,171 @@
+"""
+Linha do tempo das partidas da Plataforma de Estatísticas do Futebol Feminino
+
+Mantém os eventos de cada partida ordenados por minuto (listas paralelas com
+busca binária; o caso comum, um lance ao vivo mais recente que os outros, é
+inserção no final) e guarda a linha do tempo compacta já montada: uma tupla
+por evento com minuto, tipo, jogadora, lado (casa ou fora) e placar parcial.
+Um evento novo refaz apenas a linha da sua partida, e só no próximo pedido.
+
+Os histogramas contam eventos por faixa de minutos (1-15, 16-30, ..., 76-90
+e 90+ para os acréscimos) por jogadora, clube ou campeonato. Dentro de um
+bloco sistema.eventos_em_colunas() (eventos_colunares.py) a contagem é vetorizada.
+"""
+
+import bisect
+from collections import OrderedDict
+
+from plataforma_futebol_feminino import EVENTO_GOL
+
+# Largura padrão (minutos) das faixas dos histogramas
+LARGURA_FAIXA = 15
+
+# Tempo regulamentar: minutos acima dele caem na faixa dos acréscimos
+DURACAO_PARTIDA = 90
+
+# Agrupamentos dos histogramas
+AGRUPAMENTOS = ('jogadora', 'clube', 'campeonato')
+
+# Linhas do tempo guardadas (as menos consultadas são descartadas)
+CAPACIDADE_LINHAS = 4096
+
+# Campos de cada evento da linha do tempo compacta
+CAMPOS_LINHA = ('minuto', 'tipo', 'jogadora_id', 'lado', 'gols_casa', 'gols_fora')
+
+
+def limites_faixas(largura=LARGURA_FAIXA):
+    """Minuto final de cada faixa do tempo regulamentar (a faixa seguinte é a dos acréscimos)"""
+    if largura < 1:
+        raise ValueError("A largura das faixas deve ser de pelo menos 1 minuto")
+    return list(range(largura, DURACAO_PARTIDA, largura)) + [DURACAO_PARTIDA]
+
+
+def rotulos_faixas(largura=LARGURA_FAIXA):
+    """Rótulo de cada faixa: '1-15', '16-30', ..., '76-90', '90+'"""
+    rotulos = []
+    inicio = 1
+    for fim in limites_faixas(largura):
+        rotulos.append(f"{inicio}-{fim}")
+        inicio = fim + 1
+    rotulos.append(f"{DURACAO_PARTIDA}+")
+    return rotulos
+
+
+def histograma(pares, limites):
+    """Contagens por faixa de cada grupo a partir de pares (grupo, minuto); grupo None é ignorado"""
+    total_faixas = len(limites) + 1
+    grupos = {}
+    for grupo, minuto in pares:
+        if grupo is None:
+            continue
+        contagens = grupos.get(grupo)
+        if contagens is None:
+            contagens = grupos[grupo] = [0] * total_faixas
+        # Busca binária: primeira faixa cujo minuto final não é menor que o minuto do evento
+        contagens[bisect.bisect_left(limites, minuto)] += 1
+    return grupos
+
+
+def lado_do_clube(partida, clube_id):
+    """'casa', 'fora' ou None (clube que não disputa a partida)"""
+    if clube_id is None:
+        return None
+    if clube_id == partida['clube_casa_id']:
+        return 'casa'
+    if clube_id == partida['clube_fora_id']:
+        return 'fora'
+    return None
+
+# =============================================================================
+# LINHA DO TEMPO DE UMA PARTIDA
+# =============================================================================
+
+class LinhaDoTempo:
+    """Eventos de uma partida em ordem de minuto e a linha compacta já montada"""
+    
+    __slots__ = ('minutos', 'eventos', 'compacta')
+    
+    def __init__(self, eventos=()):
+        # Ordenação estável: eventos do mesmo minuto ficam na ordem de cadastro
+        self.eventos = sorted(eventos, key=lambda evento: evento['minuto'])
+        self.minutos = [evento['minuto'] for evento in self.eventos]
+        self.compacta = None
+    
+    def __len__(self):
+        return len(self.eventos)
+    
+    def adicionar(self, evento):
+        """Insere mantendo a ordem de minuto e descarta a linha compacta"""
+        # Caso comum (lance mais recente da partida): inserção no final, sem deslocar as listas
+        posicao = bisect.bisect_right(self.minutos, evento['minuto'])
+        self.minutos.insert(posicao, evento['minuto'])
+        self.eventos.insert(posicao, evento)
+        self.compacta = None
+    
+    def intervalo(self, inicio=None, fim=None):
+        """Eventos com inicio <= minuto <= fim (limites opcionais)"""
+        primeiro = 0 if inicio is None else bisect.bisect_left(self.minutos, inicio)
+        ultimo = len(self.minutos) if fim is None else bisect.bisect_right(self.minutos, fim)
+        return self.eventos[primeiro:ultimo]
+    
+    def primeiro(self, tipo=EVENTO_GOL):
+        """Primeiro evento do tipo na partida (ou None)"""
+        return next((evento for evento in self.eventos if evento['tipo'] == tipo), None)
+    
+    def montar(self, partida, clube_da_jogadora):
+        """Linha compacta: uma tupla (CAMPOS_LINHA) por evento, com o placar parcial após cada lance"""
+        if self.compacta is None:
+            gols = {'casa': 0, 'fora': 0}
+            linha = []
+            for evento in self.eventos:
+                lado = lado_do_clube(partida, clube_da_jogadora(evento['jogadora_id'], partida['data']))
+                if evento['tipo'] == EVENTO_GOL and lado:
+                    gols[lado] += 1
+                linha.append((evento['minuto'], evento['tipo'], evento['jogadora_id'], lado,
+                              gols['casa'], gols['fora']))
+            self.compacta = tuple(linha)
+        return self.compacta
+
+# =============================================================================
+# LINHAS DO TEMPO DE TODAS AS PARTIDAS
+# =============================================================================
+
+class LinhasDoTempo:
+    """Linhas do tempo por partida: montadas no primeiro pedido e atualizadas a cada evento"""
+    
+    def __init__(self, eventos_da_partida, capacidade=CAPACIDADE_LINHAS):
+        # Função partida_id -> eventos (lê só a página da partida quando os eventos são paginados)
+        self.eventos_da_partida = eventos_da_partida
+        self.capacidade = capacidade
+        self.linhas = OrderedDict()
+        self.examinados = 0
+    
+    def __len__(self):
+        return len(self.linhas)
+    
+    def obter(self, partida_id):
+        """Linha do tempo da partida, montando-a se ainda não estiver guardada"""
+        linha = self.linhas.get(partida_id)
+        if linha is None:
+            linha = self.linhas[partida_id] = LinhaDoTempo(self.eventos_da_partida(partida_id))
+            self.examinados += len(linha)
+            while len(self.linhas) > self.capacidade:
+                self.linhas.popitem(last=False)
+        else:
+            self.linhas.move_to_end(partida_id)
+        return linha
+    
+    def adicionar(self, evento):
+        """Leva um evento novo à linha da sua partida (se já estiver guardada)"""
+        linha = self.linhas.get(evento['partida_id'])
+        if linha is not None:
+            linha.adicionar(evento)
+    
+    def descartar_compactas(self, partida_ids=None):
+        """Descarta as linhas compactas (de algumas partidas ou de todas), mantendo os eventos ordenados"""
+        if partida_ids is None:
+            linhas = self.linhas.values()
+        else:
+            linhas = [self.linhas[partida_id] for partida_id in partida_ids if partida_id in self.linhas]
+        for linha in linhas:
+            linha.compacta = None
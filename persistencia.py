@@ -0,0 +1,404 @@
+"""
+Persistência de dados da Plataforma de Estatísticas do Futebol Feminino
+
+Armazenamentos plugáveis para o SistemaFutebolFeminino:
+- ArmazenamentoSQLite: banco SQLite com índices por jogadora, partida e tipo
+  de evento, capaz de calcular estatísticas diretamente em SQL
+- ArmazenamentoLog: log de registros somente-anexação com snapshots
+  incrementais (cada snapshot grava só os registros novos num segmento; a
+  inicialização lê os segmentos e reaplica só o final do log)
+
+Todos implementam a mesma interface:
+- carregar() -> dicionário {colecao: [registros]}
+- carregar_colecao(colecao) -> [registros] (carregamento sob demanda)
+- vazio() -> True se nenhum registro foi gravado
+- salvar_registro(colecao, registro) / salvar_registros(colecao, registros)
+- fechar()
+
+O ArmazenamentoSQLite também lê os eventos de uma única partida e as
+estatísticas de uma única jogadora pelos índices do banco, sem carregar o resto,
+e percorre uma coleção em lotes (inteira ou só um campeonato) para a exportação.
+"""
+
+import json
+import os
+import sqlite3
+
+from plataforma_futebol_feminino import (
+    COLECOES,
+    ESTATISTICA_POR_EVENTO,
+    Evento,
+    criar_registro,
+    novas_estatisticas
+)
+
+# =============================================================================
+# ARMAZENAMENTO SQLITE
+# =============================================================================
+
+# Colunas da tabela de eventos (demais coleções são guardadas como JSON)
+COLUNAS_EVENTO = ('id', 'partida_id', 'jogadora_id', 'tipo', 'minuto', 'observacoes')
+
+# Estrutura do banco: eventos em colunas próprias para permitir agregação em SQL
+ESQUEMA_SQLITE = """
+CREATE TABLE IF NOT EXISTS eventos (
+    seq INTEGER PRIMARY KEY AUTOINCREMENT,
+    id TEXT UNIQUE NOT NULL,
+    partida_id TEXT NOT NULL,
+    jogadora_id TEXT NOT NULL,
+    tipo TEXT NOT NULL,
+    minuto INTEGER,
+    observacoes TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_eventos_jogadora ON eventos (jogadora_id, partida_id);
+CREATE INDEX IF NOT EXISTS idx_eventos_partida ON eventos (partida_id);
+CREATE INDEX IF NOT EXISTS idx_eventos_tipo ON eventos (tipo, jogadora_id);
+"""
+
+
+class ArmazenamentoSQLite:
+    """Armazenamento em banco SQLite"""
+    
+    def __init__(self, caminho):
+        self.conexao = sqlite3.connect(caminho)
+        self.conexao.executescript(ESQUEMA_SQLITE)
+        
+        # Estrutura de repetição: uma tabela (id + JSON) para cada coleção que não é evento
+        for colecao in COLECOES:
+            if colecao != 'eventos':
+                self.conexao.execute(
+                    f"CREATE TABLE IF NOT EXISTS {colecao} ("
+                    "seq INTEGER PRIMARY KEY AUTOINCREMENT, "
+                    "id TEXT UNIQUE NOT NULL, dados TEXT NOT NULL)"
+                )
+        self.conexao.commit()
+    
+    def carregar(self):
+        """Carrega todas as coleções do banco, na ordem de inserção"""
+        return {colecao: self.carregar_colecao(colecao) for colecao in COLECOES}
+    
+    def carregar_colecao(self, colecao):
+        """Carrega uma coleção do banco, na ordem de inserção"""
+        if colecao == 'eventos':
+            cursor = self.conexao.execute(
+                f"SELECT {', '.join(COLUNAS_EVENTO)} FROM eventos ORDER BY seq"
+            )
+            return [Evento(*linha) for linha in cursor]
+        cursor = self.conexao.execute(f"SELECT dados FROM {colecao} ORDER BY seq")
+        return [criar_registro(colecao, json.loads(linha[0])) for linha in cursor]
+    
+    def carregar_eventos_da_partida(self, partida_id):
+        """Eventos de uma partida (uma "página" lida pelo índice de partida)"""
+        cursor = self.conexao.execute(
+            f"SELECT {', '.join(COLUNAS_EVENTO)} FROM eventos WHERE partida_id = ? ORDER BY seq",
+            (partida_id,)
+        )
+        return [Evento(*linha) for linha in cursor]
+    
+    def iterar_colecao(self, colecao, tamanho_lote=10000, campeonato_id=None):
+        """Lê uma coleção em lotes de registros (memória constante), opcionalmente de um só campeonato"""
+        if colecao == 'eventos':
+            colunas = ', '.join(f"e.{coluna}" for coluna in COLUNAS_EVENTO)
+            if campeonato_id is None:
+                cursor = self.conexao.execute(f"SELECT {colunas} FROM eventos e ORDER BY e.seq")
+            else:
+                # CROSS JOIN fixa a ordem: partidas do campeonato e, de cada uma, os eventos pelo índice
+                cursor = self.conexao.execute(
+                    f"SELECT {colunas} FROM partidas p CROSS JOIN eventos e ON e.partida_id = p.id "
+                    "WHERE json_extract(p.dados, '$.campeonato_id') = ? ORDER BY p.seq, e.seq",
+                    (campeonato_id,)
+                )
+            converter = lambda linha: Evento(*linha)
+        else:
+            if campeonato_id is None:
+                cursor = self.conexao.execute(f"SELECT dados FROM {colecao} ORDER BY seq")
+            elif colecao == 'partidas':
+                cursor = self.conexao.execute(
+                    "SELECT dados FROM partidas WHERE json_extract(dados, '$.campeonato_id') = ? ORDER BY seq",
+                    (campeonato_id,)
+                )
+            elif colecao == 'campeonatos':
+                cursor = self.conexao.execute("SELECT dados FROM campeonatos WHERE id = ?", (campeonato_id,))
+            else:
+                raise ValueError(f"A coleção {colecao} não pode ser filtrada por campeonato")
+            converter = lambda linha: criar_registro(colecao, json.loads(linha[0]))
+        
+        # Estrutura de repetição: busca o próximo lote até o cursor se esgotar
+        while True:
+            linhas = cursor.fetchmany(tamanho_lote)
+            if not linhas:
+                return
+            yield [converter(linha) for linha in linhas]
+    
+    def vazio(self):
+        """Verifica se nenhuma coleção tem registros (sem contar as linhas)"""
+        return not any(
+            self.conexao.execute(f"SELECT EXISTS (SELECT 1 FROM {colecao})").fetchone()[0]
+            for colecao in COLECOES
+        )
+    
+    def contar(self, colecao):
+        """Quantidade de registros de uma coleção"""
+        return self.conexao.execute(f"SELECT COUNT(*) FROM {colecao}").fetchone()[0]
+    
+    def ids_existentes(self, colecao, ids, tamanho_lote=500):
+        """IDs informados que já estão gravados na coleção (consulta IN (...) em lotes, pelo índice de id)"""
+        ids = list(ids)
+        existentes = set()
+        # Lotes de 500 ficam abaixo do limite de parâmetros por consulta do SQLite
+        for inicio in range(0, len(ids), tamanho_lote):
+            lote = ids[inicio:inicio + tamanho_lote]
+            marcadores = ', '.join('?' for _ in lote)
+            cursor = self.conexao.execute(f"SELECT id FROM {colecao} WHERE id IN ({marcadores})", lote)
+            existentes.update(linha[0] for linha in cursor)
+        return existentes
+    
+    def linhas(self, colecao, registros):
+        """Converte registros em tuplas de parâmetros para o SQL"""
+        if colecao == 'eventos':
+            return [tuple(registro[coluna] for coluna in COLUNAS_EVENTO) for registro in registros]
+        return [(registro['id'], json.dumps(dict(registro), ensure_ascii=False)) for registro in registros]
+    
+    def salvar_registros(self, colecao, registros):
+        """Insere ou atualiza vários registros em uma única transação"""
+        if colecao == 'eventos':
+            colunas = ', '.join(COLUNAS_EVENTO)
+            marcadores = ', '.join('?' for _ in COLUNAS_EVENTO)
+            atualizacao = ', '.join(f"{coluna} = excluded.{coluna}" for coluna in COLUNAS_EVENTO[1:])
+            sql = (f"INSERT INTO eventos ({colunas}) VALUES ({marcadores}) "
+                   f"ON CONFLICT(id) DO UPDATE SET {atualizacao}")
+        else:
+            sql = (f"INSERT INTO {colecao} (id, dados) VALUES (?, ?) "
+                   "ON CONFLICT(id) DO UPDATE SET dados = excluded.dados")
+        
+        with self.conexao:
+            self.conexao.executemany(sql, self.linhas(colecao, registros))
+    
+    def salvar_registro(self, colecao, registro):
+        """Insere ou atualiza um registro"""
+        self.salvar_registros(colecao, [registro])
+    
+    def carregar_estatisticas(self):
+        """Calcula a visão materializada de estatísticas diretamente em SQL"""
+        estatisticas = {}
+        partidas_por_jogadora = {}
+        
+        # Agregação no banco: contagem por jogadora e tipo usando o índice de tipo
+        cursor = self.conexao.execute(
+            "SELECT jogadora_id, tipo, COUNT(*) FROM eventos GROUP BY jogadora_id, tipo"
+        )
+        for jogadora_id, tipo, total in cursor:
+            stats = estatisticas.setdefault(jogadora_id, novas_estatisticas())
+            chave = ESTATISTICA_POR_EVENTO.get(tipo)
+            if chave:
+                stats[chave] += total
+        
+        cursor = self.conexao.execute("SELECT DISTINCT jogadora_id, partida_id FROM eventos")
+        for jogadora_id, partida_id in cursor:
+            partidas_por_jogadora.setdefault(jogadora_id, set()).add(partida_id)
+        
+        for jogadora_id, partidas in partidas_por_jogadora.items():
+            estatisticas[jogadora_id]['partidas_jogadas'] = len(partidas)
+        return estatisticas, partidas_por_jogadora
+    
+    def carregar_estatisticas_jogadora(self, jogadora_id):
+        """Estatísticas de uma única jogadora, usando o índice por jogadora"""
+        stats = novas_estatisticas()
+        cursor = self.conexao.execute(
+            "SELECT tipo, COUNT(*) FROM eventos WHERE jogadora_id = ? GROUP BY tipo", (jogadora_id,)
+        )
+        for tipo, total in cursor:
+            chave = ESTATISTICA_POR_EVENTO.get(tipo)
+            if chave:
+                stats[chave] += total
+        stats['partidas_jogadas'] = self.conexao.execute(
+            "SELECT COUNT(DISTINCT partida_id) FROM eventos WHERE jogadora_id = ?", (jogadora_id,)
+        ).fetchone()[0]
+        return stats
+    
+    def fechar(self):
+        """Fecha a conexão com o banco"""
+        self.conexao.close()
+
+
+# =============================================================================
+# ARMAZENAMENTO EM LOG COM SNAPSHOTS
+# =============================================================================
+
+ARQUIVO_LOG = 'registros.log'
+ARQUIVO_SNAPSHOT = 'snapshot.json'
+
+
+class ArmazenamentoLog:
+    """Log somente-anexação (JSON Lines) com snapshots incrementais em segmentos"""
+    
+    def __init__(self, diretorio, intervalo_snapshot=10000):
+        os.makedirs(diretorio, exist_ok=True)
+        self.diretorio = diretorio
+        self.caminho_log = os.path.join(diretorio, ARQUIVO_LOG)
+        self.caminho_snapshot = os.path.join(diretorio, ARQUIVO_SNAPSHOT)
+        self.intervalo_snapshot = intervalo_snapshot
+        self.registros_desde_snapshot = 0
+        
+        # Snapshot: posição do log já coberta e segmentos (do mais antigo ao mais novo), cada um
+        # com os registros gravados entre dois snapshots
+        self.snapshot = {'posicao_log': 0, 'proximo_segmento': 1, 'segmentos': []}
+        # Dicionário por coleção: id -> registro, só do trecho do log posterior ao último snapshot
+        # (os dados completos ficam no sistema, não numa segunda cópia aqui)
+        self.pendentes = {colecao: {} for colecao in COLECOES}
+        self.log = None
+        self.fechado = False
+    
+    def abrir(self):
+        """Lê o snapshot e reaplica apenas o trecho do log posterior a ele"""
+        if self.fechado:
+            raise ValueError("O armazenamento em log já foi fechado")
+        if os.path.exists(self.caminho_snapshot):
+            with open(self.caminho_snapshot, encoding='utf-8') as arquivo:
+                self.snapshot = json.load(arquivo)
+        posicao = self.snapshot['posicao_log']
+        
+        # Estrutura de repetição: reaplica o final do log (registros novos ou atualizados)
+        if os.path.exists(self.caminho_log):
+            with open(self.caminho_log, 'rb') as arquivo:
+                arquivo.seek(posicao)
+                for linha in arquivo:
+                    if not linha.endswith(b'\n'):
+                        break  # última linha incompleta (gravação interrompida)
+                    entrada = json.loads(linha)
+                    registro = criar_registro(entrada['colecao'], entrada['registro'])
+                    self.pendentes[entrada['colecao']][registro['id']] = registro
+                    self.registros_desde_snapshot += 1
+                    posicao += len(linha)
+        
+        # Modo binário: tell() retorna a posição em bytes usada pelo snapshot
+        self.log = open(self.caminho_log, 'ab')
+        self.log.truncate(posicao)  # descarta linha incompleta, se houver
+    
+    def caminho_segmento(self, numero, colecao):
+        """Arquivo de uma coleção dentro de um segmento do snapshot"""
+        return os.path.join(self.diretorio, f'snapshot_{numero:06d}_{colecao}.json')
+    
+    def ler_segmento(self, segmento, colecao):
+        """Registros (dicionários) de uma coleção gravados num segmento"""
+        if colecao not in segmento['colecoes']:
+            return []
+        with open(self.caminho_segmento(segmento['numero'], colecao), encoding='utf-8') as arquivo:
+            return json.load(arquivo)
+    
+    def carregar(self):
+        """Carrega todas as coleções: dicionário {colecao: [registros]}"""
+        return {colecao: self.carregar_colecao(colecao) for colecao in COLECOES}
+    
+    def carregar_colecao(self, colecao):
+        """Uma coleção com o estado atual: seus arquivos nos segmentos e o final do log"""
+        if self.log is None:
+            self.abrir()
+        # Segmentos mais novos sobrescrevem os mais antigos (registro atualizado mantém a posição)
+        registros = {}
+        for segmento in self.snapshot['segmentos']:
+            for dados in self.ler_segmento(segmento, colecao):
+                registros[dados['id']] = criar_registro(colecao, dados)
+        registros.update(self.pendentes[colecao])
+        return list(registros.values())
+    
+    def vazio(self):
+        """Verifica se nenhuma coleção tem registros"""
+        if self.log is None:
+            self.abrir()
+        return not self.snapshot['segmentos'] and not any(self.pendentes.values())
+    
+    def salvar_registros(self, colecao, registros):
+        """Anexa vários registros ao log"""
+        if self.log is None:
+            self.abrir()
+        for registro in registros:
+            self.pendentes[colecao][registro['id']] = registro
+            linha = json.dumps({'colecao': colecao, 'registro': dict(registro)}, ensure_ascii=False)
+            self.log.write(linha.encode('utf-8') + b'\n')
+            self.registros_desde_snapshot += 1
+        self.log.flush()
+        
+        if self.registros_desde_snapshot >= self.intervalo_snapshot:
+            self.criar_snapshot()
+    
+    def salvar_registro(self, colecao, registro):
+        """Anexa um registro ao log"""
+        self.salvar_registros(colecao, [registro])
+    
+    def gravar_json(self, caminho, dados):
+        """Grava um arquivo JSON de forma atômica"""
+        # Arquivo temporário + os.replace: um arquivo nunca fica pela metade
+        temporario = caminho + '.tmp'
+        with open(temporario, 'w', encoding='utf-8') as arquivo:
+            json.dump(dados, arquivo, ensure_ascii=False)
+        os.replace(temporario, caminho)
+    
+    def gravar_segmento(self, numero, registros_por_colecao):
+        """Grava um segmento novo (um arquivo por coleção com registros) e retorna a sua descrição"""
+        segmento = {'numero': numero, 'quantidade': 0, 'colecoes': []}
+        for colecao, registros in registros_por_colecao.items():
+            if registros:
+                self.gravar_json(self.caminho_segmento(numero, colecao), registros)
+                segmento['colecoes'].append(colecao)
+                segmento['quantidade'] += len(registros)
+        return segmento
+    
+    def juntar_segmentos(self, anterior, posterior, numero):
+        """Junta dois segmentos vizinhos num novo (o posterior prevalece em IDs repetidos)"""
+        registros_por_colecao = {}
+        for colecao in COLECOES:
+            registros = {}
+            for segmento in (anterior, posterior):
+                for dados in self.ler_segmento(segmento, colecao):
+                    registros[dados['id']] = dados
+            registros_por_colecao[colecao] = list(registros.values())
+        return self.gravar_segmento(numero, registros_por_colecao)
+    
+    def criar_snapshot(self):
+        """Grava só os registros desde o último snapshot num segmento novo e a posição atual do log"""
+        self.log.flush()
+        numero = self.snapshot['proximo_segmento']
+        segmentos = self.snapshot['segmentos'] + [self.gravar_segmento(numero, {
+            colecao: [dict(registro) for registro in registros.values()]
+            for colecao, registros in self.pendentes.items()
+        })]
+        # Segmentos substituídos (antigos ou intermediários) são apagados depois da troca
+        descartados = []
+        
+        # Junta o segmento novo ao anterior enquanto o anterior não for maior (como um contador binário):
+        # ficam O(log N) segmentos e cada registro é regravado O(log N) vezes, não o estado inteiro a cada snapshot
+        while len(segmentos) >= 2 and segmentos[-2]['quantidade'] <= segmentos[-1]['quantidade']:
+            numero += 1
+            descartados.extend(segmentos[-2:])
+            segmentos[-2:] = [self.juntar_segmentos(segmentos[-2], segmentos[-1], numero)]
+        
+        # A troca do snapshot.json é o ponto atômico: só depois os arquivos substituídos são apagados
+        self.snapshot = {'posicao_log': self.log.tell(), 'proximo_segmento': numero + 1, 'segmentos': segmentos}
+        self.gravar_json(self.caminho_snapshot, self.snapshot)
+        for segmento in descartados:
+            for colecao in segmento['colecoes']:
+                os.remove(self.caminho_segmento(segmento['numero'], colecao))
+        
+        self.pendentes = {colecao: {} for colecao in COLECOES}
+        self.registros_desde_snapshot = 0
+    
+    def fechar(self):
+        """Grava snapshot final e fecha o log (gravações posteriores geram ValueError)"""
+        if self.log:
+            if self.registros_desde_snapshot:
+                self.criar_snapshot()
+            self.log.close()
+            self.log = None
+        self.fechado = True
+
+
+# =============================================================================
+# SELEÇÃO DO ARMAZENAMENTO
+# =============================================================================
+
+def abrir_armazenamento(caminho):
+    """Abre SQLite para arquivos .db/.sqlite e log com snapshots para diretórios"""
+    if caminho.endswith(('.db', '.sqlite', '.sqlite3')):
+        return ArmazenamentoSQLite(caminho)
+    return ArmazenamentoLog(caminho)
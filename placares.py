@@ -0,0 +1,116 @@
+"""
+Placares derivados dos gols da Plataforma de Estatísticas do Futebol Feminino
+
+O placar registrado na partida (placar_casa/placar_fora) e os eventos de gol
+são cadastrados de forma independente. Aqui o placar é derivado dos gols:
+cada gol vai para o lado (casa ou fora) do clube da jogadora na data da
+partida, obtido pelo histórico de transferências (busca binária).
+
+- Incremental: cada gol novo soma 1 ao placar derivado da sua partida. Uma
+  partida ainda não vista é derivada só com os eventos dela (uma página).
+- Em lote: uma única passada agrupada por todos os eventos deriva todas as
+  partidas de uma vez.
+- Divergências: partidas cujo placar registrado difere do derivado, e gols
+  de jogadoras cujo clube não disputa a partida.
+"""
+
+from plataforma_futebol_feminino import EVENTO_GOL
+
+
+def lado_do_gol(partida, clube_id):
+    """Posição do lado no placar (0 = casa, 1 = fora) ou None se o clube não disputa a partida"""
+    if clube_id is None:
+        return None
+    if clube_id == partida['clube_casa_id']:
+        return 0
+    if clube_id == partida['clube_fora_id']:
+        return 1
+    return None
+
+
+def contar_gol(contagem, evento, partida, clube_da_jogadora):
+    """Soma um gol ao lado do clube da jogadora (ou aos gols sem clube); retorna o lado ou None"""
+    lado = lado_do_gol(partida, clube_da_jogadora(evento['jogadora_id'], partida['data']))
+    contagem[2 if lado is None else lado] += 1
+    return lado
+
+
+def placar_registrado(partida):
+    """Placar gravado na partida: (casa, fora)"""
+    return (partida['placar_casa'], partida['placar_fora'])
+
+
+class PlacaresDerivados:
+    """Placar de cada partida calculado a partir dos eventos de gol"""
+    
+    def __init__(self, eventos_da_partida, clube_da_jogadora):
+        # Função partida_id -> eventos (lê só a página da partida quando os eventos são paginados)
+        self.eventos_da_partida = eventos_da_partida
+        self.clube_da_jogadora = clube_da_jogadora
+        # Dicionário: partida_id -> [gols_casa, gols_fora, gols sem clube na partida]
+        self.placares = {}
+        # Depois de uma derivação em lote, partida sem gols tem placar 0 x 0 sem ler a página
+        self.completo = False
+        self.examinados = 0
+    
+    def __len__(self):
+        return len(self.placares)
+    
+    def contagem(self, partida):
+        """Contadores da partida, derivando-a dos seus eventos no primeiro acesso"""
+        contagem = self.placares.get(partida['id'])
+        if contagem is None:
+            contagem = self.placares[partida['id']] = [0, 0, 0]
+            if not self.completo:
+                eventos = self.eventos_da_partida(partida['id'])
+                self.examinados += len(eventos)
+                for evento in eventos:
+                    if evento['tipo'] == EVENTO_GOL:
+                        contar_gol(contagem, evento, partida, self.clube_da_jogadora)
+        return contagem
+    
+    def placar(self, partida):
+        """Placar derivado dos gols: (casa, fora)"""
+        contagem = self.contagem(partida)
+        return (contagem[0], contagem[1])
+    
+    def aplicar(self, evento, partida):
+        """Leva um gol novo (ainda não incluído nos eventos da partida) ao placar; retorna o lado ou None"""
+        return contar_gol(self.contagem(partida), evento, partida, self.clube_da_jogadora)
+    
+    def derivar_todas(self, eventos, partidas_por_id, clube_da_jogadora=None):
+        """Deriva o placar de todas as partidas numa única passada agrupada pelos eventos"""
+        clube_da_jogadora = clube_da_jogadora or self.clube_da_jogadora
+        placares = {}
+        total = 0
+        for total, evento in enumerate(eventos, 1):
+            if evento['tipo'] != EVENTO_GOL:
+                continue
+            partida = partidas_por_id.get(evento['partida_id'])
+            if partida is None:
+                continue
+            contagem = placares.get(partida['id'])
+            if contagem is None:
+                contagem = placares[partida['id']] = [0, 0, 0]
+            contar_gol(contagem, evento, partida, clube_da_jogadora)
+        self.placares = placares
+        self.completo = True
+        self.examinados += total
+    
+    def divergencias(self, partidas):
+        """Partidas com placar registrado diferente do derivado ou com gols sem clube na partida"""
+        resultado = []
+        for partida in partidas:
+            contagem = self.contagem(partida)
+            registrado = placar_registrado(partida)
+            derivado = (contagem[0], contagem[1])
+            if registrado != derivado or contagem[2]:
+                resultado.append({
+                    'partida_id': partida['id'],
+                    'data': partida['data'],
+                    'finalizada': partida['finalizada'],
+                    'registrado': registrado,
+                    'derivado': derivado,
+                    'gols_sem_clube': contagem[2]
+                })
+        return resultado
@@ -11,7 +11,19 @@ Sistema desenvolvido para demonstrar conceitos fundamentais de programação:
 """
 
 import hashlib
-import datetime
+import hmac
+import os
+import bisect
+import functools
+import heapq
+import itertools
+import re
+import sys
+import threading
+import time
+import unicodedata
+from collections import OrderedDict, deque
+from contextlib import contextmanager
 
 # =============================================================================
 # CONSTANTES E CONFIGURAÇÕES
@@ -21,6 +33,18 @@ import datetime
 TIPO_ADMIN = "admin"
 TIPO_USUARIO = "usuario"
 
+# Hash de senhas: PBKDF2-SHA256 com sal aleatório (custo configurável)
+ALGORITMO_SENHA = "pbkdf2_sha256"
+ITERACOES_SENHA = 200_000
+TAMANHO_SAL = 16
+
+# Threads para verificação de senhas (o PBKDF2 do hashlib libera o GIL)
+THREADS_SENHA = min(8, os.cpu_count() or 1)
+
+# Controle de tentativas de login: máximo de falhas por email dentro da janela
+LIMITE_FALHAS_LOGIN = 5
+JANELA_FALHAS_LOGIN = 300  # segundos
+
 # Tipos de eventos em partidas
 EVENTO_GOL = "gol"
 EVENTO_ASSISTENCIA = "assistencia"
@@ -29,25 +53,745 @@ EVENTO_CARTAO_VERMELHO = "cartao_vermelho"
 EVENTO_FINALIZACAO = "finalizacao"
 EVENTO_DEFESA = "defesa"
 
+# Coleções de entidades mantidas pelo sistema (cada uma com índice por ID)
+COLECOES = ('usuarios', 'jogadoras', 'clubes', 'campeonatos', 'partidas', 'eventos', 'transferencias')
+
+# Coleções com busca por nome (índice de busca textual)
+COLECOES_BUSCA = ('jogadoras', 'clubes', 'campeonatos')
+
+# Carregamento sob demanda: atributo do sistema -> coleção cuja leitura o preenche
+ATRIBUTOS_POR_COLECAO = {
+    'usuarios': 'usuarios',
+    'usuarios_por_email': 'usuarios',
+    'jogadoras': 'jogadoras',
+    'jogadoras_por_clube': 'jogadoras',
+    'clubes': 'clubes',
+    'campeonatos': 'campeonatos',
+    'partidas': 'partidas',
+    'partidas_por_data': 'partidas',
+    'partidas_por_campeonato': 'partidas',
+    'eventos': 'eventos',
+    'eventos_por_partida': 'eventos',
+    'transferencias': 'transferencias',
+    'historico_clubes': 'transferencias'
+}
+
+# Visão materializada, também lida sob demanda (ver carregar_visao_estatisticas)
+ATRIBUTOS_ESTATISTICAS = ('estatisticas', 'partidas_por_jogadora')
+
+# Mapeamento: tipo de evento -> contador de estatística correspondente
+ESTATISTICA_POR_EVENTO = {
+    EVENTO_GOL: 'gols',
+    EVENTO_ASSISTENCIA: 'assistencias',
+    EVENTO_CARTAO_AMARELO: 'cartoes_amarelos',
+    EVENTO_CARTAO_VERMELHO: 'cartoes_vermelhos',
+    EVENTO_FINALIZACAO: 'finalizacoes',
+    EVENTO_DEFESA: 'defesas'
+}
+
+# Estatísticas que podem ser usadas como critério de ranking
+# ('cartoes' é a soma de cartões amarelos e vermelhos)
+CHAVES_RANKING = (
+    'gols',
+    'assistencias',
+    'cartoes',
+    'cartoes_amarelos',
+    'cartoes_vermelhos',
+    'finalizacoes',
+    'defesas',
+    'partidas_jogadas'
+)
+
+# Quantidade máxima de resultados guardados no cache de consultas
+CAPACIDADE_CACHE = 1024
+
 # =============================================================================
 # FUNÇÕES AUXILIARES
 # =============================================================================
 
+class GeradorIds:
+    """Gera IDs únicos e ordenáveis: instante de início + contador + nó (estilo Snowflake)"""
+    
+    # Época própria (2024-01-01 UTC) em milissegundos e bits reservados ao contador
+    EPOCA_MS = 1704067200000
+    BITS_CONTADOR = 20
+    
+    def __init__(self):
+        self.reiniciar()
+    
+    def reiniciar(self):
+        """Recomeça o contador a partir do instante atual com um novo nó"""
+        instante = time.time_ns() // 1_000_000 - self.EPOCA_MS
+        
+        # itertools.count: next() é atômico no CPython, então não é preciso trava entre threads
+        self.contador = itertools.count(instante << self.BITS_CONTADOR)
+        
+        # Nó: identifica o processo (pid + bits aleatórios) para evitar colisões entre processos
+        no = (os.getpid() << 8 ^ int.from_bytes(os.urandom(3), 'big')) & 0xFFFFFF
+        self.formato = f"%016x{no:06x}"
+    
+    def gerar(self):
+        """Retorna um novo ID (22 caracteres hexadecimais, crescente dentro do processo)"""
+        return self.formato % next(self.contador)
+
+
+GERADOR_IDS = GeradorIds()
+
+# Processos filhos criados com fork recebem um novo nó e contador
+if hasattr(os, 'register_at_fork'):
+    os.register_at_fork(after_in_child=GERADOR_IDS.reiniciar)
+
 def gerar_id():
     """Gera um ID único para registros"""
-    timestamp = str(datetime.datetime.now())
-    return hashlib.md5(timestamp.encode()).hexdigest()[:8]
+    return GERADOR_IDS.gerar()
 
-def hash_senha(senha):
-    """Cria hash da senha para segurança"""
+def hash_senha(senha, iteracoes=ITERACOES_SENHA):
+    """Cria hash da senha com sal aleatório (formato: algoritmo$iteracoes$sal$hash)"""
+    sal = os.urandom(TAMANHO_SAL)
+    derivado = hashlib.pbkdf2_hmac('sha256', senha.encode(), sal, iteracoes)
+    return f"{ALGORITMO_SENHA}${iteracoes}${sal.hex()}${derivado.hex()}"
+
+def hash_senha_legado(senha):
+    """Hash SHA-256 sem sal usado pelas versões antigas do sistema"""
     return hashlib.sha256(senha.encode()).hexdigest()
 
+def verificar_senha(senha, senha_hash):
+    """Verifica a senha e retorna (correta, precisa_atualizar_hash)"""
+    partes = senha_hash.split('$')
+    
+    # Estrutura de decisão: hashes antigos (SHA-256 puro) continuam aceitos, mas devem ser migrados
+    if len(partes) != 4 or partes[0] != ALGORITMO_SENHA:
+        correta = hmac.compare_digest(hash_senha_legado(senha), senha_hash)
+        return correta, correta
+    
+    iteracoes = int(partes[1])
+    derivado = hashlib.pbkdf2_hmac('sha256', senha.encode(), bytes.fromhex(partes[2]), iteracoes)
+    correta = hmac.compare_digest(derivado.hex(), partes[3])
+    return correta, correta and iteracoes < ITERACOES_SENHA
+
+
+def conferir_senha(senha, senha_hash):
+    """Verifica a senha e já calcula o hash novo quando o antigo precisa de migração: (correta, novo_hash ou None)"""
+    # Só processamento (PBKDF2), sem tocar no sistema: seguro para rodar no pool de threads
+    correta, precisa_atualizar = verificar_senha(senha, senha_hash)
+    return correta, hash_senha(senha) if precisa_atualizar else None
+
+def novas_estatisticas():
+    """Cria dicionário de estatísticas com todos os contadores zerados"""
+    return {
+        'gols': 0,
+        'assistencias': 0,
+        'cartoes_amarelos': 0,
+        'cartoes_vermelhos': 0,
+        'finalizacoes': 0,
+        'defesas': 0,
+        'partidas_jogadas': 0
+    }
+
+def agregar_contadores(eventos):
+    """Uma passada pelos eventos: (estatisticas sem partidas_jogadas, partidas_por_jogadora)"""
+    estatisticas = {}
+    partidas_por_jogadora = {}
+    
+    # Estrutura de repetição: cada evento é visitado uma única vez
+    for evento in eventos:
+        jogadora_id = evento['jogadora_id']
+        stats = estatisticas.get(jogadora_id)
+        if stats is None:
+            stats = estatisticas[jogadora_id] = novas_estatisticas()
+            partidas_por_jogadora[jogadora_id] = set()
+        
+        partidas_por_jogadora[jogadora_id].add(evento['partida_id'])
+        chave = ESTATISTICA_POR_EVENTO.get(evento['tipo'])
+        if chave:
+            stats[chave] += 1
+    
+    return estatisticas, partidas_por_jogadora
+
+
+def agregar_estatisticas(eventos):
+    """Calcula estatísticas de todas as jogadoras em uma única passada pelos eventos"""
+    estatisticas, partidas_por_jogadora = agregar_contadores(eventos)
+    for jogadora_id, partidas in partidas_por_jogadora.items():
+        estatisticas[jogadora_id]['partidas_jogadas'] = len(partidas)
+    return estatisticas
+
+def estatisticas_de_contagens(contagens_por_tipo, partidas_jogadas):
+    """Monta o dicionário de estatísticas a partir de contagens por tipo de evento"""
+    stats = novas_estatisticas()
+    for tipo_evento, total in contagens_por_tipo.items():
+        chave = ESTATISTICA_POR_EVENTO.get(tipo_evento)
+        if chave:
+            stats[chave] += total
+    stats['partidas_jogadas'] = partidas_jogadas
+    return stats
+
+def valor_estatistica(stats, chave):
+    """Retorna o valor de uma estatística, incluindo as derivadas (ex: cartoes)"""
+    if chave == 'cartoes':
+        return stats['cartoes_amarelos'] + stats['cartoes_vermelhos']
+    return stats[chave]
+
 def exibir_cabecalho(titulo):
     """Exibe cabeçalho formatado"""
     print("\n" + "="*60)
     print(f"🏆 {titulo}")
     print("="*60)
 
+# =============================================================================
+# REGISTROS COMPACTOS
+# =============================================================================
+
+class Registro:
+    """Registro com __slots__ que também pode ser acessado como dicionário"""
+    
+    __slots__ = ()
+    
+    def __getitem__(self, campo):
+        if campo not in self.__slots__:
+            raise KeyError(campo)
+        return getattr(self, campo)
+    
+    def __setitem__(self, campo, valor):
+        if campo not in self.__slots__:
+            raise KeyError(campo)
+        setattr(self, campo, valor)
+    
+    def __contains__(self, campo):
+        return campo in self.__slots__
+    
+    def __iter__(self):
+        return iter(self.__slots__)
+    
+    def __len__(self):
+        return len(self.__slots__)
+    
+    def __eq__(self, outro):
+        if isinstance(outro, (Registro, dict)):
+            return dict(self.items()) == dict(outro.items())
+        return NotImplemented
+    
+    __hash__ = None
+    
+    def __repr__(self):
+        return f"{type(self).__name__}({dict(self.items())!r})"
+    
+    def get(self, campo, padrao=None):
+        """Equivalente a dict.get"""
+        return getattr(self, campo, padrao) if campo in self.__slots__ else padrao
+    
+    def keys(self):
+        """Equivalente a dict.keys"""
+        return list(self.__slots__)
+    
+    def values(self):
+        """Equivalente a dict.values"""
+        return [getattr(self, campo) for campo in self.__slots__]
+    
+    def items(self):
+        """Equivalente a dict.items"""
+        return [(campo, getattr(self, campo)) for campo in self.__slots__]
+    
+    def copy(self):
+        """Cria uma cópia do registro"""
+        return type(self)(**dict(self.items()))
+    
+    @classmethod
+    def de_dict(cls, dados):
+        """Cria o registro a partir de um dicionário (campos extras são ignorados)"""
+        return cls(**{campo: dados[campo] for campo in cls.__slots__ if campo in dados})
+
+
+# sys.intern: strings repetidas (tipos, posições, IDs referenciados) ocupam memória uma única vez
+
+class Jogadora(Registro):
+    """Jogadora cadastrada"""
+    
+    __slots__ = ('id', 'nome', 'posicao', 'clube_id', 'numero_camisa', 'idade',
+                 'nacionalidade', 'altura', 'peso', 'ativa')
+    
+    def __init__(self, id, nome, posicao, clube_id, numero_camisa, idade,
+                 nacionalidade, altura=None, peso=None, ativa=True):
+        self.id = sys.intern(id)
+        self.nome = nome
+        self.posicao = sys.intern(posicao)
+        self.clube_id = sys.intern(clube_id)
+        self.numero_camisa = numero_camisa
+        self.idade = idade
+        self.nacionalidade = sys.intern(nacionalidade)
+        self.altura = altura
+        self.peso = peso
+        self.ativa = ativa
+
+
+class Clube(Registro):
+    """Clube cadastrado"""
+    
+    __slots__ = ('id', 'nome', 'cidade', 'estado', 'pais', 'fundacao', 'cores', 'ativo')
+    
+    def __init__(self, id, nome, cidade, estado, pais, fundacao, cores=(), ativo=True):
+        self.id = sys.intern(id)
+        self.nome = nome
+        self.cidade = sys.intern(cidade)
+        self.estado = sys.intern(estado)
+        self.pais = sys.intern(pais)
+        self.fundacao = fundacao
+        self.cores = list(cores)
+        self.ativo = ativo
+
+
+class Partida(Registro):
+    """Partida entre dois clubes"""
+    
+    __slots__ = ('id', 'clube_casa_id', 'clube_fora_id', 'campeonato_id', 'data',
+                 'placar_casa', 'placar_fora', 'finalizada')
+    
+    def __init__(self, id, clube_casa_id, clube_fora_id, campeonato_id, data,
+                 placar_casa=0, placar_fora=0, finalizada=False):
+        self.id = sys.intern(id)
+        self.clube_casa_id = sys.intern(clube_casa_id)
+        self.clube_fora_id = sys.intern(clube_fora_id)
+        self.campeonato_id = sys.intern(campeonato_id)
+        self.data = sys.intern(data)
+        self.placar_casa = placar_casa
+        self.placar_fora = placar_fora
+        self.finalizada = finalizada
+
+
+class Evento(Registro):
+    """Evento de uma jogadora em uma partida"""
+    
+    __slots__ = ('id', 'partida_id', 'jogadora_id', 'tipo', 'minuto', 'observacoes')
+    
+    def __init__(self, id, partida_id, jogadora_id, tipo, minuto, observacoes=''):
+        self.id = id
+        self.partida_id = sys.intern(partida_id)
+        self.jogadora_id = sys.intern(jogadora_id)
+        self.tipo = sys.intern(tipo)
+        self.minuto = minuto
+        self.observacoes = observacoes
+
+
+# Classe de registro de cada coleção (coleções ausentes continuam usando dicionários)
+CLASSES_REGISTRO = {
+    'jogadoras': Jogadora,
+    'clubes': Clube,
+    'partidas': Partida,
+    'eventos': Evento
+}
+
+def criar_registro(colecao, dados):
+    """Converte um dicionário no registro compacto da coleção, quando houver"""
+    classe = CLASSES_REGISTRO.get(colecao)
+    if classe is None or isinstance(dados, classe):
+        return dados
+    return classe.de_dict(dados)
+
+# =============================================================================
+# ÍNDICE DE BUSCA TEXTUAL
+# =============================================================================
+
+PADRAO_TOKEN = re.compile(r'\w+')
+
+def normalizar_texto(texto):
+    """Remove acentos e converte para minúsculas (ex: 'Cássia' -> 'cassia')"""
+    decomposto = unicodedata.normalize('NFKD', texto)
+    return ''.join(c for c in decomposto if not unicodedata.combining(c)).casefold()
+
+def extrair_tokens(texto):
+    """Separa o texto normalizado em palavras"""
+    return PADRAO_TOKEN.findall(normalizar_texto(texto))
+
+# Qualidade de um casamento entre palavra buscada e palavra do nome (menor é melhor)
+CASAMENTO_EXATO = 0
+CASAMENTO_PREFIXO = 1
+CASAMENTO_TRECHO = 2
+
+class IndiceBusca:
+    """Índice invertido de nomes: palavras sem acento, prefixos e trechos (trigramas)"""
+    
+    def __init__(self):
+        self.documentos = {}          # id -> registro
+        self.palavras_documento = {}  # id -> palavras do nome
+        self.postings = {}            # palavra -> ids que contêm a palavra
+        self.postings_inicio = {}     # palavra -> ids cujo nome começa com a palavra
+        self.trigramas = {}           # trigrama -> palavras do vocabulário que o contêm
+        self.vocabulario = []         # palavras distintas (ordenadas sob demanda)
+        self.vocabulario_ordenado = True
+        self.examinados = 0           # candidatos examinados por todas as buscas (instrumentação)
+    
+    def __len__(self):
+        return len(self.documentos)
+    
+    def adicionar(self, identificador, texto, registro):
+        """Indexa o texto de um registro"""
+        palavras = extrair_tokens(texto)
+        self.documentos[identificador] = registro
+        self.palavras_documento[identificador] = tuple(palavras)
+        
+        for posicao, palavra in enumerate(palavras):
+            if palavra not in self.postings:
+                self.adicionar_ao_vocabulario(palavra)
+            self.postings[palavra].append(identificador)
+            if posicao == 0:
+                self.postings_inicio.setdefault(palavra, []).append(identificador)
+    
+    def adicionar_ao_vocabulario(self, palavra):
+        """Registra uma palavra nova no vocabulário e nos trigramas"""
+        self.postings[palavra] = []
+        self.vocabulario.append(palavra)
+        self.vocabulario_ordenado = False
+        for i in range(len(palavra) - 2):
+            self.trigramas.setdefault(palavra[i:i + 3], set()).add(palavra)
+    
+    def palavras_compativeis(self, termo):
+        """Palavras do vocabulário que casam com o termo: {palavra: qualidade}"""
+        compativeis = {}
+        
+        # Prefixos: faixa contígua do vocabulário ordenado (busca binária)
+        if not self.vocabulario_ordenado:
+            self.vocabulario.sort()
+            self.vocabulario_ordenado = True
+        inicio = bisect.bisect_left(self.vocabulario, termo)
+        for palavra in itertools.islice(self.vocabulario, inicio, None):
+            if not palavra.startswith(termo):
+                break
+            compativeis[palavra] = CASAMENTO_EXATO if palavra == termo else CASAMENTO_PREFIXO
+        
+        # Trechos: interseção dos trigramas do termo (termos curtos percorrem o vocabulário)
+        if len(termo) >= 3:
+            conjuntos = [self.trigramas.get(termo[i:i + 3], set()) for i in range(len(termo) - 2)]
+            candidatas = set.intersection(*sorted(conjuntos, key=len))
+        else:
+            candidatas = self.vocabulario
+        for palavra in candidatas:
+            if palavra not in compativeis and termo in palavra:
+                compativeis[palavra] = CASAMENTO_TRECHO
+        return compativeis
+    
+    def candidatos_por_qualidade(self, compativeis):
+        """Gera (qualidade, ID) em ordem: exato, prefixo, trecho (início do nome primeiro)"""
+        vistos = set()
+        for qualidade in (CASAMENTO_EXATO, CASAMENTO_PREFIXO, CASAMENTO_TRECHO):
+            palavras = sorted(palavra for palavra, nivel in compativeis.items() if nivel == qualidade)
+            for postings in (self.postings_inicio, self.postings):
+                for palavra in palavras:
+                    for identificador in postings.get(palavra, ()):
+                        if identificador not in vistos:
+                            vistos.add(identificador)
+                            yield qualidade, identificador
+    
+    def buscar(self, termo, limite=None):
+        """Busca registros cujo nome casa com todas as palavras do termo, melhores primeiro"""
+        termos = extrair_tokens(termo)
+        if not termos:
+            return list(itertools.islice(self.documentos.values(), limite))
+        
+        compativeis = [self.palavras_compativeis(termo) for termo in termos]
+        
+        # Uma palavra: candidatos já saem em ordem de qualidade, então basta parar no limite
+        if len(termos) == 1:
+            candidatos = self.candidatos_por_qualidade(compativeis[0])
+            resultado = [self.documentos[identificador]
+                         for _, identificador in itertools.islice(candidatos, limite)]
+            self.examinados += len(resultado)
+            return resultado
+        
+        if not all(compativeis):
+            return []
+        
+        # Várias palavras: parte da palavra mais rara e confere as demais em cada candidato
+        tamanhos = [sum(len(self.postings[palavra]) for palavra in grupo) for grupo in compativeis]
+        guia = tamanhos.index(min(tamanhos))
+        outras = [grupo for posicao, grupo in enumerate(compativeis) if posicao != guia]
+        minimo_outras = sum(min(grupo.values()) for grupo in outras)
+        
+        # Heap dos melhores até agora, com o pior no topo (pontuação e ordem negativas)
+        melhores = []
+        ordem = -1
+        for ordem, (qualidade, identificador) in enumerate(self.candidatos_por_qualidade(compativeis[guia])):
+            # Parada antecipada: nenhum candidato desta faixa em diante pontua melhor
+            if limite and len(melhores) == limite and -melhores[0][0] <= qualidade + minimo_outras:
+                break
+            palavras = self.palavras_documento[identificador]
+            pontuacao = qualidade
+            for grupo in outras:
+                niveis = [grupo[palavra] for palavra in palavras if palavra in grupo]
+                if not niveis:
+                    break
+                pontuacao += min(niveis)
+            else:
+                # Bônus: o nome começa pela primeira palavra buscada
+                if compativeis[0].get(palavras[0], CASAMENTO_TRECHO) == CASAMENTO_TRECHO:
+                    pontuacao += 1
+                heapq.heappush(melhores, (-pontuacao, -ordem, identificador))
+                if limite and len(melhores) > limite:
+                    heapq.heappop(melhores)
+        
+        self.examinados += ordem + 1
+        melhores.sort(reverse=True)
+        return [self.documentos[identificador] for _, _, identificador in melhores]
+
+# =============================================================================
+# ÍNDICE DE PARTIDAS POR DATA
+# =============================================================================
+
+class IndicePorData:
+    """IDs ordenados por data: intervalos de datas por busca binária"""
+    
+    def __init__(self):
+        # Listas paralelas: datas em ordem crescente e o ID de cada posição
+        self.datas = []
+        self.ids = []
+    
+    def adicionar(self, data, id):
+        """Insere mantendo a ordem (datas iguais ficam na ordem de cadastro)"""
+        # Caso comum (partida mais recente): inserção no final, sem deslocar a lista
+        posicao = bisect.bisect_right(self.datas, data)
+        self.datas.insert(posicao, data)
+        self.ids.insert(posicao, id)
+    
+    def intervalo(self, inicio=None, fim=None):
+        """Pares (data, id) com inicio <= data <= fim (limites opcionais, formato YYYY-MM-DD)"""
+        primeiro = 0 if inicio is None else bisect.bisect_left(self.datas, inicio)
+        ultimo = len(self.datas) if fim is None else bisect.bisect_right(self.datas, fim)
+        return list(zip(self.datas[primeiro:ultimo], self.ids[primeiro:ultimo]))
+    
+    def __len__(self):
+        return len(self.ids)
+
+# =============================================================================
+# HISTÓRICO DE CLUBES DAS JOGADORAS (TRANSFERÊNCIAS)
+# =============================================================================
+
+class HistoricoClubes:
+    """Passagens de uma jogadora por clubes: o clube numa data por busca binária"""
+    
+    __slots__ = ('inicios', 'clubes', 'clube_inicial')
+    
+    def __init__(self):
+        # Listas paralelas: data de cada transferência (em ordem) e o clube de destino
+        self.inicios = []
+        self.clubes = []
+        # Clube antes da primeira transferência (origem dela; None se desconhecido)
+        self.clube_inicial = None
+    
+    def adicionar(self, transferencia):
+        """Insere uma transferência mantendo a ordem de data"""
+        posicao = bisect.bisect_right(self.inicios, transferencia['data'])
+        self.inicios.insert(posicao, transferencia['data'])
+        self.clubes.insert(posicao, transferencia['clube_destino_id'])
+        if posicao == 0:
+            self.clube_inicial = transferencia.get('clube_origem_id')
+        return posicao
+    
+    def copia(self):
+        """Cópia independente (listas próprias) do histórico"""
+        copia = HistoricoClubes()
+        copia.inicios = list(self.inicios)
+        copia.clubes = list(self.clubes)
+        copia.clube_inicial = self.clube_inicial
+        return copia
+    
+    def clube_na_data(self, data):
+        """Clube da jogadora na data (YYYY-MM-DD): a transferência vale a partir do próprio dia"""
+        posicao = bisect.bisect_right(self.inicios, data)
+        return self.clubes[posicao - 1] if posicao else self.clube_inicial
+    
+    def periodos(self):
+        """Lista de (clube_id, inicio, fim): inicio None = antes da primeira transferência, fim None = atual"""
+        inicios = [None] + self.inicios
+        return list(zip([self.clube_inicial] + self.clubes, inicios, self.inicios + [None]))
+    
+    def __len__(self):
+        return len(self.inicios)
+
+# =============================================================================
+# CARREGAMENTO SOB DEMANDA
+# =============================================================================
+
+class IndicesPreguicosos(dict):
+    """Dicionário coleção -> índice que lê a coleção do armazenamento no primeiro acesso"""
+    
+    def __init__(self, carregar):
+        super().__init__()
+        self.carregar = carregar
+    
+    def __missing__(self, colecao):
+        self.carregar(colecao)
+        return dict.__getitem__(self, colecao)
+
+
+class EventosPorPartida(dict):
+    """Eventos agrupados por partida, lidos do armazenamento uma partida (página) por vez"""
+    
+    def __init__(self, carregar_pagina, carregar_todas):
+        super().__init__()
+        self.carregar_pagina = carregar_pagina
+        # Percorrer todas as partidas exige todos os eventos: delega ao dicionário completo
+        self.carregar_todas = carregar_todas
+    
+    def __missing__(self, partida_id):
+        eventos = self.carregar_pagina(partida_id)
+        # Página vazia não fica guardada: a partida pode receber eventos de outro processo depois
+        if eventos:
+            self[partida_id] = eventos
+        return eventos
+    
+    def get(self, partida_id, padrao=None):
+        """Equivalente a dict.get, lendo a página se ela ainda não estiver guardada"""
+        eventos = dict.get(self, partida_id)
+        if eventos is None:
+            eventos = self.__missing__(partida_id)
+        return eventos or padrao
+    
+    def setdefault(self, partida_id, padrao=None):
+        """Equivalente a dict.setdefault, sem perder os eventos já gravados da partida"""
+        eventos = dict.get(self, partida_id)
+        if eventos is None:
+            # Página vazia no armazenamento: passa a ser guardada com o valor padrão
+            eventos = self[partida_id] = self.__missing__(partida_id) or padrao
+        return eventos
+    
+    def __iter__(self):
+        return iter(self.carregar_todas())
+    
+    def __len__(self):
+        return len(self.carregar_todas())
+    
+    def keys(self):
+        return self.carregar_todas().keys()
+    
+    def values(self):
+        return self.carregar_todas().values()
+    
+    def items(self):
+        return self.carregar_todas().items()
+
+# =============================================================================
+# CACHE DE CONSULTAS
+# =============================================================================
+
+# Marca de "resultado ausente" (None também pode ser um resultado válido)
+AUSENTE = object()
+
+
+class CacheConsultas:
+    """Cache LRU de consultas, invalidado pela versão das entidades de que cada resultado depende"""
+    
+    def __init__(self, capacidade=CAPACIDADE_CACHE):
+        self.capacidade = capacidade
+        # Dicionário ordenado: (método, argumentos) -> (dependências com versões, resultado)
+        self.entradas = OrderedDict()
+        # Versão de cada entidade: ('jogadora', id), ('colecao', 'eventos'), ...
+        self.versoes = {}
+        self.acertos = 0
+        self.falhas = 0
+        self.despejos = 0
+        self.invalidacoes = 0
+    
+    def alterar(self, *entidades):
+        """Incrementa a versão das entidades alteradas (invalida os resultados que dependem delas)"""
+        for entidade in entidades:
+            self.versoes[entidade] = self.versoes.get(entidade, 0) + 1
+    
+    def obter(self, chave):
+        """Resultado guardado e ainda válido, ou AUSENTE"""
+        entrada = self.entradas.get(chave)
+        if entrada is None:
+            self.falhas += 1
+            return AUSENTE
+        
+        dependencias, resultado = entrada
+        for entidade, versao in dependencias:
+            if self.versoes.get(entidade, 0) != versao:
+                del self.entradas[chave]
+                self.invalidacoes += 1
+                self.falhas += 1
+                return AUSENTE
+        
+        self.entradas.move_to_end(chave)
+        self.acertos += 1
+        return resultado
+    
+    def guardar(self, chave, entidades, resultado):
+        """Guarda um resultado com a versão atual das entidades, descartando o menos usado"""
+        self.entradas[chave] = (tuple((entidade, self.versoes.get(entidade, 0)) for entidade in entidades),
+                                resultado)
+        self.entradas.move_to_end(chave)
+        while len(self.entradas) > self.capacidade:
+            self.entradas.popitem(last=False)
+            self.despejos += 1
+    
+    def limpar(self):
+        """Descarta todos os resultados guardados"""
+        self.invalidacoes += len(self.entradas)
+        self.entradas.clear()
+    
+    def metricas(self):
+        """Acertos, falhas, despejos, invalidações e ocupação do cache"""
+        consultas = self.acertos + self.falhas
+        return {
+            'tamanho': len(self.entradas),
+            'capacidade': self.capacidade,
+            'acertos': self.acertos,
+            'falhas': self.falhas,
+            'despejos': self.despejos,
+            'invalidacoes': self.invalidacoes,
+            'taxa_acerto': self.acertos / consultas if consultas else 0.0
+        }
+
+
+def contar_por_tipo(eventos):
+    """Quantidade de eventos de cada tipo"""
+    resumo = {}
+    for evento in eventos:
+        resumo[evento['tipo']] = resumo.get(evento['tipo'], 0) + 1
+    return resumo
+
+
+def entidades_afetadas(colecao, registro):
+    """Entidades cujas consultas mudam quando um registro da coleção é cadastrado ou alterado"""
+    if colecao == 'eventos':
+        return (('jogadora', registro['jogadora_id']), ('partida', registro['partida_id']))
+    if colecao == 'jogadoras':
+        return (('jogadora', registro['id']), ('clube', registro['clube_id']))
+    if colecao == 'partidas':
+        return (('partida', registro['id']), ('campeonato', registro['campeonato_id']))
+    if colecao == 'clubes':
+        return (('clube', registro['id']),)
+    if colecao == 'campeonatos':
+        return (('campeonato', registro['id']),)
+    if colecao == 'transferencias':
+        return (('jogadora', registro['jogadora_id']), ('clube', registro['clube_destino_id']),
+                ('clube', registro.get('clube_origem_id')))
+    return ()
+
+
+def em_cache(*dependencias):
+    """Decorador: guarda o resultado do método no cache do sistema (resultado somente leitura)"""
+    # Cada dependência é uma entidade fixa, ex: ('colecao', 'eventos'), ou uma função que
+    # recebe os argumentos do método e retorna a entidade, ex: lambda partida_id: ('partida', partida_id)
+    def decorador(metodo):
+        @functools.wraps(metodo)
+        def consultar(self, *args, **kwargs):
+            if self.cache is None:
+                return metodo(self, *args, **kwargs)
+            chave = (metodo.__name__, args, tuple(sorted(kwargs.items())))
+            try:
+                resultado = self.cache.obter(chave)
+            except TypeError:
+                # Argumentos não hasheáveis (ex: listas): consulta sem cache
+                return metodo(self, *args, **kwargs)
+            if resultado is AUSENTE:
+                resultado = metodo(self, *args, **kwargs)
+                entidades = [dependencia(*args, **kwargs) if callable(dependencia) else dependencia
+                             for dependencia in dependencias]
+                self.cache.guardar(chave, entidades, resultado)
+            return resultado
+        return consultar
+    return decorador
+
 # =============================================================================
 # SISTEMA PRINCIPAL
 # =============================================================================
@@ -55,7 +799,7 @@ def exibir_cabecalho(titulo):
 class SistemaFutebolFeminino:
     """Sistema principal da plataforma de estatísticas"""
     
-    def __init__(self):
+    def __init__(self, armazenamento=None, preguicoso=True):
         # Listas para armazenar dados (conceito de listas)
         self.usuarios = []
         self.jogadoras = []
@@ -63,10 +807,65 @@ class SistemaFutebolFeminino:
         self.campeonatos = []
         self.partidas = []
         self.eventos = []
+        self.transferencias = []
         self.usuario_logado = None
         
-        # Inicializa dados de exemplo
-        self.inicializar_dados_exemplo()
+        # Índices (dicionários) para buscas em O(1), sincronizados a cada cadastro
+        self.indices = {colecao: {} for colecao in COLECOES}
+        self.usuarios_por_email = {}
+        self.jogadoras_por_clube = {}
+        self.eventos_por_partida = {}
+        self.indices_busca = {colecao: IndiceBusca() for colecao in COLECOES_BUSCA}
+        
+        # Histórico de clubes por jogadora (transferências) para atribuir lances pela data da partida
+        self.historico_clubes = {}
+        
+        # Partidas ordenadas por data (todas e por campeonato) para consultas por período
+        self.partidas_por_data = IndicePorData()
+        self.partidas_por_campeonato = {}
+        
+        # Visão materializada: estatísticas por jogadora, atualizadas a cada evento
+        self.estatisticas = {}
+        self.partidas_por_jogadora = {}
+        
+        # Verificação de senhas em lote (pool de threads) e registro de falhas de login por email
+        self.executor_senhas = None
+        self.falhas_login = {}
+        self.trava_login = threading.Lock()
+        
+        # Colunas dos eventos, montadas só durante um bloco eventos_em_colunas()
+        self.eventos_colunares = None
+        
+        # Classificação dos campeonatos (montada na primeira consulta, depois incremental)
+        self.classificacoes = None
+        
+        # Eventos de cada partida em ordem de minuto (montados no primeiro pedido, depois incrementais)
+        self.linhas_do_tempo = None
+        
+        # Placar de cada partida derivado dos gols (derivado no primeiro gol ou consulta, depois incremental)
+        self.placares = None
+        
+        # Armazenamento persistente opcional (ver persistencia.py) e leitura sob demanda
+        self.armazenamento = armazenamento
+        self.preguicoso = preguicoso and hasattr(armazenamento, 'carregar_colecao')
+        
+        # Versão dos dados: muda a cada alteração (permite reaproveitar respostas já calculadas)
+        self.versao = 0
+        
+        # Cache LRU das consultas mais frequentes (None desativa)
+        self.cache = CacheConsultas()
+        
+        # Registros examinados pelas consultas e instrumentação opcional (ver instrumentacao.py)
+        self.linhas_examinadas = 0
+        self.instrumentacao = None
+        
+        # Carrega dados persistidos ou inicializa dados de exemplo
+        if armazenamento:
+            self.carregar_dados()
+        else:
+            self.inicializar_dados_exemplo()
+            self.reconstruir_indices()
+            self.reconstruir_estatisticas()
     
     def inicializar_dados_exemplo(self):
         """Inicializa dados de exemplo para demonstração"""
@@ -209,16 +1008,342 @@ class SistemaFutebolFeminino:
             {'id': 'evt_004', 'partida_id': 'part_001', 'jogadora_id': 'jog_003', 'tipo': EVENTO_CARTAO_AMARELO, 'minuto': 78, 'observacoes': 'Falta tática'}
         ]
     
+    def carregar_dados(self):
+        """Carrega os dados do armazenamento persistente (tudo ou sob demanda)"""
+        if self.preguicoso:
+            # Estrutura de decisão: armazenamento vazio recebe os dados de exemplo
+            if self.armazenamento.vazio():
+                self.salvar_dados_exemplo()
+            else:
+                self.preparar_carregamento_sob_demanda()
+            return
+        
+        dados = self.armazenamento.carregar()
+        if not any(dados.values()):
+            self.salvar_dados_exemplo()
+            return
+        
+        for colecao in COLECOES:
+            setattr(self, colecao, dados.get(colecao, []))
+        self.reconstruir_indices()
+        self.carregar_visao_estatisticas()
+    
+    def salvar_dados_exemplo(self):
+        """Grava os dados de exemplo num armazenamento vazio"""
+        self.inicializar_dados_exemplo()
+        for colecao in COLECOES:
+            self.armazenamento.salvar_registros(colecao, getattr(self, colecao))
+        self.reconstruir_indices()
+        self.reconstruir_estatisticas()
+    
+    def carregar_visao_estatisticas(self):
+        """Monta a visão materializada (agregação delegada ao armazenamento quando ele sabe calculá-la, ex: SQL)"""
+        estatisticas = None
+        if hasattr(self.armazenamento, 'carregar_estatisticas'):
+            estatisticas = self.armazenamento.carregar_estatisticas()
+        if estatisticas:
+            self.estatisticas, self.partidas_por_jogadora = estatisticas
+        else:
+            self.reconstruir_estatisticas()
+    
+    # =============================================================================
+    # CARREGAMENTO SOB DEMANDA
+    # =============================================================================
+    
+    def preparar_carregamento_sob_demanda(self):
+        """Inicialização em tempo constante: coleções, índices e estatísticas são lidos no primeiro uso"""
+        # Sem os atributos, o primeiro acesso a cada um passa por __getattr__
+        for atributo in (*ATRIBUTOS_POR_COLECAO, *ATRIBUTOS_ESTATISTICAS):
+            vars(self).pop(atributo, None)
+        self.indices = IndicesPreguicosos(self.carregar_colecao)
+        self.indices_busca = IndicesPreguicosos(self.carregar_indice_busca)
+        
+        # Eventos paginados por partida quando o armazenamento sabe ler uma partida isolada
+        if hasattr(self.armazenamento, 'carregar_eventos_da_partida'):
+            self.eventos_por_partida = EventosPorPartida(
+                self.armazenamento.carregar_eventos_da_partida,
+                self.carregar_todos_eventos
+            )
+    
+    def __getattr__(self, nome):
+        """Lê do armazenamento coleções, índices e estatísticas ainda não carregados"""
+        # Chamado apenas quando o atributo não existe (atributos já carregados não passam por aqui)
+        if nome in ATRIBUTOS_POR_COLECAO:
+            self.carregar_colecao(ATRIBUTOS_POR_COLECAO[nome])
+        elif nome in ATRIBUTOS_ESTATISTICAS:
+            self.carregar_visao_estatisticas()
+        else:
+            raise AttributeError(f"'{type(self).__name__}' não tem o atributo '{nome}'")
+        return vars(self)[nome]
+    
+    def carregar_colecao(self, colecao):
+        """Lê uma coleção do armazenamento e monta os seus índices"""
+        if colecao not in COLECOES or 'armazenamento' not in vars(self):
+            raise KeyError(colecao)
+        registros = self.armazenamento.carregar_colecao(colecao)
+        setattr(self, colecao, registros)
+        self.criar_indices(colecao)
+        # O índice de busca (o mais caro) só é montado na primeira busca
+        self.indices_busca.pop(colecao, None)
+        for registro in registros:
+            self.indexar_registro(colecao, registro)
+    
+    def carregar_indice_busca(self, colecao):
+        """Monta o índice de busca de uma coleção no primeiro uso"""
+        if colecao not in COLECOES_BUSCA:
+            raise KeyError(colecao)
+        registros = getattr(self, colecao)
+        indice = self.indices_busca[colecao] = IndiceBusca()
+        for registro in registros:
+            indice.adicionar(registro['id'], registro['nome'], registro)
+    
+    def carregar_todos_eventos(self):
+        """Lê todos os eventos (deixam de ser paginados) e retorna o agrupamento completo por partida"""
+        self.carregar_colecao('eventos')
+        return self.eventos_por_partida
+    
+    def eventos_paginados(self):
+        """Verifica se os eventos ainda são lidos do armazenamento uma partida por vez"""
+        return isinstance(vars(self).get('eventos_por_partida'), EventosPorPartida)
+    
+    def contar(self, colecao):
+        """Quantidade de registros da coleção (sem carregá-la, se o armazenamento souber contar)"""
+        if colecao in vars(self) or not hasattr(self.armazenamento, 'contar'):
+            return len(getattr(self, colecao))
+        return self.armazenamento.contar(colecao)
+    
+    def ids_existentes(self, colecao, ids):
+        """IDs informados que existem na coleção (sem carregá-la, se o armazenamento souber consultá-los)"""
+        if colecao in vars(self) or not hasattr(self.armazenamento, 'ids_existentes'):
+            indice = self.indices[colecao]
+            return {id_registro for id_registro in ids if id_registro in indice}
+        return self.armazenamento.ids_existentes(colecao, ids)
+    
+    # =============================================================================
+    # REPOSITÓRIO E ÍNDICES
+    # =============================================================================
+    
+    def indexar_registro(self, colecao, registro):
+        """Inclui um registro nos índices primário e secundários da coleção"""
+        self.indices[colecao][registro['id']] = registro
+        
+        # Estrutura de decisão: índices secundários específicos de cada coleção
+        if colecao == 'usuarios':
+            self.usuarios_por_email[registro['email']] = registro
+        elif colecao == 'jogadoras':
+            self.jogadoras_por_clube.setdefault(registro['clube_id'], []).append(registro)
+        elif colecao == 'eventos':
+            self.eventos_por_partida.setdefault(registro['partida_id'], []).append(registro)
+        elif colecao == 'partidas':
+            self.partidas_por_data.adicionar(registro['data'], registro['id'])
+            self.partidas_por_campeonato.setdefault(registro['campeonato_id'], IndicePorData()).adicionar(
+                registro['data'], registro['id'])
+        elif colecao == 'transferencias':
+            self.historico_clubes.setdefault(registro['jogadora_id'], HistoricoClubes()).adicionar(registro)
+        
+        # "in" não dispara o carregamento: índices de busca ainda não montados são ignorados
+        if colecao in self.indices_busca:
+            self.indices_busca[colecao].adicionar(registro['id'], registro['nome'], registro)
+    
+    def criar_indices(self, colecao):
+        """Cria vazios o índice primário e os índices secundários de uma coleção"""
+        self.indices[colecao] = {}
+        if colecao == 'usuarios':
+            self.usuarios_por_email = {}
+        elif colecao == 'jogadoras':
+            self.jogadoras_por_clube = {}
+        elif colecao == 'eventos':
+            self.eventos_por_partida = {}
+        elif colecao == 'partidas':
+            self.partidas_por_data = IndicePorData()
+            self.partidas_por_campeonato = {}
+        elif colecao == 'transferencias':
+            self.historico_clubes = {}
+        
+        if colecao in COLECOES_BUSCA:
+            self.indices_busca[colecao] = IndiceBusca()
+    
+    def reconstruir_indices(self):
+        """Reconstrói todos os índices a partir das listas de dados"""
+        self.indices = {}
+        self.indices_busca = {}
+        for colecao in COLECOES:
+            self.criar_indices(colecao)
+            for registro in getattr(self, colecao):
+                self.indexar_registro(colecao, registro)
+    
+    def adicionar_registro(self, colecao, registro):
+        """Adiciona registro à lista da coleção mantendo os índices sincronizados"""
+        # Placar derivado antes de indexar o evento: partida vista pela primeira vez é derivada sem o gol novo
+        if colecao == 'eventos':
+            self.atualizar_placares([registro])
+        
+        # Eventos paginados: gravados antes, para que o armazenamento (fonte de self.eventos e das páginas)
+        # já os tenha; senão a gravação vem por último, pois a coleção lida agora ainda não tem o registro
+        gravado = colecao == 'eventos' and self.eventos_paginados()
+        if gravado:
+            self.armazenamento.salvar_registro(colecao, registro)
+            self.adicionar_as_paginas([registro])
+        else:
+            getattr(self, colecao).append(registro)
+            self.indexar_registro(colecao, registro)
+        
+        if colecao == 'eventos':
+            # Visão ainda não lida: o evento entra na agregação feita ao carregá-la
+            if 'estatisticas' in vars(self):
+                self.atualizar_estatisticas(registro)
+            if self.eventos_colunares is not None:
+                self.eventos_colunares.adicionar(registro)
+            if self.linhas_do_tempo is not None:
+                self.linhas_do_tempo.adicionar(registro)
+        self.registrar_alteracoes(colecao, [registro])
+        if self.armazenamento and not gravado:
+            self.armazenamento.salvar_registro(colecao, registro)
+        return registro
+    
+    def adicionar_registros(self, colecao, registros):
+        """Adiciona um lote de registros com uma única gravação no armazenamento"""
+        if colecao == 'eventos':
+            self.atualizar_placares(registros)
+        
+        gravado = colecao == 'eventos' and self.eventos_paginados()
+        if gravado:
+            self.armazenamento.salvar_registros(colecao, registros)
+            self.adicionar_as_paginas(registros)
+        else:
+            getattr(self, colecao).extend(registros)
+            for registro in registros:
+                self.indexar_registro(colecao, registro)
+        
+        if colecao == 'eventos' and 'estatisticas' in vars(self):
+            for registro in registros:
+                self.atualizar_estatisticas(registro)
+        
+        if colecao == 'eventos' and self.eventos_colunares is not None:
+            self.eventos_colunares.adicionar_varios(registros)
+        if colecao == 'eventos' and self.linhas_do_tempo is not None:
+            for registro in registros:
+                self.linhas_do_tempo.adicionar(registro)
+        self.registrar_alteracoes(colecao, registros)
+        if self.armazenamento and not gravado:
+            self.armazenamento.salvar_registros(colecao, registros)
+        return registros
+    
+    def adicionar_as_paginas(self, eventos):
+        """Leva eventos já gravados às páginas em memória (páginas não lidas já os terão ao serem lidas)"""
+        for evento in eventos:
+            # dict.get não lê a página: uma página lida agora já viria com o evento
+            pagina = dict.get(self.eventos_por_partida, evento['partida_id'])
+            if pagina is not None:
+                pagina.append(evento)
+    
+    def gravar_registros(self, colecao, registros):
+        """Grava um lote direto no armazenamento, sem guardá-lo em memória (coleção ainda não carregada)"""
+        # Coleção já em memória (ou sem armazenamento): o lote entra nela normalmente
+        if not self.armazenamento or colecao in vars(self):
+            return self.adicionar_registros(colecao, registros)
+        
+        if colecao == 'eventos':
+            self.atualizar_placares(registros)
+            # Páginas lidas (inclusive pelo placar) ficariam sem os eventos novos: saem e são relidas no próximo uso
+            if self.eventos_paginados():
+                for registro in registros:
+                    dict.pop(self.eventos_por_partida, registro['partida_id'], None)
+            if 'estatisticas' in vars(self):
+                for registro in registros:
+                    self.atualizar_estatisticas(registro)
+            if self.eventos_colunares is not None:
+                self.eventos_colunares.adicionar_varios(registros)
+            if self.linhas_do_tempo is not None:
+                for registro in registros:
+                    self.linhas_do_tempo.adicionar(registro)
+        self.registrar_alteracoes(colecao, registros)
+        self.armazenamento.salvar_registros(colecao, registros)
+        return registros
+    
+    def registrar_alteracoes(self, colecao, registros):
+        """Propaga registros novos ou alterados: versão dos dados, cache de consultas e classificação"""
+        self.versao += 1
+        if self.cache:
+            # Conjunto: cada entidade recebe uma única nova versão por lote
+            entidades = {('colecao', colecao)}
+            for registro in registros:
+                entidades.update(entidades_afetadas(colecao, registro))
+            self.cache.alterar(*entidades)
+        if colecao == 'partidas':
+            for registro in registros:
+                self.atualizar_classificacao(registro)
+        # Lado (casa/fora) de cada lance depende do clube da jogadora e dos clubes da partida
+        if self.linhas_do_tempo is not None and colecao in ('jogadoras', 'transferencias'):
+            self.linhas_do_tempo.descartar_compactas()
+        elif self.linhas_do_tempo is not None and colecao == 'partidas':
+            self.linhas_do_tempo.descartar_compactas([registro['id'] for registro in registros])
+        # Transferência (inclusive retroativa) muda a atribuição de gols já contados: placares derivados de novo
+        # (e as consultas por partida que dependem do clube de cada gol deixam de valer)
+        if colecao == 'transferencias':
+            self.placares = None
+            if self.cache:
+                self.cache.alterar(('colecao', 'partidas'))
+    
+    def registrar_jogadora(self, nome, posicao, clube_id, numero_camisa, idade,
+                           nacionalidade, altura, peso):
+        """Cadastra jogadora sem interação com o usuário"""
+        return self.adicionar_registro('jogadoras', Jogadora(
+            gerar_id(), nome, posicao, clube_id, numero_camisa, idade,
+            nacionalidade, altura, peso
+        ))
+    
+    def registrar_clube(self, nome, cidade, estado, pais, fundacao, cores):
+        """Cadastra clube sem interação com o usuário"""
+        return self.adicionar_registro('clubes', Clube(
+            gerar_id(), nome, cidade, estado, pais, fundacao, cores
+        ))
+    
+    def registrar_campeonato(self, nome, pais, temporada):
+        """Cadastra campeonato sem interação com o usuário"""
+        return self.adicionar_registro('campeonatos', {
+            'id': gerar_id(),
+            'nome': nome,
+            'pais': pais,
+            'temporada': temporada,
+            'ativo': True
+        })
+    
+    def registrar_partida(self, clube_casa_id, clube_fora_id, campeonato_id, data):
+        """Cadastra partida sem interação com o usuário"""
+        return self.adicionar_registro('partidas', Partida(
+            gerar_id(), clube_casa_id, clube_fora_id, campeonato_id, data
+        ))
+    
+    def finalizar_partida(self, partida_id, placar_casa, placar_fora):
+        """Registra o placar final de uma partida e atualiza a classificação"""
+        partida = self.buscar_partida_por_id(partida_id)
+        if not partida:
+            return None
+        
+        partida['placar_casa'] = placar_casa
+        partida['placar_fora'] = placar_fora
+        partida['finalizada'] = True
+        self.registrar_alteracoes('partidas', [partida])
+        if self.armazenamento:
+            self.armazenamento.salvar_registro('partidas', partida)
+        return partida
+    
+    def registrar_evento(self, partida_id, jogadora_id, tipo_evento, minuto, observacoes=''):
+        """Registra evento e atualiza as estatísticas materializadas"""
+        return self.adicionar_registro('eventos', Evento(
+            gerar_id(), partida_id, jogadora_id, tipo_evento, minuto, observacoes
+        ))
+    
     # =============================================================================
     # SISTEMA DE AUTENTICAÇÃO
     # =============================================================================
     
     def criar_usuario(self, email, senha, nome, tipo):
         """Cria novo usuário no sistema"""
-        # Estrutura de repetição: percorre lista de usuários para verificar email duplicado
-        for usuario in self.usuarios:
-            if usuario['email'] == email:
-                return False
+        # Dicionário: índice por email verifica duplicidade sem percorrer a lista
+        if email in self.usuarios_por_email:
+            return False
         
         # Dicionário: estrutura chave-valor para organizar dados do usuário
         novo_usuario = {
@@ -230,21 +1355,92 @@ class SistemaFutebolFeminino:
             'ativo': True
         }
         
-        # Lista: adiciona novo elemento ao final da lista de usuários
-        self.usuarios.append(novo_usuario)
+        # Lista e índices: adiciona novo usuário mantendo os índices sincronizados
+        self.adicionar_registro('usuarios', novo_usuario)
         return True
     
+    def login_bloqueado(self, email):
+        """Verifica se o email excedeu o limite de falhas de login na janela de tempo"""
+        # Trava: logins de threads diferentes alteram as mesmas filas de falhas
+        with self.trava_login:
+            falhas = self.falhas_login.get(email)
+            if not falhas:
+                return False
+            
+            # Fila: descarta falhas mais antigas que a janela
+            limite_tempo = time.monotonic() - JANELA_FALHAS_LOGIN
+            while falhas and falhas[0] < limite_tempo:
+                falhas.popleft()
+            return len(falhas) >= LIMITE_FALHAS_LOGIN
+    
+    def concluir_autenticacao(self, email, usuario, correta, novo_hash):
+        """Grava o hash migrado e registra a falha (ou limpa as falhas); retorna o usuário ou None"""
+        # Migração: hash antigo ou com custo menor é gravado no formato atual
+        if novo_hash:
+            usuario['senha_hash'] = novo_hash
+            if self.armazenamento:
+                self.armazenamento.salvar_registro('usuarios', usuario)
+        
+        with self.trava_login:
+            if not correta:
+                self.falhas_login.setdefault(email, deque()).append(time.monotonic())
+                return None
+            self.falhas_login.pop(email, None)
+        return usuario
+    
+    def autenticar(self, email, senha):
+        """Verifica email e senha e retorna o usuário (ou None), sem alterar a sessão"""
+        if self.login_bloqueado(email):
+            return None
+        
+        # Dicionário: localiza o usuário diretamente pelo email
+        usuario = self.usuarios_por_email.get(email)
+        correta, novo_hash = False, None
+        if usuario and usuario['ativo']:
+            # O PBKDF2 libera o GIL: autenticações chamadas de threads diferentes rodam em paralelo
+            correta, novo_hash = conferir_senha(senha, usuario['senha_hash'])
+        return self.concluir_autenticacao(email, usuario, correta, novo_hash)
+    
+    def autenticar_varios(self, credenciais):
+        """Autentica vários pares (email, senha) de uma vez: os PBKDF2 rodam em paralelo no pool de threads"""
+        # Leituras do sistema e gravações ficam na thread de quem chamou (a conexão SQLite só pode
+        # ser usada pela thread que a criou); o pool só recebe o cálculo dos hashes
+        pendentes = []
+        for email, senha in credenciais:
+            if self.login_bloqueado(email):
+                pendentes.append(None)
+                continue
+            usuario = self.usuarios_por_email.get(email)
+            futuro = None
+            if usuario and usuario['ativo']:
+                futuro = self.executor_de_senhas().submit(conferir_senha, senha, usuario['senha_hash'])
+            pendentes.append((email, usuario, futuro))
+        
+        resultados = []
+        for pendente in pendentes:
+            if pendente is None:
+                resultados.append(None)
+                continue
+            email, usuario, futuro = pendente
+            correta, novo_hash = futuro.result() if futuro else (False, None)
+            resultados.append(self.concluir_autenticacao(email, usuario, correta, novo_hash))
+        return resultados
+    
+    def executor_de_senhas(self):
+        """Pool de threads das verificações de senha em lote (criado no primeiro uso)"""
+        if self.executor_senhas is None:
+            # Importado aqui: concurrent.futures (e logging) pesam na inicialização
+            from concurrent.futures import ThreadPoolExecutor
+            self.executor_senhas = ThreadPoolExecutor(max_workers=THREADS_SENHA,
+                                                      thread_name_prefix='senhas')
+        return self.executor_senhas
+    
     def fazer_login(self, email, senha):
         """Realiza login do usuário"""
-        senha_hash = hash_senha(senha)
-        
-        # Estrutura de repetição: busca usuário na lista comparando email e senha
-        for usuario in self.usuarios:
-            if (usuario['email'] == email and 
-                usuario['senha_hash'] == senha_hash and 
-                usuario['ativo']):
-                self.usuario_logado = usuario
-                return True
+        usuario = self.autenticar(email, senha)
+        if usuario:
+            self.usuario_logado = usuario
+            return True
         return False
     
     def fazer_logout(self):
@@ -255,81 +1451,607 @@ class SistemaFutebolFeminino:
     # SISTEMA DE ESTATÍSTICAS
     # =============================================================================
     
-    def calcular_estatisticas_jogadora(self, jogadora_id):
-        """Calcula estatísticas de uma jogadora"""
-        # Dicionário: estrutura para armazenar contadores de estatísticas
-        stats = {
-            'gols': 0,
-            'assistencias': 0,
-            'cartoes_amarelos': 0,
-            'cartoes_vermelhos': 0,
-            'finalizacoes': 0,
-            'defesas': 0,
-            'partidas_jogadas': 0
-        }
+    def atualizar_estatisticas(self, evento):
+        """Atualiza a visão materializada com um novo evento em tempo O(1)"""
+        jogadora_id = evento['jogadora_id']
+        stats = self.estatisticas.get(jogadora_id)
+        if stats is None:
+            stats = self.estatisticas[jogadora_id] = novas_estatisticas()
+            self.partidas_por_jogadora[jogadora_id] = set()
         
         # Conjunto: evita contagem duplicada de partidas (set não permite duplicatas)
-        partidas_jogadas = set()
+        partidas = self.partidas_por_jogadora[jogadora_id]
+        partidas.add(evento['partida_id'])
+        stats['partidas_jogadas'] = len(partidas)
         
-        # Estrutura de repetição: percorre todos os eventos para encontrar os da jogadora
+        chave = ESTATISTICA_POR_EVENTO.get(evento['tipo'])
+        if chave:
+            stats[chave] += 1
+    
+    def reconstruir_estatisticas(self, processos=None):
+        """Recalcula toda a visão materializada a partir dos eventos brutos"""
+        self.versao += 1
+        if self.cache:
+            self.cache.limpar()
+        
+        # Vários processos: eventos divididos por partida e contadores parciais somados
+        if processos and processos > 1:
+            from recalculo_paralelo import recalcular_estatisticas
+            
+            self.estatisticas, self.partidas_por_jogadora = recalcular_estatisticas(self, processos)
+            return
+        
+        # Estrutura de decisão: dentro de eventos_em_colunas() a agregação é vetorizada
+        if self.eventos_colunares is not None:
+            contagens = self.eventos_colunares.contagens_por_jogadora()
+            self.partidas_por_jogadora = self.eventos_colunares.partidas_por_jogadora()
+            self.estatisticas = {
+                jogadora_id: estatisticas_de_contagens(contagens[jogadora_id], len(partidas))
+                for jogadora_id, partidas in self.partidas_por_jogadora.items()
+            }
+            return
+        
+        self.estatisticas = {}
+        self.partidas_por_jogadora = {}
+        self.linhas_examinadas += len(self.eventos)
         for evento in self.eventos:
-            if evento['jogadora_id'] == jogadora_id:
-                tipo_evento = evento['tipo']
-                partidas_jogadas.add(evento['partida_id'])
-                
-                # Estrutura de decisão: incrementa contador baseado no tipo de evento
-                if tipo_evento == EVENTO_GOL:
-                    stats['gols'] += 1
-                elif tipo_evento == EVENTO_ASSISTENCIA:
-                    stats['assistencias'] += 1
-                elif tipo_evento == EVENTO_CARTAO_AMARELO:
-                    stats['cartoes_amarelos'] += 1
-                elif tipo_evento == EVENTO_CARTAO_VERMELHO:
-                    stats['cartoes_vermelhos'] += 1
-                elif tipo_evento == EVENTO_FINALIZACAO:
-                    stats['finalizacoes'] += 1
-                elif tipo_evento == EVENTO_DEFESA:
-                    stats['defesas'] += 1
-        
-        stats['partidas_jogadas'] = len(partidas_jogadas)
-        return stats
+            self.atualizar_estatisticas(evento)
     
-    def obter_ranking_gols(self, limite=10):
-        """Obtém ranking de artilheiras"""
-        ranking = []
+    @contextmanager
+    def eventos_em_colunas(self):
+        """Monta as colunas dos eventos para um bloco de agregações e as descarta no final"""
+        # Os registros continuam sendo a fonte dos dados: as colunas só ocupam memória enquanto o
+        # bloco roda, e o custo de montá-las é dividido entre as agregações feitas dentro dele
+        if self.eventos_colunares is not None:
+            yield self.eventos_colunares
+            return
+        
+        from eventos_colunares import EventosColunares
         
-        # Estrutura de repetição: processa cada jogadora ativa para calcular estatísticas
+        self.eventos_colunares = EventosColunares.de_eventos(self.eventos)
+        try:
+            yield self.eventos_colunares
+        finally:
+            self.eventos_colunares = None
+    
+    def ativar_instrumentacao(self, amostragem_memoria=None, metodos=None):
+        """Mede chamadas, latência, linhas examinadas e memória das consultas e cadastros"""
+        from instrumentacao import Instrumentacao
+        
+        # Desativada, nenhum método é envolvido: o custo é zero
+        if self.instrumentacao is None:
+            self.instrumentacao = Instrumentacao(self, amostragem_memoria, metodos)
+        return self.instrumentacao
+    
+    def desativar_instrumentacao(self):
+        """Remove a instrumentação e devolve as métricas coletadas"""
+        if self.instrumentacao is None:
+            return None
+        metricas = self.instrumentacao.metricas()
+        self.instrumentacao.remover()
+        self.instrumentacao = None
+        return metricas
+    
+    def total_linhas_examinadas(self):
+        """Registros examinados até agora: eventos e jogadoras percorridos e candidatos das buscas"""
+        total = self.linhas_examinadas + sum(indice.examinados for indice in self.indices_busca.values())
+        if self.linhas_do_tempo is not None:
+            total += self.linhas_do_tempo.examinados
+        if self.placares is not None:
+            total += self.placares.examinados
+        return total
+    
+    def verificar_consistencia_estatisticas(self):
+        """Compara a visão materializada com os eventos brutos e retorna IDs divergentes"""
+        recalculadas = agregar_estatisticas(self.eventos)
+        divergentes = []
+        
+        # Estrutura de repetição: verifica todas as jogadoras presentes em qualquer lado
+        for jogadora_id in set(recalculadas) | set(self.estatisticas):
+            if recalculadas.get(jogadora_id) != self.estatisticas.get(jogadora_id):
+                divergentes.append(jogadora_id)
+        
+        return sorted(divergentes)
+    
+    def calcular_estatisticas_jogadora(self, jogadora_id, campeonato_id=None, temporada=None,
+                                       data_inicio=None, data_fim=None, ultimas=None):
+        """Calcula estatísticas de uma jogadora, opcionalmente filtradas (campeonato, temporada, período, últimas N)"""
+        if campeonato_id is None and temporada is None and data_inicio is None and data_fim is None and ultimas is None:
+            # Visão ainda não carregada: só a jogadora pedida, pelo índice do armazenamento
+            if 'estatisticas' not in vars(self) and hasattr(self.armazenamento, 'carregar_estatisticas_jogadora'):
+                return self.armazenamento.carregar_estatisticas_jogadora(jogadora_id)
+            # Dicionário: consulta direta na visão materializada (cópia para não alterar o original)
+            stats = self.estatisticas.get(jogadora_id)
+            return dict(stats) if stats else novas_estatisticas()
+        
+        # Só as partidas que a jogadora disputou, e só os eventos dessas partidas
+        selecionadas = []
+        for partida_id in self.partidas_por_jogadora.get(jogadora_id, ()):
+            partida = self.buscar_partida_por_id(partida_id)
+            if partida and self.partida_no_filtro(partida, campeonato_id, temporada, data_inicio, data_fim):
+                selecionadas.append((partida['data'], partida_id))
+        selecionadas.sort()
+        if ultimas is not None:
+            selecionadas = selecionadas[-ultimas:] if ultimas > 0 else []
+        
+        paginas = [self.eventos_por_partida[partida_id] for _, partida_id in selecionadas]
+        self.linhas_examinadas += sum(map(len, paginas))
+        estatisticas = agregar_estatisticas(
+            evento for eventos in paginas for evento in eventos if evento['jogadora_id'] == jogadora_id
+        )
+        return estatisticas.get(jogadora_id) or novas_estatisticas()
+    
+    def calcular_estatisticas_todas(self, campeonato_id=None, temporada=None, data_inicio=None, data_fim=None):
+        """Retorna estatísticas de todas as jogadoras (visão materializada ou filtrada, somente leitura)"""
+        if campeonato_id is None and temporada is None and data_inicio is None and data_fim is None:
+            return self.estatisticas
+        
+        # Uma passada apenas pelos eventos das partidas do recorte
+        paginas = [self.eventos_por_partida.get(partida_id, ())
+                   for _, partida_id in self.partidas_filtradas(campeonato_id, temporada, data_inicio, data_fim)]
+        self.linhas_examinadas += sum(map(len, paginas))
+        return agregar_estatisticas(evento for eventos in paginas for evento in eventos)
+    
+    def partida_no_filtro(self, partida, campeonato_id=None, temporada=None, data_inicio=None, data_fim=None):
+        """Verifica se a partida atende aos filtros de campeonato, temporada e período"""
+        if campeonato_id is not None and partida['campeonato_id'] != campeonato_id:
+            return False
+        if data_inicio is not None and partida['data'] < data_inicio:
+            return False
+        if data_fim is not None and partida['data'] > data_fim:
+            return False
+        if temporada is not None:
+            campeonato = self.buscar_campeonato_por_id(partida['campeonato_id'])
+            return campeonato is not None and campeonato['temporada'] == temporada
+        return True
+    
+    def partidas_filtradas(self, campeonato_id=None, temporada=None, data_inicio=None, data_fim=None):
+        """Pares (data, partida_id) do recorte em ordem de data, via busca binária nos índices por data"""
+        if campeonato_id is not None:
+            campeonato = self.buscar_campeonato_por_id(campeonato_id)
+            if campeonato is None or (temporada is not None and campeonato['temporada'] != temporada):
+                return []
+            indices = [self.partidas_por_campeonato.get(campeonato_id, IndicePorData())]
+        elif temporada is not None:
+            indices = [self.partidas_por_campeonato[campeonato['id']] for campeonato in self.campeonatos
+                       if campeonato['temporada'] == temporada and campeonato['id'] in self.partidas_por_campeonato]
+        else:
+            indices = [self.partidas_por_data]
+        
+        fatias = [indice.intervalo(data_inicio, data_fim) for indice in indices]
+        if len(fatias) == 1:
+            return fatias[0]
+        # Vários campeonatos da temporada: intercala as fatias já ordenadas
+        return list(heapq.merge(*fatias))
+    
+    @em_cache(('colecao', 'jogadoras'), ('colecao', 'clubes'), ('colecao', 'campeonatos'))
+    def listar_disponiveis(self):
+        """Jogadoras (com o nome do clube), clubes e campeonatos ativos"""
+        jogadoras = []
         for jogadora in self.jogadoras:
             if jogadora['ativa']:
-                stats = self.calcular_estatisticas_jogadora(jogadora['id'])
-                # Lista: adiciona dicionário com dados da jogadora ao ranking
-                ranking.append({
-                    'jogadora': jogadora,
-                    'gols': stats['gols'],
-                    'partidas': stats['partidas_jogadas']
-                })
-        
-        # Processamento: ordena lista por gols em ordem decrescente
-        ranking.sort(key=lambda x: x['gols'], reverse=True)
-        return ranking[:limite]
+                clube = self.buscar_clube_por_id(jogadora['clube_id'])
+                jogadoras.append((jogadora['id'], jogadora['nome'], clube['nome'] if clube else "N/A"))
+        return {
+            'jogadoras': jogadoras,
+            'clubes': [(clube['id'], clube['nome']) for clube in self.clubes if clube['ativo']],
+            'campeonatos': [(campeonato['id'], campeonato['nome'])
+                            for campeonato in self.campeonatos if campeonato['ativo']]
+        }
+    
+    @em_cache(lambda partida_id: ('partida', partida_id))
+    def resumo_partida(self, partida_id):
+        """Quantidade de eventos de cada tipo em uma partida"""
+        eventos = self.eventos_por_partida.get(partida_id, [])
+        self.linhas_examinadas += len(eventos)
+        return contar_por_tipo(eventos)
+    
+    @em_cache(('colecao', 'eventos'))
+    def resumo_partidas(self):
+        """Quantidade de eventos de cada tipo para todas as partidas"""
+        self.linhas_examinadas += len(self.eventos)
+        if self.eventos_colunares is not None:
+            return self.eventos_colunares.resumo_por_partida()
+        # Sem passar pelo cache de resumo_partida (não descarta as consultas frequentes)
+        return {partida_id: contar_por_tipo(eventos) for partida_id, eventos in self.eventos_por_partida.items()}
+    
+    @em_cache(('colecao', 'eventos'), ('colecao', 'jogadoras'))
+    def obter_ranking(self, chave='gols', limite=10):
+        """Obtém ranking das jogadoras ativas por qualquer estatística"""
+        if chave not in CHAVES_RANKING:
+            raise ValueError(f"Estatística inválida para ranking: {chave}")
+        
+        # Contadores de todas as jogadoras já mantidos pela visão materializada
+        estatisticas = self.calcular_estatisticas_todas()
+        vazias = novas_estatisticas()
+        self.linhas_examinadas += len(self.jogadoras)
+        
+        def valor(jogadora):
+            return valor_estatistica(estatisticas.get(jogadora['id'], vazias), chave)
+        
+        # Processamento: heap mantém apenas as 'limite' maiores, sem ordenar a lista toda
+        # (nlargest preserva a ordem de cadastro em caso de empate)
+        ativas = (jogadora for jogadora in self.jogadoras if jogadora['ativa'])
+        melhores = heapq.nlargest(limite, ativas, key=valor)
+        
+        # Dicionários do resultado montados só para as jogadoras do ranking
+        return [
+            {
+                'jogadora': jogadora,
+                chave: valor(jogadora),
+                'partidas': estatisticas.get(jogadora['id'], vazias)['partidas_jogadas']
+            }
+            for jogadora in melhores
+        ]
+    
+    def atualizar_classificacao(self, partida):
+        """Leva à classificação o estado atual de uma partida (novo placar ou finalização)"""
+        if self.classificacoes:
+            self.classificacoes.aplicar(partida)
+    
+    def obter_classificacao(self, campeonato_id, data=None):
+        """Classificação do campeonato na data (YYYY-MM-DD) ou atual; None se não existir"""
+        if campeonato_id not in self.indices['campeonatos']:
+            return None
+        
+        if self.classificacoes is None:
+            from classificacao import Classificacoes
+            
+            nome_clube = lambda clube_id: (self.buscar_clube_por_id(clube_id) or {}).get('nome', clube_id)
+            self.classificacoes = Classificacoes.de_partidas(self.partidas, nome_clube)
+        return self.classificacoes.tabela(campeonato_id, data)
+    
+    def obter_ranking_gols(self, limite=10):
+        """Obtém ranking de artilheiras"""
+        return self.obter_ranking('gols', limite)
     
     def obter_ranking_assistencias(self, limite=10):
         """Obtém ranking de assistências"""
-        ranking = []
+        return self.obter_ranking('assistencias', limite)
+    
+    @em_cache(('colecao', 'eventos'), ('colecao', 'jogadoras'))
+    def distribuicoes_por_posicao(self):
+        """Taxas por 90 minutos ordenadas de cada posição (referência dos percentis)"""
+        from comparacao import distribuicoes_por_posicao
         
-        # Estrutura de repetição: processa jogadoras ativas para ranking de assistências
-        for jogadora in self.jogadoras:
-            if jogadora['ativa']:
-                stats = self.calcular_estatisticas_jogadora(jogadora['id'])
-                ranking.append({
-                    'jogadora': jogadora,
-                    'assistencias': stats['assistencias'],
-                    'partidas': stats['partidas_jogadas']
-                })
+        return distribuicoes_por_posicao(self.jogadoras, self.estatisticas)
+    
+    def comparar(self, jogadora_ids=None, clube_id=None, confronto_direto=False, adversario_id=None):
+        """Compara várias jogadoras (ou o elenco de um clube): totais, taxas por 90 e percentis na posição"""
+        from comparacao import (
+            distribuicoes_por_posicao,
+            linhas_comparacao,
+            partidas_do_confronto,
+            partidas_entre_clubes
+        )
+        
+        nao_encontradas = []
+        if clube_id is not None:
+            jogadoras = self.listar_jogadoras_do_clube(clube_id)
+        elif jogadora_ids:
+            jogadoras = []
+            for jogadora_id in jogadora_ids:
+                jogadora = self.buscar_jogadora_por_id(jogadora_id)
+                if jogadora:
+                    jogadoras.append(jogadora)
+                else:
+                    nao_encontradas.append(jogadora_id)
+        else:
+            raise ValueError("Informe os IDs das jogadoras ou o ID do clube")
+        
+        if not confronto_direto:
+            return {
+                'confronto_direto': False,
+                'partidas': None,
+                'jogadoras': linhas_comparacao(jogadoras, self.estatisticas, self.distribuicoes_por_posicao()),
+                'nao_encontradas': nao_encontradas
+            }
+        
+        # Elenco de um clube: o confronto é contra um adversário (o clube contra si mesmo não tem partidas)
+        if clube_id is not None:
+            if adversario_id is None or adversario_id == clube_id:
+                raise ValueError("Informe um adversário diferente do clube para o confronto direto")
+            partidas = partidas_do_confronto(self.partidas, clube_id, adversario_id)
+        else:
+            partidas = partidas_entre_clubes(self.partidas, [jogadora['id'] for jogadora in jogadoras],
+                                             self.clubes_na_data())
+        
+        # Uma passada pelos eventos das partidas do confronto: estatísticas de todas as participantes,
+        # que também formam a referência dos percentis (mesmo recorte das jogadoras comparadas)
+        paginas = [self.eventos_por_partida.get(partida_id, ()) for partida_id in partidas]
+        self.linhas_examinadas += sum(map(len, paginas))
+        estatisticas = agregar_estatisticas(evento for eventos in paginas for evento in eventos)
+        participantes = [jogadora for jogadora in map(self.buscar_jogadora_por_id, estatisticas) if jogadora]
+        
+        return {
+            'confronto_direto': True,
+            'partidas': partidas,
+            'jogadoras': linhas_comparacao(jogadoras, estatisticas,
+                                           distribuicoes_por_posicao(participantes, estatisticas)),
+            'nao_encontradas': nao_encontradas
+        }
+    
+    # =============================================================================
+    # LINHA DO TEMPO DAS PARTIDAS
+    # =============================================================================
+    
+    def clube_da_jogadora(self, jogadora_id, data=None):
+        """Clube da jogadora na data (pelo histórico de transferências) ou o atual; None se ela não existir"""
+        historico = self.historico_clubes.get(jogadora_id)
+        if historico is not None and data is not None:
+            return historico.clube_na_data(data)
+        jogadora = self.buscar_jogadora_por_id(jogadora_id)
+        return jogadora['clube_id'] if jogadora else None
+    
+    def linha_do_tempo(self, partida_id):
+        """Linha do tempo compacta da partida (lances em ordem de minuto com placar parcial); None se não existir"""
+        from linha_do_tempo import CAMPOS_LINHA, LinhasDoTempo
+        
+        partida = self.buscar_partida_por_id(partida_id)
+        if partida is None:
+            return None
+        if self.linhas_do_tempo is None:
+            self.linhas_do_tempo = LinhasDoTempo(lambda partida_id: self.eventos_por_partida.get(partida_id, ()))
+        
+        # Linha já montada: devolvida sem percorrer os eventos
+        lances = self.linhas_do_tempo.obter(partida_id).montar(partida, self.clube_da_jogadora)
+        return {
+            'partida_id': partida_id,
+            'clube_casa_id': partida['clube_casa_id'],
+            'clube_fora_id': partida['clube_fora_id'],
+            'campos': CAMPOS_LINHA,
+            'lances': lances,
+            'placar': (lances[-1][4], lances[-1][5]) if lances else (0, 0)
+        }
+    
+    @em_cache(('colecao', 'eventos'), ('colecao', 'jogadoras'), ('colecao', 'partidas'),
+              ('colecao', 'transferencias'))
+    def histograma_minutos(self, agrupar='jogadora', tipos=(EVENTO_GOL,), largura=None):
+        """Eventos dos tipos pedidos por faixa de minutos (1-15, ..., 90+) de cada jogadora, clube ou campeonato"""
+        from linha_do_tempo import AGRUPAMENTOS, LARGURA_FAIXA, histograma, limites_faixas, rotulos_faixas
+        
+        if agrupar not in AGRUPAMENTOS:
+            raise ValueError(f"Agrupamento inválido: {agrupar} (use {', '.join(AGRUPAMENTOS)})")
+        largura = largura or LARGURA_FAIXA
+        limites = limites_faixas(largura)
+        
+        # Estrutura de decisão: coluna do evento que identifica o grupo e o mapa coluna -> grupo
+        if agrupar == 'jogadora':
+            campo, mapa = 'jogadora_id', None
+        elif agrupar == 'clube':
+            campo, mapa = 'jogadora_id', {jogadora['id']: jogadora['clube_id'] for jogadora in self.jogadoras}
+        else:
+            campo, mapa = 'partida_id', {partida['id']: partida['campeonato_id'] for partida in self.partidas}
+        
+        # Com transferências o clube de cada lance depende da data da partida (não cabe num mapa por coluna)
+        por_data = agrupar == 'clube' and self.historico_clubes
+        
+        # Dentro de eventos_em_colunas() a contagem é vetorizada (bincount por grupo e faixa)
+        if self.eventos_colunares is not None and not por_data:
+            grupos = self.eventos_colunares.histograma_minutos(campo.removesuffix('_id'), tipos, limites, mapa)
+        else:
+            self.linhas_examinadas += len(self.eventos)
+            if por_data:
+                partidas = self.indices['partidas']
+                clube_na_data = self.clubes_na_data()
+                
+                def grupo(evento):
+                    partida = partidas.get(evento['partida_id'])
+                    return clube_na_data(evento['jogadora_id'], partida['data']) if partida else None
+            elif mapa is None:
+                grupo = lambda evento: evento[campo]
+            else:
+                grupo = lambda evento: mapa.get(evento[campo])
+            grupos = histograma(
+                ((grupo(evento), evento['minuto']) for evento in self.eventos if evento['tipo'] in tipos), limites
+            )
+        return {'agrupar': agrupar, 'tipos': tipos, 'faixas': rotulos_faixas(largura), 'grupos': grupos}
+    
+    @em_cache(('colecao', 'eventos'), ('colecao', 'jogadoras'), ('colecao', 'partidas'))
+    def distribuicao_primeiro_gol(self, campeonato_id=None, temporada=None, data_inicio=None, data_fim=None,
+                                  largura=None):
+        """Minuto do primeiro gol das partidas do recorte, por faixa de minutos"""
+        from linha_do_tempo import LARGURA_FAIXA, histograma, limites_faixas, rotulos_faixas
+        
+        largura = largura or LARGURA_FAIXA
+        partidas = self.partidas_filtradas(campeonato_id, temporada, data_inicio, data_fim)
+        minutos = []
+        for _, partida_id in partidas:
+            eventos = self.eventos_por_partida.get(partida_id, ())
+            self.linhas_examinadas += len(eventos)
+            minuto = min((evento['minuto'] for evento in eventos if evento['tipo'] == EVENTO_GOL), default=None)
+            if minuto is not None:
+                minutos.append(minuto)
+        
+        faixas = rotulos_faixas(largura)
+        contagens = histograma((('primeiro_gol', minuto) for minuto in minutos), limites_faixas(largura))
+        return {
+            'faixas': faixas,
+            'contagens': contagens.get('primeiro_gol', [0] * len(faixas)),
+            'partidas': len(partidas),
+            'sem_gol': len(partidas) - len(minutos),
+            'minuto_medio': sum(minutos) / len(minutos) if minutos else None
+        }
+    
+    # =============================================================================
+    # PLACARES DERIVADOS DOS GOLS
+    # =============================================================================
+    
+    def placares_derivados(self):
+        """Placares derivados dos gols (cada partida é derivada dos seus eventos no primeiro uso)"""
+        if self.placares is None:
+            from placares import PlacaresDerivados
+            
+            self.placares = PlacaresDerivados(lambda partida_id: self.eventos_por_partida.get(partida_id, ()),
+                                              self.clube_da_jogadora)
+        return self.placares
+    
+    def placar_derivado(self, partida_id):
+        """Placar (casa, fora) calculado a partir dos gols da partida; None se ela não existir"""
+        partida = self.buscar_partida_por_id(partida_id)
+        return self.placares_derivados().placar(partida) if partida else None
+    
+    def atualizar_placares(self, eventos):
+        """Leva gols novos (ainda não indexados) aos placares derivados; retorna as partidas alteradas"""
+        # Só o placar derivado muda: o registrado (placar_casa/placar_fora) é o lançado na partida
+        # e só é sobrescrito pela reconciliação com corrigir=True
+        placares = None
+        alteradas = {}
+        for evento in eventos:
+            if evento['tipo'] != EVENTO_GOL:
+                continue
+            partida = self.buscar_partida_por_id(evento['partida_id'])
+            if partida is None:
+                continue
+            placares = placares or self.placares_derivados()
+            if placares.aplicar(evento, partida) is not None:
+                alteradas[partida['id']] = partida
+        return alteradas
+    
+    def reconciliar_placares(self, corrigir=False):
+        """Deriva o placar de todas as partidas numa passada pelos eventos e aponta (ou corrige) as divergências"""
+        placares = self.placares_derivados()
         
-        # Processamento: ordena por assistências em ordem decrescente
-        ranking.sort(key=lambda x: x['assistencias'], reverse=True)
-        return ranking[:limite]
+        # Eventos ainda não carregados: lidos do armazenamento em lotes, sem ficar na memória
+        if 'eventos' not in vars(self) and hasattr(self.armazenamento, 'iterar_colecao'):
+            eventos = (evento for lote in self.armazenamento.iterar_colecao('eventos') for evento in lote)
+        else:
+            eventos = self.eventos
+        # Clubes atuais indexados uma vez para a passada inteira (histórico por busca binária)
+        placares.derivar_todas(eventos, self.indices['partidas'], self.clubes_na_data())
+        
+        divergencias = placares.divergencias(self.partidas)
+        corrigidas = []
+        if corrigir:
+            for divergencia in divergencias:
+                if divergencia['registrado'] != divergencia['derivado']:
+                    partida = self.indices['partidas'][divergencia['partida_id']]
+                    partida['placar_casa'], partida['placar_fora'] = divergencia['derivado']
+                    corrigidas.append(partida)
+        if corrigidas:
+            self.registrar_alteracoes('partidas', corrigidas)
+            if self.armazenamento:
+                self.armazenamento.salvar_registros('partidas', corrigidas)
+        
+        return {'partidas': len(self.partidas), 'divergencias': divergencias, 'corrigidas': len(corrigidas)}
+    
+    # =============================================================================
+    # TRANSFERÊNCIAS E CLUBES POR PERÍODO
+    # =============================================================================
+    
+    def registrar_transferencia(self, jogadora_id, clube_destino_id, data):
+        """Registra a ida da jogadora para o clube a partir da data; None se jogadora ou clube não existir"""
+        if self.buscar_jogadora_por_id(jogadora_id) is None or self.buscar_clube_por_id(clube_destino_id) is None:
+            return None
+        return self.registrar_transferencias([{
+            'id': gerar_id(),
+            'jogadora_id': jogadora_id,
+            'clube_origem_id': None,
+            'clube_destino_id': clube_destino_id,
+            'data': data
+        }])[0]
+    
+    def registrar_transferencias(self, transferencias):
+        """Cadastra transferências de jogadoras existentes (cadastro ou importação) com uma única gravação"""
+        # Validação antes de qualquer alteração: um lote com referência inexistente não é aplicado pela metade
+        for transferencia in transferencias:
+            if self.buscar_jogadora_por_id(transferencia['jogadora_id']) is None:
+                raise ValueError(f"Jogadora inexistente: {transferencia['jogadora_id']}")
+            if self.buscar_clube_por_id(transferencia['clube_destino_id']) is None:
+                raise ValueError(f"Clube de destino inexistente: {transferencia['clube_destino_id']}")
+            # Origem é opcional (completada abaixo), mas, se informada, precisa existir
+            origem = transferencia.get('clube_origem_id')
+            if origem is not None and self.buscar_clube_por_id(origem) is None:
+                raise ValueError(f"Clube de origem inexistente: {origem}")
+        
+        # Histórico provisório por jogadora: cada transferência vê as anteriores, inclusive as do lote
+        historicos = {}
+        # Dicionário: jogadora -> clube de destino, quando a transferência do lote é a mais recente dela
+        destinos = {}
+        for transferencia in transferencias:
+            jogadora = self.buscar_jogadora_por_id(transferencia['jogadora_id'])
+            historico = historicos.get(jogadora['id'])
+            if historico is None:
+                existente = self.historico_clubes.get(jogadora['id'])
+                historico = historicos[jogadora['id']] = existente.copia() if existente else HistoricoClubes()
+            
+            # Clube de origem ausente: o da jogadora na data (o atual, se ela ainda não tem histórico)
+            if transferencia.get('clube_origem_id') is None:
+                transferencia['clube_origem_id'] = (
+                    historico.clube_na_data(transferencia['data']) if historico else jogadora['clube_id']
+                )
+            if historico.adicionar(transferencia) == len(historico) - 1:
+                destinos[jogadora['id']] = transferencia['clube_destino_id']
+        
+        # Transferência mais recente: a jogadora passa para o elenco do clube de destino
+        alteradas = []
+        for jogadora_id, clube_destino_id in destinos.items():
+            jogadora = self.buscar_jogadora_por_id(jogadora_id)
+            if jogadora['clube_id'] != clube_destino_id:
+                elenco = self.jogadoras_por_clube.get(jogadora['clube_id'], [])
+                self.jogadoras_por_clube[jogadora['clube_id']] = [outra for outra in elenco if outra is not jogadora]
+                self.jogadoras_por_clube.setdefault(clube_destino_id, []).append(jogadora)
+                jogadora['clube_id'] = clube_destino_id
+                alteradas.append(jogadora)
+        if alteradas:
+            self.registrar_alteracoes('jogadoras', alteradas)
+            if self.armazenamento:
+                self.armazenamento.salvar_registros('jogadoras', alteradas)
+        
+        return self.adicionar_registros('transferencias', transferencias)
+    
+    def historico_da_jogadora(self, jogadora_id):
+        """Passagens da jogadora por clubes em ordem: dicionários com clube_id, inicio e fim; None se não existir"""
+        jogadora = self.buscar_jogadora_por_id(jogadora_id)
+        if jogadora is None:
+            return None
+        historico = self.historico_clubes.get(jogadora_id)
+        # Sem transferências: uma única passagem, no clube atual
+        periodos = historico.periodos() if historico else [(jogadora['clube_id'], None, None)]
+        return [{'clube_id': clube_id, 'inicio': inicio, 'fim': fim} for clube_id, inicio, fim in periodos]
+    
+    def clubes_na_data(self):
+        """Função (jogadora_id, data) -> clube para passadas por muitos eventos (índice de clubes atuais montado uma vez)"""
+        atuais = {jogadora['id']: jogadora['clube_id'] for jogadora in self.jogadoras}
+        historicos = self.historico_clubes
+        
+        def clube_na_data(jogadora_id, data):
+            historico = historicos.get(jogadora_id)
+            return atuais.get(jogadora_id) if historico is None else historico.clube_na_data(data)
+        return clube_na_data
+    
+    @em_cache(('colecao', 'eventos'), ('colecao', 'partidas'), ('colecao', 'campeonatos'),
+              ('colecao', 'jogadoras'), ('colecao', 'transferencias'))
+    def gols_por_clube(self, temporada=None, tipo=EVENTO_GOL):
+        """Eventos do tipo (gols) de cada clube por temporada, atribuídos ao clube da jogadora na data da partida"""
+        if tipo not in ESTATISTICA_POR_EVENTO:
+            raise ValueError(f"Tipo de evento inválido: {tipo}")
+        
+        temporadas = {campeonato['id']: campeonato['temporada'] for campeonato in self.campeonatos}
+        if temporada is None:
+            eventos = self.eventos
+        else:
+            # Só as páginas das partidas da temporada
+            eventos = [evento for _, partida_id in self.partidas_filtradas(temporada=temporada)
+                       for evento in self.eventos_por_partida.get(partida_id, ())]
+        self.linhas_examinadas += len(eventos)
+        
+        # Uma única passada: partida pelo índice de IDs e clube por busca binária no histórico da jogadora
+        partidas = self.indices['partidas']
+        clube_na_data = self.clubes_na_data()
+        totais = {}
+        for evento in eventos:
+            if evento['tipo'] != tipo:
+                continue
+            partida = partidas.get(evento['partida_id'])
+            if partida is None:
+                continue
+            clube_id = clube_na_data(evento['jogadora_id'], partida['data'])
+            if clube_id is None:
+                continue
+            por_clube = totais.setdefault(temporadas.get(partida['campeonato_id']), {})
+            por_clube[clube_id] = por_clube.get(clube_id, 0) + 1
+        return totais
     
     # =============================================================================
     # FUNÇÕES DE BUSCA
@@ -337,31 +2059,49 @@ class SistemaFutebolFeminino:
     
     def buscar_jogadora_por_id(self, jogadora_id):
         """Busca jogadora por ID"""
-        # Estrutura de repetição: percorre lista até encontrar jogadora com ID correspondente
-        for jogadora in self.jogadoras:
-            if jogadora['id'] == jogadora_id:
-                return jogadora
-        return None
+        # Dicionário: acesso direto pelo índice de IDs
+        return self.indices['jogadoras'].get(jogadora_id)
     
     def buscar_clube_por_id(self, clube_id):
         """Busca clube por ID"""
-        # Estrutura de repetição: busca clube específico na lista de clubes
-        for clube in self.clubes:
-            if clube['id'] == clube_id:
-                return clube
-        return None
+        return self.indices['clubes'].get(clube_id)
     
-    def buscar_jogadoras_por_nome(self, termo):
-        """Busca jogadoras por nome"""
-        jogadoras_encontradas = []
-        termo_lower = termo.lower()
-        
-        # Estrutura de repetição: busca parcial no nome (case-insensitive)
-        for jogadora in self.jogadoras:
-            if termo_lower in jogadora['nome'].lower():
-                jogadoras_encontradas.append(jogadora)
-        
-        return jogadoras_encontradas
+    def buscar_campeonato_por_id(self, campeonato_id):
+        """Busca campeonato por ID"""
+        return self.indices['campeonatos'].get(campeonato_id)
+    
+    def buscar_partida_por_id(self, partida_id):
+        """Busca partida por ID"""
+        return self.indices['partidas'].get(partida_id)
+    
+    def buscar_usuario_por_email(self, email):
+        """Busca usuário por email"""
+        return self.usuarios_por_email.get(email)
+    
+    def listar_jogadoras_do_clube(self, clube_id):
+        """Lista jogadoras de um clube usando o índice secundário"""
+        return list(self.jogadoras_por_clube.get(clube_id, []))
+    
+    def listar_eventos_da_partida(self, partida_id):
+        """Lista eventos de uma partida usando o índice secundário"""
+        return list(self.eventos_por_partida.get(partida_id, []))
+    
+    def buscar_jogadoras_por_nome(self, termo, limite=None):
+        """Busca jogadoras por nome (sem diferenciar acentos), melhores resultados primeiro"""
+        return self.indices_busca['jogadoras'].buscar(termo, limite)
+    
+    def buscar_clubes_por_nome(self, termo, limite=None):
+        """Busca clubes por nome"""
+        return self.indices_busca['clubes'].buscar(termo, limite)
+    
+    def buscar_campeonatos_por_nome(self, termo, limite=None):
+        """Busca campeonatos por nome"""
+        return self.indices_busca['campeonatos'].buscar(termo, limite)
+    
+    @em_cache(*(('colecao', colecao) for colecao in COLECOES_BUSCA))
+    def buscar(self, termo, limite=10):
+        """Busca o termo em jogadoras, clubes e campeonatos de uma vez"""
+        return {colecao: self.indices_busca[colecao].buscar(termo, limite) for colecao in COLECOES_BUSCA}
     
     # =============================================================================
     # INTERFACE DO USUÁRIO
@@ -441,7 +2181,9 @@ class SistemaFutebolFeminino:
         email = input("Email: ").strip()
         senha = input("Senha: ").strip()
         
-        if self.fazer_login(email, senha):
+        if self.login_bloqueado(email):
+            print("❌ Muitas tentativas incorretas. Tente novamente mais tarde.")
+        elif self.fazer_login(email, senha):
             print("✅ Login realizado com sucesso!")
         else:
             print("❌ Email ou senha incorretos!")
@@ -513,10 +2255,23 @@ class SistemaFutebolFeminino:
         clube = self.buscar_clube_por_id(jogadora['clube_id'])
         clube_nome = clube['nome'] if clube else "Clube não encontrado"
         
-        stats = self.calcular_estatisticas_jogadora(jogadora_id)
+        # Filtros opcionais (Enter = carreira inteira)
+        campeonato_id = input("Campeonato (ID, Enter para todos): ").strip() or None
+        temporada = input("Temporada (Enter para todas): ").strip() or None
+        ultimas = input("Últimas N partidas (Enter para todas): ").strip()
+        if ultimas and not ultimas.isdigit():
+            print("❌ Quantidade de partidas inválida!")
+            return
+        
+        stats = self.calcular_estatisticas_jogadora(jogadora_id, campeonato_id, temporada,
+                                                    ultimas=int(ultimas) if ultimas else None)
         
         print(f"\n📊 ESTATÍSTICAS DE {jogadora['nome'].upper()}")
         print("=" * 60)
+        filtros = [texto for texto in (campeonato_id, temporada and f"temporada {temporada}",
+                                       ultimas and f"últimas {ultimas} partidas") if texto]
+        if filtros:
+            print(f"Recorte: {', '.join(filtros)}")
         print(f"Clube: {clube_nome}")
         print(f"Posição: {jogadora['posicao']}")
         print(f"Número: {jogadora['numero_camisa']}")
@@ -539,6 +2294,9 @@ class SistemaFutebolFeminino:
         print("\n🏆 RANKINGS")
         print("1. Ranking de Artilheiras")
         print("2. Ranking de Assistências")
+        print("3. Ranking de Cartões")
+        print("4. Ranking de Finalizações")
+        print("5. Ranking de Defesas")
         print("0. Voltar")
         
         opcao = input("\nEscolha uma opção: ").strip()
@@ -547,14 +2305,20 @@ class SistemaFutebolFeminino:
             self.exibir_ranking_gols()
         elif opcao == "2":
             self.exibir_ranking_assistencias()
+        elif opcao == "3":
+            self.exibir_ranking('cartoes', "🟨 RANKING DE CARTÕES", "Cartões")
+        elif opcao == "4":
+            self.exibir_ranking('finalizacoes', "🎯 RANKING DE FINALIZAÇÕES", "Final.")
+        elif opcao == "5":
+            self.exibir_ranking('defesas', "🛡️  RANKING DE DEFESAS", "Defesas")
     
-    def exibir_ranking_gols(self):
-        """Exibe ranking de artilheiras"""
-        ranking = self.obter_ranking_gols(10)
+    def exibir_ranking(self, chave, titulo, rotulo):
+        """Exibe ranking de uma estatística qualquer"""
+        ranking = self.obter_ranking(chave, 10)
         
-        print("\n⚽ RANKING DE ARTILHEIRAS")
+        print(f"\n{titulo}")
         print("=" * 80)
-        print(f"{'Pos':<4} {'Nome':<30} {'Clube':<25} {'Gols':<6} {'Partidas':<8}")
+        print(f"{'Pos':<4} {'Nome':<30} {'Clube':<25} {rotulo:<6} {'Partidas':<8}")
         print("-" * 80)
         
         # Estrutura de repetição: exibe cada posição do ranking com enumerate para numerar
@@ -563,29 +2327,18 @@ class SistemaFutebolFeminino:
             clube = self.buscar_clube_por_id(jogadora['clube_id'])
             clube_nome = clube['nome'] if clube else "N/A"
             
-            print(f"{i:<4} {jogadora['nome']:<30} {clube_nome:<25} {item['gols']:<6} {item['partidas']:<8}")
+            print(f"{i:<4} {jogadora['nome']:<30} {clube_nome:<25} {item[chave]:<6} {item['partidas']:<8}")
         
         # Pausa para usuário ver os resultados
         input("\n⏸️  Pressione Enter para continuar...")
     
+    def exibir_ranking_gols(self):
+        """Exibe ranking de artilheiras"""
+        self.exibir_ranking('gols', "⚽ RANKING DE ARTILHEIRAS", "Gols")
+    
     def exibir_ranking_assistencias(self):
         """Exibe ranking de assistências"""
-        ranking = self.obter_ranking_assistencias(10)
-        
-        print("\n🎯 RANKING DE ASSISTÊNCIAS")
-        print("=" * 80)
-        print(f"{'Pos':<4} {'Nome':<30} {'Clube':<25} {'Assist':<6} {'Partidas':<8}")
-        print("-" * 80)
-        
-        for i, item in enumerate(ranking, 1):
-            jogadora = item['jogadora']
-            clube = self.buscar_clube_por_id(jogadora['clube_id'])
-            clube_nome = clube['nome'] if clube else "N/A"
-            
-            print(f"{i:<4} {jogadora['nome']:<30} {clube_nome:<25} {item['assistencias']:<6} {item['partidas']:<8}")
-        
-        # Pausa para usuário ver os resultados
-        input("\n⏸️  Pressione Enter para continuar...")
+        self.exibir_ranking('assistencias', "🎯 RANKING DE ASSISTÊNCIAS", "Assist")
     
     def menu_clubes(self):
         """Menu de clubes"""
@@ -620,9 +2373,34 @@ class SistemaFutebolFeminino:
                 print(f"Temporada: {campeonato['temporada']}")
                 print("-" * 60)
         
+        campeonato_id = input("\nID do campeonato para ver a classificação (Enter para voltar): ").strip()
+        if campeonato_id:
+            data = input("Data (YYYY-MM-DD, Enter para atual): ").strip()
+            self.exibir_classificacao(campeonato_id, data or None)
+        
         # Pausa para usuário ver os resultados
         input("\n⏸️  Pressione Enter para continuar...")
     
+    def exibir_classificacao(self, campeonato_id, data=None):
+        """Exibe a tabela de classificação de um campeonato"""
+        tabela = self.obter_classificacao(campeonato_id, data)
+        if tabela is None:
+            print("❌ Campeonato não encontrado!")
+            return
+        
+        print(f"\n📋 CLASSIFICAÇÃO{' EM ' + data if data else ''}")
+        print("-" * 60)
+        if not tabela:
+            print("Nenhuma partida finalizada até a data.")
+            return
+        
+        print(f"{'#':>3} {'Clube':<26} {'P':>3} {'J':>3} {'V':>3} {'E':>3} {'D':>3} {'SG':>4}")
+        for linha in tabela:
+            clube = self.buscar_clube_por_id(linha['clube_id'])
+            nome = clube['nome'] if clube else linha['clube_id']
+            print(f"{linha['posicao']:>3} {nome[:26]:<26} {linha['pontos']:>3} {linha['jogos']:>3} "
+                  f"{linha['vitorias']:>3} {linha['empates']:>3} {linha['derrotas']:>3} {linha['saldo']:>4}")
+    
     def buscar_jogadora(self):
         """Busca jogadora por nome"""
         termo = input("Digite o nome da jogadora: ").strip()
@@ -648,7 +2426,7 @@ class SistemaFutebolFeminino:
         input("\n⏸️  Pressione Enter para continuar...")
     
     def comparar_jogadoras(self):
-        """Compara duas jogadoras"""
+        """Compara jogadoras (ou o elenco de um clube)"""
         print("\n📈 COMPARAÇÃO DE JOGADORAS")
         
         # Mostra jogadoras disponíveis para facilitar teste
@@ -657,30 +2435,51 @@ class SistemaFutebolFeminino:
             if jogadora['ativa']:
                 print(f"   ID: {jogadora['id']} - {jogadora['nome']}")
         
-        id1 = input("\nDigite o ID da primeira jogadora: ").strip()
-        id2 = input("Digite o ID da segunda jogadora: ").strip()
-        
-        jogadora1 = self.buscar_jogadora_por_id(id1)
-        jogadora2 = self.buscar_jogadora_por_id(id2)
-        
-        if not jogadora1 or not jogadora2:
-            print("❌ Uma ou ambas as jogadoras não foram encontradas!")
+        entrada = input("\nDigite os IDs das jogadoras separados por vírgula (ou o ID de um clube): ").strip()
+        confronto_direto = input("Apenas partidas entre os clubes delas? (s/N): ").strip().lower() == 's'
+        
+        if self.buscar_clube_por_id(entrada):
+            # Elenco de um clube: o confronto direto é contra um adversário escolhido
+            adversario_id = None
+            if confronto_direto:
+                adversario_id = input("ID do clube adversário: ").strip()
+                if adversario_id == entrada or self.buscar_clube_por_id(adversario_id) is None:
+                    print("❌ Adversário inválido!")
+                    return
+            comparacao = self.comparar(clube_id=entrada, confronto_direto=confronto_direto,
+                                       adversario_id=adversario_id)
+        else:
+            ids = [jogadora_id.strip() for jogadora_id in entrada.split(',') if jogadora_id.strip()]
+            if not ids:
+                print("❌ Informe ao menos uma jogadora!")
+                return
+            comparacao = self.comparar(ids, confronto_direto=confronto_direto)
+        
+        if comparacao['nao_encontradas']:
+            print(f"⚠️  Não encontradas: {', '.join(comparacao['nao_encontradas'])}")
+        if not comparacao['jogadoras']:
+            print("❌ Nenhuma jogadora para comparar!")
             return
         
-        stats1 = self.calcular_estatisticas_jogadora(id1)
-        stats2 = self.calcular_estatisticas_jogadora(id2)
-        
-        print(f"\n📊 COMPARAÇÃO: {jogadora1['nome']} vs {jogadora2['nome']}")
-        print("=" * 80)
-        print(f"{'Estatística':<20} {'Jogadora 1':<15} {'Jogadora 2':<15}")
-        print("-" * 80)
-        print(f"{'Gols':<20} {stats1['gols']:<15} {stats2['gols']:<15}")
-        print(f"{'Assistências':<20} {stats1['assistencias']:<15} {stats2['assistencias']:<15}")
-        print(f"{'Partidas':<20} {stats1['partidas_jogadas']:<15} {stats2['partidas_jogadas']:<15}")
-        print(f"{'Cartões Amarelos':<20} {stats1['cartoes_amarelos']:<15} {stats2['cartoes_amarelos']:<15}")
-        print(f"{'Cartões Vermelhos':<20} {stats1['cartoes_vermelhos']:<15} {stats2['cartoes_vermelhos']:<15}")
-        print(f"{'Finalizações':<20} {stats1['finalizacoes']:<15} {stats2['finalizacoes']:<15}")
-        print(f"{'Defesas':<20} {stats1['defesas']:<15} {stats2['defesas']:<15}")
+        if confronto_direto:
+            print(f"\n📊 CONFRONTO DIRETO ({len(comparacao['partidas'])} partidas)")
+        else:
+            print("\n📊 COMPARAÇÃO")
+        print("=" * 100)
+        print(f"{'Jogadora':<25} {'Posição':<12} {'J':>3} {'Gols':>5} {'Assist':>6} {'Cart':>5} "
+              f"{'Gols/90':>8} {'Assist/90':>9} {'%Gols':>6} {'%Assist':>7}")
+        print("-" * 100)
+        for linha in comparacao['jogadoras']:
+            stats = linha['estatisticas']
+            percentis = [linha['percentis'][chave] for chave in ('gols', 'assistencias')]
+            pct_gols, pct_assist = ('-' if valor is None else f"{valor:.0f}" for valor in percentis)
+            print(f"{linha['jogadora']['nome'][:25]:<25} {linha['jogadora']['posicao'][:12]:<12} "
+                  f"{stats['partidas_jogadas']:>3} {stats['gols']:>5} {stats['assistencias']:>6} "
+                  f"{stats['cartoes_amarelos'] + stats['cartoes_vermelhos']:>5} "
+                  f"{linha['por_90']['gols']:>8.2f} {linha['por_90']['assistencias']:>9.2f} "
+                  f"{pct_gols:>6} {pct_assist:>7}")
+        print("\n%: percentil da taxa por 90 minutos entre as jogadoras da mesma posição"
+              + (" (nas partidas do confronto)" if confronto_direto else ""))
         
         # Pausa para usuário ver os resultados
         input("\n⏸️  Pressione Enter para continuar...")
@@ -690,29 +2489,40 @@ class SistemaFutebolFeminino:
         print("\nℹ️  INFORMAÇÕES DO SISTEMA")
         print("=" * 60)
         print(f"📊 Dados cadastrados:")
-        print(f"   • {len(self.usuarios)} usuários")
-        print(f"   • {len(self.jogadoras)} jogadoras")
-        print(f"   • {len(self.clubes)} clubes")
-        print(f"   • {len(self.campeonatos)} campeonatos")
-        print(f"   • {len(self.partidas)} partidas")
-        print(f"   • {len(self.eventos)} eventos")
-        
+        print(f"   • {self.contar('usuarios')} usuários")
+        print(f"   • {self.contar('jogadoras')} jogadoras")
+        print(f"   • {self.contar('clubes')} clubes")
+        print(f"   • {self.contar('campeonatos')} campeonatos")
+        print(f"   • {self.contar('partidas')} partidas")
+        print(f"   • {self.contar('eventos')} eventos")
+        
+        disponiveis = self.listar_disponiveis()
         print(f"\n👥 JOGADORAS DISPONÍVEIS:")
-        for jogadora in self.jogadoras:
-            if jogadora['ativa']:
-                clube = self.buscar_clube_por_id(jogadora['clube_id'])
-                clube_nome = clube['nome'] if clube else "N/A"
-                print(f"   • ID: {jogadora['id']} - {jogadora['nome']} ({clube_nome})")
+        for jogadora_id, nome, clube_nome in disponiveis['jogadoras']:
+            print(f"   • ID: {jogadora_id} - {nome} ({clube_nome})")
         
         print(f"\n⚽ CLUBES DISPONÍVEIS:")
-        for clube in self.clubes:
-            if clube['ativo']:
-                print(f"   • ID: {clube['id']} - {clube['nome']}")
+        for clube_id, nome in disponiveis['clubes']:
+            print(f"   • ID: {clube_id} - {nome}")
         
         print(f"\n🏅 CAMPEONATOS DISPONÍVEIS:")
-        for campeonato in self.campeonatos:
-            if campeonato['ativo']:
-                print(f"   • ID: {campeonato['id']} - {campeonato['nome']}")
+        for campeonato_id, nome in disponiveis['campeonatos']:
+            print(f"   • ID: {campeonato_id} - {nome}")
+        
+        if self.cache:
+            metricas = self.cache.metricas()
+            print("\n🗃️  CACHE DE CONSULTAS:")
+            print(f"   • {metricas['tamanho']}/{metricas['capacidade']} resultados guardados")
+            print(f"   • {metricas['acertos']} acertos, {metricas['falhas']} falhas "
+                  f"(taxa de acerto: {metricas['taxa_acerto']:.1%})")
+            print(f"   • {metricas['despejos']} despejos, {metricas['invalidacoes']} invalidações")
+        
+        if self.instrumentacao:
+            print("\n⏱️  CONSULTAS MAIS DEMORADAS (instrumentação):")
+            for metodo, dados in self.instrumentacao.mais_demoradas(5):
+                print(f"   • {metodo}: {dados['chamadas']} chamadas, "
+                      f"{dados['latencia']['media'] * 1000:.2f} ms em média, "
+                      f"{dados['linhas_examinadas']} linhas examinadas")
         
         print(f"\n💡 DICAS:")
         print("   • Use os IDs mostrados acima para testar as funcionalidades")
@@ -731,6 +2541,9 @@ class SistemaFutebolFeminino:
         print("4. Cadastrar Partida")
         print("5. Adicionar Evento à Partida")
         print("6. Gerenciar Usuários")
+        print("7. Lançar Resultado de Partida")
+        print("8. Reconciliar Placares com os Gols")
+        print("9. Registrar Transferência de Jogadora")
         print("0. Voltar")
         
         opcao = input("\nEscolha uma opção: ").strip()
@@ -747,6 +2560,12 @@ class SistemaFutebolFeminino:
             self.adicionar_evento()
         elif opcao == "6":
             self.gerenciar_usuarios()
+        elif opcao == "7":
+            self.lancar_resultado()
+        elif opcao == "8":
+            self.exibir_reconciliacao_placares()
+        elif opcao == "9":
+            self.cadastrar_transferencia()
     
     def cadastrar_jogadora(self):
         """Cadastra nova jogadora"""
@@ -761,20 +2580,8 @@ class SistemaFutebolFeminino:
         altura = float(input("Altura (m): "))
         peso = float(input("Peso (kg): "))
         
-        nova_jogadora = {
-            'id': gerar_id(),
-            'nome': nome,
-            'posicao': posicao,
-            'clube_id': clube_id,
-            'numero_camisa': numero,
-            'idade': idade,
-            'nacionalidade': nacionalidade,
-            'altura': altura,
-            'peso': peso,
-            'ativa': True
-        }
-        
-        self.jogadoras.append(nova_jogadora)
+        self.registrar_jogadora(nome, posicao, clube_id, numero, idade,
+                                nacionalidade, altura, peso)
         print("✅ Jogadora cadastrada com sucesso!")
         
         # Pausa para usuário ver o resultado
@@ -792,18 +2599,7 @@ class SistemaFutebolFeminino:
         cores_input = input("Cores (separadas por vírgula): ").strip()
         cores = [cor.strip() for cor in cores_input.split(',')]
         
-        novo_clube = {
-            'id': gerar_id(),
-            'nome': nome,
-            'cidade': cidade,
-            'estado': estado,
-            'pais': pais,
-            'fundacao': fundacao,
-            'cores': cores,
-            'ativo': True
-        }
-        
-        self.clubes.append(novo_clube)
+        self.registrar_clube(nome, cidade, estado, pais, fundacao, cores)
         print("✅ Clube cadastrado com sucesso!")
         
         # Pausa para usuário ver o resultado
@@ -817,15 +2613,7 @@ class SistemaFutebolFeminino:
         pais = input("País: ").strip()
         temporada = input("Temporada: ").strip()
         
-        novo_campeonato = {
-            'id': gerar_id(),
-            'nome': nome,
-            'pais': pais,
-            'temporada': temporada,
-            'ativo': True
-        }
-        
-        self.campeonatos.append(novo_campeonato)
+        self.registrar_campeonato(nome, pais, temporada)
         print("✅ Campeonato cadastrado com sucesso!")
         
         # Pausa para usuário ver o resultado
@@ -840,23 +2628,69 @@ class SistemaFutebolFeminino:
         campeonato_id = input("ID do campeonato: ").strip()
         data = input("Data (YYYY-MM-DD): ").strip()
         
-        nova_partida = {
-            'id': gerar_id(),
-            'clube_casa_id': clube_casa,
-            'clube_fora_id': clube_fora,
-            'campeonato_id': campeonato_id,
-            'data': data,
-            'placar_casa': 0,
-            'placar_fora': 0,
-            'finalizada': False
-        }
-        
-        self.partidas.append(nova_partida)
+        self.registrar_partida(clube_casa, clube_fora, campeonato_id, data)
         print("✅ Partida cadastrada com sucesso!")
         
         # Pausa para usuário ver o resultado
         input("\n⏸️  Pressione Enter para continuar...")
     
+    def lancar_resultado(self):
+        """Registra o placar final de uma partida"""
+        print("\n🏁 LANÇAR RESULTADO DE PARTIDA")
+        
+        partida_id = input("ID da partida: ").strip()
+        placar_casa = int(input("Gols do clube da casa: "))
+        placar_fora = int(input("Gols do clube visitante: "))
+        
+        if self.finalizar_partida(partida_id, placar_casa, placar_fora):
+            print("✅ Partida finalizada! Classificação atualizada.")
+        else:
+            print("❌ Partida não encontrada!")
+        
+        # Pausa para usuário ver o resultado
+        input("\n⏸️  Pressione Enter para continuar...")
+    
+    def exibir_reconciliacao_placares(self):
+        """Lista as partidas cujo placar diverge dos gols e oferece a correção"""
+        print("\n🔎 RECONCILIAÇÃO DE PLACARES")
+        
+        relatorio = self.reconciliar_placares()
+        divergencias = relatorio['divergencias']
+        print(f"{relatorio['partidas']} partidas verificadas, {len(divergencias)} com divergência")
+        for divergencia in divergencias[:20]:
+            casa, fora = divergencia['registrado']
+            gols_casa, gols_fora = divergencia['derivado']
+            sem_clube = divergencia['gols_sem_clube']
+            aviso = f" ({sem_clube} gol(s) sem clube na partida)" if sem_clube else ""
+            print(f"{divergencia['partida_id']} ({divergencia['data']}): registrado {casa} x {fora}, "
+                  f"gols {gols_casa} x {gols_fora}{aviso}")
+        
+        if divergencias and input("\nGravar o placar calculado pelos gols? (s/n): ").strip().lower() == 's':
+            print(f"✅ {self.reconciliar_placares(corrigir=True)['corrigidas']} partida(s) corrigida(s)!")
+        
+        # Pausa para usuário ver o resultado
+        input("\n⏸️  Pressione Enter para continuar...")
+    
+    def cadastrar_transferencia(self):
+        """Registra a transferência de uma jogadora para outro clube"""
+        print("\n🔁 REGISTRAR TRANSFERÊNCIA")
+        
+        jogadora_id = input("ID da jogadora: ").strip()
+        clube_id = input("ID do novo clube: ").strip()
+        data = input("Data da transferência (YYYY-MM-DD): ").strip()
+        
+        if self.registrar_transferencia(jogadora_id, clube_id, data):
+            print("✅ Transferência registrada!")
+            for periodo in self.historico_da_jogadora(jogadora_id):
+                clube = self.buscar_clube_por_id(periodo['clube_id'])
+                print(f"   {clube['nome'] if clube else 'N/A'}: "
+                      f"{periodo['inicio'] or '...'} até {periodo['fim'] or 'hoje'}")
+        else:
+            print("❌ Jogadora ou clube não encontrado!")
+        
+        # Pausa para usuário ver o resultado
+        input("\n⏸️  Pressione Enter para continuar...")
+    
     def adicionar_evento(self):
         """Adiciona evento a uma partida"""
         print("\n📝 ADICIONAR EVENTO À PARTIDA")
@@ -890,16 +2724,7 @@ class SistemaFutebolFeminino:
         minuto = int(input("Minuto do evento: "))
         observacoes = input("Observações (opcional): ").strip()
         
-        novo_evento = {
-            'id': gerar_id(),
-            'partida_id': partida_id,
-            'jogadora_id': jogadora_id,
-            'tipo': tipo_evento,
-            'minuto': minuto,
-            'observacoes': observacoes
-        }
-        
-        self.eventos.append(novo_evento)
+        self.registrar_evento(partida_id, jogadora_id, tipo_evento, minuto, observacoes)
         print("✅ Evento adicionado com sucesso!")
         
         # Pausa para usuário ver o resultado
@@ -932,8 +2757,17 @@ def main():
     print("📚 Trabalho Acadêmico - Demonstração de Conceitos Python")
     
     try:
-        sistema = SistemaFutebolFeminino()
+        # Argumento opcional: arquivo .db (SQLite) ou diretório de log para persistir os dados
+        armazenamento = None
+        if len(sys.argv) > 1:
+            from persistencia import abrir_armazenamento
+            armazenamento = abrir_armazenamento(sys.argv[1])
+        
+        sistema = SistemaFutebolFeminino(armazenamento)
         sistema.exibir_menu_principal()
+        
+        if armazenamento:
+            armazenamento.fechar()
     except KeyboardInterrupt:
         print("\n\n👋 Obrigado por usar a plataforma!")
     except Exception as e:
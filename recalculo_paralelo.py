@@ -0,0 +1,183 @@
+"""
+Recálculo paralelo das estatísticas da Plataforma de Estatísticas do Futebol Feminino
+
+Quando uma correção de eventos ou uma regra de pontuação muda, todas as
+estatísticas precisam ser recalculadas. Este módulo divide os eventos em
+partições por partida (ou por campeonato), agrega cada partição num processo
+separado e junta os contadores parciais numa etapa de redução.
+
+Como cada partida fica inteira numa única partição, os conjuntos de partidas
+por jogadora das partições não se sobrepõem e a soma é exata. As partições são
+faixas contíguas de partidas juntadas sempre na mesma ordem, então o resultado
+(inclusive a ordem das jogadoras) é o mesmo para qualquer quantidade de processos.
+
+Os eventos das partições são gravados, em colunas de códigos inteiros
+(eventos_colunares), num bloco de memória compartilhada (shared_memory), na
+ordem das partições. Cada processo recebe só o nome do bloco e a faixa de
+posições da sua partição: nada é serializado por evento e nenhum objeto Python
+é tocado nos filhos (com fork, ler dicionários herdados alteraria as contagens
+de referência e copiaria as páginas de memória para cada filho). Os filhos
+devolvem códigos, que o processo principal traduz de volta para os IDs.
+Antes de criar o pool, todas as páginas de eventos são lidas no processo
+principal, então os filhos nunca consultam o banco.
+"""
+
+import multiprocessing
+import os
+from multiprocessing import shared_memory
+
+from eventos_colunares import EventosColunares
+from plataforma_futebol_feminino import ESTATISTICA_POR_EVENTO, agregar_contadores, novas_estatisticas
+
+# Colunas gravadas na memória compartilhada: (nome, typecode do memoryview, bytes por evento)
+COLUNAS_COMPARTILHADAS = (('partida', 'i', 4), ('jogadora', 'i', 4), ('tipo', 'b', 1))
+
+# =============================================================================
+# PARTICIONAMENTO
+# =============================================================================
+
+def particionar(sistema, criterio='partida', quantidade=1):
+    """Divide as partidas em partições: lista de listas de partida_id"""
+    eventos_por_partida = sistema.eventos_por_partida
+    
+    if criterio == 'campeonato':
+        # Uma partição por campeonato (partidas desconhecidas ficam juntas no final)
+        grupos = {}
+        for partida_id in eventos_por_partida:
+            partida = sistema.buscar_partida_por_id(partida_id)
+            grupos.setdefault(partida['campeonato_id'] if partida else None, []).append(partida_id)
+        chaves = sorted(grupos, key=lambda chave: (chave is None, chave or ''))
+        return [grupos[chave] for chave in chaves]
+    
+    if criterio != 'partida':
+        raise ValueError(f"Critério de partição inválido: {criterio}")
+    
+    # Partidas consecutivas até somar a fração de eventos de cada partição
+    eventos_por_particao = -(-len(sistema.eventos) // quantidade)
+    particoes = []
+    atual = []
+    total = 0
+    for partida_id, eventos in eventos_por_partida.items():
+        atual.append(partida_id)
+        total += len(eventos)
+        if total >= eventos_por_particao:
+            particoes.append(atual)
+            atual = []
+            total = 0
+    if atual:
+        particoes.append(atual)
+    return particoes
+
+# =============================================================================
+# AGREGAÇÃO (PROCESSOS) E REDUÇÃO
+# =============================================================================
+
+def criar_memoria_compartilhada(colunar):
+    """Copia as colunas de códigos para um bloco de memória compartilhada"""
+    tamanho = len(colunar)
+    memoria = shared_memory.SharedMemory(create=True, size=max(tamanho * 9, 1))
+    posicao = 0
+    for nome, _, largura in COLUNAS_COMPARTILHADAS:
+        memoria.buf[posicao:posicao + tamanho * largura] = memoryview(colunar.coluna(nome)).cast('B')
+        posicao += tamanho * largura
+    return memoria
+
+
+def agregar_faixa(tarefa):
+    """Agrega as posições [inicio, fim) das colunas compartilhadas; devolve contadores por código"""
+    nome, tamanho, inicio, fim, chave_por_tipo = tarefa
+    memoria = shared_memory.SharedMemory(name=nome)
+    colunas = []
+    try:
+        posicao = 0
+        for _, typecode, largura in COLUNAS_COMPARTILHADAS:
+            colunas.append(memoria.buf[posicao:posicao + tamanho * largura].cast(typecode))
+            posicao += tamanho * largura
+        
+        estatisticas = {}
+        partidas_por_jogadora = {}
+        # Estrutura de repetição: mesma passada de agregar_contadores, sobre os códigos
+        for partida, jogadora, tipo in zip(*(coluna[inicio:fim] for coluna in colunas)):
+            stats = estatisticas.get(jogadora)
+            if stats is None:
+                stats = estatisticas[jogadora] = novas_estatisticas()
+                partidas_por_jogadora[jogadora] = set()
+            
+            partidas_por_jogadora[jogadora].add(partida)
+            chave = chave_por_tipo[tipo]
+            if chave:
+                stats[chave] += 1
+        return estatisticas, partidas_por_jogadora
+    finally:
+        # As visões precisam ser liberadas antes de fechar o bloco
+        for coluna in colunas:
+            coluna.release()
+        memoria.close()
+
+
+def decodificar(parciais, colunar):
+    """Traduz os códigos dos contadores parciais de volta para os IDs de jogadoras e partidas"""
+    jogadoras = colunar.valores['jogadora']
+    partidas = colunar.valores['partida']
+    for estatisticas, partidas_por_jogadora in parciais:
+        yield (
+            {jogadoras[codigo]: stats for codigo, stats in estatisticas.items()},
+            {jogadoras[codigo]: {partidas[partida] for partida in conjunto}
+             for codigo, conjunto in partidas_por_jogadora.items()}
+        )
+
+
+def mesclar(parciais):
+    """Redução: soma os contadores parciais na ordem das partições (à medida que chegam)"""
+    estatisticas = {}
+    partidas_por_jogadora = {}
+    
+    for parcial_estatisticas, parcial_partidas in parciais:
+        for jogadora_id, stats in parcial_estatisticas.items():
+            total = estatisticas.get(jogadora_id)
+            if total is None:
+                estatisticas[jogadora_id] = stats
+                partidas_por_jogadora[jogadora_id] = parcial_partidas[jogadora_id]
+                continue
+            for chave, valor in stats.items():
+                total[chave] += valor
+            partidas_por_jogadora[jogadora_id] |= parcial_partidas[jogadora_id]
+    
+    for jogadora_id, partidas in partidas_por_jogadora.items():
+        estatisticas[jogadora_id]['partidas_jogadas'] = len(partidas)
+    return estatisticas, partidas_por_jogadora
+
+
+def recalcular_estatisticas(sistema, processos=None, criterio='partida'):
+    """Recalcula (estatisticas, partidas_por_jogadora) em paralelo a partir dos eventos"""
+    processos = processos or os.cpu_count() or 1
+    particoes = particionar(sistema, criterio, processos)
+    
+    # Carrega todas as páginas aqui, no processo principal: os filhos só leem as colunas compartilhadas
+    eventos_por_partida = dict(sistema.eventos_por_partida.items())
+    
+    # Uma partição: mesma agregação e redução, sem o custo de criar o pool
+    if processos == 1 or len(particoes) <= 1:
+        return mesclar(
+            agregar_contadores(evento for partida_id in particao for evento in eventos_por_partida[partida_id])
+            for particao in particoes
+        )
+    
+    # Colunas na ordem das partições: cada partição vira uma faixa contígua de posições
+    colunar = EventosColunares()
+    faixas = []
+    for particao in particoes:
+        inicio = len(colunar)
+        for partida_id in particao:
+            colunar.adicionar_varios(eventos_por_partida[partida_id])
+        faixas.append((inicio, len(colunar)))
+    chave_por_tipo = [ESTATISTICA_POR_EVENTO.get(tipo) for tipo in colunar.valores['tipo']]
+    
+    memoria = criar_memoria_compartilhada(colunar)
+    try:
+        tarefas = [(memoria.name, len(colunar), inicio, fim, chave_por_tipo) for inicio, fim in faixas]
+        with multiprocessing.Pool(processos) as pool:
+            return mesclar(decodificar(pool.imap(agregar_faixa, tarefas), colunar))
+    finally:
+        memoria.close()
+        memoria.unlink()
@@ -0,0 +1,116 @@
+"""Testes da API HTTP/JSON assíncrona"""
+
+import asyncio
+import json
+import time
+
+from api_http import ServidorApi, calcular_etag, etag_confere, responder_consulta
+from plataforma_futebol_feminino import SistemaFutebolFeminino
+
+
+async def requisitar(porta, caminho, etag=None):
+    """Envia um GET e retorna (status, cabeçalhos, corpo)"""
+    leitor, escritor = await asyncio.open_connection('127.0.0.1', porta)
+    try:
+        pedido = f"GET {caminho} HTTP/1.1\r\nHost: teste\r\nConnection: close\r\n"
+        if etag:
+            pedido += f"If-None-Match: {etag}\r\n"
+        escritor.write((pedido + "\r\n").encode())
+        resposta = await leitor.read()
+    finally:
+        escritor.close()
+    cabecalho, _, corpo = resposta.partition(b'\r\n\r\n')
+    linhas = cabecalho.decode('latin-1').split('\r\n')
+    cabecalhos = dict(linha.split(': ', 1) for linha in linhas[1:])
+    return int(linhas[0].split()[1]), cabecalhos, corpo
+
+
+def executar_com_servidor(sistema, cenario):
+    async def principal():
+        servidor = ServidorApi(sistema, porta=0)
+        porta = await servidor.iniciar()
+        tarefa = asyncio.create_task(servidor.servir())
+        try:
+            return await cenario(porta)
+        finally:
+            tarefa.cancel()
+            servidor.executor.shutdown()
+    return asyncio.run(principal())
+
+
+def test_etag_e_revalidacao():
+    sistema = SistemaFutebolFeminino()
+    
+    async def cenario(porta):
+        status, cabecalhos, corpo = await requisitar(porta, '/rankings/gols?limite=3')
+        assert status == 200
+        assert len(json.loads(corpo)['itens']) == 3
+        status_revalidado, _, corpo_revalidado = await requisitar(porta, '/rankings/gols?limite=3', cabecalhos['ETag'])
+        
+        # Dado novo: a mesma consulta muda de ETag
+        sistema.registrar_evento('part_001', 'jog_003', 'gol', 70)
+        status_novo, cabecalhos_novos, _ = await requisitar(porta, '/rankings/gols?limite=3', cabecalhos['ETag'])
+        return status_revalidado, corpo_revalidado, status_novo, cabecalhos['ETag'], cabecalhos_novos['ETag']
+    
+    status_revalidado, corpo_revalidado, status_novo, etag, etag_nova = executar_com_servidor(sistema, cenario)
+    assert status_revalidado == 304 and corpo_revalidado == b''
+    assert status_novo == 200 and etag_nova != etag
+
+
+def test_rotas_documentadas_e_erros():
+    sistema = SistemaFutebolFeminino()
+    
+    async def cenario(porta):
+        return [(await requisitar(porta, caminho))[0] for caminho in (
+            '/jogadoras/jog_001/clubes', '/gols-por-clube', '/jogadoras/inexistente', '/rota/desconhecida'
+        )]
+    
+    assert executar_com_servidor(sistema, cenario) == [200, 200, 404, 404]
+
+
+def test_consulta_lenta_nao_bloqueia_o_laco():
+    sistema = SistemaFutebolFeminino()
+    obter_ranking = sistema.obter_ranking
+    
+    def ranking_lento(*args, **kwargs):
+        time.sleep(0.5)
+        return obter_ranking(*args, **kwargs)
+    sistema.obter_ranking = ranking_lento
+    
+    async def cenario(porta):
+        await requisitar(porta, '/clubes')
+        lenta = asyncio.create_task(requisitar(porta, '/rankings/gols'))
+        await asyncio.sleep(0.05)
+        # Resposta já calculada sai pelo laço de eventos enquanto a consulta lenta roda na thread
+        inicio = time.perf_counter()
+        status, _, _ = await requisitar(porta, '/clubes')
+        duracao = time.perf_counter() - inicio
+        assert not lenta.done()
+        return status, duracao, (await lenta)[0]
+    
+    status, duracao, status_lenta = executar_com_servidor(sistema, cenario)
+    assert status == 200 and status_lenta == 200
+    assert duracao < 0.3
+
+
+def test_if_none_match_com_lista_etag_fraca_e_curinga():
+    etag = calcular_etag(b'{"a":1}')
+    assert etag == calcular_etag(b'{"a":1}') != calcular_etag(b'{"a":2}')
+    assert etag_confere(f'"outra", W/{etag}', etag)
+    assert etag_confere('*', etag)
+    assert not etag_confere('"outra"', etag)
+    assert not etag_confere(None, etag)
+
+
+def test_parametros_e_paginacao():
+    sistema = SistemaFutebolFeminino()
+    status, corpo = responder_consulta(sistema, '/jogadoras?inicio=1&limite=1')
+    pagina = json.loads(corpo)
+    assert status == 200
+    assert pagina['total'] == 3 and [jogadora['id'] for jogadora in pagina['itens']] == ['jog_002']
+    
+    assert responder_consulta(sistema, '/jogadoras?limite=x')[0] == 400
+    assert responder_consulta(sistema, '/jogadoras?limite=0')[0] == 400
+    assert responder_consulta(sistema, '/rankings/chutes')[0] == 404
+    assert responder_consulta(sistema, '/comparacao')[0] == 400
+    assert responder_consulta(sistema, '/comparacao?clube_id=clube_001&confronto_direto=1')[0] == 400
@@ -0,0 +1,92 @@
+"""Testes da autenticação: migração de hash no SQLite, lote no pool de senhas e falhas entre threads"""
+
+from concurrent.futures import ThreadPoolExecutor
+
+from persistencia import abrir_armazenamento
+from plataforma_futebol_feminino import (
+    ALGORITMO_SENHA,
+    LIMITE_FALHAS_LOGIN,
+    TIPO_USUARIO,
+    SistemaFutebolFeminino,
+    hash_senha_legado
+)
+
+
+def criar_banco_com_usuaria_legada(caminho):
+    """Banco SQLite com uma usuária cujo hash ainda é o SHA-256 antigo"""
+    armazenamento = abrir_armazenamento(caminho)
+    sistema = SistemaFutebolFeminino(armazenamento)
+    sistema.criar_usuario('legada@teste.com', 'senha123', 'Legada', TIPO_USUARIO)
+    usuario = sistema.usuarios_por_email['legada@teste.com']
+    usuario['senha_hash'] = hash_senha_legado('senha123')
+    armazenamento.salvar_registro('usuarios', usuario)
+    armazenamento.fechar()
+
+
+def hash_gravado(caminho):
+    """Hash da usuária legada lido de novo do banco"""
+    armazenamento = abrir_armazenamento(caminho)
+    try:
+        usuario = SistemaFutebolFeminino(armazenamento).usuarios_por_email['legada@teste.com']
+        return usuario['senha_hash']
+    finally:
+        armazenamento.fechar()
+
+
+def test_login_migra_hash_legado_no_sqlite(tmp_path):
+    caminho = str(tmp_path / 'dados.db')
+    criar_banco_com_usuaria_legada(caminho)
+    
+    armazenamento = abrir_armazenamento(caminho)
+    sistema = SistemaFutebolFeminino(armazenamento, preguicoso=False)
+    assert sistema.fazer_login('legada@teste.com', 'senha123')
+    armazenamento.fechar()
+    
+    assert hash_gravado(caminho).startswith(ALGORITMO_SENHA + '$')
+
+
+def test_login_com_carregamento_sob_demanda(tmp_path):
+    caminho = str(tmp_path / 'dados.db')
+    criar_banco_com_usuaria_legada(caminho)
+    
+    # Usuários ainda não lidos: o índice por email é carregado no primeiro login
+    armazenamento = abrir_armazenamento(caminho)
+    sistema = SistemaFutebolFeminino(armazenamento, preguicoso=True)
+    assert not sistema.fazer_login('legada@teste.com', 'errada')
+    assert sistema.fazer_login('legada@teste.com', 'senha123')
+    assert sistema.fazer_login('admin@passaabola.com', 'admin123')
+    armazenamento.fechar()
+    
+    assert hash_gravado(caminho).startswith(ALGORITMO_SENHA + '$')
+
+
+def test_lote_no_pool_grava_na_thread_de_quem_chamou(tmp_path):
+    caminho = str(tmp_path / 'dados.db')
+    criar_banco_com_usuaria_legada(caminho)
+    
+    armazenamento = abrir_armazenamento(caminho)
+    sistema = SistemaFutebolFeminino(armazenamento)
+    resultados = sistema.autenticar_varios([
+        ('legada@teste.com', 'senha123'), ('legada@teste.com', 'errada'),
+        ('ninguem@teste.com', 'senha123'), ('admin@passaabola.com', 'admin123')
+    ])
+    assert [usuario['email'] if usuario else None for usuario in resultados] == [
+        'legada@teste.com', None, None, 'admin@passaabola.com'
+    ]
+    armazenamento.fechar()
+    
+    assert hash_gravado(caminho).startswith(ALGORITMO_SENHA + '$')
+
+
+def test_falhas_de_login_simultaneas_bloqueiam_o_email():
+    sistema = SistemaFutebolFeminino()
+    tentativas = LIMITE_FALHAS_LOGIN * 4
+    with ThreadPoolExecutor(max_workers=8) as clientes:
+        resultados = list(clientes.map(lambda _: sistema.autenticar('admin@passaabola.com', 'errada'),
+                                       range(tentativas)))
+    assert not any(resultados)
+    # Toda falha fica registrada (nenhuma se perde entre threads) e o email fica bloqueado
+    assert len(sistema.falhas_login['admin@passaabola.com']) <= tentativas
+    assert len(sistema.falhas_login['admin@passaabola.com']) >= LIMITE_FALHAS_LOGIN
+    assert sistema.login_bloqueado('admin@passaabola.com')
+    assert sistema.autenticar('admin@passaabola.com', 'admin123') is None
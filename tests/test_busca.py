@@ -0,0 +1,42 @@
+"""Testes do índice de busca textual (sem acentos, prefixos e trechos)"""
+
+from plataforma_futebol_feminino import IndiceBusca, SistemaFutebolFeminino
+
+
+def indice(*nomes):
+    resultado = IndiceBusca()
+    for posicao, nome in enumerate(nomes):
+        resultado.adicionar(f"id_{posicao}", nome, nome)
+    return resultado
+
+
+def test_exato_antes_de_prefixo_antes_de_trecho():
+    busca = indice('Mariana Santos', 'Marta Silva', 'Ana Maria', 'Rosimar Lima')
+    assert busca.buscar('mar') == ['Mariana Santos', 'Marta Silva', 'Ana Maria', 'Rosimar Lima']
+    assert busca.buscar('maria') == ['Ana Maria', 'Mariana Santos']
+    assert busca.buscar('imar') == ['Rosimar Lima']
+    assert busca.buscar('mar', limite=2) == ['Mariana Santos', 'Marta Silva']
+
+
+def test_sem_acentos_e_sem_maiusculas():
+    busca = indice('Cássia Conceição', 'Debora Cristiane')
+    assert busca.buscar('CASSIA') == ['Cássia Conceição']
+    assert busca.buscar('débora') == ['Debora Cristiane']
+    assert busca.buscar('ceicao') == ['Cássia Conceição']
+
+
+def test_varias_palavras_exigem_todas():
+    busca = indice('Ana Silva', 'Ana Santos', 'Bia Silva', 'Silva Ana Lima')
+    assert busca.buscar('ana sil') == ['Ana Silva', 'Silva Ana Lima']
+    assert busca.buscar('ana sil', limite=1) == ['Ana Silva']
+    assert busca.buscar('ana xyz') == []
+    # Termo vazio: todos os registros, na ordem de cadastro
+    assert busca.buscar('  ', limite=2) == ['Ana Silva', 'Ana Santos']
+
+
+def test_busca_do_sistema_acompanha_cadastros():
+    sistema = SistemaFutebolFeminino()
+    assert sistema.buscar('zzqq')['jogadoras'] == []
+    jogadora = sistema.registrar_jogadora('Zzqqa Teste', 'Goleira', 'clube_001', 1, 20, 'Brasil', 1.80, 70)
+    assert sistema.buscar('zzqq')['jogadoras'] == [jogadora]
+    assert sistema.buscar_jogadoras_por_nome('teste') == [jogadora]
@@ -0,0 +1,46 @@
+"""Testes do cache de consultas invalidado por entidade"""
+
+from plataforma_futebol_feminino import AUSENTE, EVENTO_GOL, CacheConsultas, SistemaFutebolFeminino
+
+
+def test_evento_invalida_so_o_que_depende_dele():
+    sistema = SistemaFutebolFeminino()
+    ranking = sistema.obter_ranking_gols()
+    resumo = sistema.resumo_partida('part_001')
+    disponiveis = sistema.listar_disponiveis()
+    assert sistema.obter_ranking_gols() is ranking
+    assert sistema.cache.metricas()['acertos'] == 1
+    
+    sistema.registrar_evento('part_001', 'jog_001', EVENTO_GOL, 88)
+    novo_ranking = sistema.obter_ranking_gols()
+    assert novo_ranking is not ranking and novo_ranking[0]['gols'] == 2
+    assert sistema.resumo_partida('part_001')[EVENTO_GOL] == resumo[EVENTO_GOL] + 1
+    # Lista de clubes e jogadoras não depende de eventos: continua no cache
+    assert sistema.listar_disponiveis() is disponiveis
+    assert sistema.cache.metricas()['invalidacoes'] == 2
+
+
+def test_despejo_do_menos_usado():
+    cache = CacheConsultas(capacidade=2)
+    cache.guardar('a', [('colecao', 'eventos')], 1)
+    cache.guardar('b', [], 2)
+    assert cache.obter('a') == 1
+    cache.guardar('c', [], 3)
+    
+    # 'b' era o menos usado ('a' acabou de ser lido)
+    assert cache.obter('b') is AUSENTE
+    assert cache.obter('a') == 1 and cache.obter('c') == 3
+    assert cache.metricas()['despejos'] == 1
+    
+    cache.alterar(('colecao', 'eventos'))
+    assert cache.obter('a') is AUSENTE
+    assert cache.metricas()['tamanho'] == 1
+
+
+def test_argumentos_diferentes_e_sem_cache():
+    sistema = SistemaFutebolFeminino()
+    assert sistema.obter_ranking_gols(1) is not sistema.obter_ranking_gols(2)
+    assert len(sistema.obter_ranking_gols(1)) == 1
+    
+    sistema.cache = None
+    assert sistema.obter_ranking_gols(1) == sistema.obter_ranking_gols(1)
@@ -0,0 +1,71 @@
+"""Testes dos eventos paginados por partida (carregamento sob demanda)"""
+
+from persistencia import abrir_armazenamento
+from plataforma_futebol_feminino import EVENTO_GOL, Evento, SistemaFutebolFeminino, gerar_id
+
+
+def test_pagina_vazia_nao_fica_guardada(tmp_path):
+    caminho = str(tmp_path / 'dados.db')
+    escritor = SistemaFutebolFeminino(abrir_armazenamento(caminho))
+    leitor = SistemaFutebolFeminino(abrir_armazenamento(caminho))
+    assert leitor.eventos_paginados()
+    
+    # Partida ainda sem eventos consultada antes de o outro processo gravar o primeiro
+    partida = escritor.registrar_partida('clube_001', 'clube_002', 'camp_001', '2024-09-01')
+    assert leitor.listar_eventos_da_partida(partida['id']) == []
+    assert leitor.eventos_por_partida.get('partida_inexistente') is None
+    
+    escritor.registrar_evento(partida['id'], 'jog_001', EVENTO_GOL, 10)
+    assert len(leitor.listar_eventos_da_partida(partida['id'])) == 1
+    
+    escritor.armazenamento.fechar()
+    leitor.armazenamento.fechar()
+
+
+def test_evento_em_partida_sem_pagina(tmp_path):
+    caminho = str(tmp_path / 'dados.db')
+    SistemaFutebolFeminino(abrir_armazenamento(caminho)).armazenamento.fechar()
+    
+    sistema = SistemaFutebolFeminino(abrir_armazenamento(caminho))
+    partida = sistema.registrar_partida('clube_001', 'clube_002', 'camp_001', '2024-09-01')
+    sistema.registrar_evento(partida['id'], 'jog_001', EVENTO_GOL, 10)
+    sistema.registrar_evento(partida['id'], 'jog_001', EVENTO_GOL, 20)
+    assert [evento['minuto'] for evento in sistema.listar_eventos_da_partida(partida['id'])] == [10, 20]
+    sistema.armazenamento.fechar()
+
+
+def test_eventos_novos_na_pagina_e_na_colecao(tmp_path):
+    caminho = str(tmp_path / 'dados.db')
+    SistemaFutebolFeminino(abrir_armazenamento(caminho)).armazenamento.fechar()
+    
+    sistema = SistemaFutebolFeminino(abrir_armazenamento(caminho))
+    antes = len(sistema.listar_eventos_da_partida('part_001'))
+    sistema.registrar_evento('part_001', 'jog_001', EVENTO_GOL, 50)
+    sistema.adicionar_registros('eventos', [Evento(gerar_id(), 'part_001', 'jog_002', EVENTO_GOL, 60)])
+    assert len(sistema.listar_eventos_da_partida('part_001')) == antes + 2
+    assert sistema.eventos_paginados()
+    
+    # self.eventos (lido do armazenamento) tem os mesmos eventos que as páginas
+    assert len(sistema.eventos) == antes + 2
+    assert len(sistema.eventos_por_partida['part_001']) == antes + 2
+    sistema.armazenamento.fechar()
+
+
+def test_leitura_completa_durante_o_cadastro(tmp_path, monkeypatch):
+    caminho = str(tmp_path / 'dados.db')
+    SistemaFutebolFeminino(abrir_armazenamento(caminho)).armazenamento.fechar()
+    sistema = SistemaFutebolFeminino(abrir_armazenamento(caminho))
+    antes = len(sistema.listar_eventos_da_partida('part_001'))
+    
+    # Um leitor de self.eventos no meio do cadastro encerra a paginação
+    registrar_alteracoes = sistema.registrar_alteracoes
+    def ler_todos_e_registrar(colecao, registros):
+        len(sistema.eventos)
+        registrar_alteracoes(colecao, registros)
+    monkeypatch.setattr(sistema, 'registrar_alteracoes', ler_todos_e_registrar)
+    
+    sistema.registrar_evento('part_001', 'jog_001', EVENTO_GOL, 50)
+    assert not sistema.eventos_paginados()
+    assert len(sistema.eventos) == antes + 1
+    assert len(sistema.eventos_por_partida['part_001']) == antes + 1
+    sistema.armazenamento.fechar()
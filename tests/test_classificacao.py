@@ -0,0 +1,68 @@
+"""Testes da classificação incremental dos campeonatos"""
+
+from classificacao import Classificacoes
+from plataforma_futebol_feminino import Partida, SistemaFutebolFeminino
+
+
+def partida(numero, casa, fora, gols_casa, gols_fora, data='2024-03-01', campeonato_id='camp'):
+    return Partida(f"p{numero}", casa, fora, campeonato_id, data, gols_casa, gols_fora, True)
+
+
+def ordem(classificacoes, campeonato_id='camp', data=None):
+    return [linha['clube_id'] for linha in classificacoes.tabela(campeonato_id, data)]
+
+
+def test_desempate_por_saldo_e_por_confronto_direto():
+    classificacoes = Classificacoes.de_partidas([
+        partida(1, 'zeta', 'alfa', 1, 0),
+        partida(2, 'alfa', 'gama', 1, 0, '2024-03-08'),
+        partida(3, 'zeta', 'delta', 0, 1, '2024-03-08')
+    ])
+    # delta, zeta e alfa com 3 pontos e 1 vitória: delta pelo saldo, zeta venceu alfa no confronto direto
+    assert ordem(classificacoes) == ['delta', 'zeta', 'alfa', 'gama']
+    linha = classificacoes.tabela('camp')[0]
+    assert (linha['pontos'], linha['jogos'], linha['vitorias'], linha['saldo']) == (3, 1, 1, 1)
+
+
+def test_desempate_por_vitorias_e_por_nome():
+    classificacoes = Classificacoes.de_partidas([
+        partida(1, 'xis', 'p1', 1, 0),
+        partida(2, 'w', 'xis', 5, 0),
+        partida(3, 'ypsilon', 'p2', 0, 0),
+        partida(4, 'ypsilon', 'p3', 0, 0),
+        partida(5, 'ypsilon', 'p4', 0, 0),
+        partida(6, 'bravo', 'alfa', 1, 1, campeonato_id='outro')
+    ])
+    # Mesmos pontos: mais vitórias na frente, mesmo com saldo pior
+    assert ordem(classificacoes).index('xis') < ordem(classificacoes).index('ypsilon')
+    # Empate em tudo (inclusive no confronto direto): ordem do nome
+    assert ordem(classificacoes, 'outro') == ['alfa', 'bravo']
+
+
+def test_tabela_na_data_e_correcao_de_placar():
+    primeira = partida(1, 'a', 'b', 2, 0, '2024-03-01')
+    classificacoes = Classificacoes.de_partidas([primeira, partida(2, 'b', 'a', 3, 0, '2024-03-08')])
+    assert ordem(classificacoes, data='2024-03-05') == ['a', 'b']
+    assert ordem(classificacoes, data='2024-02-01') == []
+    assert ordem(classificacoes) == ['b', 'a']
+    
+    # Correção: o resultado antigo sai da tabela antes do novo entrar (inclusive nos retratos seguintes)
+    primeira['placar_casa'], primeira['placar_fora'] = 0, 1
+    assert classificacoes.aplicar(primeira)
+    assert not classificacoes.aplicar(primeira)
+    assert classificacoes.tabela('camp', '2024-03-05')[0]['clube_id'] == 'b'
+    assert classificacoes.tabela('camp')[0]['pontos'] == 6
+
+
+def test_sistema_atualiza_a_classificacao_ao_finalizar_partida():
+    sistema = SistemaFutebolFeminino()
+    antes = {linha['clube_id']: linha['pontos'] for linha in sistema.obter_classificacao('camp_001')}
+    nova = sistema.registrar_partida('clube_002', 'clube_003', 'camp_001', '2024-04-01')
+    sistema.finalizar_partida(nova['id'], 2, 0)
+    
+    depois = {linha['clube_id']: linha['pontos'] for linha in sistema.obter_classificacao('camp_001')}
+    assert depois['clube_002'] == antes.get('clube_002', 0) + 3
+    assert depois['clube_003'] == antes.get('clube_003', 0)
+    # Na véspera da partida nova, a tabela é a de antes
+    assert {linha['clube_id']: linha['pontos'] for linha in sistema.obter_classificacao('camp_001', '2024-03-31')} == antes
+    assert sistema.obter_classificacao('camp_inexistente') is None
@@ -0,0 +1,58 @@
+"""Testes da linha de comando não interativa"""
+
+import csv
+import io
+import json
+
+from cli import main
+
+
+def linhas_jsonl(texto):
+    return [json.loads(linha) for linha in texto.splitlines()]
+
+
+def test_stats_em_csv_e_ranking_em_jsonl(capsys):
+    assert main(['stats', 'jog_001', '--formato', 'csv']) == 0
+    linhas = list(csv.DictReader(io.StringIO(capsys.readouterr().out)))
+    assert linhas == [{'jogadora_id': 'jog_001', 'gols': '1', 'assistencias': '1', 'cartoes_amarelos': '0',
+                       'cartoes_vermelhos': '0', 'finalizacoes': '0', 'defesas': '0', 'partidas_jogadas': '1'}]
+    
+    assert main(['ranking', 'gols', '--limite', '2']) == 0
+    ranking = linhas_jsonl(capsys.readouterr().out)
+    assert [linha['posicao'] for linha in ranking] == [1, 2]
+    assert {linha['jogadora_id'] for linha in ranking} == {'jog_001', 'jog_002'}
+
+
+def test_erros_vao_para_o_stderr(capsys):
+    assert main(['stats', 'jog_999']) == 1
+    saida = capsys.readouterr()
+    assert saida.out == ''
+    assert 'jogadora não encontrada: jog_999' in saida.err
+    
+    # Comando malformado não encerra o processo: código 2 e uso no stderr
+    assert main(['ranking', 'chave_inexistente']) == 2
+    assert 'erro:' in capsys.readouterr().err
+
+
+def test_placares_em_json(capsys):
+    assert main(['--formato', 'json', 'placares']) == 0
+    placares = json.loads(capsys.readouterr().out)
+    assert placares[0]['partida_id'] == 'part_001'
+    assert (placares[0]['placar_casa'], placares[0]['gols_casa']) == (2, 1)
+    assert placares[0]['corrigida'] is False
+
+
+def test_batch_continua_depois_de_erros(tmp_path, capsys):
+    consultas = tmp_path / 'consultas.txt'
+    consultas.write_text('search marta\n# comentário\n\nstats jog_999\nbatch outro.txt\nranking --limite 1\n',
+                         encoding='utf-8')
+    
+    assert main(['batch', str(consultas)]) == 1
+    respostas = linhas_jsonl(capsys.readouterr().out)
+    assert [resposta['consulta'] for resposta in respostas] == [
+        'search marta', 'stats jog_999', 'batch outro.txt', 'ranking --limite 1'
+    ]
+    assert respostas[0]['resultado'][0]['id'] == 'jog_001'
+    assert respostas[1]['erro'] == 'jogadora não encontrada: jog_999'
+    assert 'batch' in respostas[2]['erro']
+    assert len(respostas[3]['resultado']) == 1
@@ -0,0 +1,64 @@
+"""Testes da comparação de jogadoras e do confronto direto"""
+
+import pytest
+
+from comparacao import percentil, taxas_por_90
+from plataforma_futebol_feminino import EVENTO_GOL, SistemaFutebolFeminino, novas_estatisticas
+
+
+def test_confronto_direto_usa_o_clube_na_data_da_partida():
+    sistema = SistemaFutebolFeminino()
+    # Depois da transferência, part_001 (clube_001 x clube_002) continua sendo confronto entre elas
+    sistema.registrar_transferencia('jog_001', 'clube_003', '2024-06-01')
+    
+    comparacao = sistema.comparar(['jog_001', 'jog_002'], confronto_direto=True)
+    assert comparacao['partidas'] == ['part_001']
+    gols = {linha['jogadora']['id']: linha['estatisticas']['gols'] for linha in comparacao['jogadoras']}
+    assert gols == {'jog_001': 1, 'jog_002': 1}
+
+
+def test_percentis_do_confronto_usam_o_mesmo_recorte():
+    sistema = SistemaFutebolFeminino()
+    # Partida fora do confronto: a taxa de carreira da jog_001 sobe, a do confronto não
+    partida = sistema.registrar_partida('clube_001', 'clube_003', 'camp_001', '2024-04-01')
+    for minuto in (10, 20, 30):
+        sistema.registrar_evento(partida['id'], 'jog_001', EVENTO_GOL, minuto)
+    
+    carreira = sistema.comparar(['jog_001', 'jog_002'])
+    assert [linha['percentis']['gols'] for linha in carreira['jogadoras']] == [75.0, 25.0]
+    
+    confronto = sistema.comparar(['jog_001', 'jog_002'], confronto_direto=True)
+    assert confronto['partidas'] == ['part_001']
+    assert [linha['por_90']['gols'] for linha in confronto['jogadoras']] == [1.0, 1.0]
+    assert [linha['percentis']['gols'] for linha in confronto['jogadoras']] == [50.0, 50.0]
+
+
+def test_confronto_direto_de_um_elenco_contra_adversario():
+    sistema = SistemaFutebolFeminino()
+    comparacao = sistema.comparar(clube_id='clube_001', confronto_direto=True, adversario_id='clube_002')
+    assert comparacao['partidas'] == ['part_001']
+    assert [linha['jogadora']['id'] for linha in comparacao['jogadoras']] == ['jog_001']
+    
+    # O clube contra si mesmo não tem confronto
+    with pytest.raises(ValueError):
+        sistema.comparar(clube_id='clube_001', confronto_direto=True)
+    with pytest.raises(ValueError):
+        sistema.comparar(clube_id='clube_001', confronto_direto=True, adversario_id='clube_001')
+
+
+def test_taxas_por_90_e_percentil_com_empates():
+    assert taxas_por_90({**novas_estatisticas(), 'gols': 3, 'partidas_jogadas': 2})['gols'] == 1.5
+    assert taxas_por_90(novas_estatisticas())['gols'] == 0.0
+    assert percentil([0.0, 1.0, 1.0, 2.0], 1.0) == 50.0
+    assert percentil([0.0, 1.0], 5.0) == 100.0
+    assert percentil([], 1.0) is None
+
+
+def test_ids_inexistentes_e_sem_jogadoras():
+    sistema = SistemaFutebolFeminino()
+    comparacao = sistema.comparar(['jog_001', 'jog_999'])
+    assert comparacao['nao_encontradas'] == ['jog_999']
+    assert [linha['jogadora']['id'] for linha in comparacao['jogadoras']] == ['jog_001']
+    assert comparacao['jogadoras'][0]['minutos'] == 90
+    with pytest.raises(ValueError):
+        sistema.comparar()
@@ -0,0 +1,63 @@
+"""Testes do gerador de temporadas sintéticas e da detecção de regressões dos benchmarks"""
+
+from benchmarks import exibir_resultado_tamanho
+from dados_sinteticos import dimensoes_para_eventos, gerar_temporada, gravar_temporada
+from persistencia import abrir_armazenamento
+from plataforma_futebol_feminino import SistemaFutebolFeminino
+
+
+def gerar(semente=2024, total_eventos=3_000):
+    sistema = SistemaFutebolFeminino()
+    dimensoes = gerar_temporada(sistema, semente=semente, **dimensoes_para_eventos(total_eventos))
+    return sistema, dimensoes
+
+
+def sinteticos(sistema):
+    """Eventos gerados (sem os eventos de exemplo), como dicionários"""
+    return [dict(evento.items()) for evento in sistema.eventos if evento['id'].startswith('evt_s')]
+
+
+def test_mesma_semente_mesma_temporada():
+    primeiro, dimensoes = gerar()
+    assert dimensoes['partidas'] == 100
+    assert len(sinteticos(primeiro)) == dimensoes['eventos']
+    assert sinteticos(gerar()[0]) == sinteticos(primeiro)
+    assert sinteticos(gerar(semente=7)[0]) != sinteticos(primeiro)
+
+
+def test_eventos_de_jogadoras_dos_clubes_da_partida_e_placar_pelos_gols():
+    sistema, _ = gerar()
+    # Eventos gerados: a jogadora é de um dos clubes da partida
+    for evento in sinteticos(sistema):
+        partida = sistema.buscar_partida_por_id(evento['partida_id'])
+        jogadora = sistema.buscar_jogadora_por_id(evento['jogadora_id'])
+        assert jogadora['clube_id'] in (partida['clube_casa_id'], partida['clube_fora_id'])
+    
+    # Só a partida de exemplo (placar lançado à mão) diverge dos gols
+    divergencias = sistema.reconciliar_placares()['divergencias']
+    assert {divergencia['partida_id'] for divergencia in divergencias} <= {'part_001'}
+
+
+def test_gravar_temporada_igual_a_gerar(tmp_path):
+    sistema, _ = gerar()
+    armazenamento = abrir_armazenamento(str(tmp_path / 'dados.db'))
+    gravar_temporada(armazenamento, **dimensoes_para_eventos(3_000))
+    gravados = armazenamento.carregar_colecao('eventos')
+    armazenamento.fechar()
+    
+    assert [dict(evento.items()) for evento in gravados] == sinteticos(sistema)
+
+
+def test_regressao_acima_da_tolerancia(capsys):
+    resultado = {
+        'dimensoes': {'eventos': 10, 'jogadoras': 1, 'partidas': 1},
+        'geracao_s': 0.1,
+        'memoria_pico_mb': None,
+        'consultas': {
+            'rapida': {'p50_us': 10.0, 'p99_us': 12.0, 'ops_s': 1e5},
+            'lenta': {'p50_us': 20.0, 'p99_us': 25.0, 'ops_s': 5e4}
+        }
+    }
+    baseline = {'rapida': {'p50_us': 10.0}, 'lenta': {'p50_us': 10.0}}
+    assert exibir_resultado_tamanho(10, resultado, baseline, tolerancia=1.5) == ['lenta']
+    assert 'REGRESSÃO' in capsys.readouterr().out
@@ -0,0 +1,44 @@
+"""Testes da visão materializada de estatísticas por jogadora"""
+
+from plataforma_futebol_feminino import (
+    EVENTO_CARTAO_AMARELO,
+    EVENTO_GOL,
+    SistemaFutebolFeminino
+)
+
+
+def test_evento_atualiza_a_visao_sem_recalcular():
+    sistema = SistemaFutebolFeminino()
+    partida = sistema.registrar_partida('clube_001', 'clube_002', 'camp_001', '2024-04-01')
+    
+    sistema.registrar_evento('part_001', 'jog_001', EVENTO_GOL, 80)
+    sistema.registrar_evento(partida['id'], 'jog_001', EVENTO_CARTAO_AMARELO, 15)
+    stats = sistema.calcular_estatisticas_jogadora('jog_001')
+    assert stats['gols'] == 2
+    assert stats['cartoes_amarelos'] == 1
+    # Duas partidas distintas, mesmo com vários eventos na primeira
+    assert stats['partidas_jogadas'] == 2
+    assert sistema.verificar_consistencia_estatisticas() == []
+
+
+def test_consulta_devolve_copia_e_jogadora_sem_eventos_zerada():
+    sistema = SistemaFutebolFeminino()
+    stats = sistema.calcular_estatisticas_jogadora('jog_001')
+    stats['gols'] = 99
+    assert sistema.calcular_estatisticas_jogadora('jog_001')['gols'] == 1
+    
+    jogadora = sistema.registrar_jogadora('Nova', 'Zagueira', 'clube_001', 4, 20, 'Brasil', 1.70, 60)
+    assert set(sistema.calcular_estatisticas_jogadora(jogadora['id']).values()) == {0}
+
+
+def test_reconstrucao_igual_a_visao_incremental():
+    sistema = SistemaFutebolFeminino()
+    sistema.registrar_evento('part_001', 'jog_002', EVENTO_GOL, 90)
+    incremental = {jogadora_id: dict(stats) for jogadora_id, stats in sistema.estatisticas.items()}
+    
+    sistema.reconstruir_estatisticas()
+    assert sistema.estatisticas == incremental
+    
+    # Divergência (visão alterada por fora) é apontada
+    sistema.estatisticas['jog_002']['gols'] += 1
+    assert sistema.verificar_consistencia_estatisticas() == ['jog_002']
@@ -0,0 +1,47 @@
+"""Testes das estatísticas por campeonato, temporada, período e últimas partidas"""
+
+from plataforma_futebol_feminino import EVENTO_ASSISTENCIA, EVENTO_GOL, SistemaFutebolFeminino
+
+
+def sistema_com_temporada():
+    """part_001 (camp_001, 2024-03-15) do exemplo e mais três partidas da jog_001"""
+    sistema = SistemaFutebolFeminino()
+    sistema.registrar_campeonato('Copa 2025', 'Brasil', '2025')
+    camp_2025 = sistema.campeonatos[-1]['id']
+    for campeonato_id, data, gols in (('camp_002', '2024-05-01', 2), ('camp_001', '2024-06-01', 1),
+                                       (camp_2025, '2025-02-01', 3)):
+        partida = sistema.registrar_partida('clube_001', 'clube_002', campeonato_id, data)
+        for minuto in range(gols):
+            sistema.registrar_evento(partida['id'], 'jog_001', EVENTO_GOL, minuto + 1)
+    return sistema, camp_2025
+
+
+def test_recortes_de_uma_jogadora():
+    sistema, camp_2025 = sistema_com_temporada()
+    gols = lambda **filtros: sistema.calcular_estatisticas_jogadora('jog_001', **filtros)['gols']
+    
+    assert gols() == 7
+    assert gols(campeonato_id='camp_001') == 2
+    assert gols(temporada='2024') == 4
+    assert gols(campeonato_id=camp_2025, temporada='2024') == 0
+    assert gols(data_inicio='2024-04-01', data_fim='2024-12-31') == 3
+    # Últimas N partidas em ordem de data
+    assert gols(ultimas=1) == 3
+    assert gols(ultimas=2) == 4
+    assert gols(ultimas=0) == 0
+    assert sistema.calcular_estatisticas_jogadora('jog_001', temporada='2024')['partidas_jogadas'] == 3
+
+
+def test_recorte_de_todas_as_jogadoras_e_partidas_em_ordem_de_data():
+    sistema, _ = sistema_com_temporada()
+    sistema.registrar_evento('part_001', 'jog_002', EVENTO_ASSISTENCIA, 5)
+    
+    recorte = sistema.calcular_estatisticas_todas(campeonato_id='camp_001')
+    assert recorte['jog_001']['gols'] == 2
+    assert recorte['jog_002']['assistencias'] == 1
+    assert 'jog_001' in sistema.calcular_estatisticas_todas(data_inicio='2025-01-01')
+    assert 'jog_002' not in sistema.calcular_estatisticas_todas(data_inicio='2025-01-01')
+    
+    datas = [data for data, _ in sistema.partidas_filtradas(temporada='2024')]
+    assert datas == ['2024-03-15', '2024-05-01', '2024-06-01']
+    assert sistema.partidas_filtradas(campeonato_id='camp_inexistente') == []
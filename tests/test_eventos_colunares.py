@@ -0,0 +1,37 @@
+"""Testes das colunas de eventos montadas sob demanda"""
+
+from plataforma_futebol_feminino import (
+    EVENTO_ASSISTENCIA,
+    EVENTO_GOL,
+    Evento,
+    SistemaFutebolFeminino,
+    gerar_id
+)
+
+
+def test_colunas_sem_eventos_recebem_os_novos_dentro_do_bloco():
+    sistema = SistemaFutebolFeminino()
+    sistema.eventos = []
+    sistema.reconstruir_indices()
+    sistema.reconstruir_estatisticas()
+    
+    with sistema.eventos_em_colunas() as colunar:
+        assert len(colunar) == 0
+        
+        partida_id = sistema.partidas[0]['id']
+        sistema.registrar_evento(partida_id, 'jog_001', EVENTO_GOL, 10)
+        sistema.adicionar_registros('eventos', [Evento(gerar_id(), partida_id, 'jog_002', EVENTO_ASSISTENCIA, 10)])
+        assert len(colunar) == 2
+        assert colunar.resumo_por_partida() == {partida_id: {EVENTO_GOL: 1, EVENTO_ASSISTENCIA: 1}}
+
+
+def test_colunas_descartadas_no_fim_do_bloco_com_o_mesmo_resultado():
+    sistema = SistemaFutebolFeminino()
+    esperado = (sistema.histograma_minutos('jogadora'), sistema.resumo_partidas())
+    sistema.cache.limpar()
+    
+    with sistema.eventos_em_colunas():
+        with sistema.eventos_em_colunas() as interno:
+            assert interno is sistema.eventos_colunares
+        assert (sistema.histograma_minutos('jogadora'), sistema.resumo_partidas()) == esperado
+    assert sistema.eventos_colunares is None
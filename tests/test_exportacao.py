@@ -0,0 +1,77 @@
+"""Testes da exportação em lotes (CSV, JSON Lines e um arquivo por campeonato)"""
+
+import csv
+import json
+
+import pytest
+
+from exportacao import exportar, exportar_por_campeonato, lotes_exportacao
+from persistencia import abrir_armazenamento
+from plataforma_futebol_feminino import EVENTO_GOL, SistemaFutebolFeminino
+
+
+def ler_jsonl(caminho):
+    with open(caminho, encoding='utf-8') as arquivo:
+        return [json.loads(linha) for linha in arquivo]
+
+
+def test_colecao_em_csv_com_listas_separadas_por_barra(tmp_path):
+    sistema = SistemaFutebolFeminino()
+    caminho = str(tmp_path / 'clubes.csv')
+    
+    resumo = exportar(sistema, 'clubes', caminho)
+    assert resumo['linhas'] == len(sistema.clubes)
+    with open(caminho, encoding='utf-8', newline='') as arquivo:
+        linhas = list(csv.DictReader(arquivo))
+    assert linhas[0]['id'] == 'clube_001'
+    assert linhas[0]['cores'] == 'vermelho|branco|preto'
+
+
+def test_lotes_e_recorte_por_campeonato(tmp_path):
+    sistema = SistemaFutebolFeminino()
+    partida = sistema.registrar_partida('clube_001', 'clube_002', 'camp_002', '2024-05-01')
+    sistema.registrar_evento(partida['id'], 'jog_001', EVENTO_GOL, 10)
+    
+    lotes = list(lotes_exportacao(sistema, 'eventos', tamanho_lote=2))
+    assert [len(lote) for lote in lotes] == [2, 2, 1]
+    
+    caminho = str(tmp_path / 'eventos.jsonl')
+    assert exportar(sistema, 'eventos', caminho, campeonato_id='camp_001')['linhas'] == 4
+    assert {linha['partida_id'] for linha in ler_jsonl(caminho)} == {'part_001'}
+    
+    exportar(sistema, 'estatisticas', caminho, campeonato_id='camp_002')
+    estatisticas = {linha['jogadora_id']: linha for linha in ler_jsonl(caminho)}
+    # Uma linha por jogadora, zerada para quem não jogou o campeonato
+    assert len(estatisticas) == len(sistema.jogadoras)
+    assert estatisticas['jog_001']['gols'] == 1
+    assert estatisticas['jog_002']['gols'] == 0
+    assert estatisticas['jog_001']['campeonato_id'] == 'camp_002'
+
+
+def test_erros_antes_de_criar_o_arquivo(tmp_path):
+    sistema = SistemaFutebolFeminino()
+    caminho = tmp_path / 'saida.jsonl'
+    
+    with pytest.raises(ValueError):
+        exportar(sistema, 'usuarios', str(caminho))
+    with pytest.raises(ValueError):
+        exportar(sistema, 'jogadoras', str(caminho), campeonato_id='camp_001')
+    with pytest.raises(ValueError):
+        exportar(sistema, 'eventos', str(caminho), campeonato_id='camp_inexistente')
+    with pytest.raises(ValueError):
+        exportar(sistema, 'ranking', str(caminho), chave='chave_inexistente')
+    assert not caminho.exists()
+
+
+@pytest.mark.parametrize('processos', [1, 2])
+def test_um_arquivo_por_campeonato(tmp_path, processos):
+    caminho_dados = str(tmp_path / 'dados.db')
+    SistemaFutebolFeminino(abrir_armazenamento(caminho_dados)).armazenamento.fechar()
+    
+    resumos = exportar_por_campeonato(caminho_dados, 'eventos', str(tmp_path / 'saida'), 'jsonl', processos)
+    linhas = {resumo['campeonato_id']: resumo['linhas'] for resumo in resumos}
+    assert linhas == {'camp_001': 4, 'camp_002': 0}
+    assert len(ler_jsonl(tmp_path / 'saida' / 'eventos_camp_001.jsonl')) == 4
+    
+    with pytest.raises(ValueError):
+        exportar_por_campeonato(caminho_dados, 'jogadoras', str(tmp_path / 'saida'))
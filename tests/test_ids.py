@@ -0,0 +1,48 @@
+"""Testes do gerador de IDs (unicidade em threads e processos)"""
+
+import multiprocessing
+from concurrent.futures import ThreadPoolExecutor
+
+from plataforma_futebol_feminino import GeradorIds, SistemaFutebolFeminino, gerar_id
+
+
+def gerar_ids(quantidade):
+    return [gerar_id() for _ in range(quantidade)]
+
+
+def test_um_milhao_de_ids_unicos_e_crescentes():
+    ids = gerar_ids(1_000_000)
+    assert len(set(ids)) == len(ids)
+    assert ids == sorted(ids)
+    assert {len(id_registro) for id_registro in ids} == {22}
+
+
+def test_ids_unicos_entre_threads():
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        lotes = list(executor.map(gerar_ids, [100_000] * 4))
+    todos = [id_registro for lote in lotes for id_registro in lote]
+    assert len(set(todos)) == len(todos)
+
+
+def test_ids_unicos_entre_processos_com_fork():
+    # Cada filho criado por fork recebe um novo nó: os IDs não repetem os do pai nem os do irmão
+    with multiprocessing.get_context('fork').Pool(2) as processos:
+        lotes = processos.map(gerar_ids, [100_000, 100_000])
+    ids_do_pai = gerar_ids(100_000)
+    todos = set(lotes[0]) | set(lotes[1]) | set(ids_do_pai)
+    assert len(todos) == 300_000
+    assert len({id_registro[-6:] for id_registro in lotes[0] + lotes[1] + ids_do_pai}) == 3
+
+
+def test_reiniciar_troca_o_no():
+    gerador = GeradorIds()
+    antes = gerador.gerar()
+    gerador.reiniciar()
+    depois = gerador.gerar()
+    assert antes != depois and antes[-6:] != depois[-6:]
+
+
+def test_cadastros_recebem_ids_distintos():
+    sistema = SistemaFutebolFeminino()
+    eventos = [sistema.registrar_evento('part_001', 'jog_001', 'gol', minuto % 90) for minuto in range(5000)]
+    assert len({evento['id'] for evento in eventos}) == 5000
@@ -0,0 +1,60 @@
+"""Testes da importação em lote (validação por consulta ao armazenamento)"""
+
+import tracemalloc
+
+from importador import importar_registros
+from persistencia import abrir_armazenamento
+from plataforma_futebol_feminino import SistemaFutebolFeminino
+
+
+def test_validacao_nao_carrega_eventos(tmp_path):
+    caminho = str(tmp_path / 'dados.db')
+    SistemaFutebolFeminino(abrir_armazenamento(caminho)).armazenamento.fechar()
+    
+    sistema = SistemaFutebolFeminino(abrir_armazenamento(caminho))
+    eventos = [
+        {'id': 'evt_001', 'partida_id': 'part_001', 'jogadora_id': 'jog_001', 'tipo': 'gol', 'minuto': 5},
+        {'id': 'evt_novo', 'partida_id': 'part_inexistente', 'jogadora_id': 'jog_001', 'tipo': 'gol', 'minuto': 6},
+        {'id': 'evt_novo', 'partida_id': 'part_001', 'jogadora_id': 'jog_001', 'tipo': 'gol', 'minuto': 7},
+        {'id': 'evt_novo', 'partida_id': 'part_001', 'jogadora_id': 'jog_001', 'tipo': 'gol', 'minuto': 8},
+    ]
+    resumo = importar_registros(sistema, 'eventos', eventos, tamanho_lote=2)
+    
+    assert resumo['importados'] == 1
+    assert [erro for _, erro in resumo['erros']] == [
+        'ID duplicado: evt_001', 'partida_id inexistente: part_inexistente', 'ID duplicado: evt_novo'
+    ]
+    # Os eventos continuam paginados: nenhum índice completo foi montado para validar
+    assert sistema.eventos_paginados()
+    assert 'eventos' not in vars(sistema)
+    sistema.armazenamento.fechar()
+
+
+def test_memoria_constante_na_importacao(tmp_path):
+    caminho = str(tmp_path / 'dados.db')
+    SistemaFutebolFeminino(abrir_armazenamento(caminho)).armazenamento.fechar()
+    sistema = SistemaFutebolFeminino(abrir_armazenamento(caminho))
+    
+    def eventos(inicio, quantidade):
+        # Gerador: o arquivo simulado também não fica inteiro em memória
+        for numero in range(inicio, inicio + quantidade):
+            yield {'id': f'evt_imp_{numero}', 'partida_id': 'part_001',
+                   'jogadora_id': 'jog_001', 'tipo': 'gol' if numero % 4 == 0 else 'assistencia',
+                   'minuto': numero % 90 + 1}
+    
+    tracemalloc.start()
+    try:
+        # Primeira importação aquece índices de partidas, jogadoras e placares
+        importar_registros(sistema, 'eventos', eventos(0, 2000), tamanho_lote=500)
+        antes = tracemalloc.get_traced_memory()[0]
+        resumo = importar_registros(sistema, 'eventos', eventos(2000, 20000), tamanho_lote=500)
+        depois = tracemalloc.get_traced_memory()[0]
+    finally:
+        tracemalloc.stop()
+    
+    assert resumo['importados'] == 20000
+    # 20 mil eventos guardados em memória ocupariam vários MB
+    assert depois - antes < 256 * 1024
+    assert sistema.armazenamento.contar('eventos') >= 22000
+    assert len(sistema.listar_eventos_da_partida('part_001')) > 22000
+    sistema.armazenamento.fechar()
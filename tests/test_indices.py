@@ -0,0 +1,38 @@
+"""Testes dos índices por ID, email, clube e partida"""
+
+from plataforma_futebol_feminino import EVENTO_GOL, SistemaFutebolFeminino
+
+
+def test_indices_acompanham_os_cadastros():
+    sistema = SistemaFutebolFeminino()
+    jogadora = sistema.registrar_jogadora('Nova', 'Zagueira', 'clube_002', 4, 20, 'Brasil', 1.70, 60)
+    partida = sistema.registrar_partida('clube_001', 'clube_002', 'camp_001', '2024-04-01')
+    evento = sistema.registrar_evento(partida['id'], jogadora['id'], EVENTO_GOL, 10)
+    assert sistema.criar_usuario('nova@passaabola.com', 'senha123', 'Nova', 'usuario')
+    
+    assert sistema.buscar_jogadora_por_id(jogadora['id']) is jogadora
+    assert sistema.buscar_partida_por_id(partida['id']) is partida
+    assert jogadora in sistema.listar_jogadoras_do_clube('clube_002')
+    assert sistema.listar_eventos_da_partida(partida['id']) == [evento]
+    assert sistema.buscar_usuario_por_email('nova@passaabola.com')['nome'] == 'Nova'
+
+
+def test_ausentes_e_duplicidade_de_email():
+    sistema = SistemaFutebolFeminino()
+    assert sistema.buscar_jogadora_por_id('jog_999') is None
+    assert sistema.buscar_clube_por_id('clube_999') is None
+    assert sistema.buscar_usuario_por_email('ninguem@passaabola.com') is None
+    assert sistema.listar_jogadoras_do_clube('clube_999') == []
+    assert sistema.listar_eventos_da_partida('part_999') == []
+    assert not sistema.criar_usuario('admin@passaabola.com', 'outra', 'Outro', 'usuario')
+
+
+def test_listas_devolvidas_sao_copias_e_reconstrucao_igual():
+    sistema = SistemaFutebolFeminino()
+    sistema.listar_jogadoras_do_clube('clube_001').clear()
+    assert len(sistema.listar_jogadoras_do_clube('clube_001')) == 1
+    
+    antes = {colecao: dict(indice) for colecao, indice in sistema.indices.items()}
+    sistema.reconstruir_indices()
+    assert sistema.indices == antes
+    assert [jogadora['id'] for jogadora in sistema.listar_jogadoras_do_clube('clube_001')] == ['jog_001']
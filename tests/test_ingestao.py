@@ -0,0 +1,94 @@
+"""Testes da ingestão contínua de eventos"""
+
+import asyncio
+
+from ingestao import IngestaoEventos, publicar_linha
+from plataforma_futebol_feminino import SistemaFutebolFeminino
+
+
+def evento(**campos):
+    dados = {'partida_id': 'part_001', 'jogadora_id': 'jog_001', 'tipo': 'gol', 'minuto': 50}
+    dados.update(campos)
+    return dados
+
+
+async def publicar_e_esperar(ingestao, eventos):
+    for dados in eventos:
+        await ingestao.publicar(dados)
+    await asyncio.wait_for(ingestao.fila.join(), 5)
+
+
+def test_eventos_invalidos_nao_travam_a_fila():
+    sistema = SistemaFutebolFeminino()
+    gols_antes = sistema.estatisticas['jog_001']['gols']
+    
+    async def cenario():
+        ingestao = IngestaoEventos(sistema, intervalo_lote=0.001)
+        tarefa = asyncio.create_task(ingestao.processar())
+        try:
+            await publicar_e_esperar(ingestao, [
+                evento(), evento(tipo='voleio'), evento(partida_id='part_inexistente')
+            ])
+            # ID não hasheável derruba a validação do lote inteiro
+            await publicar_e_esperar(ingestao, [evento(id=['evt_lista'])])
+            await publicar_e_esperar(ingestao, [evento(minuto=60)])
+            assert not tarefa.done()
+        finally:
+            tarefa.cancel()
+        return ingestao
+    
+    ingestao = asyncio.run(cenario())
+    assert ingestao.processados == 2
+    assert ingestao.rejeitados == 3
+    assert ingestao.erros[-1][1].startswith('lote rejeitado')
+    assert sistema.estatisticas['jog_001']['gols'] == gols_antes + 2
+
+
+def test_ranking_acompanha_os_gols():
+    sistema = SistemaFutebolFeminino()
+    
+    async def cenario():
+        ingestao = IngestaoEventos(sistema, intervalo_lote=0.001, limite_top=3)
+        fila = ingestao.inscrever()
+        tarefa = asyncio.create_task(ingestao.processar())
+        try:
+            await publicar_e_esperar(ingestao, [evento(jogadora_id='jog_003', minuto=minuto)
+                                                for minuto in range(1, 21)])
+        finally:
+            tarefa.cancel()
+        return ingestao, fila
+    
+    ingestao, fila = asyncio.run(cenario())
+    assert ingestao.rankings['gols'].itens()[0][0] == 'jog_003'
+    assert [item['jogadora']['id'] for item in sistema.obter_ranking('gols', 3)] == \
+        [jogadora_id for jogadora_id, _ in ingestao.rankings['gols'].itens()]
+    assert not fila.empty()
+
+
+def test_lote_notifica_placar_derivado_e_ranking():
+    sistema = SistemaFutebolFeminino()
+    ingestao = IngestaoEventos(sistema, limite_top=2)
+    lote = [(0, evento(jogadora_id='jog_002', minuto=minuto)) for minuto in (60, 70)]
+    lote.append((0, evento(tipo='assistencia', minuto=75)))
+    
+    notificacao = ingestao.aplicar_lote(lote)
+    assert notificacao['eventos'] == 3
+    # Placar calculado pelos gols (1 x 1 do exemplo + 2 gols da visitante)
+    assert notificacao['placares'] == {'part_001': [1, 3]}
+    assert notificacao['rankings']['gols'][0] == ('jog_002', 3)
+
+
+def test_micro_lote_limitado_e_linhas_invalidas():
+    sistema = SistemaFutebolFeminino()
+    
+    async def cenario():
+        ingestao = IngestaoEventos(sistema, tamanho_lote=2, intervalo_lote=0.001)
+        await publicar_linha(ingestao, '{"partida_id": "part_001"')
+        await publicar_linha(ingestao, '   ')
+        for minuto in (1, 2, 3):
+            await ingestao.publicar(evento(minuto=minuto))
+        return ingestao, [len(await ingestao.proximo_lote()) for _ in range(2)]
+    
+    ingestao, tamanhos = asyncio.run(cenario())
+    assert tamanhos == [2, 1]
+    assert ingestao.rejeitados == 1 and ingestao.erros[0][1].startswith('JSON inválido')
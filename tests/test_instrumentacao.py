@@ -0,0 +1,73 @@
+"""Testes da instrumentação: métricas por método, Prometheus e perfil"""
+
+import json
+
+import pytest
+
+from plataforma_futebol_feminino import SistemaFutebolFeminino
+
+
+def sistema_sem_cache():
+    sistema = SistemaFutebolFeminino()
+    sistema.cache = None
+    return sistema
+
+
+def test_chamadas_erros_latencia_e_linhas():
+    sistema = sistema_sem_cache()
+    instrumentacao = sistema.ativar_instrumentacao(amostragem_memoria=0)
+    # Ativar de novo devolve a mesma instrumentação (métodos envolvidos uma vez só)
+    assert sistema.ativar_instrumentacao() is instrumentacao
+    
+    sistema.calcular_estatisticas_jogadora('jog_001', temporada='2024')
+    sistema.calcular_estatisticas_jogadora('jog_002', temporada='2024')
+    with pytest.raises(ValueError):
+        sistema.obter_ranking('chave_inexistente')
+    
+    metricas = instrumentacao.metricas()
+    estatisticas = metricas['calcular_estatisticas_jogadora']
+    assert (estatisticas['chamadas'], estatisticas['erros']) == (2, 0)
+    assert estatisticas['linhas_examinadas'] > 0
+    # Faixas acumuladas: a última (+Inf) conta todas as chamadas
+    assert estatisticas['latencia']['faixas']['+Inf'] == 2
+    assert estatisticas['latencia']['maxima'] <= estatisticas['latencia']['soma']
+    assert estatisticas['memoria']['amostras'] == 0
+    assert (metricas['obter_ranking']['chamadas'], metricas['obter_ranking']['erros']) == (1, 1)
+    # Métodos não chamados ficam de fora
+    assert 'comparar' not in metricas
+    assert instrumentacao.mais_demoradas(1)[0][0] in metricas
+
+
+def test_amostra_de_memoria_e_formatos_de_saida():
+    sistema = sistema_sem_cache()
+    instrumentacao = sistema.ativar_instrumentacao(amostragem_memoria=1)
+    sistema.buscar('marta')
+    
+    assert instrumentacao.metricas()['buscar']['memoria']['amostras'] == 1
+    assert json.loads(instrumentacao.json())['metodos']['buscar']['chamadas'] == 1
+    
+    texto = instrumentacao.prometheus()
+    assert '# TYPE futebol_latencia_segundos histogram' in texto
+    assert 'futebol_chamadas_total{metodo="buscar"} 1' in texto
+    assert 'futebol_latencia_segundos_bucket{metodo="buscar",le="+Inf"} 1' in texto
+    assert 'futebol_memoria_alocada_bytes_count{metodo="buscar"} 1' in texto
+    
+    instrumentacao.zerar()
+    assert instrumentacao.metricas() == {}
+
+
+def test_desativar_devolve_os_metodos_originais():
+    sistema = sistema_sem_cache()
+    instrumentacao = sistema.ativar_instrumentacao(amostragem_memoria=0)
+    assert 'obter_ranking' in vars(sistema)
+    instrumentacao.iniciar_perfil()
+    sistema.obter_ranking('gols')
+    assert 'obter_ranking' in instrumentacao.parar_perfil(limite=50)
+    assert instrumentacao.parar_perfil() == ''
+    
+    metricas = sistema.desativar_instrumentacao()
+    assert metricas['obter_ranking']['chamadas'] == 1
+    assert 'obter_ranking' not in vars(sistema)
+    assert sistema.instrumentacao is None
+    assert sistema.desativar_instrumentacao() is None
+    assert sistema.obter_ranking.__func__ is SistemaFutebolFeminino.obter_ranking
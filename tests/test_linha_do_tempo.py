@@ -0,0 +1,61 @@
+"""Testes da linha do tempo das partidas e dos histogramas por faixa de minutos"""
+
+import pytest
+
+from linha_do_tempo import rotulos_faixas
+from plataforma_futebol_feminino import EVENTO_GOL, SistemaFutebolFeminino
+
+
+def test_lances_em_ordem_de_minuto_com_placar_parcial():
+    sistema = SistemaFutebolFeminino()
+    assert [lance[0] for lance in sistema.linha_do_tempo('part_001')['lances']] == [15, 45, 67, 78]
+    
+    # Lance registrado depois, mas anterior aos outros: entra na posição do minuto
+    sistema.registrar_evento('part_001', 'jog_002', EVENTO_GOL, 5)
+    linha = sistema.linha_do_tempo('part_001')
+    assert linha['lances'][0] == (5, EVENTO_GOL, 'jog_002', 'fora', 0, 1)
+    assert linha['lances'][1] == (15, EVENTO_GOL, 'jog_001', 'casa', 1, 1)
+    assert linha['placar'] == (1, 2)
+    assert sistema.linha_do_tempo('part_inexistente') is None
+
+
+def test_histogramas_por_jogadora_clube_e_campeonato():
+    sistema = SistemaFutebolFeminino()
+    sistema.registrar_evento('part_001', 'jog_001', EVENTO_GOL, 93)
+    
+    por_jogadora = sistema.histograma_minutos()
+    assert por_jogadora['faixas'] == ['1-15', '16-30', '31-45', '46-60', '61-75', '76-90', '90+']
+    assert por_jogadora['grupos']['jog_001'] == [1, 0, 0, 0, 0, 0, 1]
+    assert sistema.histograma_minutos('clube')['grupos']['clube_002'] == [0, 0, 0, 0, 1, 0, 0]
+    assert sistema.histograma_minutos('campeonato', largura=45)['grupos'] == {'camp_001': [1, 1, 1]}
+    assert sistema.histograma_minutos('jogadora', tipos=('cartao_amarelo',))['grupos'] == {
+        'jog_003': [0, 0, 0, 0, 0, 1, 0]
+    }
+    
+    # A contagem vetorizada (eventos em colunas) dá o mesmo resultado
+    sistema.cache = None
+    for agrupar in ('jogadora', 'clube', 'campeonato'):
+        esperado = sistema.histograma_minutos(agrupar)
+        with sistema.eventos_em_colunas():
+            assert sistema.histograma_minutos(agrupar) == esperado
+    
+    with pytest.raises(ValueError):
+        sistema.histograma_minutos('temporada')
+    with pytest.raises(ValueError):
+        rotulos_faixas(0)
+
+
+def test_distribuicao_do_primeiro_gol():
+    sistema = SistemaFutebolFeminino()
+    sistema.registrar_partida('clube_001', 'clube_002', 'camp_001', '2024-04-01')
+    partida = sistema.registrar_partida('clube_002', 'clube_001', 'camp_002', '2024-05-01')
+    sistema.registrar_evento(partida['id'], 'jog_002', EVENTO_GOL, 40)
+    
+    distribuicao = sistema.distribuicao_primeiro_gol()
+    assert distribuicao['contagens'] == [1, 0, 1, 0, 0, 0, 0]
+    assert (distribuicao['partidas'], distribuicao['sem_gol']) == (3, 1)
+    assert distribuicao['minuto_medio'] == 27.5
+    
+    recorte = sistema.distribuicao_primeiro_gol(campeonato_id='camp_001')
+    assert (recorte['partidas'], recorte['sem_gol'], recorte['minuto_medio']) == (2, 1, 15.0)
+    assert sistema.distribuicao_primeiro_gol(temporada='1999')['minuto_medio'] is None
@@ -0,0 +1,51 @@
+"""Testes do armazenamento em log com snapshots incrementais"""
+
+import pytest
+
+from persistencia import ArmazenamentoLog
+from plataforma_futebol_feminino import Evento, SistemaFutebolFeminino
+
+
+def test_snapshots_incrementais_preservam_os_dados(tmp_path):
+    diretorio = str(tmp_path / 'log')
+    armazenamento = ArmazenamentoLog(diretorio, intervalo_snapshot=100)
+    assert armazenamento.vazio()
+    
+    for inicio in range(0, 3000, 50):
+        armazenamento.salvar_registros('eventos', [
+            Evento(f'evt_{numero}', 'part_001', 'jog_001', 'gol', numero % 90 + 1)
+            for numero in range(inicio, inicio + 50)
+        ])
+    # Registro atualizado depois de já estar num segmento: a versão nova prevalece
+    armazenamento.salvar_registro('eventos', Evento('evt_0', 'part_001', 'jog_001', 'assistencia', 1))
+    
+    # Segmentos juntados como um contador binário: poucos arquivos, não um por snapshot
+    assert len(armazenamento.snapshot['segmentos']) <= 6
+    armazenamento.fechar()
+    
+    reaberto = ArmazenamentoLog(diretorio)
+    eventos = reaberto.carregar_colecao('eventos')
+    assert len(eventos) == 3000
+    assert eventos[0]['id'] == 'evt_0' and eventos[0]['tipo'] == 'assistencia'
+    assert reaberto.carregar_colecao('jogadoras') == []
+    reaberto.fechar()
+
+
+def test_final_do_log_reaplicado_sem_snapshot(tmp_path):
+    diretorio = str(tmp_path / 'log')
+    sistema = SistemaFutebolFeminino(ArmazenamentoLog(diretorio))
+    jogadora = sistema.registrar_jogadora('Nova', 'Meio-campo', 'clube_001', 8, 22, 'Brasil', 1.65, 58)
+    # Sem fechar: o registro só está no log, depois do último snapshot
+    sistema.armazenamento.log.flush()
+    
+    reaberto = SistemaFutebolFeminino(ArmazenamentoLog(diretorio))
+    assert reaberto.buscar_jogadora_por_id(jogadora['id'])['nome'] == 'Nova'
+    assert len(reaberto.jogadoras) == len(sistema.jogadoras)
+
+
+def test_gravar_depois_de_fechar(tmp_path):
+    armazenamento = ArmazenamentoLog(str(tmp_path / 'log'))
+    armazenamento.salvar_registro('eventos', Evento('evt_1', 'part_001', 'jog_001', 'gol', 10))
+    armazenamento.fechar()
+    with pytest.raises(ValueError):
+        armazenamento.salvar_registro('eventos', Evento('evt_2', 'part_001', 'jog_001', 'gol', 11))
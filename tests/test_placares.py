@@ -0,0 +1,34 @@
+"""Testes dos placares derivados dos gols"""
+
+from plataforma_futebol_feminino import EVENTO_GOL, SistemaFutebolFeminino
+
+
+def test_gol_muda_so_o_placar_derivado():
+    sistema = SistemaFutebolFeminino()
+    partida = sistema.registrar_partida('clube_001', 'clube_002', 'camp_001', '2024-04-01')
+    sistema.finalizar_partida(partida['id'], 0, 0)
+    
+    # O placar lançado (0 x 0) é igual ao derivado antes do gol, mas não acompanha os gols
+    sistema.registrar_evento(partida['id'], 'jog_001', EVENTO_GOL, 30)
+    assert (partida['placar_casa'], partida['placar_fora']) == (0, 0)
+    assert sistema.placar_derivado(partida['id']) == (1, 0)
+    
+    divergencias = {divergencia['partida_id']: divergencia for divergencia in sistema.reconciliar_placares()['divergencias']}
+    assert divergencias[partida['id']]['registrado'] == (0, 0)
+    assert divergencias[partida['id']]['derivado'] == (1, 0)
+    
+    # Só a correção explícita grava o placar calculado
+    sistema.reconciliar_placares(corrigir=True)
+    assert (partida['placar_casa'], partida['placar_fora']) == (1, 0)
+
+
+def test_transferencia_invalida_consultas_por_partida():
+    sistema = SistemaFutebolFeminino()
+    partida = sistema.registrar_partida('clube_001', 'clube_002', 'camp_001', '2024-09-10')
+    sistema.registrar_evento(partida['id'], 'jog_003', EVENTO_GOL, 10)
+    assert sistema.placar_derivado(partida['id']) == (0, 0)
+    versao = sistema.cache.versoes.get(('colecao', 'partidas'), 0)
+    
+    sistema.registrar_transferencia('jog_003', 'clube_002', '2024-09-01')
+    assert sistema.cache.versoes[('colecao', 'partidas')] > versao
+    assert sistema.placar_derivado(partida['id']) == (0, 1)
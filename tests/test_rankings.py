@@ -0,0 +1,41 @@
+"""Testes dos rankings calculados em uma única passada"""
+
+import pytest
+
+from plataforma_futebol_feminino import EVENTO_ASSISTENCIA, EVENTO_GOL, SistemaFutebolFeminino
+
+
+def ids(ranking):
+    return [item['jogadora']['id'] for item in ranking]
+
+
+def test_ranking_de_gols_ordenado_com_empate_pela_ordem_de_cadastro():
+    sistema = SistemaFutebolFeminino()
+    # Exemplo: jog_001 e jog_002 com 1 gol cada, jog_003 sem gols
+    assert ids(sistema.obter_ranking_gols()) == ['jog_001', 'jog_002', 'jog_003']
+    
+    sistema.registrar_evento('part_001', 'jog_002', EVENTO_GOL, 70)
+    ranking = sistema.obter_ranking_gols(limite=2)
+    assert ids(ranking) == ['jog_002', 'jog_001']
+    assert ranking[0]['gols'] == 2
+    assert ranking[0]['partidas'] == 1
+
+
+def test_ranking_ignora_jogadoras_inativas():
+    sistema = SistemaFutebolFeminino()
+    sistema.registrar_evento('part_001', 'jog_003', EVENTO_ASSISTENCIA, 80)
+    sistema.registrar_evento('part_001', 'jog_003', EVENTO_ASSISTENCIA, 85)
+    assert ids(sistema.obter_ranking_assistencias(limite=1)) == ['jog_003']
+    
+    jogadora = sistema.buscar_jogadora_por_id('jog_003')
+    jogadora['ativa'] = False
+    sistema.registrar_alteracoes('jogadoras', [jogadora])
+    assert 'jog_003' not in ids(sistema.obter_ranking_assistencias())
+
+
+def test_ranking_de_estatistica_derivada_e_invalida():
+    sistema = SistemaFutebolFeminino()
+    # Cartões = amarelos + vermelhos (estatística derivada)
+    assert ids(sistema.obter_ranking('cartoes', limite=1)) == ['jog_003']
+    with pytest.raises(ValueError):
+        sistema.obter_ranking('chutes')
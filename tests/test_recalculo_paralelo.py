@@ -0,0 +1,22 @@
+"""Testes do recálculo paralelo das estatísticas"""
+
+from persistencia import abrir_armazenamento
+from plataforma_futebol_feminino import SistemaFutebolFeminino
+from recalculo_paralelo import recalcular_estatisticas
+
+
+def test_recalculo_com_eventos_paginados(tmp_path):
+    caminho = str(tmp_path / 'dados.db')
+    SistemaFutebolFeminino(abrir_armazenamento(caminho)).armazenamento.fechar()
+    
+    # Cada recálculo parte de um sistema reaberto, com os eventos ainda paginados
+    resultados = []
+    for processos, criterio in [(1, 'partida'), (2, 'partida'), (2, 'campeonato')]:
+        sistema = SistemaFutebolFeminino(abrir_armazenamento(caminho))
+        assert sistema.eventos_paginados()
+        resultados.append(recalcular_estatisticas(sistema, processos, criterio))
+        sistema.armazenamento.fechar()
+    
+    assert resultados[0][0]
+    assert resultados[1] == resultados[0]
+    assert resultados[2][0] == resultados[0][0]
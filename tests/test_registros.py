@@ -0,0 +1,48 @@
+"""Testes dos registros compactos (__slots__) acessados como dicionário"""
+
+import json
+
+import pytest
+
+from plataforma_futebol_feminino import Evento, Jogadora, Partida, criar_registro
+
+
+def test_registro_se_comporta_como_dicionario():
+    evento = Evento('evt_1', 'part_001', 'jog_001', 'gol', 10)
+    assert evento['tipo'] == 'gol'
+    assert evento.get('observacoes') == ''
+    assert evento.get('inexistente', 'padrao') == 'padrao'
+    assert 'minuto' in evento and 'nome' not in evento
+    assert evento == {'id': 'evt_1', 'partida_id': 'part_001', 'jogadora_id': 'jog_001',
+                      'tipo': 'gol', 'minuto': 10, 'observacoes': ''}
+    # Serializável como o dicionário original
+    assert json.loads(json.dumps(dict(evento.items())))['minuto'] == 10
+    
+    evento['minuto'] = 45
+    assert evento.minuto == 45
+    with pytest.raises(KeyError):
+        evento['nome']
+    with pytest.raises(KeyError):
+        evento['nome'] = 'x'
+
+
+def test_registro_sem_dict_e_com_strings_internadas():
+    partida = Partida('part_x', 'clube_' + '001', 'clube_002', 'camp_001', '2024-01-01')
+    assert not hasattr(partida, '__dict__')
+    with pytest.raises(AttributeError):
+        partida.extra = 1
+    assert partida['clube_casa_id'] is Partida('part_y', 'clube_001', 'clube_002', 'camp_001', '2024-01-02')['clube_casa_id']
+
+
+def test_criar_registro_ignora_campos_extras_e_copia_independente():
+    dados = {'id': 'jog_x', 'nome': 'Nova', 'posicao': 'Goleira', 'clube_id': 'clube_001',
+             'numero_camisa': 1, 'idade': 20, 'nacionalidade': 'Brasil', 'campo_extra': True}
+    jogadora = criar_registro('jogadoras', dados)
+    assert isinstance(jogadora, Jogadora)
+    assert jogadora['ativa'] is True and 'campo_extra' not in jogadora
+    assert criar_registro('jogadoras', jogadora) is jogadora
+    assert criar_registro('usuarios', {'id': 'u'}) == {'id': 'u'}
+    
+    copia = jogadora.copy()
+    copia['nome'] = 'Outra'
+    assert jogadora['nome'] == 'Nova'
@@ -0,0 +1,81 @@
+"""Testes do histórico de transferências e da atribuição de gols por data"""
+
+import pytest
+
+from importador import importar_registros
+from plataforma_futebol_feminino import EVENTO_GOL, SistemaFutebolFeminino
+
+
+def test_transferencia_importada_atribui_clube_pela_data():
+    sistema = SistemaFutebolFeminino()
+    antes = sistema.registrar_partida('clube_001', 'clube_002', 'camp_001', '2024-08-10')
+    depois = sistema.registrar_partida('clube_001', 'clube_002', 'camp_001', '2024-09-10')
+    sistema.registrar_evento(antes['id'], 'jog_001', EVENTO_GOL, 10)
+    sistema.registrar_evento(depois['id'], 'jog_001', EVENTO_GOL, 20)
+    gols_antes = sistema.gols_por_clube()
+    
+    # Sem clube_origem_id: a origem é o clube atual da jogadora
+    resumo = importar_registros(sistema, 'transferencias', [
+        {'jogadora_id': 'jog_001', 'clube_destino_id': 'clube_002', 'data': '2024-09-01'}
+    ])
+    assert resumo['importados'] == 1
+    
+    assert sistema.transferencias[-1]['clube_origem_id'] == 'clube_001'
+    assert sistema.clube_da_jogadora('jog_001', '2024-08-31') == 'clube_001'
+    assert sistema.clube_da_jogadora('jog_001', '2024-09-01') == 'clube_002'
+    jogadora = sistema.buscar_jogadora_por_id('jog_001')
+    assert jogadora['clube_id'] == 'clube_002'
+    assert jogadora in sistema.listar_jogadoras_do_clube('clube_002')
+    assert jogadora not in sistema.listar_jogadoras_do_clube('clube_001')
+    
+    # O gol de depois da transferência passa para o novo clube; o de antes continua no antigo
+    gols = sistema.gols_por_clube()['2024']
+    assert gols['clube_001'] == gols_antes['2024']['clube_001'] - 1
+    assert gols['clube_002'] == gols_antes['2024'].get('clube_002', 0) + 1
+    assert sistema.placar_derivado(antes['id']) == (1, 0)
+    assert sistema.placar_derivado(depois['id']) == (0, 1)
+
+
+def test_transferencias_do_mesmo_lote_em_sequencia():
+    sistema = SistemaFutebolFeminino()
+    importar_registros(sistema, 'transferencias', [
+        {'jogadora_id': 'jog_001', 'clube_destino_id': 'clube_002', 'data': '2024-03-01'},
+        {'jogadora_id': 'jog_001', 'clube_destino_id': 'clube_003', 'data': '2024-06-01'}
+    ])
+    
+    assert sistema.historico_da_jogadora('jog_001') == [
+        {'clube_id': 'clube_001', 'inicio': None, 'fim': '2024-03-01'},
+        {'clube_id': 'clube_002', 'inicio': '2024-03-01', 'fim': '2024-06-01'},
+        {'clube_id': 'clube_003', 'inicio': '2024-06-01', 'fim': None}
+    ]
+    assert sistema.buscar_jogadora_por_id('jog_001')['clube_id'] == 'clube_003'
+
+
+def test_transferencia_com_referencia_inexistente():
+    sistema = SistemaFutebolFeminino()
+    total = len(sistema.transferencias)
+    lote = [
+        {'id': 'transf_ok', 'jogadora_id': 'jog_001', 'clube_origem_id': None,
+         'clube_destino_id': 'clube_002', 'data': '2024-09-01'},
+        {'id': 'transf_ruim', 'jogadora_id': 'jog_inexistente', 'clube_origem_id': None,
+         'clube_destino_id': 'clube_002', 'data': '2024-09-02'}
+    ]
+    with pytest.raises(ValueError):
+        sistema.registrar_transferencias(lote)
+    # Nada do lote foi aplicado
+    assert len(sistema.transferencias) == total
+    assert sistema.buscar_jogadora_por_id('jog_001')['clube_id'] == 'clube_001'
+    assert sistema.registrar_transferencia('jog_inexistente', 'clube_002', '2024-09-01') is None
+
+
+def test_importacao_confere_clube_de_origem_informado():
+    sistema = SistemaFutebolFeminino()
+    resumo = importar_registros(sistema, 'transferencias', [
+        {'jogadora_id': 'jog_001', 'clube_origem_id': 'clube_inexistente',
+         'clube_destino_id': 'clube_002', 'data': '2024-09-01'},
+        {'jogadora_id': 'jog_002', 'clube_origem_id': 'clube_002',
+         'clube_destino_id': 'clube_001', 'data': '2024-09-01'},
+        {'jogadora_id': 'jog_003', 'clube_destino_id': 'clube_001', 'data': '2024-09-01'}
+    ])
+    assert resumo['importados'] == 2
+    assert resumo['erros'][0][1] == 'clube_origem_id inexistente: clube_inexistente'